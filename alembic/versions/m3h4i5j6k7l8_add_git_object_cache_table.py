@@ -0,0 +1,81 @@
+"""Add git_object_cache table for content-addressed GitHub blob/tree caching
+
+Revision ID: m3h4i5j6k7l8
+Revises: 70323bca3baa
+Create Date: 2026-10-16 10:00:00.000000
+
+This table persists git blob contents and recursive tree listings keyed by SHA,
+so file reads and tree listings survive process restarts and deploys instead of
+being refetched from GitHub. Git objects are immutable, so entries never go
+stale; the table is bounded by LRU eviction on last_accessed_at.
+
+Unlike commit_stats_cache, rows hold repository contents (possibly private), so
+RLS is enabled with no policies: only the service role (BYPASSRLS) can read or
+write.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "m3h4i5j6k7l8"
+down_revision: str | None = "70323bca3baa"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "git_object_cache",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("object_type", sa.String(10), nullable=False),
+        sa.Column("sha", sa.String(40), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_accessed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Unique composite index for lookups (also enforces uniqueness)
+    op.create_index(
+        "ix_git_object_cache_type_sha",
+        "git_object_cache",
+        ["object_type", "sha"],
+        unique=True,
+    )
+
+    # Index for LRU eviction
+    op.create_index(
+        "ix_git_object_cache_last_accessed_at",
+        "git_object_cache",
+        ["last_accessed_at"],
+    )
+
+    # No policies - reads and writes go through service role (BYPASSRLS)
+    op.execute("ALTER TABLE git_object_cache ENABLE ROW LEVEL SECURITY")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE git_object_cache DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_git_object_cache_last_accessed_at", table_name="git_object_cache")
+    op.drop_index("ix_git_object_cache_type_sha", table_name="git_object_cache")
+    op.drop_table("git_object_cache")
@@ -0,0 +1,102 @@
+"""Add repository_commits table for locally ingested commits
+
+Revision ID: n4i5j6k7l8m9
+Revises: m3h4i5j6k7l8
+Create Date: 2026-10-16 11:00:00.000000
+
+Stores commits on tracked repositories' default branches, ingested from GitHub
+push / pull_request webhooks (and later the commit sync worker), so progress
+views can read recent activity from Postgres instead of polling GitHub.
+
+Shared across products like commit_stats_cache: keyed by
+(repository_full_name, commit_sha).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "n4i5j6k7l8m9"
+down_revision: str | None = "m3h4i5j6k7l8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "repository_commits",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("repository_full_name", sa.String(500), nullable=False),
+        sa.Column("github_repo_id", sa.BigInteger(), nullable=True),
+        sa.Column("commit_sha", sa.String(40), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("author_name", sa.String(255), nullable=False),
+        sa.Column("author_email", sa.String(255), nullable=True),
+        sa.Column("author_login", sa.String(255), nullable=True),
+        sa.Column("author_avatar_url", sa.String(500), nullable=True),
+        sa.Column("html_url", sa.String(500), nullable=False),
+        sa.Column("authored_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("committed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("additions", sa.Integer(), nullable=True),
+        sa.Column("deletions", sa.Integer(), nullable=True),
+        sa.Column("files_changed", sa.Integer(), nullable=True),
+        sa.Column("source", sa.String(20), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Unique composite index for upserts (also enforces uniqueness)
+    op.create_index(
+        "ix_repository_commits_repo_sha",
+        "repository_commits",
+        ["repository_full_name", "commit_sha"],
+        unique=True,
+    )
+
+    # Index for time-window reads per repository
+    op.create_index(
+        "ix_repository_commits_repo_committed_at",
+        "repository_commits",
+        ["repository_full_name", "committed_at"],
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE repository_commits ENABLE ROW LEVEL SECURITY")
+
+    # Readable if the repository is linked to a product the user can view
+    op.execute("""
+        CREATE POLICY repository_commits_select ON repository_commits
+            FOR SELECT
+            USING (
+                EXISTS (
+                    SELECT 1 FROM repositories
+                    WHERE repositories.full_name = repository_commits.repository_full_name
+                    AND can_view_product(repositories.product_id)
+                )
+            )
+    """)
+
+    # No INSERT/UPDATE/DELETE policies - writes go through service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("DROP POLICY IF EXISTS repository_commits_select ON repository_commits")
+    op.execute("ALTER TABLE repository_commits DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_repository_commits_repo_committed_at", table_name="repository_commits")
+    op.drop_index("ix_repository_commits_repo_sha", table_name="repository_commits")
+    op.drop_table("repository_commits")
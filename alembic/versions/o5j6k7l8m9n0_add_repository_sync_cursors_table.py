@@ -0,0 +1,81 @@
+"""Add repository_sync_cursors table for incremental commit sync
+
+Revision ID: o5j6k7l8m9n0
+Revises: n4i5j6k7l8m9
+Create Date: 2026-10-16 13:00:00.000000
+
+Tracks, per repository, the newest commit the background sync worker has
+stored in repository_commits and how far back the store is complete, so each
+run fetches only newer commits and reads can tell when the store covers a
+requested window.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "o5j6k7l8m9n0"
+down_revision: str | None = "n4i5j6k7l8m9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "repository_sync_cursors",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("repository_full_name", sa.String(500), nullable=False),
+        sa.Column("last_commit_sha", sa.String(40), nullable=True),
+        sa.Column("last_commit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("covered_since", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_synced_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_index(
+        "ix_repository_sync_cursors_full_name",
+        "repository_sync_cursors",
+        ["repository_full_name"],
+        unique=True,
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE repository_sync_cursors ENABLE ROW LEVEL SECURITY")
+
+    # Readable if the repository is linked to a product the user can view
+    op.execute("""
+        CREATE POLICY repository_sync_cursors_select ON repository_sync_cursors
+            FOR SELECT
+            USING (
+                EXISTS (
+                    SELECT 1 FROM repositories
+                    WHERE repositories.full_name = repository_sync_cursors.repository_full_name
+                    AND can_view_product(repositories.product_id)
+                )
+            )
+    """)
+
+    # No INSERT/UPDATE/DELETE policies - writes go through service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("DROP POLICY IF EXISTS repository_sync_cursors_select ON repository_sync_cursors")
+    op.execute("ALTER TABLE repository_sync_cursors DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_repository_sync_cursors_full_name", table_name="repository_sync_cursors")
+    op.drop_table("repository_sync_cursors")
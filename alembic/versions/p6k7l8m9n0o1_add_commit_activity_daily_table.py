@@ -0,0 +1,106 @@
+"""Add commit_activity_daily rollup table
+
+Revision ID: p6k7l8m9n0o1
+Revises: o5j6k7l8m9n0
+Create Date: 2026-10-16 15:00:00.000000
+
+Per (repository, author, UTC day) commit counts and line stats, rebuilt from
+repository_commits whenever commits for that repository and day are ingested.
+Progress analytics over long windows aggregate these rows instead of raw
+commits.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p6k7l8m9n0o1"
+down_revision: str | None = "o5j6k7l8m9n0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "commit_activity_daily",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("repository_full_name", sa.String(500), nullable=False),
+        sa.Column("author_name", sa.String(255), nullable=False),
+        sa.Column("author_login", sa.String(255), nullable=True),
+        sa.Column("author_avatar_url", sa.String(500), nullable=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("commits", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("additions", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("deletions", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("files_changed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Unique per repository/day/author; also serves day-range reads per repository
+    op.create_index(
+        "ix_commit_activity_daily_repo_day_author",
+        "commit_activity_daily",
+        ["repository_full_name", "day", "author_name"],
+        unique=True,
+    )
+
+    # Backfill from commits already in the store
+    op.execute("""
+        INSERT INTO commit_activity_daily (
+            repository_full_name, author_name, author_login, author_avatar_url, day,
+            commits, additions, deletions, files_changed
+        )
+        SELECT
+            repository_full_name,
+            author_name,
+            max(author_login),
+            max(author_avatar_url),
+            (committed_at AT TIME ZONE 'UTC')::date,
+            count(*),
+            coalesce(sum(additions), 0),
+            coalesce(sum(deletions), 0),
+            coalesce(sum(files_changed), 0)
+        FROM repository_commits
+        GROUP BY repository_full_name, author_name, (committed_at AT TIME ZONE 'UTC')::date
+    """)
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE commit_activity_daily ENABLE ROW LEVEL SECURITY")
+
+    # Readable if the repository is linked to a product the user can view
+    op.execute("""
+        CREATE POLICY commit_activity_daily_select ON commit_activity_daily
+            FOR SELECT
+            USING (
+                EXISTS (
+                    SELECT 1 FROM repositories
+                    WHERE repositories.full_name = commit_activity_daily.repository_full_name
+                    AND can_view_product(repositories.product_id)
+                )
+            )
+    """)
+
+    # No INSERT/UPDATE/DELETE policies - writes go through service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("DROP POLICY IF EXISTS commit_activity_daily_select ON commit_activity_daily")
+    op.execute("ALTER TABLE commit_activity_daily DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_commit_activity_daily_repo_day_author", table_name="commit_activity_daily")
+    op.drop_table("commit_activity_daily")
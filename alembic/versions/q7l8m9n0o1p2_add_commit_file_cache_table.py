@@ -0,0 +1,98 @@
+"""Add commit_file_cache table for per-commit file changes
+
+Revision ID: q7l8m9n0o1p2
+Revises: p6k7l8m9n0o1
+Create Date: 2026-10-16 16:00:00.000000
+
+Stores the files changed by each commit, keyed by (repository, SHA), so the
+active-code view and commit detail endpoint stop refetching full commits from
+GitHub on every request. File lists are immutable per SHA, so entries never
+go stale.
+
+File paths reveal repository structure, so unlike commit_stats_cache reads
+are limited to users who can view a product the repository is linked to.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q7l8m9n0o1p2"
+down_revision: str | None = "p6k7l8m9n0o1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "commit_file_cache",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("repository_full_name", sa.String(500), nullable=False),
+        sa.Column("commit_sha", sa.String(40), nullable=False),
+        sa.Column(
+            "files",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+            comment="Array of file changes: [{filename, status, additions, deletions}]",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Unique lookup by repository and SHA
+    op.create_index(
+        "ix_commit_file_cache_repo_sha",
+        "commit_file_cache",
+        ["repository_full_name", "commit_sha"],
+        unique=True,
+    )
+
+    # For potential future cleanup of old entries
+    op.create_index(
+        "ix_commit_file_cache_created_at",
+        "commit_file_cache",
+        ["created_at"],
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE commit_file_cache ENABLE ROW LEVEL SECURITY")
+
+    # Readable if the repository is linked to a product the user can view
+    op.execute("""
+        CREATE POLICY commit_file_cache_select ON commit_file_cache
+            FOR SELECT
+            USING (
+                EXISTS (
+                    SELECT 1 FROM repositories
+                    WHERE repositories.full_name = commit_file_cache.repository_full_name
+                    AND can_view_product(repositories.product_id)
+                )
+            )
+    """)
+
+    # No INSERT/UPDATE/DELETE policies - writes go through service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("DROP POLICY IF EXISTS commit_file_cache_select ON commit_file_cache")
+    op.execute("ALTER TABLE commit_file_cache DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_commit_file_cache_created_at", table_name="commit_file_cache")
+    op.drop_index("ix_commit_file_cache_repo_sha", table_name="commit_file_cache")
+    op.drop_table("commit_file_cache")
@@ -0,0 +1,67 @@
+"""Add auto_progress_checkpoints table for resumable auto-progress runs
+
+Revision ID: r8m9n0o1p2q3
+Revises: q7l8m9n0o1p2
+Create Date: 2026-10-16 18:00:00.000000
+
+Records each product the daily auto-progress run has finished with, so a run
+stopped by the job timeout is resumed with the remaining products instead of
+starting over the next day.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "r8m9n0o1p2q3"
+down_revision: str | None = "q7l8m9n0o1p2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auto_progress_checkpoints",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("run_date", sa.Date(), nullable=False),
+        sa.Column("product_id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("outcome", sa.String(20), nullable=False),
+        sa.Column(
+            "completed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_index(
+        "ix_auto_progress_checkpoints_run_product",
+        "auto_progress_checkpoints",
+        ["run_date", "product_id"],
+        unique=True,
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE auto_progress_checkpoints ENABLE ROW LEVEL SECURITY")
+
+    # No policies - only the background job reads and writes, via service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE auto_progress_checkpoints DISABLE ROW LEVEL SECURITY")
+    op.drop_index(
+        "ix_auto_progress_checkpoints_run_product", table_name="auto_progress_checkpoints"
+    )
+    op.drop_table("auto_progress_checkpoints")
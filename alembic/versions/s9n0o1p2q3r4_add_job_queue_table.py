@@ -0,0 +1,100 @@
+"""Add job_queue table for durable background jobs
+
+Revision ID: s9n0o1p2q3r4
+Revises: r8m9n0o1p2q3
+Create Date: 2026-10-16 20:00:00.000000
+
+Background work (docs generation, analysis, custom docs, team summary
+regeneration) is enqueued here and claimed by job workers with
+FOR UPDATE SKIP LOCKED, instead of running as in-process asyncio tasks that
+are lost on deploy or crash.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s9n0o1p2q3r4"
+down_revision: str | None = "r8m9n0o1p2q3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_queue",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("job_type", sa.String(50), nullable=False),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+            comment="Keyword arguments for the job handler",
+        ),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("dedupe_key", sa.String(200), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("last_error", sa.String(2000), nullable=True),
+        sa.Column(
+            "run_after",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("locked_by", sa.String(100), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_index("ix_job_queue_id", "job_queue", ["id"])
+    op.create_index(
+        "ix_job_queue_type_status_run_after",
+        "job_queue",
+        ["job_type", "status", "run_after"],
+    )
+    op.create_index(
+        "ix_job_queue_dedupe_key",
+        "job_queue",
+        ["dedupe_key"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE job_queue ENABLE ROW LEVEL SECURITY")
+
+    # No policies - only enqueue helpers and job workers use it, via service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE job_queue DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_job_queue_dedupe_key", table_name="job_queue")
+    op.drop_index("ix_job_queue_type_status_run_after", table_name="job_queue")
+    op.drop_index("ix_job_queue_id", table_name="job_queue")
+    op.drop_table("job_queue")
@@ -0,0 +1,67 @@
+"""Add scheduler_shard_runs table for sharded scheduler runs
+
+Revision ID: t0o1p2q3r4s5
+Revises: s9n0o1p2q3r4
+Create Date: 2026-10-16 22:00:00.000000
+
+Scheduled jobs split organizations into hash-range shards claimed by
+instances through per-shard advisory locks. Each finished shard is recorded
+here so other instances skip it, and shards of an instance that died are
+picked up by the others.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "t0o1p2q3r4s5"
+down_revision: str | None = "s9n0o1p2q3r4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_shard_runs",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("job_name", sa.String(50), nullable=False),
+        sa.Column("run_key", sa.String(100), nullable=False),
+        sa.Column("shard_index", sa.Integer(), nullable=False),
+        sa.Column("shard_count", sa.Integer(), nullable=False),
+        sa.Column("instance_id", sa.String(100), nullable=False),
+        sa.Column(
+            "completed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_index(
+        "ix_scheduler_shard_runs_job_run_shard",
+        "scheduler_shard_runs",
+        ["job_name", "run_key", "shard_count", "shard_index"],
+        unique=True,
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE scheduler_shard_runs ENABLE ROW LEVEL SECURITY")
+
+    # No policies - only the scheduler reads and writes, via service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE scheduler_shard_runs DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_scheduler_shard_runs_job_run_shard", table_name="scheduler_shard_runs")
+    op.drop_table("scheduler_shard_runs")
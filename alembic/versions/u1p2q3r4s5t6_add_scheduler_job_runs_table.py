@@ -0,0 +1,79 @@
+"""Add scheduler_job_runs table for job duration and throughput metrics
+
+Revision ID: u1p2q3r4s5t6
+Revises: t0o1p2q3r4s5
+Create Date: 2026-10-16 23:00:00.000000
+
+Every shard a scheduled job processes is recorded with its duration, items
+processed, errors, per-organization timings and the instance that ran it, so
+p50/p95 durations over time show scaling regressions before a job reaches
+its timeout.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "u1p2q3r4s5t6"
+down_revision: str | None = "t0o1p2q3r4s5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_job_runs",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("job_name", sa.String(50), nullable=False),
+        sa.Column("run_key", sa.String(100), nullable=False),
+        sa.Column("shard_index", sa.Integer(), nullable=False),
+        sa.Column("shard_count", sa.Integer(), nullable=False),
+        sa.Column("instance_id", sa.String(100), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("items_processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "errors",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column(
+            "org_timings",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_index(
+        "ix_scheduler_job_runs_job_started",
+        "scheduler_job_runs",
+        ["job_name", "started_at"],
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE scheduler_job_runs ENABLE ROW LEVEL SECURITY")
+
+    # No policies - only the scheduler and internal endpoints use it, via service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE scheduler_job_runs DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_scheduler_job_runs_job_started", table_name="scheduler_job_runs")
+    op.drop_table("scheduler_job_runs")
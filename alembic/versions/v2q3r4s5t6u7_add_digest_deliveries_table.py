@@ -0,0 +1,64 @@
+"""Add digest_deliveries table so digest shards never send twice
+
+Revision ID: v2q3r4s5t6u7
+Revises: u1p2q3r4s5t6
+Create Date: 2026-10-17 10:00:00.000000
+
+A digest run records each recipient before sending, so an instance that
+re-runs a shard (or takes over one from an instance that died after
+sending) skips recipients already handled for the same run.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2q3r4s5t6u7"
+down_revision: str | None = "u1p2q3r4s5t6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "digest_deliveries",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("frequency", sa.String(20), nullable=False),
+        sa.Column("run_key", sa.String(100), nullable=False),
+        sa.Column("preference_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "sent_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_index(
+        "ix_digest_deliveries_run_preference",
+        "digest_deliveries",
+        ["frequency", "run_key", "preference_id"],
+        unique=True,
+    )
+
+    # ======================================================================
+    # ROW-LEVEL SECURITY
+    # ======================================================================
+    op.execute("ALTER TABLE digest_deliveries ENABLE ROW LEVEL SECURITY")
+
+    # No policies - only the digest job reads and writes, via service role (BYPASSRLS)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE digest_deliveries DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_digest_deliveries_run_preference", table_name="digest_deliveries")
+    op.drop_table("digest_deliveries")
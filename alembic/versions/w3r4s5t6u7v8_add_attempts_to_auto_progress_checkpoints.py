@@ -0,0 +1,33 @@
+"""Add attempts to auto_progress_checkpoints to cap same-day retries
+
+Revision ID: w3r4s5t6u7v8
+Revises: v2q3r4s5t6u7
+Create Date: 2026-10-17 11:00:00.000000
+
+The hourly resume job retries products whose checkpoint is "failed". The
+attempt count lets the generator stop retrying a product that keeps failing
+instead of regenerating it every hour of the day.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "w3r4s5t6u7v8"
+down_revision: str | None = "v2q3r4s5t6u7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "auto_progress_checkpoints",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("auto_progress_checkpoints", "attempts")
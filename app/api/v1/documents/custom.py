@@ -7,9 +7,9 @@ Supports both synchronous generation (for smaller requests) and background
 generation with progress tracking (for longer requests).
 """
 
-import asyncio
 import logging
 import uuid as uuid_pkg
+from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -36,9 +36,12 @@ from app.services.docs import job_store
 from app.services.docs.custom_generator import CustomDocGenerator
 from app.services.docs.types import CustomDocRequest
 from app.services.github import GitHubService
+from app.services.jobs import enqueue_job, job_handler
 
 logger = logging.getLogger(__name__)
 
+CUSTOM_DOC_JOB = "custom_doc_generation"
+
 # Rate limit configuration by plan tier
 RATE_LIMITS = {
     "none": {"max_requests": 5, "window_hours": 24},
@@ -167,17 +170,18 @@ async def generate_custom_document(
             user_id=str(current_user.id),
         )
 
-        # Run generation in background task — pass primitive IDs only
-        # to avoid stale ORM objects after the request session closes
-        asyncio.create_task(
-            _run_background_generation(
-                job_id=job_id,
-                custom_request=custom_request,
-                product_id=product_id,
-                repository_ids=[r.id for r in repositories],
-                user_id=current_user.id,
-                github_token=github_token,
-            )
+        # Queue generation — pass primitive IDs only (the payload is stored
+        # as JSON); the job resolves the GitHub token itself so it is never
+        # written to the queue
+        await enqueue_job(
+            CUSTOM_DOC_JOB,
+            {
+                "job_id": job_id,
+                "request": asdict(custom_request),
+                "product_id": str(product_id),
+                "repository_ids": [str(r.id) for r in repositories],
+                "user_id": str(current_user.id),
+            },
         )
 
         return CustomDocResponseSchema(
@@ -211,6 +215,38 @@ async def generate_custom_document(
             )
 
 
+@job_handler(CUSTOM_DOC_JOB, concurrency=3, visibility_timeout_seconds=300, max_attempts=2)
+async def run_custom_doc_job(
+    job_id: str,
+    request: dict[str, Any],
+    product_id: str,
+    repository_ids: list[str],
+    user_id: str,
+) -> None:
+    """Job handler for background custom doc generation.
+
+    Progress and the result are tracked on the CustomDocJob (job_store).
+    """
+    from app.core.database import async_session_maker
+
+    user_uuid = uuid_pkg.UUID(user_id)
+    async with async_session_maker() as db:
+        preferences = await preferences_ops.get_by_user_id(db, user_uuid)
+        github_token = preferences_ops.get_decrypted_token(preferences) if preferences else None
+        if not github_token:
+            await job_store.set_failed(db, job_id, "GitHub token not configured.")
+            return
+
+    await _run_background_generation(
+        job_id=job_id,
+        custom_request=CustomDocRequest(**request),
+        product_id=uuid_pkg.UUID(product_id),
+        repository_ids=[uuid_pkg.UUID(rid) for rid in repository_ids],
+        user_id=user_uuid,
+        github_token=github_token,
+    )
+
+
 async def _run_background_generation(
     job_id: str,
     custom_request: CustomDocRequest,
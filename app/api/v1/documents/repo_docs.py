@@ -250,7 +250,7 @@ async def get_repo_file_content(
 
         # Try to fetch file content (with larger limit for docs)
         max_size = 500_000  # 500KB for docs
-        file_content = await github_service.get_file_content(
+        file_content = await github_service.get_file_content_via_tree(
             owner, repo_name, path, branch, max_size
         )
 
@@ -7,9 +7,10 @@ Endpoints bypass Supabase JWT auth and instead validate a shared secret via X-Cr
 
 import logging
 from dataclasses import asdict
-from typing import Any
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import settings
@@ -116,3 +117,93 @@ async def trigger_daily_digest(
     await db.commit()
 
     return asdict(report)
+
+
+@router.post("/commit-sync")
+async def trigger_commit_sync(
+    x_cron_secret: str = Header(...),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """
+    Manually trigger an incremental commit sync for all tracked repositories.
+
+    Protected by X-Cron-Secret header. Useful for testing or backfilling a new repo.
+    Note: This job runs automatically via APScheduler — see services/scheduler.py.
+    """
+    _verify_cron_secret(x_cron_secret)
+
+    from app.services.progress.commit_sync import commit_sync_worker
+
+    report = await commit_sync_worker.run(db)
+    await db.commit()
+
+    return asdict(report)
+
+
+@router.get("/progress-cache-stats")
+async def get_progress_cache_stats(
+    x_cron_secret: str = Header(...),
+) -> dict[str, Any]:
+    """
+    Report Progress response cache counters (hits, stale hits, misses, refreshes).
+
+    Protected by X-Cron-Secret header. Counters are per process since startup.
+    """
+    _verify_cron_secret(x_cron_secret)
+
+    from app.api.v1.progress.response_cache import progress_response_cache
+
+    return progress_response_cache.get_stats()
+
+
+@router.get("/job-runs")
+async def get_job_run_stats(
+    job_name: str = Query("auto_progress", max_length=50),
+    days: int = Query(30, ge=1, le=90),
+    bucket: Literal["hour", "day", "week"] = Query("day"),
+    recent: int = Query(10, ge=0, le=100),
+    x_cron_secret: str = Header(...),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """
+    Report p50/p95 durations and throughput of a scheduled job over time.
+
+    Each ledger entry is one shard of a run (the unit TOTAL_JOB_TIMEOUT_SECONDS
+    applies to). Recent runs include their slowest organizations; org timings
+    add up the durations of an org's concurrently processed products, so they
+    measure work spent on the org rather than its elapsed time.
+
+    Protected by X-Cron-Secret header.
+    """
+    _verify_cron_secret(x_cron_secret)
+
+    from app.domain import scheduler_job_run_ops
+
+    since = datetime.now(UTC) - timedelta(days=days)
+    periods = await scheduler_job_run_ops.get_duration_stats(db, job_name, since, bucket)
+    runs = await scheduler_job_run_ops.get_recent(db, job_name, limit=recent) if recent else []
+
+    return {
+        "job_name": job_name,
+        "since": since.isoformat(),
+        "bucket": bucket,
+        "periods": periods,
+        "recent_runs": [
+            {
+                "run_key": run.run_key,
+                "shard": f"{run.shard_index + 1}/{run.shard_count}",
+                "instance_id": run.instance_id,
+                "started_at": run.started_at.isoformat(),
+                "finished_at": run.finished_at.isoformat(),
+                "duration_seconds": run.duration_seconds,
+                "status": run.status,
+                "items_processed": run.items_processed,
+                "error_count": run.error_count,
+                "errors": run.errors,
+                "slowest_orgs": dict(
+                    sorted(run.org_timings.items(), key=lambda item: item[1], reverse=True)[:5]
+                ),
+            }
+            for run in runs
+        ],
+    }
@@ -10,7 +10,7 @@ import uuid as uuid_pkg
 from datetime import datetime
 from typing import Any, Literal
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -677,7 +677,7 @@ async def get_repository_file(
 
     try:
         gh = GitHubReadOperations(token=token)
-        file = await gh.get_file_content(
+        file = await gh.get_file_content_via_tree(
             owner=owner, repo=repo_name, path=path, branch=target_branch
         )
     except Exception as e:
@@ -883,14 +883,13 @@ async def update_work_item(
 
 @router.post("/generate-docs", response_model=MCPGenerateDocsResponse)
 async def generate_docs(
-    background_tasks: BackgroundTasks,
     data: MCPGenerateDocsRequest | None = None,
     api_key: ProductApiKey = Depends(require_scope("mcp:admin")),
     db: AsyncSession = Depends(get_db),
 ) -> MCPGenerateDocsResponse:
     """Trigger AI documentation generation for the product.
 
-    Runs as a background task. Poll GET /api/v1/mcp/docs-status for progress.
+    Runs as a queued background job. Poll GET /api/v1/mcp/docs-status for progress.
     """
     rate_limiter.check_rate_limit(api_key.id, "mcp_admin", MCP_ADMIN_LIMIT)
 
@@ -913,14 +912,9 @@ async def generate_docs(
     await db.commit()
 
     # Import here to avoid circular imports — same pattern as docs_generation.py
-    from app.api.v1.products.docs_generation import run_document_orchestrator
+    from app.api.v1.products.docs_generation import enqueue_docs_generation
 
-    background_tasks.add_task(
-        run_document_orchestrator,
-        product_id=str(api_key.product_id),
-        user_id=str(api_key.created_by_user_id),
-        mode=mode,
-    )
+    await enqueue_docs_generation(api_key.product_id, api_key.created_by_user_id, mode)
 
     return MCPGenerateDocsResponse(
         status="started",
@@ -43,7 +43,7 @@ from app.api.v1.organizations.members import (
 )
 from app.api.v1.organizations.repositories import list_org_repositories
 from app.api.v1.organizations.settings import get_settings, update_settings
-from app.api.v1.organizations.team_activity import get_team_activity
+from app.api.v1.organizations.team_activity import get_team_activity, stream_team_activity
 from app.api.v1.organizations.team_summaries import get_team_summaries
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
@@ -93,6 +93,7 @@ router.add_api_route("/{org_id}/settings", update_settings, methods=["PATCH"])
 
 # Team activity routes
 router.add_api_route("/{org_id}/team-activity", get_team_activity, methods=["GET"])
+router.add_api_route("/{org_id}/team-activity/stream", stream_team_activity, methods=["GET"])
 router.add_api_route("/{org_id}/team-activity/summaries", get_team_summaries, methods=["GET"])
 
 # Digest preference routes
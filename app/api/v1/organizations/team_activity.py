@@ -4,14 +4,16 @@ Aggregates contributor data across all products in an organization,
 merging by GitHub author identity and joining with org member records.
 """
 
-import asyncio
+import json
 import logging
 import uuid as uuid_pkg
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from fastapi import Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db_with_rls
@@ -25,12 +27,19 @@ from app.api.v1.organizations.schemas import (
     TeamMemberStats,
 )
 from app.api.v1.progress.commit_fetcher import fetch_commit_stats, fetch_product_commits
+from app.core.fanout import FanOutResult, fan_out, fan_out_as_completed
 from app.domain import org_member_ops, product_ops
 from app.models.user import User
 from app.services.github.timeline_types import TimelineEvent
 
 logger = logging.getLogger(__name__)
 
+# Products fetched at once, each holding its own pooled session
+MAX_CONCURRENT_PRODUCT_FETCHES = 5
+
+# Time budget for one product's commits and stats
+PRODUCT_FETCH_TIMEOUT_SECONDS = 30.0
+
 
 def _period_string(days: int) -> str:
     """Convert days integer to period string for existing helpers."""
@@ -126,48 +135,180 @@ async def get_team_activity(
         # Return empty response with org members as idle/pending
         return await _build_empty_response(db, org_id, days)
 
-    # 2. Fetch contributor data per product (in parallel)
-    async def fetch_for_product(product: Any) -> tuple[str, str, list[TimelineEvent]]:
-        """Fetch and enrich commits for a single product."""
-        product_name = product.name or "Unknown"
-        product_id_str = str(product.id)
-        try:
-            result = await fetch_product_commits(
-                db=db,
-                product_id=product.id,
-                current_user=user,
-                period=period,
-                fetch_limit=200,
+    # 2. Fetch contributor data per product (in parallel, one session each)
+    async def fetch(session: AsyncSession, product: Any) -> list[TimelineEvent]:
+        return await _fetch_product_events(session, user, product, period)
+
+    fetch_results = await fan_out(
+        products,
+        fetch,
+        user_id=user.id,
+        max_concurrency=MAX_CONCURRENT_PRODUCT_FETCHES,
+        timeout=PRODUCT_FETCH_TIMEOUT_SECONDS,
+    )
+
+    # 3. Fetch org members, then merge contributor data across products by author
+    member_map = _build_member_map(await org_member_ops.get_by_org(db, org_id))
+    accumulator = _TeamActivityAccumulator(days, member_map)
+
+    for outcome in fetch_results:
+        accumulator.add_product(
+            str(outcome.item.id), outcome.item.name or "Unknown", _outcome_events(outcome)
+        )
+
+    # 4. Join with org members, sort and aggregate
+    return accumulator.response(sort)
+
+
+async def stream_team_activity(
+    org_id: uuid_pkg.UUID,
+    days: int = Query(14, description="Period in days: 7, 14, 30"),
+    sort: str = Query("commits", description="Sort: commits, additions, last_active, name"),
+    stream_format: str = Query("ndjson", alias="format", description="Stream format: ndjson, sse"),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_with_rls),
+) -> StreamingResponse:
+    """Stream team activity as each product's commits arrive.
+
+    Emits one `product` message per product as soon as its commits are
+    fetched, carrying the current merged entry of every contributor that
+    product touched (so a contributor seen in several products is sent
+    again with updated totals). The last message is a `summary` with the
+    same body as GET /team-activity.
+
+    NDJSON sends one JSON object per line; SSE sends each object as a
+    `data:` event.
+    """
+    await require_org_access(db, org_id, user)
+
+    if days not in (7, 14, 30):
+        days = 14
+    sse = stream_format == "sse"
+
+    period = _period_string(days)
+    products = await product_ops.get_by_organization(db, org_id)
+    member_map = _build_member_map(await org_member_ops.get_by_org(db, org_id))
+
+    def encode(message: dict[str, Any]) -> str:
+        body = json.dumps(message)
+        return f"data: {body}\n\n" if sse else f"{body}\n"
+
+    async def fetch(session: AsyncSession, product: Any) -> list[TimelineEvent]:
+        return await _fetch_product_events(session, user, product, period)
+
+    async def message_generator() -> AsyncIterator[str]:
+        accumulator = _TeamActivityAccumulator(days, member_map)
+        # Closing the iterator (client went away mid-stream) cancels outstanding fetches
+        outcomes = fan_out_as_completed(
+            products,
+            fetch,
+            user_id=user.id,
+            max_concurrency=MAX_CONCURRENT_PRODUCT_FETCHES,
+            timeout=PRODUCT_FETCH_TIMEOUT_SECONDS,
+        )
+        completed = 0
+        async for outcome in outcomes:
+            completed += 1
+            product_id_str = str(outcome.item.id)
+            product_name = outcome.item.name or "Unknown"
+            authors = accumulator.add_product(
+                product_id_str, product_name, _outcome_events(outcome)
+            )
+            yield encode(
+                {
+                    "type": "product",
+                    "product_id": product_id_str,
+                    "product_name": product_name,
+                    "completed": completed,
+                    "total": len(products),
+                    "members": [
+                        accumulator.contributor(a).model_dump(mode="json") for a in authors
+                    ],
+                }
             )
-            if not result:
-                return (product_id_str, product_name, [])
-
-            events = await fetch_commit_stats(db, result.github, result.repos, result.events)
-            return (product_id_str, product_name, events)
-        except Exception:
-            logger.exception(f"Failed to fetch commits for product {product.id}")
-            return (product_id_str, product_name, [])
-
-    fetch_results = await asyncio.gather(
-        *[fetch_for_product(p) for p in products],
-        return_exceptions=True,
+
+        yield encode({"type": "summary", **accumulator.response(sort).model_dump(mode="json")})
+
+    return StreamingResponse(
+        message_generator(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
     )
 
-    # 3. Merge contributor data across products by author
-    # author -> { stats, daily_activities, focus_areas_counts, products, recent_commits, avatar }
-    author_data: dict[str, dict[str, Any]] = {}
-    products_with_activity: set[str] = set()
 
-    for result in fetch_results:
-        if isinstance(result, BaseException):
-            logger.warning(f"Product fetch failed: {result}")
-            continue
+async def _fetch_product_events(
+    db: AsyncSession,
+    user: User,
+    product: Any,
+    period: str,
+) -> list[TimelineEvent]:
+    """Fetch and enrich commits for a single product."""
+    result = await fetch_product_commits(
+        db=db,
+        product_id=product.id,
+        current_user=user,
+        period=period,
+    )
+    if not result:
+        return []
+
+    return await fetch_commit_stats(db, result.github, result.repos, result.events)
+
+
+def _outcome_events(outcome: FanOutResult[Any, list[TimelineEvent]]) -> list[TimelineEvent]:
+    """Events of a product fetch, or none (logged) if it failed or timed out."""
+    if outcome.timed_out:
+        logger.warning(f"Commit fetch for product {outcome.item.id} timed out")
+    elif outcome.error is not None:
+        logger.warning(f"Failed to fetch commits for product {outcome.item.id}: {outcome.error}")
+    return outcome.value or []
+
+
+def _build_member_map(org_members: list[Any]) -> dict[str, dict[str, Any]]:
+    """Build member lookup: user_id -> member info."""
+    member_map: dict[str, dict[str, Any]] = {}
+    for m in org_members:
+        uid = str(m.user_id)
+        member_map[uid] = {
+            "user_id": uid,
+            "display_name": m.user.display_name if m.user else None,
+            "email": m.user.email if m.user else None,
+            "avatar_url": m.user.avatar_url if m.user else None,
+            "role": m.role,
+            "joined_at": m.joined_at.isoformat() if m.joined_at else None,
+            "github_username": m.user.github_username if m.user else None,
+            "has_signed_in": (m.user.onboarding_completed_at is not None if m.user else False),
+        }
+    return member_map
+
+
+class _TeamActivityAccumulator:
+    """Merges contributor data into team members one product at a time.
+
+    Products can be added in any order; contributor entries and the final
+    response reflect every product added so far.
+    """
 
-        product_id_str, product_name, events = result
+    def __init__(self, days: int, member_map: dict[str, dict[str, Any]]) -> None:
+        self.days = days
+        self.member_map = member_map
+        # author -> { stats, daily_activities, focus_areas_counts, products, recent_commits, avatar }
+        self.author_data: dict[str, dict[str, Any]] = {}
+        self.products_with_activity: set[str] = set()
+        self._matches: dict[str, dict[str, Any] | None] = {}
+
+    def add_product(
+        self, product_id_str: str, product_name: str, events: list[TimelineEvent]
+    ) -> list[str]:
+        """Merge one product's commits. Returns the authors it touched."""
         if not events:
-            continue
+            return []
 
-        products_with_activity.add(product_id_str)
+        self.products_with_activity.add(product_id_str)
 
         # Group events by author within this product
         product_authors: dict[str, list[TimelineEvent]] = defaultdict(list)
@@ -175,8 +316,8 @@ async def get_team_activity(
             product_authors[event.commit_author].append(event)
 
         for author, author_events in product_authors.items():
-            if author not in author_data:
-                author_data[author] = {
+            if author not in self.author_data:
+                self.author_data[author] = {
                     "commits": 0,
                     "additions": 0,
                     "deletions": 0,
@@ -190,7 +331,7 @@ async def get_team_activity(
                     "recent_commits": [],
                 }
 
-            data = author_data[author]
+            data = self.author_data[author]
             product_commits = len(author_events)
             data["commits"] += product_commits
             data["additions"] += sum(e.additions or 0 for e in author_events)
@@ -217,7 +358,7 @@ async def get_team_activity(
 
             today = datetime.now(UTC).date()
             product_daily = []
-            for i in range(days - 1, -1, -1):
+            for i in range(self.days - 1, -1, -1):
                 d = today - timedelta(days=i)
                 ds = d.strftime("%Y-%m-%d")
                 product_daily.append({"date": ds, "commits": daily_counts.get(ds, 0)})
@@ -249,14 +390,14 @@ async def get_team_activity(
                     )
                 )
 
-    # 4. Build final stats per contributor
-    contributor_stats: dict[
-        str, tuple[TeamMemberStats, list[TeamMemberRecentCommit], str | None, str | None]
-    ] = {}
+        return list(product_authors)
+
+    def contributor(self, author: str) -> TeamMember:
+        """Current team member entry for a contributor, matched to an org member."""
+        data = self.author_data[author]
 
-    for author, data in author_data.items():
         # Merge daily activity
-        merged_daily = _merge_daily_activity(data["daily_activities"], days)
+        merged_daily = _merge_daily_activity(data["daily_activities"], self.days)
         streak = _compute_streak(merged_daily)
 
         # Top focus areas
@@ -264,7 +405,9 @@ async def get_team_activity(
         focus_areas = [area for area, _ in focus_sorted[:5]]
 
         # Sort recent commits by timestamp, take top 10
-        all_recent = sorted(data["recent_commits"], key=lambda c: c.timestamp, reverse=True)[:10]
+        recent_commits = sorted(data["recent_commits"], key=lambda c: c.timestamp, reverse=True)[
+            :10
+        ]
 
         stats = TeamMemberStats(
             commits=data["commits"],
@@ -275,120 +418,98 @@ async def get_team_activity(
             streak_days=streak,
             daily_activity=merged_daily,
             focus_areas=focus_areas,
-            products=data["products"],
+            products=list(data["products"]),
         )
-        contributor_stats[author] = (stats, all_recent, data["avatar_url"], data["github_login"])
 
-    # 5. Fetch org members and join with contributor data
-    org_members = await org_member_ops.get_by_org(db, org_id)
+        if author not in self._matches:
+            self._matches[author] = _match_contributor_to_member(author, self.member_map)
+        matched = self._matches[author]
 
-    # Build member lookup: user_id -> member info
-    member_map: dict[str, dict[str, Any]] = {}
-    for m in org_members:
-        uid = str(m.user_id)
-        member_map[uid] = {
-            "user_id": uid,
-            "display_name": m.user.display_name if m.user else None,
-            "email": m.user.email if m.user else None,
-            "avatar_url": m.user.avatar_url if m.user else None,
-            "role": m.role,
-            "joined_at": m.joined_at.isoformat() if m.joined_at else None,
-            "github_username": m.user.github_username if m.user else None,
-            "has_signed_in": (m.user.onboarding_completed_at is not None if m.user else False),
-        }
-
-    # 6. Match contributors to org members
-    matched_member_ids: set[str] = set()
-    team_members: list[TeamMember] = []
-
-    for author, (stats, recent_commits, avatar_url, github_login) in contributor_stats.items():
-        matched = _match_contributor_to_member(author, member_map)
         if matched:
-            uid = matched["user_id"]
             gh_username = matched.get("github_username")
-            matched_member_ids.add(uid)
+            return TeamMember(
+                user_id=matched["user_id"],
+                display_name=matched["display_name"] or author,
+                email=matched["email"],
+                avatar_url=matched["avatar_url"] or data["avatar_url"],
+                role=matched["role"],
+                joined_at=matched["joined_at"],
+                status="active",
+                stats=stats,
+                recent_commits=recent_commits,
+                github_username=gh_username,
+                github_author=None,
+                is_linked=bool(gh_username),
+            )
+
+        # External contributor (not an org member)
+        return TeamMember(
+            user_id=None,
+            display_name=author,
+            email=None,
+            avatar_url=data["avatar_url"],
+            role=None,
+            joined_at=None,
+            status="active",
+            stats=stats,
+            recent_commits=recent_commits,
+            github_username=data["github_login"],
+            github_author=author,
+            is_linked=False,
+        )
+
+    def response(self, sort: str) -> TeamActivityResponse:
+        """Build the full response: contributors, idle/pending members and aggregate."""
+        team_members = [self.contributor(author) for author in self.author_data]
+        matched_member_ids = {m.user_id for m in team_members if m.user_id}
+
+        # Add idle/pending org members (no matching contributor data)
+        for uid, member in self.member_map.items():
+            if uid in matched_member_ids:
+                continue
+
+            member_status = "pending" if not member["has_signed_in"] else "idle"
+            gh_username = member.get("github_username")
+
             team_members.append(
                 TeamMember(
                     user_id=uid,
-                    display_name=matched["display_name"] or author,
-                    email=matched["email"],
-                    avatar_url=matched["avatar_url"] or avatar_url,
-                    role=matched["role"],
-                    joined_at=matched["joined_at"],
-                    status="active",
-                    stats=stats,
-                    recent_commits=recent_commits,
+                    display_name=member["display_name"] or member["email"] or "Unknown",
+                    email=member["email"],
+                    avatar_url=member["avatar_url"],
+                    role=member["role"],
+                    joined_at=member["joined_at"],
+                    status=member_status,
+                    stats=None,
+                    recent_commits=[],
                     github_username=gh_username,
                     github_author=None,
                     is_linked=bool(gh_username),
                 )
             )
-        else:
-            # External contributor (not an org member)
-            team_members.append(
-                TeamMember(
-                    user_id=None,
-                    display_name=author,
-                    email=None,
-                    avatar_url=avatar_url,
-                    role=None,
-                    joined_at=None,
-                    status="active",
-                    stats=stats,
-                    recent_commits=recent_commits,
-                    github_username=github_login,
-                    github_author=author,
-                    is_linked=False,
-                )
-            )
 
-    # 7. Add idle/pending org members (no matching contributor data)
-    for uid, member in member_map.items():
-        if uid in matched_member_ids:
-            continue
-
-        member_status = "pending" if not member["has_signed_in"] else "idle"
-        gh_username = member.get("github_username")
-
-        team_members.append(
-            TeamMember(
-                user_id=uid,
-                display_name=member["display_name"] or member["email"] or "Unknown",
-                email=member["email"],
-                avatar_url=member["avatar_url"],
-                role=member["role"],
-                joined_at=member["joined_at"],
-                status=member_status,
-                stats=None,
-                recent_commits=[],
-                github_username=gh_username,
-                github_author=None,
-                is_linked=bool(gh_username),
-            )
+        # Sort
+        team_members = _sort_members(team_members, sort)
+
+        # Compute aggregate
+        active_count = sum(1 for m in team_members if m.status == "active")
+        total_commits = sum(m.stats.commits for m in team_members if m.stats)
+        total_additions = sum(m.stats.additions for m in team_members if m.stats)
+        total_deletions = sum(m.stats.deletions for m in team_members if m.stats)
+
+        aggregate = TeamActivityAggregate(
+            active_contributors=active_count,
+            total_commits=total_commits,
+            total_additions=total_additions,
+            total_deletions=total_deletions,
+            products_touched=len(self.products_with_activity),
         )
 
-    # 8. Sort
-    team_members = _sort_members(team_members, sort)
-
-    # 9. Compute aggregate
-    active_count = sum(1 for m in team_members if m.status == "active")
-    total_commits = sum(m.stats.commits for m in team_members if m.stats)
-    total_additions = sum(m.stats.additions for m in team_members if m.stats)
-    total_deletions = sum(m.stats.deletions for m in team_members if m.stats)
-
-    aggregate = TeamActivityAggregate(
-        active_contributors=active_count,
-        total_commits=total_commits,
-        total_additions=total_additions,
-        total_deletions=total_deletions,
-        products_touched=len(products_with_activity),
-    )
-
-    return TeamActivityResponse(
-        period_days=days,
-        aggregate=aggregate,
-        members=team_members,
-    )
+        return TeamActivityResponse(
+            period_days=self.days,
+            aggregate=aggregate,
+            members=team_members,
+        )
 
 
 def _sort_members(members: list[TeamMember], sort: str) -> list[TeamMember]:
@@ -4,7 +4,6 @@ Generates and caches per-contributor AI narratives for the team page,
 using the existing ContributorSummarizer with org-wide commits.
 """
 
-import asyncio
 import logging
 import uuid as uuid_pkg
 from collections import defaultdict
@@ -19,8 +18,11 @@ from app.api.deps import get_current_user
 from app.api.v1.organizations.helpers import require_org_access
 from app.api.v1.progress.commit_fetcher import fetch_commit_stats, fetch_product_commits
 from app.core.database import direct_session_maker, get_direct_db
+from app.core.fanout import fan_out
 from app.domain import product_ops, team_contributor_summary_ops
 from app.models.user import User
+from app.services.github import background_github_work
+from app.services.jobs import enqueue_job, job_handler
 from app.services.progress.summarizer import (
     ContributorCommitData,
     ContributorInput,
@@ -29,6 +31,14 @@ from app.services.progress.summarizer import (
 
 logger = logging.getLogger(__name__)
 
+# Products fetched at once, each holding its own pooled session
+MAX_CONCURRENT_PRODUCT_FETCHES = 5
+
+# Time budget for one product's commits and stats
+PRODUCT_FETCH_TIMEOUT_SECONDS = 30.0
+
+TEAM_SUMMARIES_JOB = "team_summaries_regeneration"
+
 # ---------------------------------------------------------------------------
 # Response schemas
 # ---------------------------------------------------------------------------
@@ -50,12 +60,6 @@ class TeamSummariesResponse(BaseModel):
     is_generating: bool
 
 
-# ---------------------------------------------------------------------------
-# In-memory lock to prevent concurrent regeneration
-# ---------------------------------------------------------------------------
-
-_regeneration_locks: dict[str, bool] = {}
-
 # ---------------------------------------------------------------------------
 # Endpoint
 # ---------------------------------------------------------------------------
@@ -88,7 +92,7 @@ async def get_team_summaries(
 
         if age_hours < 48:
             # Stale — serve cached, trigger background regeneration
-            _trigger_background_regeneration(org_id, period, user)
+            await _trigger_background_regeneration(org_id, period, user)
             return _build_response(cached, is_stale=True, is_generating=False)
 
         # Expired — regenerate synchronously (treat as cache miss)
@@ -103,46 +107,47 @@ async def get_team_summaries(
 # ---------------------------------------------------------------------------
 
 
-def _trigger_background_regeneration(org_id: uuid_pkg.UUID, period: str, user: User) -> None:
-    """Fire-and-forget background regeneration."""
-    lock_key = f"{org_id}:{period}"
-    if _regeneration_locks.get(lock_key):
-        return
-    # Set lock BEFORE spawning the task to prevent TOCTOU race
-    _regeneration_locks[lock_key] = True
-    asyncio.create_task(_background_regenerate(org_id, period, user.id))
+async def _trigger_background_regeneration(org_id: uuid_pkg.UUID, period: str, user: User) -> None:
+    """Queue background regeneration (at most one pending per org and period)."""
+    try:
+        await enqueue_job(
+            TEAM_SUMMARIES_JOB,
+            {"org_id": str(org_id), "period": period, "user_id": str(user.id)},
+            dedupe_key=f"{TEAM_SUMMARIES_JOB}:{org_id}:{period}",
+        )
+    except Exception:
+        # The stale summaries are still served; the next request retries
+        logger.exception(f"Failed to queue summary regeneration for org {org_id}")
 
 
-async def _background_regenerate(
-    org_id: uuid_pkg.UUID, period: str, user_id: uuid_pkg.UUID
-) -> None:
-    """Background task: regenerate summaries with a fresh DB session.
+@job_handler(TEAM_SUMMARIES_JOB, concurrency=2)
+@background_github_work
+async def _background_regenerate(org_id: str, period: str, user_id: str) -> None:
+    """Background job: regenerate summaries with a fresh DB session.
 
-    Accepts user_id (a plain UUID) instead of a User ORM object to avoid
-    DetachedInstanceError — the request session that loaded the User closes
-    before this coroutine runs.
+    Accepts user_id instead of a User ORM object: the job runs on a worker,
+    after the request session that loaded the User is closed.
     """
-    lock_key = f"{org_id}:{period}"
-    try:
-        async with direct_session_maker() as session:
-            try:
-                # Re-fetch user in this session's scope
-                from sqlalchemy import select
-
-                from app.models.user import User as UserModel
-
-                result = await session.execute(select(UserModel).where(UserModel.id == user_id))
-                user = result.scalars().first()
-                if not user:
-                    logger.error(f"Background regen: user {user_id} not found")
-                    return
-                await _generate_team_summaries(session, org_id, period, user)
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                logger.exception(f"Background summary regeneration failed for org {org_id}")
-    finally:
-        _regeneration_locks.pop(lock_key, None)
+    async with direct_session_maker() as session:
+        try:
+            # Re-fetch user in this session's scope
+            from sqlalchemy import select
+
+            from app.models.user import User as UserModel
+
+            result = await session.execute(
+                select(UserModel).where(UserModel.id == uuid_pkg.UUID(user_id))
+            )
+            user = result.scalars().first()
+            if not user:
+                logger.error(f"Background regen: user {user_id} not found")
+                return
+            await _generate_team_summaries(session, uuid_pkg.UUID(org_id), period, user)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            logger.exception(f"Background summary regeneration failed for org {org_id}")
+            raise
 
 
 # ---------------------------------------------------------------------------
@@ -170,37 +175,46 @@ async def _generate_team_summaries(
             is_generating=False,
         )
 
-    # 2. Fetch commits across all products in parallel
-    async def fetch_for_product(product: Any) -> list[dict[str, Any]]:
-        try:
-            result = await fetch_product_commits(
-                db=db,
-                product_id=product.id,
-                current_user=user,
-                period=period,
-                fetch_limit=200,
-            )
-            if not result:
-                return []
-            events = await fetch_commit_stats(db, result.github, result.repos, result.events)
-            return [
-                {
-                    "author": e.commit_author,
-                    "message": e.commit_message,
-                    "sha": e.commit_sha[:7],
-                    "branch": "",
-                    "timestamp": e.timestamp,
-                    "additions": e.additions or 0,
-                    "deletions": e.deletions or 0,
-                    "product_name": product.name or "Unknown",
-                }
-                for e in events
-            ]
-        except Exception:
-            logger.exception(f"Failed to fetch commits for product {product.id}")
+    # 2. Fetch commits across all products in parallel, one session each
+    async def fetch_for_product(session: AsyncSession, product: Any) -> list[dict[str, Any]]:
+        result = await fetch_product_commits(
+            db=session,
+            product_id=product.id,
+            current_user=user,
+            period=period,
+        )
+        if not result:
             return []
-
-    all_results = [await fetch_for_product(p) for p in products]
+        events = await fetch_commit_stats(session, result.github, result.repos, result.events)
+        return [
+            {
+                "author": e.commit_author,
+                "message": e.commit_message,
+                "sha": e.commit_sha[:7],
+                "branch": "",
+                "timestamp": e.timestamp,
+                "additions": e.additions or 0,
+                "deletions": e.deletions or 0,
+                "product_name": product.name or "Unknown",
+            }
+            for e in events
+        ]
+
+    all_results: list[list[dict[str, Any]]] = []
+    for outcome in await fan_out(
+        products,
+        fetch_for_product,
+        user_id=user.id,
+        max_concurrency=MAX_CONCURRENT_PRODUCT_FETCHES,
+        timeout=PRODUCT_FETCH_TIMEOUT_SECONDS,
+    ):
+        if outcome.timed_out:
+            logger.warning(f"Commit fetch for product {outcome.item.id} timed out")
+        elif outcome.error is not None:
+            logger.warning(
+                f"Failed to fetch commits for product {outcome.item.id}: {outcome.error}"
+            )
+        all_results.append(outcome.value or [])
 
     # 3. Group commits by author
     commits_by_author: dict[str, list[dict[str, Any]]] = defaultdict(list)
@@ -1,11 +1,10 @@
 """Product analysis: AI-powered repository analysis."""
 
-import asyncio
 import logging
 import uuid as uuid_pkg
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
@@ -24,7 +23,7 @@ from app.domain.subscription_operations import subscription_ops
 from app.models.product import Product
 from app.models.user import User
 from app.schemas.product_overview import AnalyzeProductResponse
-from app.services.analysis import run_analysis_task
+from app.services.analysis import enqueue_analysis
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +40,6 @@ ANALYSIS_FREQUENCY_LIMITS = {
 @router.post("/{product_id}/analyze", response_model=AnalyzeProductResponse)
 async def analyze_product(
     product_id: uuid_pkg.UUID,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_with_rls),
 ) -> AnalyzeProductResponse:
@@ -133,15 +131,11 @@ async def analyze_product(
         else:
             logger.warning(f"Product {product_id} not found during status update")
 
-    # Dispatch background task
-    # Note: run_analysis_task creates its own database session since
-    # FastAPI's request session is closed by the time background tasks run.
+    # Queue the analysis job
+    # Note: run_analysis_task creates its own database session since it runs
+    # on a job worker, after this request's session is closed.
     # Security: GitHub token is fetched inside the task, not passed as param.
-    background_tasks.add_task(
-        run_analysis_task,
-        product_id=str(product.id),
-        user_id=str(current_user.id),
-    )
+    await enqueue_analysis(product.id, current_user.id)
 
     return AnalyzeProductResponse(
         status="analyzing",
@@ -195,13 +189,7 @@ async def maybe_auto_trigger_analysis(
             logger.warning(f"Product {product_id} not found during analysis auto-trigger")
             return False
 
-    # 5. Start as independent async task (runs concurrently with docs generation)
-    asyncio.create_task(
-        run_analysis_task(
-            product_id=str(product_id),
-            user_id=str(user_id),
-        ),
-        name=f"analysis-{product_id}",
-    )
+    # 5. Queue the analysis job (runs concurrently with docs generation)
+    await enqueue_analysis(product_id, user_id)
 
     return True
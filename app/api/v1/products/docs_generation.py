@@ -5,7 +5,7 @@ import logging
 import uuid as uuid_pkg
 from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
@@ -20,7 +20,9 @@ from app.domain.preferences_operations import preferences_ops
 from app.domain.product_access_operations import product_access_ops
 from app.models.user import User
 from app.schemas.docs import DocsStatusResponse, GenerateDocsRequest, GenerateDocsResponse
+from app.services.github import background_github_work
 from app.services.github.app_auth import github_app_auth
+from app.services.jobs import enqueue_job, job_handler
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -28,6 +30,8 @@ logger = logging.getLogger(__name__)
 # Stale job detection: mark as failed if generating for longer than this
 DOCS_GENERATION_TIMEOUT_MINUTES = 15
 
+DOCS_GENERATION_JOB = "docs_generation"
+
 
 async def _has_github_access(
     db: AsyncSession,
@@ -64,7 +68,6 @@ async def _has_github_access(
 @router.post("/{product_id}/generate-docs", response_model=GenerateDocsResponse)
 async def generate_documentation(
     product_id: uuid_pkg.UUID,
-    background_tasks: BackgroundTasks,
     request: GenerateDocsRequest | None = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_with_rls),
@@ -79,7 +82,7 @@ async def generate_documentation(
             - mode="full": Regenerate all documentation from scratch (default)
             - mode="additive": Only add new docs, preserve existing
 
-    Runs as a background task with progress updates. Poll GET /products/{id}/docs-status
+    Runs as a queued background job with progress updates. Poll GET /products/{id}/docs-status
     for real-time progress.
     """
     await check_product_editor_access(db, product_id, current_user.id)
@@ -112,13 +115,8 @@ async def generate_documentation(
     db.add(product)
     await db.commit()
 
-    # Start background task
-    background_tasks.add_task(
-        run_document_orchestrator,
-        product_id=str(product.id),
-        user_id=str(current_user.id),
-        mode=mode,
-    )
+    # Queue the generation job
+    await enqueue_docs_generation(product.id, current_user.id, mode)
 
     return GenerateDocsResponse(
         status="started",
@@ -401,19 +399,27 @@ async def maybe_auto_trigger_docs(
             logger.warning(f"Product {product_id} not found during docs auto-trigger")
             return False
 
-    # 5. Start as independent async task (runs concurrently with analysis)
-    asyncio.create_task(
-        run_document_orchestrator(
-            product_id=str(product_id),
-            user_id=str(user_id),
-            mode="additive",
-        ),
-        name=f"docs-gen-{product_id}",
-    )
+    # 5. Queue the generation job (runs concurrently with analysis)
+    await enqueue_docs_generation(product_id, user_id, "additive")
 
     return True
 
 
+async def enqueue_docs_generation(
+    product_id: uuid_pkg.UUID,
+    user_id: uuid_pkg.UUID,
+    mode: str,
+) -> None:
+    """Queue documentation generation for a product (at most one pending per product)."""
+    await enqueue_job(
+        DOCS_GENERATION_JOB,
+        {"product_id": str(product_id), "user_id": str(user_id), "mode": mode},
+        dedupe_key=f"{DOCS_GENERATION_JOB}:{product_id}",
+    )
+
+
+@job_handler(DOCS_GENERATION_JOB, concurrency=2, visibility_timeout_seconds=300, max_attempts=2)
+@background_github_work
 async def run_document_orchestrator(
     product_id: str,
     user_id: str,
@@ -7,12 +7,14 @@ This package provides the Progress tab functionality including:
 - Active code visualization
 - Velocity charts
 - Dashboard aggregation
+- Bundled sections computed from one commit set
 """
 
 from fastapi import APIRouter
 
 from .active_code import router as active_code_router
 from .ai_summary import router as ai_summary_router
+from .bundle import router as bundle_router
 from .commit_fetcher import MAX_CONCURRENT_STAT_FETCHES
 from .contributors import router as contributors_router
 from .dashboard import router as dashboard_router
@@ -34,6 +36,7 @@ router.include_router(active_code_router)
 router.include_router(velocity_router)
 router.include_router(leaderboard_router)
 router.include_router(dashboard_router)
+router.include_router(bundle_router)
 
 __all__ = [
     "router",
@@ -0,0 +1,102 @@
+"""Daily activity loading for Progress API analytics.
+
+Analytics that only need per-author, per-day totals (leaderboard, velocity)
+work on DailyAuthorActivity rows. When every repository in scope is kept
+current by the commit sync worker, the rows come straight from the
+commit_activity_daily rollup in one indexed query; otherwise the endpoint
+fetches commits as before and rolls them up in memory with rollup_events().
+"""
+
+import uuid as uuid_pkg
+from collections import defaultdict
+from datetime import UTC, datetime, time, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain import commit_activity_daily_ops, repository_ops
+from app.services.github.timeline_types import TimelineEvent
+from app.services.progress.commit_sync import covered_repositories
+
+from .event_columns import EventColumns
+from .types import DailyAuthorActivity
+from .utils import get_period_days
+
+# Shorter periods are measured in hours, not whole days, so they read commits
+ROLLUP_MIN_DAYS = 7
+
+
+def period_first_day(period: str) -> str:
+    """First UTC day (YYYY-MM-DD) of a period measured in whole days, ending today."""
+    today = datetime.now(UTC).date()
+    return (today - timedelta(days=get_period_days(period) - 1)).isoformat()
+
+
+async def fetch_product_activity(
+    db: AsyncSession,
+    product_id: uuid_pkg.UUID,
+    period: str,
+    repo_ids: str | None = None,
+) -> list[DailyAuthorActivity] | None:
+    """Read a product's daily activity from the rollup.
+
+    Args:
+        db: Database session
+        product_id: Product UUID
+        period: Time period string; covered as whole UTC days ending today
+        repo_ids: Optional comma-separated repository IDs to filter
+
+    Returns:
+        Activity rows oldest day first, or None when the rollup cannot answer
+        (period too short, or a repository not fully synced for the window).
+    """
+    if get_period_days(period) < ROLLUP_MIN_DAYS:
+        return None
+
+    repos = await repository_ops.get_github_repos_by_product(db, product_id=product_id)
+    if repo_ids:
+        filter_ids = set(repo_ids.split(","))
+        repos = [r for r in repos if str(r.id) in filter_ids]
+
+    repos_by_name = {r.full_name: r for r in repos if r.full_name}
+    if not repos_by_name:
+        return None
+
+    first_day = datetime.fromisoformat(period_first_day(period)).date()
+    since = datetime.combine(first_day, time.min, tzinfo=UTC)
+    covered = await covered_repositories(db, list(repos_by_name), since)
+    if len(covered) < len(repos_by_name):
+        return None
+
+    rows = await commit_activity_daily_ops.get_in_window(db, list(repos_by_name), first_day)
+    return [
+        DailyAuthorActivity(
+            repository_name=repos_by_name[row.repository_full_name].name or "",
+            repository_full_name=row.repository_full_name,
+            author=row.author_name,
+            avatar_url=row.author_avatar_url,
+            date=row.day.isoformat(),
+            commits=row.commits,
+            additions=row.additions,
+            deletions=row.deletions,
+            files_changed=row.files_changed,
+        )
+        for row in rows
+    ]
+
+
+def rollup_events(events: list[TimelineEvent]) -> list[DailyAuthorActivity]:
+    """Aggregate commit events into daily per-author activity rows.
+
+    Rows are oldest day first and keep the avatar of the author's newest
+    commit that day.
+    """
+    return EventColumns.from_events(events).rollup()
+
+
+def latest_avatars(activity: list[DailyAuthorActivity]) -> dict[str, str | None]:
+    """Most recent known avatar URL per author."""
+    avatars: dict[str, str | None] = defaultdict(lambda: None)
+    for row in sorted(activity, key=lambda r: r.date):
+        if row.avatar_url:
+            avatars[row.author] = row.avatar_url
+    return avatars
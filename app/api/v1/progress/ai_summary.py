@@ -15,7 +15,8 @@ from app.api.deps import (
 )
 from app.models import User
 
-from .commit_fetcher import fetch_commit_stats, fetch_product_commits
+from .commit_fetcher import fetch_commit_stats
+from .commit_window import product_commit_window
 from .summary import _compute_summary
 
 router = APIRouter()
@@ -78,14 +79,12 @@ async def generate_ai_summary(
     from app.domain import progress_summary_ops
     from app.services.progress.summarizer import ProgressData, progress_summarizer
 
-    # Fetch commits using consolidated fetcher
-    result = await fetch_product_commits(
-        db=db,
+    # Fetch commits from the product's shared commit window
+    result = await product_commit_window.fetch(
         product_id=product_id,
         current_user=current_user,
         period=period,
         repo_ids=repo_ids,
-        fetch_limit=200,
     )
 
     if not result:
@@ -0,0 +1,151 @@
+"""Progress API: Bundle endpoint.
+
+Returns several Progress tab sections in one response, computed from a single
+set of commits. The commits are taken from the product's shared commit window
+and enriched with stats once, instead of once per endpoint.
+"""
+
+import uuid as uuid_pkg
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import (
+    ProductAccessContext,
+    get_current_user,
+    get_db_with_rls,
+    get_product_access,
+)
+from app.models import User
+
+from .active_code import _compute_active_code, _empty_active_code_response, _fetch_file_activity
+from .activity_fetcher import rollup_events
+from .commit_fetcher import fetch_commit_stats
+from .commit_window import product_commit_window
+from .contributors import _contributors_response, _empty_contributors_response
+from .leaderboard import VALID_RANK_BY, _leaderboard_response
+from .response_cache import progress_response_cache
+from .summary import _compute_summary, _empty_summary_response
+from .utils import get_period_start
+from .velocity import _compute_velocity, _empty_velocity_response
+
+router = APIRouter()
+
+BUNDLE_SECTIONS = ("summary", "contributors", "leaderboard", "velocity", "active_code")
+
+# Sections that need additions/deletions/files on each commit
+_STATS_SECTIONS = {"summary", "contributors", "leaderboard", "velocity"}
+
+
+def parse_sections(sections: str | None) -> list[str]:
+    """Parse a comma-separated section list, defaulting to every section.
+
+    Raises:
+        HTTPException: 400 if a section name is unknown
+    """
+    if not sections:
+        return list(BUNDLE_SECTIONS)
+
+    requested = [s.strip() for s in sections.split(",") if s.strip()]
+    unknown = [s for s in requested if s not in BUNDLE_SECTIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown sections: {', '.join(unknown)}. "
+            f"Valid sections: {', '.join(BUNDLE_SECTIONS)}",
+        )
+    return [s for s in BUNDLE_SECTIONS if s in requested]
+
+
+@router.get("/products/{product_id}/bundle")
+@progress_response_cache.cached("bundle", ("period", "repo_ids", "sections", "sort_by", "rank_by"))
+async def get_progress_bundle(
+    product_id: uuid_pkg.UUID,
+    period: str = Query("7d", description="Time period: 24h, 48h, 7d, 14d, 30d, 90d, 365d"),
+    repo_ids: str | None = Query(None, description="Comma-separated repository IDs to filter"),
+    sections: str | None = Query(
+        None,
+        description="Comma-separated sections: summary, contributors, leaderboard, "
+        "velocity, active_code (default: all)",
+    ),
+    sort_by: str = Query(
+        "commits", description="Contributors sort: commits, additions, last_active"
+    ),
+    rank_by: str = Query(
+        "commits", description="Leaderboard rank: commits, additions, active_days, files_changed"
+    ),
+    _access_ctx: ProductAccessContext = Depends(get_product_access),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_with_rls),
+) -> dict[str, Any]:
+    """Get several Progress sections for a product in one request.
+
+    Each section has the same shape as the response of its own endpoint
+    (`/summary`, `/contributors`, `/leaderboard`, `/velocity`, `/active-code`)
+    for the same period; only the requested sections are computed and returned.
+    """
+    selected = parse_sections(sections)
+    if rank_by not in VALID_RANK_BY:
+        rank_by = "commits"
+
+    # Current and comparison commits, from the product's shared commit window
+    result = await product_commit_window.fetch(
+        product_id=product_id,
+        current_user=current_user,
+        period=period,
+        repo_ids=repo_ids,
+        extended=True,
+    )
+
+    if not result:
+        return {section: _empty_section(section, period, rank_by) for section in selected}
+
+    # Enrich once: the comparison period only matters for velocity's totals
+    period_start_str = get_period_start(period).strftime("%Y-%m-%dT%H:%M:%SZ")
+    all_events = result.events
+    current = [e for e in all_events if e.timestamp >= period_start_str]
+
+    if _STATS_SECTIONS.intersection(selected):
+        to_enrich = all_events if "velocity" in selected else current
+        await fetch_commit_stats(db, result.github, result.repos, to_enrich)
+
+    bundle: dict[str, Any] = {}
+    for section in selected:
+        if section == "summary":
+            bundle[section] = (
+                _compute_summary(list(current), all_events, period)
+                if current
+                else _empty_summary_response(period)
+            )
+        elif section == "contributors":
+            bundle[section] = (
+                _contributors_response(current, period, sort_by)
+                if current
+                else _empty_contributors_response()
+            )
+        elif section == "leaderboard":
+            bundle[section] = _leaderboard_response(rollup_events(current), period, rank_by)
+        elif section == "velocity":
+            previous = [e for e in all_events if e.timestamp < period_start_str]
+            bundle[section] = _compute_velocity(
+                rollup_events(current), rollup_events(previous), period
+            )
+        elif section == "active_code":
+            file_activity = await _fetch_file_activity(db, result.github, current)
+            bundle[section] = _compute_active_code(file_activity)
+
+    return bundle
+
+
+def _empty_section(section: str, period: str, rank_by: str) -> dict[str, Any]:
+    """Return the empty response of a section's own endpoint."""
+    if section == "summary":
+        return _empty_summary_response(period)
+    if section == "contributors":
+        return _empty_contributors_response()
+    if section == "leaderboard":
+        return _leaderboard_response([], period, rank_by)
+    if section == "velocity":
+        return _empty_velocity_response()
+    return _empty_active_code_response()
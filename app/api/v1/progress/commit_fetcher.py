@@ -2,6 +2,8 @@
 
 This module contains the shared logic for fetching commits from GitHub
 repositories, handling renames, and converting to TimelineEvent objects.
+Repositories kept current by the commit sync worker are read from the local
+commit store instead.
 It eliminates the ~150-line pattern that was duplicated across 7 endpoints.
 """
 
@@ -13,12 +15,19 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain import commit_stats_cache_ops, repository_ops
+from app.domain import (
+    commit_file_cache_ops,
+    commit_stats_cache_ops,
+    repository_commit_ops,
+    repository_ops,
+)
 from app.models import User
 from app.models.repository import Repository
 from app.services.github import GitHubReadOperations
 from app.services.github.exceptions import GitHubRepoRenamed
 from app.services.github.timeline_types import TimelineEvent
+from app.services.progress.commit_store import api_commit_from_row
+from app.services.progress.commit_sync import covered_repositories
 
 from .utils import get_period_start, handle_repo_rename, resolve_github_token
 
@@ -27,6 +36,9 @@ logger = logging.getLogger(__name__)
 # Concurrency limit for fetching commit stats
 MAX_CONCURRENT_STAT_FETCHES = 10
 
+# Safety cap on commits read per repository for one window (50 pages)
+MAX_WINDOW_COMMITS = 5000
+
 
 @dataclass
 class FetchResult:
@@ -43,7 +55,7 @@ async def fetch_product_commits(
     current_user: User,
     period: str,
     repo_ids: str | None = None,
-    fetch_limit: int = 200,
+    fetch_limit: int = MAX_WINDOW_COMMITS,
     extended_period: str | None = None,
 ) -> FetchResult | None:
     """Fetch commits for a product with full rename handling.
@@ -57,7 +69,7 @@ async def fetch_product_commits(
         current_user: Current authenticated user
         period: Time period string (e.g., "7d", "30d")
         repo_ids: Optional comma-separated repository IDs to filter
-        fetch_limit: Maximum commits to fetch per repository
+        fetch_limit: Safety cap on commits fetched per repository
         extended_period: If provided, use this period for date filtering
                         (useful for velocity comparison data)
 
@@ -86,8 +98,16 @@ async def fetch_product_commits(
     period_start = get_period_start(filter_period)
     since_str = period_start.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    # 5. Fetch commits from all repos in parallel
+    # 5. Read repos kept current by the commit sync worker from the local store
     github = GitHubReadOperations(github_token)
+    repos_by_name = {r.full_name: r for r in repos if r.full_name}
+    covered = await covered_repositories(db, list(repos_by_name), period_start)
+    all_commits: list[tuple[Repository, dict[str, Any]]] = [
+        (repos_by_name[row.repository_full_name], api_commit_from_row(row))
+        for row in await repository_commit_ops.get_in_window(db, list(covered), period_start)
+    ]
+
+    # 6. Fetch commits from the remaining repos in parallel
 
     async def fetch_repo_commits(
         repo: Repository,
@@ -95,23 +115,25 @@ async def fetch_product_commits(
         if not repo.full_name:
             return []
         owner, name = repo.full_name.split("/")
-        commits, _ = await github.get_commits_for_timeline(
-            owner, name, repo.default_branch, per_page=fetch_limit
-        )
-        return [(repo, c) for c in commits]
+        return [
+            (repo, c)
+            async for c in github.iter_commits(
+                owner, name, repo.default_branch, since=since_str, max_commits=fetch_limit
+            )
+        ]
 
+    uncovered = [r for r in repos if r.full_name not in covered]
     results = await asyncio.gather(
-        *[fetch_repo_commits(r) for r in repos],
+        *[fetch_repo_commits(r) for r in uncovered],
         return_exceptions=True,
     )
 
-    # 6. Handle renames and flatten results
-    all_commits: list[tuple[Repository, dict[str, Any]]] = []
+    # 7. Handle renames and flatten results
     repos_to_retry: list[Repository] = []
 
     for i, result in enumerate(results):
         if isinstance(result, GitHubRepoRenamed):
-            repo = repos[i]
+            repo = uncovered[i]
             updated_repo = await handle_repo_rename(db, github, repo, result)
             if updated_repo:
                 repos_to_retry.append(updated_repo)
@@ -121,7 +143,7 @@ async def fetch_product_commits(
         else:
             all_commits.extend(result)
 
-    # 7. Retry renamed repos
+    # 8. Retry renamed repos
     if repos_to_retry:
         retry_results = await asyncio.gather(
             *[fetch_repo_commits(r) for r in repos_to_retry],
@@ -133,7 +155,7 @@ async def fetch_product_commits(
                 continue
             all_commits.extend(result)
 
-    # 8. Convert to TimelineEvent and filter by date
+    # 9. Convert to TimelineEvent and filter by date
     events: list[TimelineEvent] = []
     for repo, commit in all_commits:
         timestamp = commit["commit"]["committer"]["date"]
@@ -207,11 +229,36 @@ async def fetch_commit_stats(
         else:
             events_needing_fetch.append(event)
 
-    # Fetch missing stats from GitHub (with concurrency limit)
+    # Fetch missing stats from GitHub: GraphQL history first (100 commits per
+    # request), then per-commit REST for anything it could not resolve
     if events_needing_fetch:
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STAT_FETCHES)
         stats_to_cache: list[dict[str, str | int]] = []
 
+        def apply_stats(event: TimelineEvent, stats: dict[str, int]) -> None:
+            event.additions = stats["additions"]
+            event.deletions = stats["deletions"]
+            event.files_changed = stats["files_changed"]
+            stats_to_cache.append(
+                {
+                    "full_name": event.repository_full_name,
+                    "sha": event.commit_sha,
+                    "additions": stats["additions"],
+                    "deletions": stats["deletions"],
+                    "files_changed": stats["files_changed"],
+                }
+            )
+
+        history_stats = await _fetch_history_stats(github, repos, events_needing_fetch)
+        rest_events: list[TimelineEvent] = []
+        for event in events_needing_fetch:
+            stats = history_stats.get((event.repository_full_name, event.commit_sha))
+            if stats:
+                apply_stats(event, stats)
+            else:
+                rest_events.append(event)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STAT_FETCHES)
+
         async def fetch_and_cache_stats(event: TimelineEvent) -> None:
             repo_info = repo_map.get(event.repository_full_name)
             if not repo_info:
@@ -221,21 +268,10 @@ async def fetch_commit_stats(
             async with semaphore:
                 stats = await github.get_commit_detail(owner_name, repo_name, event.commit_sha)
                 if stats:
-                    event.additions = stats["additions"]
-                    event.deletions = stats["deletions"]
-                    event.files_changed = stats["files_changed"]
-                    stats_to_cache.append(
-                        {
-                            "full_name": event.repository_full_name,
-                            "sha": event.commit_sha,
-                            "additions": stats["additions"],
-                            "deletions": stats["deletions"],
-                            "files_changed": stats["files_changed"],
-                        }
-                    )
+                    apply_stats(event, stats)
 
         await asyncio.gather(
-            *[fetch_and_cache_stats(e) for e in events_needing_fetch],
+            *[fetch_and_cache_stats(e) for e in rest_events],
             return_exceptions=True,
         )
 
@@ -244,3 +280,101 @@ async def fetch_commit_stats(
             await commit_stats_cache_ops.bulk_upsert(db, stats_to_cache)
 
     return events
+
+
+async def fetch_commit_files(
+    db: AsyncSession,
+    github: GitHubReadOperations,
+    commits: list[tuple[str, str]],
+) -> dict[tuple[str, str], list[dict[str, Any]]]:
+    """Fetch the files changed by commits, with caching.
+
+    File lists are immutable per SHA, so they are read from the commit file
+    cache first and only cache misses are fetched from GitHub (one request
+    per commit) and written back.
+
+    Args:
+        db: Database session
+        github: GitHub client
+        commits: List of (repository_full_name, commit_sha) tuples
+
+    Returns:
+        Dict mapping (full_name, sha) -> list of file change dicts.
+        Commits whose files could not be fetched are not in the dict.
+    """
+    cached_files = await commit_file_cache_ops.get_bulk_by_repo_shas(db, commits)
+    missing = [key for key in dict.fromkeys(commits) if key not in cached_files]
+    if not missing:
+        return cached_files
+
+    fetched: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_STAT_FETCHES)
+
+    async def fetch_and_cache_files(full_name: str, sha: str) -> None:
+        if "/" not in full_name:
+            return
+        owner_name, repo_name = full_name.split("/", 1)
+
+        async with semaphore:
+            files = await github.get_commit_files(owner_name, repo_name, sha)
+            if files is not None:
+                fetched[(full_name, sha)] = files
+
+    await asyncio.gather(
+        *[fetch_and_cache_files(full_name, sha) for full_name, sha in missing],
+        return_exceptions=True,
+    )
+
+    # Bulk insert newly fetched file lists into cache
+    if fetched:
+        await commit_file_cache_ops.bulk_upsert(db, fetched)
+
+    return {**cached_files, **fetched}
+
+
+async def _fetch_history_stats(
+    github: GitHubReadOperations,
+    repos: list[Repository],
+    events: list[TimelineEvent],
+) -> dict[tuple[str, str], dict[str, int]]:
+    """Bulk-fetch commit stats per repository via the GraphQL history connection.
+
+    Walks each repo's default branch back to its oldest uncached commit.
+    Failures are logged and yield no stats, leaving those commits to the
+    REST fallback.
+
+    Returns:
+        Dict mapping (repository_full_name, commit_sha) to stats
+    """
+    repos_by_name = {r.full_name: r for r in repos if r.full_name}
+    events_by_repo: dict[str, list[TimelineEvent]] = {}
+    for event in events:
+        if event.repository_full_name in repos_by_name:
+            events_by_repo.setdefault(event.repository_full_name, []).append(event)
+
+    async def fetch_repo(
+        full_name: str, repo_events: list[TimelineEvent]
+    ) -> dict[str, dict[str, int]]:
+        owner_name, repo_name = full_name.split("/")
+        return await github.get_commit_history_stats(
+            owner_name,
+            repo_name,
+            repos_by_name[full_name].default_branch,
+            since=min(e.timestamp for e in repo_events),
+            shas={e.commit_sha for e in repo_events},
+        )
+
+    names = list(events_by_repo)
+    results = await asyncio.gather(
+        *[fetch_repo(name, events_by_repo[name]) for name in names],
+        return_exceptions=True,
+    )
+
+    history_stats: dict[tuple[str, str], dict[str, int]] = {}
+    for full_name, result in zip(names, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning(f"GraphQL commit history failed for {full_name}, using REST: {result}")
+            continue
+        for sha, stats in result.items():
+            history_stats[(full_name, sha)] = stats
+    return history_stats
@@ -0,0 +1,169 @@
+"""Shared product commit windows for the Progress API.
+
+Opening the Progress tab calls several endpoints at once (summary,
+contributors, leaderboard, velocity, active code), and each used to resolve
+repositories and a token and download the same commits on its own. Summary
+even fetched twice, once for the period and once for the comparison window.
+
+ProductCommitWindow fetches a product's commits once, over the widest window
+any of those endpoints needs for the selected period (the extended comparison
+period), keeps it for a short time per user and product, and hands out views
+sliced by period and repository. Concurrent requests for the same window
+share one fetch, which runs in its own session so it never depends on the
+request that happened to start it.
+"""
+
+import uuid as uuid_pkg
+from dataclasses import dataclass
+from datetime import datetime
+
+from cachetools import TTLCache
+
+from app.core.database import async_session_maker
+from app.core.rls import set_rls_user_context
+from app.models import User
+from app.services.github.cache import coalesce
+
+from .commit_fetcher import FetchResult, fetch_product_commits
+from .utils import get_extended_period, get_period_start
+
+# How long a fetched window is reused. Long enough to cover one page load
+# (all Progress tab requests), short enough that new pushes show up quickly.
+WINDOW_TTL_SECONDS = 60
+
+# Windows kept at once, across users and products
+MAX_CACHED_WINDOWS = 256
+
+
+@dataclass
+class CommitWindow:
+    """Commits for a product fetched from `since` up to the time of the fetch."""
+
+    since: datetime
+    result: FetchResult | None
+
+    def view(self, since: datetime, repo_ids: str | None = None) -> FetchResult | None:
+        """
+        Slice the window to commits at or after `since`, optionally for some repos.
+
+        Returns None when nothing is left, like fetch_product_commits. Events
+        are shared with the window, so stats filled in by one endpoint are
+        visible to the next.
+        """
+        if self.result is None:
+            return None
+
+        repos = self.result.repos
+        if repo_ids:
+            filter_ids = set(repo_ids.split(","))
+            repos = [r for r in repos if str(r.id) in filter_ids]
+
+        repo_keys = {str(r.id) for r in repos}
+        since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+        events = [
+            e
+            for e in self.result.events
+            if e.timestamp >= since_str and e.repository_id in repo_keys
+        ]
+        if not events:
+            return None
+
+        return FetchResult(events=events, repos=repos, github=self.result.github)
+
+
+class ProductCommitWindow:
+    """Per-user, per-product cache of commit windows with single-flight loads."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = WINDOW_TTL_SECONDS,
+        maxsize: int = MAX_CACHED_WINDOWS,
+    ) -> None:
+        self._windows: TTLCache[tuple[uuid_pkg.UUID, uuid_pkg.UUID], CommitWindow] = TTLCache(
+            maxsize=maxsize, ttl=ttl_seconds
+        )
+
+    async def fetch(
+        self,
+        product_id: uuid_pkg.UUID,
+        current_user: User,
+        period: str,
+        repo_ids: str | None = None,
+        extended: bool = False,
+    ) -> FetchResult | None:
+        """Get a product's commits for a period, from a shared window.
+
+        Replaces fetch_product_commits in request handlers. The window loaded
+        for `period` spans its extended comparison period, so asking for the
+        same period with `extended=True` (or for a shorter period) is served
+        from the same fetch.
+
+        The load is shared with concurrent requests and outlives the request
+        that started it if that one is cancelled, so it opens its own session
+        (with the user's RLS context) instead of using a request session.
+
+        Args:
+            product_id: Product UUID to fetch commits for
+            current_user: Current authenticated user (windows are per user,
+                since each user may resolve a different GitHub token)
+            period: Time period string (e.g., "7d", "30d")
+            repo_ids: Optional comma-separated repository IDs to filter
+            extended: Return the extended comparison period instead of `period`
+
+        Returns:
+            FetchResult with events, repos, and github client, or None if no data
+        """
+        view_period = get_extended_period(period) if extended else period
+        since = get_period_start(view_period)
+
+        window = await self._get_window(product_id, current_user, period, since)
+        return window.view(since, repo_ids)
+
+    async def _get_window(
+        self,
+        product_id: uuid_pkg.UUID,
+        current_user: User,
+        period: str,
+        since: datetime,
+    ) -> CommitWindow:
+        """Return a cached window reaching back to `since`, loading one if needed."""
+        key = (current_user.id, product_id)
+        cached = self._windows.get(key)
+        if cached is not None and cached.since <= since:
+            return cached
+
+        window_period = get_extended_period(period)
+
+        async def load() -> CommitWindow:
+            window_since = get_period_start(window_period)
+            async with async_session_maker() as session:
+                try:
+                    await set_rls_user_context(session, current_user.id)
+                    result = await fetch_product_commits(
+                        db=session,
+                        product_id=product_id,
+                        current_user=current_user,
+                        period=window_period,
+                    )
+                    # Keeps repository renames recorded during the fetch
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+            window = CommitWindow(since=window_since, result=result)
+
+            # Keep the wider of the two windows while the older one is still fresh
+            current = self._windows.get(key)
+            if current is None or window.since <= current.since:
+                self._windows[key] = window
+            return window
+
+        return await coalesce(f"commit-window:{current_user.id}:{product_id}:{window_period}", load)
+
+    def invalidate(self, product_id: uuid_pkg.UUID) -> None:
+        """Drop every user's window for a product, so the next fetch sees new commits."""
+        for key in [k for k in self._windows if k[1] == product_id]:
+            self._windows.pop(key, None)
+
+
+product_commit_window = ProductCommitWindow()
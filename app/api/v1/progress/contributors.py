@@ -1,8 +1,8 @@
 """Progress API: Contributors endpoint."""
 
 import uuid as uuid_pkg
-from collections import defaultdict
 from dataclasses import asdict
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query
@@ -17,14 +17,18 @@ from app.api.deps import (
 from app.models import User
 from app.services.github.timeline_types import TimelineEvent
 
-from .commit_fetcher import fetch_commit_stats, fetch_product_commits
+from .commit_fetcher import fetch_commit_stats
+from .commit_window import product_commit_window
+from .event_columns import EventColumns
+from .response_cache import progress_response_cache
 from .types import ContributorDetail, DayOfWeekEntry, HeatmapRow
-from .utils import generate_daily_activity, get_period_days
+from .utils import get_period_days
 
 router = APIRouter()
 
 
 @router.get("/products/{product_id}/contributors")
+@progress_response_cache.cached("contributors", ("period", "repo_ids", "sort_by"))
 async def get_progress_contributors(
     product_id: uuid_pkg.UUID,
     period: str = Query("7d", description="Time period: 24h, 48h, 7d, 14d, 30d, 90d, 365d"),
@@ -43,28 +47,35 @@ async def get_progress_contributors(
     - Activity sparkline (daily commits)
     - Recent commits (last 3)
     """
-    # Fetch commits using consolidated fetcher
-    result = await fetch_product_commits(
-        db=db,
+    # Fetch commits from the product's shared commit window
+    result = await product_commit_window.fetch(
         product_id=product_id,
         current_user=current_user,
         period=period,
         repo_ids=repo_ids,
-        fetch_limit=200,
     )
 
     if not result:
-        return {"contributors": [], "heatmap": {"rows": [], "dates": []}, "day_of_week_pattern": []}
+        return _empty_contributors_response()
 
     # Fetch commit stats for LOC calculation
     events = await fetch_commit_stats(db, result.github, result.repos, result.events)
 
-    # Compute per-contributor details
-    contributors = _compute_contributors(events, period, sort_by)
+    return _contributors_response(events, period, sort_by)
 
-    # Compute heatmap and day-of-week pattern
-    heatmap = _compute_heatmap(events, period)
-    day_of_week = _compute_day_of_week(events)
+
+def _contributors_response(
+    events: list[TimelineEvent], period: str, sort_by: str
+) -> dict[str, Any]:
+    """Build the contributors response from stats-enriched events."""
+    # Sort events by timestamp (newest first) for last_active and recent_commits
+    events.sort(key=lambda e: e.timestamp, reverse=True)
+    columns = EventColumns.from_events(events)
+
+    # Compute per-contributor details, heatmap and day-of-week pattern
+    contributors = _compute_contributors(events, columns, period, sort_by)
+    heatmap = _compute_heatmap(columns, period)
+    day_of_week = _compute_day_of_week(columns)
 
     return {
         "contributors": contributors,
@@ -74,46 +85,27 @@ async def get_progress_contributors(
 
 
 def _compute_contributors(
-    events: list[TimelineEvent], period: str, sort_by: str
+    events: list[TimelineEvent], columns: EventColumns, period: str, sort_by: str
 ) -> list[dict[str, Any]]:
-    """Compute detailed per-contributor statistics."""
-    # Sort events by timestamp (newest first) for last_active and recent_commits
-    events.sort(key=lambda e: e.timestamp, reverse=True)
+    """Compute detailed per-contributor statistics.
 
-    # Group events by author
-    author_events: dict[str, list[TimelineEvent]] = defaultdict(list)
-    for event in events:
-        author_events[event.commit_author].append(event)
+    `events` are sorted newest first and `columns` are built from them.
+    """
+    # Per-author totals and daily activity (sparkline), grouped by author code
+    commits = columns.author_totals()
+    additions = columns.author_totals(columns.additions)
+    deletions = columns.author_totals(columns.deletions)
+    files_changed = columns.author_totals(columns.files_changed)
+    dates = _period_dates(period)
+    daily_commits = columns.author_day_commits(date.fromisoformat(dates[0]), len(dates))
 
-    contributors: list[ContributorDetail] = []
+    # Focus areas (top 3 repositories for each author)
+    focus_areas = columns.author_top_repositories(3)
 
-    for author, author_commits in author_events.items():
-        # Basic stats
-        commits = len(author_commits)
-        additions = sum(e.additions or 0 for e in author_commits)
-        deletions = sum(e.deletions or 0 for e in author_commits)
-        files_changed = sum(e.files_changed or 0 for e in author_commits)
-
-        # Avatar (take from first commit)
-        avatar_url = author_commits[0].commit_author_avatar if author_commits else None
-
-        # Last active (already sorted newest first)
-        last_active = author_commits[0].timestamp if author_commits else ""
-
-        # Focus areas (top 3 repositories for this author)
-        repo_counts: dict[str, int] = defaultdict(int)
-        for event in author_commits:
-            repo_counts[event.repository_name] += 1
-        focus_areas = [
-            repo for repo, _ in sorted(repo_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        ]
+    contributors: list[ContributorDetail] = []
 
-        # Daily activity (sparkline)
-        daily_counts: dict[str, int] = defaultdict(int)
-        for event in author_commits:
-            date = event.timestamp.split("T")[0]
-            daily_counts[date] += 1
-        daily_activity = generate_daily_activity(daily_counts, period)
+    for author, indices in enumerate(columns.author_events()):
+        author_commits = [events[i] for i in indices[:3]]
 
         # Recent commits (last 3)
         recent_commits = [
@@ -124,20 +116,24 @@ def _compute_contributors(
                 "timestamp": e.timestamp,
                 "url": e.commit_url,
             }
-            for e in author_commits[:3]
+            for e in author_commits
         ]
 
         contributors.append(
             ContributorDetail(
-                author=author,
-                avatar_url=avatar_url,
-                commits=commits,
-                additions=additions,
-                deletions=deletions,
-                files_changed=files_changed,
-                last_active=last_active,
-                focus_areas=focus_areas,
-                daily_activity=daily_activity,
+                author=columns.authors[author],
+                # Avatar and last active from the newest commit
+                avatar_url=columns.author_avatars[author],
+                commits=commits[author],
+                additions=additions[author],
+                deletions=deletions[author],
+                files_changed=files_changed[author],
+                last_active=author_commits[0].timestamp,
+                focus_areas=focus_areas[author],
+                daily_activity=[
+                    {"date": d, "commits": c}
+                    for d, c in zip(dates, daily_commits[author], strict=True)
+                ],
                 recent_commits=recent_commits,
             )
         )
@@ -150,41 +146,41 @@ def _compute_contributors(
     else:  # Default: commits
         contributors.sort(key=lambda c: c.commits, reverse=True)
 
-    return [asdict(c) for c in contributors]
+    # Details are built fresh above, so a shallow conversion is enough
+    # (asdict would deep-copy every daily activity cell)
+    return [vars(c) for c in contributors]
 
 
-def _compute_heatmap(events: list[TimelineEvent], period: str) -> dict[str, Any]:
-    """Compute activity heatmap: contributors × dates grid."""
-    from datetime import UTC, datetime, timedelta
-
+def _period_dates(period: str) -> list[str]:
+    """All dates (YYYY-MM-DD) in a period, oldest first, ending today."""
     period_days = get_period_days(period)
-    today = datetime.now(UTC).date()
-    dates = [
-        (today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(period_days - 1, -1, -1)
-    ]
+    first_day = datetime.now(UTC).date() - timedelta(days=period_days - 1)
+    return [(first_day + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(period_days)]
 
-    # Group events by author → date → count
-    author_date_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    author_totals: dict[str, int] = defaultdict(int)
-    author_avatars: dict[str, str | None] = {}
 
-    for event in events:
-        author = event.commit_author
-        date = event.timestamp.split("T")[0]
-        author_date_counts[author][date] += 1
-        author_totals[author] += 1
-        if author not in author_avatars:
-            author_avatars[author] = event.commit_author_avatar
+def _compute_heatmap(columns: EventColumns, period: str) -> dict[str, Any]:
+    """Compute activity heatmap: contributors × dates grid."""
+    dates = _period_dates(period)
+
+    # Commits per author and date, and per author overall
+    author_day_commits = columns.author_day_commits(date.fromisoformat(dates[0]), len(dates))
+    author_totals = columns.author_totals()
 
     # Sort by total commits descending (most active on top)
-    sorted_authors = sorted(author_totals.keys(), key=lambda a: author_totals[a], reverse=True)
+    sorted_authors = sorted(
+        range(len(columns.authors)), key=author_totals.__getitem__, reverse=True
+    )
 
+    # Rows are built fresh, so a shallow conversion is enough (asdict would deep-copy every cell)
     rows = [
-        asdict(
+        vars(
             HeatmapRow(
-                author=author,
-                avatar_url=author_avatars.get(author),
-                cells=[{"date": d, "commits": author_date_counts[author].get(d, 0)} for d in dates],
+                author=columns.authors[author],
+                avatar_url=columns.author_avatars[author],
+                cells=[
+                    {"date": d, "commits": c}
+                    for d, c in zip(dates, author_day_commits[author], strict=True)
+                ],
             )
         )
         for author in sorted_authors
@@ -193,15 +189,14 @@ def _compute_heatmap(events: list[TimelineEvent], period: str) -> dict[str, Any]
     return {"rows": rows, "dates": dates}
 
 
-def _compute_day_of_week(events: list[TimelineEvent]) -> list[DayOfWeekEntry]:
+def _compute_day_of_week(columns: EventColumns) -> list[DayOfWeekEntry]:
     """Compute commit counts grouped by day of the week (Mon–Sun)."""
-    from datetime import datetime
-
     day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    counts: dict[int, int] = defaultdict(int)
+    counts = columns.weekday_commits()
+
+    return [DayOfWeekEntry(day=day_names[i], commits=counts[i]) for i in range(7)]
 
-    for event in events:
-        dt = datetime.fromisoformat(event.timestamp.replace("Z", "+00:00"))
-        counts[dt.weekday()] += 1  # 0=Mon, 6=Sun
 
-    return [DayOfWeekEntry(day=day_names[i], commits=counts.get(i, 0)) for i in range(7)]
+def _empty_contributors_response() -> dict[str, Any]:
+    """Return an empty contributors response."""
+    return {"contributors": [], "heatmap": {"rows": [], "dates": []}, "day_of_week_pattern": []}
@@ -12,13 +12,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db_with_rls
-from app.domain import repository_ops
-from app.domain.preferences_operations import preferences_ops
+from app.core.fanout import fan_out
 from app.models import User
-from app.services.github import GitHubReadOperations
 
+from .dashboard_fetcher import ProductCommits, fetch_dashboard_commits
 from .types import ProductShippedSummary
-from .utils import generate_daily_activity, get_period_start, resolve_github_token
+from .utils import generate_daily_activity, get_period_start
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +25,12 @@ router = APIRouter()
 
 VALID_DASHBOARD_PERIODS = ("1d", "2d", "7d", "14d", "30d")
 
+# AI summaries generated at once by POST /dashboard/generate
+MAX_CONCURRENT_SUMMARIES = 4
+
+# Organizations whose products are loaded at once, each in its own session
+MAX_CONCURRENT_ORG_LOADS = 4
+
 
 def _normalize_period(days: int) -> str:
     """Convert days integer to period string, defaulting to 7d."""
@@ -95,6 +100,35 @@ def _build_shipped_summary_dict(
     )
 
 
+async def _load_org_products(
+    current_user: User, organization_ids: list[uuid_pkg.UUID]
+) -> list[tuple[Any, uuid_pkg.UUID]]:
+    """Load the products of several organizations concurrently.
+
+    Returns (product, organization_id) pairs in the order of the given
+    organizations. An organization whose load fails is skipped.
+    """
+    from app.domain import product_ops
+
+    outcomes = await fan_out(
+        organization_ids,
+        product_ops.get_by_organization,
+        user_id=current_user.id,
+        max_concurrency=MAX_CONCURRENT_ORG_LOADS,
+    )
+
+    all_products: list[tuple[Any, uuid_pkg.UUID]] = []
+    for outcome in outcomes:
+        if not outcome.ok:
+            logger.warning(
+                f"Failed to load products for organization {outcome.item}: "
+                f"{outcome.error or 'timed out'}"
+            )
+            continue
+        all_products.extend((product, outcome.item) for product in outcome.value or [])
+    return all_products
+
+
 @router.get("/dashboard")
 async def get_dashboard_progress(
     organization_id: uuid_pkg.UUID | None = Query(None, description="Filter to specific org"),
@@ -112,7 +146,7 @@ async def get_dashboard_progress(
     If no cached summaries exist, returns is_generating=False and empty summaries.
     Use POST /dashboard/generate to trigger summary generation.
     """
-    from app.domain import dashboard_shipped_ops, org_member_ops, product_ops
+    from app.domain import dashboard_shipped_ops, org_member_ops
 
     period = _normalize_period(days)
 
@@ -128,11 +162,7 @@ async def get_dashboard_progress(
             return _empty_dashboard_response()
 
     # Get all products across user's orgs
-    all_products: list[tuple[Any, Any]] = []
-    for membership in memberships:
-        products = await product_ops.get_by_organization(db, membership.organization_id)
-        for product in products:
-            all_products.append((product, membership.organization_id))
+    all_products = await _load_org_products(current_user, [m.organization_id for m in memberships])
 
     if not all_products:
         return _empty_dashboard_response()
@@ -140,10 +170,11 @@ async def get_dashboard_progress(
     # Get product IDs for cache lookup
     product_ids = [p.id for p, _ in all_products]
 
-    # Resolve GitHub token (current user first for fast path)
-    preferences = await preferences_ops.get_by_user_id(db, current_user.id)
-    user_token = preferences_ops.get_decrypted_token(preferences) if preferences else None
-    user_github = GitHubReadOperations(user_token) if user_token else None
+    # Fetch commits for all products concurrently
+    period_start = get_period_start(period)
+    product_commits = await fetch_dashboard_commits(
+        db, current_user, [p for p, _ in all_products], period_start
+    )
 
     # Aggregate stats across all products
     aggregate_stats: dict[str, Any] = {
@@ -154,44 +185,14 @@ async def get_dashboard_progress(
         "daily_activity": defaultdict(int),
     }
 
-    period_start = get_period_start(period)
-    since_str = period_start.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    for product, _ in all_products:
-        repos = await repository_ops.get_github_repos_by_product(db, product.id)
-        if not repos:
-            continue
-
-        # Per-product token fallback when current user has no token
-        product_github = user_github
-        if not product_github:
-            fallback_token = await resolve_github_token(db, current_user, product.id)
-            if not fallback_token:
-                continue
-            product_github = GitHubReadOperations(fallback_token)
-
-        for repo in repos:
-            if not repo.full_name:
-                continue
-            try:
-                owner, name = repo.full_name.split("/")
-                commits, _ = await product_github.get_commits_for_timeline(
-                    owner, name, repo.default_branch, per_page=100
-                )
-
-                for commit in commits:
-                    timestamp = commit["commit"]["committer"]["date"]
-                    if timestamp < since_str:
-                        continue
-
-                    aggregate_stats["total_commits"] += 1
-                    aggregate_stats["unique_contributors"].add(commit["commit"]["author"]["name"])
+    for entry in product_commits:
+        for commit in entry.commits:
+            timestamp = commit["commit"]["committer"]["date"]
+            aggregate_stats["total_commits"] += 1
+            aggregate_stats["unique_contributors"].add(commit["commit"]["author"]["name"])
 
-                    date = timestamp.split("T")[0]
-                    aggregate_stats["daily_activity"][date] += 1
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch commits for {repo.full_name}: {e}")
+            date = timestamp.split("T")[0]
+            aggregate_stats["daily_activity"][date] += 1
 
     # Get cached shipped summaries (includes enriched data)
     summaries = await dashboard_shipped_ops.get_by_products_period(db, product_ids, period)
@@ -216,6 +217,7 @@ async def get_dashboard_progress(
         "shipped_summaries": shipped_summaries,
         "generated_at": (max(s.generated_at for s in summaries).isoformat() if summaries else None),
         "is_generating": False,
+        "is_partial": not all(entry.complete for entry in product_commits),
     }
 
 
@@ -232,10 +234,11 @@ async def generate_dashboard_progress(
     per-product contributor stats, and uses AI to generate "What Shipped"
     summaries. Results are cached for subsequent GET requests.
     """
-    from app.domain import dashboard_shipped_ops, org_member_ops, product_ops
+    from app.domain import dashboard_shipped_ops, org_member_ops
     from app.services.progress.shipped_summarizer import (
         CommitInfo,
         ShippedAnalysisInput,
+        ShippedSummary,
         shipped_summarizer,
     )
 
@@ -253,24 +256,22 @@ async def generate_dashboard_progress(
             raise HTTPException(status_code=400, detail="Organization not found")
 
     # Get all products across user's orgs
-    all_products: list[Any] = []
-    for membership in memberships:
-        products = await product_ops.get_by_organization(db, membership.organization_id)
-        all_products.extend(products)
+    all_products = [
+        product
+        for product, _ in await _load_org_products(
+            current_user, [m.organization_id for m in memberships]
+        )
+    ]
 
     if not all_products:
         raise HTTPException(status_code=400, detail="No products found")
 
-    # Resolve GitHub token (current user first for fast path)
-    preferences = await preferences_ops.get_by_user_id(db, current_user.id)
-    user_token = preferences_ops.get_decrypted_token(preferences) if preferences else None
-    github = GitHubReadOperations(user_token) if user_token else None
-
+    # Fetch commits + merged PRs for all products concurrently
     period_start = get_period_start(period)
-    since_str = period_start.strftime("%Y-%m-%dT%H:%M:%SZ")
+    product_commits = await fetch_dashboard_commits(
+        db, current_user, all_products, period_start, include_merged_prs=True
+    )
 
-    # Process each product
-    shipped_summaries: list[dict[str, Any]] = []
     aggregate_stats: dict[str, Any] = {
         "total_commits": 0,
         "total_additions": 0,
@@ -279,111 +280,81 @@ async def generate_dashboard_progress(
         "daily_activity": defaultdict(int),
     }
 
-    for product in all_products:
-        repos = await repository_ops.get_github_repos_by_product(db, product.id)
-        if not repos:
-            continue
-
-        # Per-product token fallback when current user has no token
-        product_github = github
-        if not product_github:
-            fallback_token = await resolve_github_token(db, current_user, product.id)
-            if not fallback_token:
-                continue
-            product_github = GitHubReadOperations(fallback_token)
-
-        # Fetch commits + merged PRs concurrently for all repos
-        product_commits: list[CommitInfo] = []
-        product_stats = {"commits": 0, "additions": 0, "deletions": 0}
+    # Build per-product analysis input and enrichment data
+    analyses: list[tuple[ProductCommits, ShippedAnalysisInput, dict[str, Any]]] = []
+    for entry in product_commits:
+        product_commit_infos: list[CommitInfo] = []
         contributor_stats: dict[str, dict[str, Any]] = {}
-        total_merged_prs = 0
 
-        async def fetch_repo_commits(gh: GitHubReadOperations, repo: Any) -> list[dict[str, Any]]:
-            owner, name = repo.full_name.split("/")
-            commits, _ = await gh.get_commits_for_timeline(
-                owner, name, repo.default_branch, per_page=100
-            )
-            return commits
-
-        async def fetch_repo_prs(gh: GitHubReadOperations, repo: Any) -> int:
-            owner, name = repo.full_name.split("/")
-            return await gh.get_merged_pulls_count(owner, name, since_str)
-
-        valid_repos = [r for r in repos if r.full_name]
-
-        # Launch commit and PR fetches concurrently
-        commit_tasks = [fetch_repo_commits(product_github, r) for r in valid_repos]
-        pr_tasks = [fetch_repo_prs(product_github, r) for r in valid_repos]
-
-        all_results = await asyncio.gather(*commit_tasks, *pr_tasks, return_exceptions=True)
-
-        commit_results = all_results[: len(valid_repos)]
-        pr_results = all_results[len(valid_repos) :]
-
-        # Process commit results
-        for i, result in enumerate(commit_results):
-            if isinstance(result, BaseException):
-                logger.warning(f"Failed to fetch commits for {valid_repos[i].full_name}: {result}")
-                continue
-
-            for commit in result:
-                timestamp = commit["commit"]["committer"]["date"]
-                if timestamp < since_str:
-                    continue
-
-                author_name = commit["commit"]["author"]["name"]
-                avatar_url = commit["author"]["avatar_url"] if commit.get("author") else None
-                message = commit["commit"]["message"].split("\n")[0][:200]
-
-                product_commits.append(
-                    CommitInfo(
-                        sha=commit["sha"],
-                        message=message,
-                        author=author_name,
-                        timestamp=timestamp,
-                        files=[],
-                    )
+        for commit in entry.commits:
+            timestamp = commit["commit"]["committer"]["date"]
+            author_name = commit["commit"]["author"]["name"]
+            avatar_url = commit["author"]["avatar_url"] if commit.get("author") else None
+            message = commit["commit"]["message"].split("\n")[0][:200]
+
+            product_commit_infos.append(
+                CommitInfo(
+                    sha=commit["sha"],
+                    message=message,
+                    author=author_name,
+                    timestamp=timestamp,
+                    files=[],
                 )
-
-                product_stats["commits"] += 1
-                aggregate_stats["total_commits"] += 1
-                aggregate_stats["unique_contributors"].add(author_name)
-
-                date = timestamp.split("T")[0]
-                aggregate_stats["daily_activity"][date] += 1
-
-                # Track per-product contributor stats
-                if author_name not in contributor_stats:
-                    contributor_stats[author_name] = {
-                        "author": author_name,
-                        "avatar_url": avatar_url,
-                        "additions": 0,
-                        "deletions": 0,
-                    }
-                elif avatar_url and not contributor_stats[author_name]["avatar_url"]:
-                    contributor_stats[author_name]["avatar_url"] = avatar_url
-
-        # Process PR results
-        for i, result in enumerate(pr_results):
-            if isinstance(result, BaseException):
-                logger.warning(f"Failed to fetch PRs for {valid_repos[i].full_name}: {result}")
-                continue
-            total_merged_prs += result
-
-        # Build enrichment data
-        repo_metadata = _build_repo_metadata(valid_repos)
-        top_contribs = _build_top_contributors(contributor_stats)
-
-        # Generate AI summary for this product
-        try:
-            input_data = ShippedAnalysisInput(
-                product_id=product.id,
-                product_name=product.name or "Unnamed",
-                period=period,
-                commits=product_commits,
             )
-            summary = await shipped_summarizer.interpret(input_data)
 
+            aggregate_stats["total_commits"] += 1
+            aggregate_stats["unique_contributors"].add(author_name)
+
+            date = timestamp.split("T")[0]
+            aggregate_stats["daily_activity"][date] += 1
+
+            # Track per-product contributor stats
+            if author_name not in contributor_stats:
+                contributor_stats[author_name] = {
+                    "author": author_name,
+                    "avatar_url": avatar_url,
+                    "additions": 0,
+                    "deletions": 0,
+                }
+            elif avatar_url and not contributor_stats[author_name]["avatar_url"]:
+                contributor_stats[author_name]["avatar_url"] = avatar_url
+
+        # A summary of a partial fetch would be cached as if complete; keep the old one
+        if not entry.complete:
+            continue
+
+        input_data = ShippedAnalysisInput(
+            product_id=entry.product.id,
+            product_name=entry.product.name or "Unnamed",
+            period=period,
+            commits=product_commit_infos,
+        )
+        enrichment: dict[str, Any] = {
+            "top_contributors": _build_top_contributors(contributor_stats),
+            "repositories": _build_repo_metadata(entry.repos),
+        }
+        analyses.append((entry, input_data, enrichment))
+
+    # Generate AI summaries concurrently; results are written sequentially below
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+
+    async def interpret(input_data: ShippedAnalysisInput) -> ShippedSummary:
+        async with semaphore:
+            return await shipped_summarizer.interpret(input_data)
+
+    summaries = await asyncio.gather(
+        *[interpret(input_data) for _, input_data, _ in analyses],
+        return_exceptions=True,
+    )
+
+    shipped_summaries: list[dict[str, Any]] = []
+    for (entry, _, enrichment), summary in zip(analyses, summaries, strict=True):
+        product = entry.product
+        if isinstance(summary, BaseException):
+            logger.error(f"Failed to generate summary for product {product.id}: {summary}")
+            continue
+
+        try:
             items_as_dicts = [
                 {"description": item.description, "category": item.category}
                 for item in summary.items
@@ -394,12 +365,12 @@ async def generate_dashboard_progress(
                 period=period,
                 items=items_as_dicts,
                 has_significant_changes=summary.has_significant_changes,
-                total_commits=product_stats["commits"],
-                total_additions=product_stats["additions"],
-                total_deletions=product_stats["deletions"],
-                merged_prs=total_merged_prs,
-                top_contributors=top_contribs,
-                repositories=repo_metadata,
+                total_commits=len(entry.commits),
+                total_additions=0,
+                total_deletions=0,
+                merged_prs=entry.merged_prs,
+                top_contributors=enrichment["top_contributors"],
+                repositories=enrichment["repositories"],
             )
 
             shipped_summaries.append(_build_shipped_summary_dict(product, cached_summary))
@@ -420,6 +391,7 @@ async def generate_dashboard_progress(
         "shipped_summaries": shipped_summaries,
         "generated_at": datetime.now(UTC).isoformat(),
         "is_generating": False,
+        "is_partial": not all(entry.complete for entry in product_commits),
     }
 
 
@@ -434,4 +406,5 @@ def _empty_dashboard_response() -> dict[str, Any]:
         "shipped_summaries": [],
         "generated_at": None,
         "is_generating": False,
+        "is_partial": False,
     }
@@ -0,0 +1,170 @@
+"""Concurrent commit fetching for the cross-product dashboard.
+
+The dashboard covers every product in the user's organizations. Instead of
+walking products and repositories one at a time, repositories are loaded for
+all products in one query and a GitHub token is resolved once per
+organization. Repositories kept current by the commit sync worker are read
+from the local commit store in one more query. The rest are fetched from
+GitHub concurrently, bounded by a semaphore and an overall deadline; when
+the deadline passes, whatever has arrived is returned and the affected
+products are marked incomplete.
+"""
+
+import asyncio
+import logging
+import uuid as uuid_pkg
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain import repository_commit_ops, repository_ops
+from app.domain.preferences_operations import preferences_ops
+from app.models import User
+from app.models.product import Product
+from app.models.repository import Repository
+from app.services.github import GitHubReadOperations
+from app.services.progress.commit_store import api_commit_from_row
+from app.services.progress.commit_sync import covered_repositories
+
+from .utils import resolve_github_token
+
+logger = logging.getLogger(__name__)
+
+# GitHub requests in flight at once for one dashboard request
+MAX_CONCURRENT_REPO_FETCHES = 10
+
+# Time budget for all GitHub requests of one dashboard request
+FETCH_DEADLINE_SECONDS = 8.0
+
+
+@dataclass
+class ProductCommits:
+    """Commits (REST shape, newest first) for one product within the period."""
+
+    product: Product
+    repos: list[Repository]
+    commits: list[dict[str, Any]] = field(default_factory=list)
+    merged_prs: int = 0
+    # False when a repository fetch missed the deadline
+    complete: bool = True
+
+
+async def fetch_dashboard_commits(
+    db: AsyncSession,
+    current_user: User,
+    products: list[Product],
+    since: datetime,
+    include_merged_prs: bool = False,
+    deadline: float = FETCH_DEADLINE_SECONDS,
+) -> list[ProductCommits]:
+    """Fetch commits in a period for many products at once.
+
+    All database work happens up front on `db`; only GitHub requests run
+    concurrently, so the session is never shared between tasks.
+
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+        products: Products to fetch
+        since: Start of the period (commits before it are dropped)
+        include_merged_prs: Also count merged PRs per repository
+        deadline: Seconds to wait for GitHub before returning partial results
+
+    Returns:
+        One entry per product that has GitHub repositories and a usable
+        token, in the order given.
+    """
+    since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    # 1. Repositories for all products in one query
+    repos_by_product = await repository_ops.get_github_repos_by_products(
+        db, [p.id for p in products]
+    )
+
+    # 2. One GitHub client per organization (the user's own token when they have one)
+    preferences = await preferences_ops.get_by_user_id(db, current_user.id)
+    user_token = preferences_ops.get_decrypted_token(preferences) if preferences else None
+    user_github = GitHubReadOperations(user_token) if user_token else None
+    org_github: dict[uuid_pkg.UUID | None, GitHubReadOperations | None] = {}
+
+    entries: list[tuple[ProductCommits, GitHubReadOperations]] = []
+    for product in products:
+        repos = [r for r in repos_by_product.get(product.id, []) if r.full_name]
+        if not repos:
+            continue
+
+        github = user_github
+        if github is None:
+            if product.organization_id not in org_github:
+                token = await resolve_github_token(db, current_user, product.id)
+                org_github[product.organization_id] = GitHubReadOperations(token) if token else None
+            github = org_github[product.organization_id]
+        if github is None:
+            continue
+
+        entries.append((ProductCommits(product=product, repos=repos), github))
+
+    # 3. Repositories kept current by the commit sync worker, from the store
+    names = list({r.full_name for entry, _ in entries for r in entry.repos if r.full_name})
+    covered = await covered_repositories(db, names, since)
+    stored: dict[str, list[dict[str, Any]]] = {}
+    for row in await repository_commit_ops.get_in_window(db, list(covered), since):
+        stored.setdefault(row.repository_full_name, []).append(api_commit_from_row(row))
+
+    # 4. Everything else from GitHub, concurrently, within the deadline
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPO_FETCHES)
+
+    async def fetch_commits(github: GitHubReadOperations, repo: Repository) -> list[dict[str, Any]]:
+        owner, name = (repo.full_name or "").split("/")
+        async with semaphore:
+            commits, _ = await github.get_commits_for_timeline(
+                owner, name, repo.default_branch, per_page=100
+            )
+        return commits
+
+    async def count_merged_prs(github: GitHubReadOperations, repo: Repository) -> int:
+        owner, name = (repo.full_name or "").split("/")
+        async with semaphore:
+            return await github.get_merged_pulls_count(owner, name, since_str)
+
+    tasks: dict[asyncio.Task[Any], tuple[ProductCommits, Repository, str]] = {}
+    for entry, github in entries:
+        for repo in entry.repos:
+            full_name = repo.full_name or ""
+            if full_name in covered:
+                entry.commits.extend(stored.get(full_name, []))
+            else:
+                tasks[asyncio.ensure_future(fetch_commits(github, repo))] = (entry, repo, "commits")
+            if include_merged_prs:
+                tasks[asyncio.ensure_future(count_merged_prs(github, repo))] = (entry, repo, "prs")
+
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+            entry, repo, kind = tasks[task]
+            entry.complete = False
+            logger.warning(f"Dashboard {kind} fetch for {repo.full_name} missed the deadline")
+
+        for task in done:
+            entry, repo, kind = tasks[task]
+            error = task.exception()
+            if error is not None:
+                logger.warning(f"Failed to fetch {kind} for {repo.full_name}: {error}")
+            elif kind == "prs":
+                entry.merged_prs += task.result()
+            else:
+                entry.commits.extend(task.result())
+
+    # 5. Keep commits within the period, newest first
+    results: list[ProductCommits] = []
+    for entry, _ in entries:
+        entry.commits = sorted(
+            (c for c in entry.commits if c["commit"]["committer"]["date"] >= since_str),
+            key=lambda c: c["commit"]["committer"]["date"],
+            reverse=True,
+        )
+        results.append(entry)
+    return results
@@ -0,0 +1,196 @@
+"""Columnar commit events for Progress API analytics.
+
+Contributor stats, the activity heatmap, the day-of-week pattern and the
+daily per-author rollup (which feeds leaderboard and velocity) used to walk
+the TimelineEvent list once each, parsing or slicing every timestamp again
+and growing nested dicts along the way. For org-wide windows with tens of
+thousands of commits that work runs in the request thread.
+
+EventColumns converts the events once into NumPy arrays: timestamps become
+epoch seconds and days, repositories and authors are dictionary-encoded as
+integer codes (in order of first appearance, so ties keep the order the
+loops produced), and line counts become int arrays. Each aggregation is then
+a group-by over integer codes with np.bincount / np.unique / np.lexsort.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.services.github.timeline_types import TimelineEvent
+
+from .types import DailyAuthorActivity
+
+IntArray = NDArray[np.int64]
+
+_EPOCH = date(1970, 1, 1)
+
+
+def _encode(values: list[str]) -> tuple[IntArray, list[str]]:
+    """Dictionary-encode values as codes 0..k-1 in order of first appearance."""
+    uniques = list(dict.fromkeys(values))
+    codes = dict(zip(uniques, range(len(uniques)), strict=True))
+    return np.fromiter(map(codes.__getitem__, values), np.int64, len(values)), uniques
+
+
+def _first_index(codes: IntArray) -> list[int]:
+    """Index of the first event of each code, by code."""
+    _, first = np.unique(codes, return_index=True)
+    result: list[int] = first.tolist()
+    return result
+
+
+def _to_list(values: IntArray) -> list[int]:
+    result: list[int] = values.tolist()
+    return result
+
+
+@dataclass
+class EventColumns:
+    """Commit events as parallel columns, one entry per event in input order."""
+
+    events: Sequence[TimelineEvent]  # the source events, for per-row fields
+    seconds: IntArray  # timestamp as epoch seconds
+    day: IntArray  # date of the timestamp as days since 1970-01-01
+    repo: IntArray  # index into repo_full_names / repo_names
+    author: IntArray  # index into authors / author_avatars
+    additions: IntArray
+    deletions: IntArray
+    files_changed: IntArray
+
+    # Dictionary encodings, in order of first appearance
+    repo_full_names: list[str]
+    repo_names: list[str]
+    authors: list[str]
+    author_avatars: list[str | None]  # avatar on each author's first event
+
+    @classmethod
+    def from_events(cls, events: Sequence[TimelineEvent]) -> "EventColumns":
+        """Build columns from events (missing stats count as 0)."""
+        # "YYYY-MM-DDTHH:MM:SS" as written, like the date prefix the loops used
+        seconds = np.array([e.timestamp[:19] for e in events], dtype="datetime64[s]").astype(
+            np.int64
+        )
+        repo, repo_full_names = _encode([e.repository_full_name for e in events])
+        author, authors = _encode([e.commit_author for e in events])
+
+        return cls(
+            events=events,
+            seconds=seconds,
+            day=seconds // 86400,
+            repo=repo,
+            author=author,
+            additions=np.array([e.additions or 0 for e in events], np.int64),
+            deletions=np.array([e.deletions or 0 for e in events], np.int64),
+            files_changed=np.array([e.files_changed or 0 for e in events], np.int64),
+            repo_full_names=repo_full_names,
+            repo_names=[events[i].repository_name for i in _first_index(repo)],
+            authors=authors,
+            author_avatars=[events[i].commit_author_avatar for i in _first_index(author)],
+        )
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def author_totals(self, values: IntArray | None = None) -> list[int]:
+        """Per author code: commit count, or the sum of `values` (a column)."""
+        sums = np.bincount(self.author, weights=values, minlength=len(self.authors))
+        return _to_list(sums.astype(np.int64))
+
+    def weekday_commits(self) -> list[int]:
+        """Commit count per weekday, Monday (0) to Sunday (6)."""
+        # 1970-01-01 was a Thursday
+        return _to_list(np.bincount((self.day + 3) % 7, minlength=7))
+
+    def author_day_commits(self, first_day: date, days: int) -> list[list[int]]:
+        """Commit count per author code and day, for `days` days from `first_day`."""
+        offset = self.day - (first_day - _EPOCH).days
+        inside = (offset >= 0) & (offset < days)
+        flat = np.bincount(
+            self.author[inside] * days + offset[inside], minlength=len(self.authors) * days
+        )
+        result: list[list[int]] = flat.reshape(len(self.authors), days).tolist()
+        return result
+
+    def author_top_repositories(self, limit: int) -> list[list[str]]:
+        """Repository names with the most commits per author code (ties: first seen first)."""
+        if not self.authors:
+            return []
+
+        name_codes, names = _encode(self.repo_names)
+        k = len(names)
+        pairs, first, counts = np.unique(
+            self.author * k + name_codes[self.repo], return_index=True, return_counts=True
+        )
+        ranked = pairs[np.lexsort((first, -counts, pairs // k))]
+
+        top: list[list[str]] = [[] for _ in self.authors]
+        for pair in _to_list(ranked):
+            author_top = top[pair // k]
+            if len(author_top) < limit:
+                author_top.append(names[pair % k])
+        return top
+
+    def author_events(self) -> list[list[int]]:
+        """Event indices per author code, in input order."""
+        if not self.authors:
+            return []
+        order = np.argsort(self.author, kind="stable")
+        bounds = np.cumsum(np.bincount(self.author, minlength=len(self.authors)))[:-1]
+        return [_to_list(part) for part in np.split(order, bounds)]
+
+    def rollup(self) -> list[DailyAuthorActivity]:
+        """Aggregate into daily per-author activity rows, oldest day first.
+
+        Each row keeps the avatar of its newest commit; rows on the same day
+        are ordered by their newest commit, newest first.
+        """
+        if len(self) == 0:
+            return []
+
+        # One integer key per (repository, author, day)
+        first_day = int(self.day.min())
+        days = int(self.day.max()) - first_day + 1
+        keys = (self.repo * len(self.authors) + self.author) * days + (self.day - first_day)
+        groups, inverse, commits = np.unique(keys, return_inverse=True, return_counts=True)
+
+        # Newest event of each group (ties: first in input order)
+        order = np.lexsort((np.arange(len(self)), -self.seconds, inverse))
+        newest = order[np.concatenate(([0], np.cumsum(commits)[:-1]))]
+
+        # Oldest day first, then newest commit first
+        row_order = np.lexsort((newest, -self.seconds[newest], self.day[newest]))
+        newest = newest[row_order]
+
+        def column(values: IntArray) -> list[int]:
+            sums = np.bincount(inverse, weights=values, minlength=len(groups))
+            return _to_list(sums.astype(np.int64)[row_order])
+
+        dates = {d: (_EPOCH + timedelta(days=d)).isoformat() for d in _to_list(np.unique(self.day))}
+        return [
+            DailyAuthorActivity(
+                repository_name=self.repo_names[repo],
+                repository_full_name=self.repo_full_names[repo],
+                author=self.authors[author],
+                avatar_url=self.events[event].commit_author_avatar,
+                date=dates[day],
+                commits=count,
+                additions=additions,
+                deletions=deletions,
+                files_changed=files,
+            )
+            for event, repo, author, day, count, additions, deletions, files in zip(
+                _to_list(newest),
+                _to_list(self.repo[newest]),
+                _to_list(self.author[newest]),
+                _to_list(self.day[newest]),
+                _to_list(commits[row_order]),
+                column(self.additions),
+                column(self.deletions),
+                column(self.files_changed),
+                strict=True,
+            )
+        ]
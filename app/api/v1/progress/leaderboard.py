@@ -15,10 +15,12 @@ from app.api.deps import (
     get_product_access,
 )
 from app.models import User
-from app.services.github.timeline_types import TimelineEvent
 
-from .commit_fetcher import fetch_commit_stats, fetch_product_commits
-from .types import LeaderboardEntry
+from .activity_fetcher import fetch_product_activity, latest_avatars, rollup_events
+from .commit_fetcher import fetch_commit_stats
+from .commit_window import product_commit_window
+from .response_cache import progress_response_cache
+from .types import DailyAuthorActivity, LeaderboardEntry
 from .utils import generate_daily_activity, get_period_days
 
 router = APIRouter()
@@ -27,6 +29,7 @@ VALID_RANK_BY = {"commits", "additions", "active_days", "files_changed"}
 
 
 @router.get("/products/{product_id}/leaderboard")
+@progress_response_cache.cached("leaderboard", ("period", "repo_ids", "rank_by"))
 async def get_progress_leaderboard(
     product_id: uuid_pkg.UUID,
     period: str = Query("7d", description="Time period: 24h, 48h, 7d, 14d, 30d, 90d, 365d"),
@@ -45,21 +48,29 @@ async def get_progress_leaderboard(
     if rank_by not in VALID_RANK_BY:
         rank_by = "commits"
 
-    result = await fetch_product_commits(
-        db=db,
-        product_id=product_id,
-        current_user=current_user,
-        period=period,
-        repo_ids=repo_ids,
-        fetch_limit=200,
-    )
+    activity = await fetch_product_activity(db, product_id, period, repo_ids)
+    if activity is None:
+        result = await product_commit_window.fetch(
+            product_id=product_id,
+            current_user=current_user,
+            period=period,
+            repo_ids=repo_ids,
+        )
+
+        if not result:
+            return _leaderboard_response([], period, rank_by)
 
-    if not result:
-        return {"entries": [], "total_contributors": 0, "period": period, "ranked_by": rank_by}
+        events = await fetch_commit_stats(db, result.github, result.repos, result.events)
+        activity = rollup_events(events)
 
-    events = await fetch_commit_stats(db, result.github, result.repos, result.events)
+    return _leaderboard_response(activity, period, rank_by)
 
-    entries = _compute_leaderboard(events, period, rank_by)
+
+def _leaderboard_response(
+    activity: list[DailyAuthorActivity], period: str, rank_by: str
+) -> dict[str, Any]:
+    """Build the leaderboard response from daily activity."""
+    entries = _compute_leaderboard(activity, period, rank_by)
 
     return {
         "entries": entries,
@@ -70,34 +81,32 @@ async def get_progress_leaderboard(
 
 
 def _compute_leaderboard(
-    events: list[TimelineEvent], period: str, rank_by: str
+    activity: list[DailyAuthorActivity], period: str, rank_by: str
 ) -> list[dict[str, Any]]:
-    """Compute leaderboard entries from events."""
-    events.sort(key=lambda e: e.timestamp, reverse=True)
-
-    author_events: dict[str, list[TimelineEvent]] = defaultdict(list)
-    for event in events:
-        author_events[event.commit_author].append(event)
+    """Compute leaderboard entries from daily activity."""
+    # Most recently active authors first (tie order for equal ranks)
+    author_rows: dict[str, list[DailyAuthorActivity]] = defaultdict(list)
+    for row in reversed(activity):
+        author_rows[row.author].append(row)
 
+    avatars = latest_avatars(activity)
     entries: list[LeaderboardEntry] = []
     period_days = get_period_days(period)
 
-    for author, author_commits in author_events.items():
-        commits = len(author_commits)
-        additions = sum(e.additions or 0 for e in author_commits)
-        deletions = sum(e.deletions or 0 for e in author_commits)
-        files_changed = sum(e.files_changed or 0 for e in author_commits)
-        avatar_url = author_commits[0].commit_author_avatar if author_commits else None
+    for author, rows in author_rows.items():
+        commits = sum(r.commits for r in rows)
+        additions = sum(r.additions for r in rows)
+        deletions = sum(r.deletions for r in rows)
+        files_changed = sum(r.files_changed for r in rows)
+        avatar_url = avatars[author]
 
-        repos_contributed_to = len({e.repository_name for e in author_commits})
-        active_day_set = {e.timestamp.split("T")[0] for e in author_commits}
-        active_days = len(active_day_set)
-        avg_commits_per_active_day = round(commits / active_days, 1) if active_days > 0 else 0.0
+        repos_contributed_to = len({r.repository_name for r in rows})
 
         daily_counts: dict[str, int] = defaultdict(int)
-        for event in author_commits:
-            date = event.timestamp.split("T")[0]
-            daily_counts[date] += 1
+        for row in rows:
+            daily_counts[row.date] += row.commits
+        active_days = len(daily_counts)
+        avg_commits_per_active_day = round(commits / active_days, 1) if active_days > 0 else 0.0
         daily_activity = generate_daily_activity(daily_counts, period)
 
         entries.append(
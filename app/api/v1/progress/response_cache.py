@@ -0,0 +1,298 @@
+"""Stale-while-revalidate cache for Progress API responses.
+
+Progress responses for a product only change when new commits land, but the
+dashboard is refreshed constantly and every request recomputed its payload.
+ProgressResponseCache keeps the last payload per user, product, endpoint and
+query parameters:
+
+- Fresh entries (younger than `progress_cache_fresh_seconds`) are served as-is.
+- Stale entries are served immediately while a background task checks the
+  product's latest commit date with activity_checker (commit store or one
+  per_page=1 request per repository). If it is unchanged the entry is marked
+  fresh again; if it moved, every cached response and commit window for the
+  product is dropped and this one is recomputed.
+- Entries older than `progress_cache_max_age_seconds` are dropped, so a
+  request after a long idle period is computed synchronously.
+
+Usage:
+    @router.get("/products/{product_id}/summary")
+    @progress_response_cache.cached("summary", ("period", "repo_ids"))
+    async def get_progress_summary(product_id, period, repo_ids, current_user, db):
+        ...
+
+The endpoint must take `product_id`, `current_user` and `db` keyword
+arguments. The cache always calls it with a session of its own: a miss is
+computed once for all concurrent requests with the same key and must not
+depend on the request that started it, and a background refresh runs after
+the request session is closed.
+"""
+
+import asyncio
+import logging
+import time
+import uuid as uuid_pkg
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from functools import wraps
+from typing import Any
+
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import settings
+from app.core.database import async_session_maker
+from app.core.rls import set_rls_user_context
+from app.domain import repository_ops
+from app.models import User
+from app.services.github import GitHubReadOperations, background_github_work
+from app.services.github.cache import coalesce
+from app.services.progress.activity_checker import activity_checker
+
+from .commit_window import WINDOW_TTL_SECONDS, product_commit_window
+from .utils import resolve_github_token
+
+logger = logging.getLogger(__name__)
+
+Endpoint = Callable[..., Awaitable[dict[str, Any]]]
+
+# Responses kept at once, across users, products and query parameters
+MAX_CACHED_RESPONSES = 1024
+
+
+@dataclass(frozen=True)
+class ResponseKey:
+    user_id: uuid_pkg.UUID
+    product_id: uuid_pkg.UUID
+    endpoint: str
+    params: tuple[Any, ...]
+
+
+@dataclass
+class CachedResponse:
+    """A computed payload and the product's latest commit date when it was computed."""
+
+    payload: dict[str, Any]
+    latest_commit: datetime | None
+    computed_at: datetime
+    checked_at: float  # time.monotonic() of the last computation or revalidation
+
+    def settled(self) -> bool:
+        """Whether the payload certainly reflects `latest_commit`.
+
+        Payloads are computed from commit windows up to WINDOW_TTL_SECONDS old,
+        so a commit newer than that at computation time may be missing even
+        though the latest commit date has not moved since.
+        """
+        if self.latest_commit is None:
+            return True
+        return self.latest_commit < self.computed_at - timedelta(seconds=WINDOW_TTL_SECONDS)
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0  # served fresh
+    stale_hits: int = 0  # served stale, refresh scheduled
+    misses: int = 0  # computed in the request
+    revalidations: int = 0  # stale entry confirmed current without recomputing
+    refreshes: int = 0  # stale entry recomputed in the background
+    invalidations: int = 0  # entries dropped because the latest commit moved
+    refresh_errors: int = 0
+
+
+async def latest_commit_date(
+    db: AsyncSession, product_id: uuid_pkg.UUID, current_user: User
+) -> datetime | None:
+    """Latest commit date across a product's GitHub repositories."""
+    repos = await repository_ops.get_github_repos_by_product(db, product_id=product_id)
+    if not repos:
+        return None
+
+    github_token = await resolve_github_token(db, current_user, product_id)
+    if not github_token:
+        return None
+
+    return await activity_checker.get_latest_commit_date(
+        repos, GitHubReadOperations(github_token), db=db
+    )
+
+
+class ProgressResponseCache:
+    """Per-user, per-product response cache with background revalidation."""
+
+    def __init__(
+        self,
+        fresh_seconds: float = settings.progress_cache_fresh_seconds,
+        max_age_seconds: float = settings.progress_cache_max_age_seconds,
+        maxsize: int = MAX_CACHED_RESPONSES,
+    ) -> None:
+        self.fresh_seconds = fresh_seconds
+        self._entries: TTLCache[ResponseKey, CachedResponse] = TTLCache(
+            maxsize=maxsize, ttl=max_age_seconds
+        )
+        self._refreshing: dict[ResponseKey, asyncio.Task[None]] = {}
+        self.stats = ResponseCacheStats()
+
+    def cached(self, endpoint: str, key_params: tuple[str, ...]) -> Callable[[Endpoint], Endpoint]:
+        """Decorator caching a Progress endpoint by the given query parameters."""
+
+        def decorator(func: Endpoint) -> Endpoint:
+            @wraps(func)
+            async def wrapper(**kwargs: Any) -> dict[str, Any]:
+                return await self.get(endpoint, key_params, func, kwargs)
+
+            return wrapper
+
+        return decorator
+
+    async def get(
+        self,
+        endpoint: str,
+        key_params: tuple[str, ...],
+        func: Endpoint,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Serve a cached payload, computing it on a miss and refreshing it when stale."""
+        key = ResponseKey(
+            user_id=kwargs["current_user"].id,
+            product_id=kwargs["product_id"],
+            endpoint=endpoint,
+            params=tuple(kwargs[name] for name in key_params),
+        )
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return await coalesce(
+                f"progress-response:{key}", lambda: self._compute(key, func, kwargs)
+            )
+
+        if time.monotonic() - entry.checked_at < self.fresh_seconds:
+            self.stats.hits += 1
+        else:
+            self.stats.stale_hits += 1
+            self._schedule_refresh(key, func, kwargs)
+        return entry.payload
+
+    async def _compute(
+        self, key: ResponseKey, func: Endpoint, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Compute a payload on a miss and cache it with the latest commit date.
+
+        Runs in its own session: the computation is shared by concurrent
+        requests and keeps running if the request that started it is
+        cancelled, which closes that request's session.
+        """
+        computed_at = datetime.now(UTC)
+        async with async_session_maker() as session:
+            try:
+                await set_rls_user_context(session, key.user_id)
+                try:
+                    latest = await latest_commit_date(
+                        session, key.product_id, kwargs["current_user"]
+                    )
+                    cacheable = True
+                except Exception:
+                    # Without a latest commit date the entry could never be revalidated
+                    logger.exception(f"Latest commit check failed for product {key.product_id}")
+                    latest, cacheable = None, False
+                    await session.rollback()
+                    await set_rls_user_context(session, key.user_id)
+
+                payload = await func(**{**kwargs, "db": session})
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        if cacheable:
+            self._store(key, payload, latest, computed_at)
+        return payload
+
+    def _store(
+        self,
+        key: ResponseKey,
+        payload: dict[str, Any],
+        latest: datetime | None,
+        computed_at: datetime,
+    ) -> None:
+        self._entries[key] = CachedResponse(
+            payload=payload,
+            latest_commit=latest,
+            computed_at=computed_at,
+            checked_at=time.monotonic(),
+        )
+
+    def _schedule_refresh(self, key: ResponseKey, func: Endpoint, kwargs: dict[str, Any]) -> None:
+        """Start a background refresh for a key unless one is running."""
+        if key in self._refreshing:
+            return
+        self._refreshing[key] = asyncio.ensure_future(self._refresh(key, func, kwargs))
+
+    @background_github_work
+    async def _refresh(self, key: ResponseKey, func: Endpoint, kwargs: dict[str, Any]) -> None:
+        """Background task: revalidate a stale entry, recomputing it if commits landed.
+
+        Runs in its own session: the request session is closed by the time
+        this runs.
+        """
+        try:
+            async with async_session_maker() as session:
+                try:
+                    await set_rls_user_context(session, key.user_id)
+                    computed_at = datetime.now(UTC)
+                    latest = await latest_commit_date(
+                        session, key.product_id, kwargs["current_user"]
+                    )
+
+                    entry = self._entries.get(key)
+                    if entry is not None and entry.latest_commit == latest and entry.settled():
+                        entry.checked_at = time.monotonic()
+                        self._entries[key] = entry  # restart the max age
+                        self.stats.revalidations += 1
+                        return
+
+                    if entry is None or entry.latest_commit != latest:
+                        self.invalidate_product(key.product_id)
+                    else:
+                        product_commit_window.invalidate(key.product_id)
+
+                    payload = await func(**{**kwargs, "db": session})
+                    await session.commit()
+                    self._store(key, payload, latest, computed_at)
+                    self.stats.refreshes += 1
+                except Exception:
+                    await session.rollback()
+                    raise
+        except Exception:
+            self.stats.refresh_errors += 1
+            logger.exception(f"Progress response refresh failed for product {key.product_id}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    def invalidate_product(self, product_id: uuid_pkg.UUID) -> None:
+        """Drop every cached response and commit window for a product."""
+        stale = [key for key in self._entries if key.product_id == product_id]
+        for key in stale:
+            self._entries.pop(key, None)
+        self.stats.invalidations += len(stale)
+        product_commit_window.invalidate(product_id)
+
+    def clear(self) -> None:
+        """Drop every cached response and reset the counters."""
+        self._entries.clear()
+        self.stats = ResponseCacheStats()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache counters and size for monitoring."""
+        served = self.stats.hits + self.stats.stale_hits + self.stats.misses
+        return {
+            **asdict(self.stats),
+            "hit_ratio": (self.stats.hits + self.stats.stale_hits) / served if served else 0.0,
+            "size": len(self._entries),
+            "maxsize": int(self._entries.maxsize),
+            "refreshing": len(self._refreshing),
+        }
+
+
+progress_response_cache = ProgressResponseCache()
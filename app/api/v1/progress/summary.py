@@ -18,14 +18,17 @@ from app.api.deps import (
 from app.models import User
 from app.services.github.timeline_types import TimelineEvent
 
-from .commit_fetcher import fetch_commit_stats, fetch_product_commits
+from .commit_fetcher import fetch_commit_stats
+from .commit_window import product_commit_window
+from .response_cache import progress_response_cache
 from .types import CommitQuality, CommitTypeBreakdown, ContributorStats, FocusArea, PulseData
-from .utils import generate_daily_activity, get_extended_period, get_period_days
+from .utils import generate_daily_activity, get_period_days
 
 router = APIRouter()
 
 
 @router.get("/products/{product_id}/summary")
+@progress_response_cache.cached("summary", ("period", "repo_ids"))
 async def get_progress_summary(
     product_id: uuid_pkg.UUID,
     period: str = Query("7d", description="Time period: 24h, 48h, 7d, 14d, 30d, 90d, 365d"),
@@ -43,14 +46,12 @@ async def get_progress_summary(
     - Daily activity breakdown (for sparkline)
     - Recent commits preview
     """
-    # Fetch commits using consolidated fetcher
-    result = await fetch_product_commits(
-        db=db,
+    # Fetch commits from the product's shared commit window
+    result = await product_commit_window.fetch(
         product_id=product_id,
         current_user=current_user,
         period=period,
         repo_ids=repo_ids,
-        fetch_limit=200,
     )
 
     if not result:
@@ -59,15 +60,13 @@ async def get_progress_summary(
     # Fetch commit stats for LOC calculation
     events = await fetch_commit_stats(db, result.github, result.repos, result.events)
 
-    # Fetch previous period commits for velocity trend
-    extended_period = get_extended_period(period)
-    prev_result = await fetch_product_commits(
-        db=db,
+    # Previous period commits for velocity trend (same window, no refetch)
+    prev_result = await product_commit_window.fetch(
         product_id=product_id,
         current_user=current_user,
-        period=extended_period,
+        period=period,
         repo_ids=repo_ids,
-        fetch_limit=200,
+        extended=True,
     )
 
     prev_events: list[TimelineEvent] = []
@@ -32,6 +32,21 @@ class DailyActivity:
     commits: int
 
 
+@dataclass
+class DailyAuthorActivity:
+    """One author's activity in one repository on one UTC day."""
+
+    repository_name: str
+    repository_full_name: str
+    author: str
+    avatar_url: str | None
+    date: str  # YYYY-MM-DD
+    commits: int
+    additions: int
+    deletions: int
+    files_changed: int
+
+
 @dataclass
 class ProgressSummaryResponse:
     """Response structure for progress summary endpoint."""
@@ -1,6 +1,5 @@
 """Progress API: Velocity endpoint."""
 
-import asyncio
 import logging
 import uuid as uuid_pkg
 from collections import defaultdict
@@ -17,22 +16,14 @@ from app.api.deps import (
     get_db_with_rls,
     get_product_access,
 )
-from app.domain import repository_ops
 from app.models import User
-from app.models.repository import Repository
-from app.services.github import GitHubReadOperations
-from app.services.github.exceptions import GitHubRepoRenamed
-from app.services.github.timeline_types import TimelineEvent
 
+from .activity_fetcher import fetch_product_activity, period_first_day, rollup_events
 from .commit_fetcher import fetch_commit_stats
-from .types import RepoComparison, VelocityInsight
-from .utils import (
-    get_extended_period,
-    get_period_days,
-    get_period_start,
-    handle_repo_rename,
-    resolve_github_token,
-)
+from .commit_window import product_commit_window
+from .response_cache import progress_response_cache
+from .types import DailyAuthorActivity, RepoComparison, VelocityInsight
+from .utils import get_extended_period, get_period_days, get_period_start
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +31,7 @@ router = APIRouter()
 
 
 @router.get("/products/{product_id}/velocity")
+@progress_response_cache.cached("velocity", ("period", "repo_ids"))
 async def get_velocity(
     product_id: uuid_pkg.UUID,
     period: str = Query("30d", description="Time period: 24h, 48h, 7d, 14d, 30d, 90d, 365d"),
@@ -57,132 +49,54 @@ async def get_velocity(
 
     Default period is 30d for velocity to show meaningful trends.
     """
-    # Get GitHub-linked repositories
-    repos = await repository_ops.get_github_repos_by_product(db, product_id=product_id)
-    if not repos:
-        return _empty_velocity_response()
-
-    # Filter repositories if repo_ids provided
-    if repo_ids:
-        filter_ids = set(repo_ids.split(","))
-        repos = [r for r in repos if str(r.id) in filter_ids]
-        if not repos:
+    # Answer from the daily activity rollup when the repos are synced
+    activity = await fetch_product_activity(db, product_id, get_extended_period(period), repo_ids)
+    if activity is not None:
+        if not activity:
             return _empty_velocity_response()
-
-    # Resolve GitHub token
-    github_token = await resolve_github_token(db, current_user, product_id)
-    if not github_token:
-        return _empty_velocity_response()
-
-    # Calculate period bounds (fetch extra for comparison)
-    period_start = get_period_start(period)
-    extended_period = get_extended_period(period)
-    extended_start = get_period_start(extended_period)
-    extended_since_str = extended_start.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    # Fetch commits from all repos in parallel
-    github = GitHubReadOperations(github_token)
-    fetch_limit = 500  # Fetch more for velocity analysis
-
-    async def fetch_repo_commits(
-        repo: Repository,
-    ) -> list[tuple[Repository, dict[str, Any]]]:
-        if not repo.full_name:
-            return []
-        owner, name = repo.full_name.split("/")
-        commits, _ = await github.get_commits_for_timeline(
-            owner, name, repo.default_branch, per_page=fetch_limit
+        first_day = period_first_day(period)
+        return _compute_velocity(
+            [a for a in activity if a.date >= first_day],
+            [a for a in activity if a.date < first_day],
+            period,
         )
-        return [(repo, c) for c in commits]
 
-    results = await asyncio.gather(
-        *[fetch_repo_commits(r) for r in repos],
-        return_exceptions=True,
+    # Fetch current and comparison commits from the product's shared commit window
+    result = await product_commit_window.fetch(
+        product_id=product_id,
+        current_user=current_user,
+        period=period,
+        repo_ids=repo_ids,
+        extended=True,
     )
 
-    # Handle renames and flatten results
-    all_commits: list[tuple[Repository, dict[str, Any]]] = []
-    repos_to_retry: list[Repository] = []
-
-    for i, result in enumerate(results):
-        if isinstance(result, GitHubRepoRenamed):
-            repo = repos[i]
-            updated_repo = await handle_repo_rename(db, github, repo, result)
-            if updated_repo:
-                repos_to_retry.append(updated_repo)
-        elif isinstance(result, BaseException):
-            logger.warning(f"Failed to fetch commits for repo: {result}")
-            continue
-        else:
-            all_commits.extend(result)
-
-    # Retry renamed repos
-    if repos_to_retry:
-        retry_results = await asyncio.gather(
-            *[fetch_repo_commits(r) for r in repos_to_retry],
-            return_exceptions=True,
-        )
-        for result in retry_results:
-            if isinstance(result, BaseException):
-                logger.warning(f"Retry failed for renamed repo: {result}")
-                continue
-            all_commits.extend(result)
-
-    # Convert to TimelineEvent and filter by extended date range
-    events: list[TimelineEvent] = []
-    for repo, commit in all_commits:
-        timestamp = commit["commit"]["committer"]["date"]
-
-        if timestamp < extended_since_str:
-            continue
-
-        events.append(
-            TimelineEvent(
-                id=f"commit:{commit['sha']}",
-                event_type="commit",
-                timestamp=timestamp,
-                repository_id=str(repo.id),
-                repository_name=repo.name or "",
-                repository_full_name=repo.full_name or "",
-                commit_sha=commit["sha"],
-                commit_message=commit["commit"]["message"].split("\n")[0][:100],
-                commit_author=commit["commit"]["author"]["name"],
-                commit_author_avatar=(
-                    commit["author"]["avatar_url"] if commit.get("author") else None
-                ),
-                commit_url=commit["html_url"],
-            )
-        )
-
-    if not events:
+    if not result:
         return _empty_velocity_response()
 
     # Fetch commit stats for LOC calculation
-    events = await fetch_commit_stats(db, github, repos, events)
-
-    # Compute velocity data
-    return _compute_velocity(events, period, period_start)
+    events = await fetch_commit_stats(db, result.github, result.repos, result.events)
+
+    # Split events into current period and previous period, then compute
+    period_start_str = get_period_start(period).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _compute_velocity(
+        rollup_events([e for e in events if e.timestamp >= period_start_str]),
+        rollup_events([e for e in events if e.timestamp < period_start_str]),
+        period,
+    )
 
 
 def _compute_velocity(
-    events: list[TimelineEvent],
+    current: list[DailyAuthorActivity],
+    previous: list[DailyAuthorActivity],
     period: str,
-    period_start: datetime,
 ) -> dict[str, Any]:
     """Compute velocity data for charts and insights."""
-    events.sort(key=lambda e: e.timestamp)
-
-    # Split events into current period and previous period
-    period_start_str = period_start.strftime("%Y-%m-%dT%H:%M:%SZ")
-    current_events = [e for e in events if e.timestamp >= period_start_str]
-    previous_events = [e for e in events if e.timestamp < period_start_str]
-
     # Compute daily data for current period
-    velocity_data = _compute_daily_velocity(current_events, period)
+    velocity_data = _compute_daily_velocity(current, period)
 
     # Compute totals for current and previous periods
-    current_totals = _compute_period_totals(current_events)
-    previous_totals = _compute_period_totals(previous_events)
+    current_totals = _compute_period_totals(current)
+    previous_totals = _compute_period_totals(previous)
 
     # Compute LOC data (daily additions/deletions)
     loc_data = [
@@ -199,7 +113,7 @@ def _compute_velocity(
     insights = _compute_velocity_insights(velocity_data, current_totals, previous_totals, period)
 
     # Compute repo comparison
-    repo_comparison = _compute_repo_comparison(current_events, period)
+    repo_comparison = _compute_repo_comparison(current, period)
 
     return {
         "velocity_data": velocity_data,
@@ -212,7 +126,9 @@ def _compute_velocity(
     }
 
 
-def _compute_daily_velocity(events: list[TimelineEvent], period: str) -> list[dict[str, Any]]:
+def _compute_daily_velocity(
+    activity: list[DailyAuthorActivity], period: str
+) -> list[dict[str, Any]]:
     """Compute daily velocity data points."""
     days = get_period_days(period)
 
@@ -230,13 +146,12 @@ def _compute_daily_velocity(events: list[TimelineEvent], period: str) -> list[di
             "contributors": set(),
         }
 
-    for event in events:
-        date_str = event.timestamp.split("T")[0]
-        if date_str in daily_data:
-            daily_data[date_str]["commits"] += 1
-            daily_data[date_str]["additions"] += event.additions or 0
-            daily_data[date_str]["deletions"] += event.deletions or 0
-            daily_data[date_str]["contributors"].add(event.commit_author)
+    for row in activity:
+        if row.date in daily_data:
+            daily_data[row.date]["commits"] += row.commits
+            daily_data[row.date]["additions"] += row.additions
+            daily_data[row.date]["deletions"] += row.deletions
+            daily_data[row.date]["contributors"].add(row.author)
 
     result = []
     for date_str in sorted(daily_data.keys()):
@@ -254,24 +169,26 @@ def _compute_daily_velocity(events: list[TimelineEvent], period: str) -> list[di
     return result
 
 
-def _compute_period_totals(events: list[TimelineEvent]) -> dict[str, Any]:
-    """Compute totals for a set of events."""
-    if not events:
+def _compute_period_totals(activity: list[DailyAuthorActivity]) -> dict[str, Any]:
+    """Compute totals for a set of activity rows."""
+    if not activity:
         return {"commits": 0, "additions": 0, "deletions": 0, "contributors": 0, "files_changed": 0}
 
     contributors = set()
+    total_commits = 0
     total_additions = 0
     total_deletions = 0
     total_files = 0
 
-    for event in events:
-        contributors.add(event.commit_author)
-        total_additions += event.additions or 0
-        total_deletions += event.deletions or 0
-        total_files += event.files_changed or 0
+    for row in activity:
+        contributors.add(row.author)
+        total_commits += row.commits
+        total_additions += row.additions
+        total_deletions += row.deletions
+        total_files += row.files_changed
 
     return {
-        "commits": len(events),
+        "commits": total_commits,
         "additions": total_additions,
         "deletions": total_deletions,
         "contributors": len(contributors),
@@ -371,30 +288,32 @@ def _compute_velocity_insights(
     return [asdict(i) for i in insights]
 
 
-def _compute_repo_comparison(events: list[TimelineEvent], period: str) -> list[RepoComparison]:
+def _compute_repo_comparison(
+    activity: list[DailyAuthorActivity], period: str
+) -> list[RepoComparison]:
     """Compute per-repository comparison stats."""
     period_days = get_period_days(period)
 
-    # Group events by repository
-    repo_events: dict[str, list[TimelineEvent]] = defaultdict(list)
+    # Group activity by repository
+    repo_rows: dict[str, list[DailyAuthorActivity]] = defaultdict(list)
     repo_full_names: dict[str, str] = {}
 
-    for event in events:
-        repo_events[event.repository_name].append(event)
-        if event.repository_name not in repo_full_names:
-            repo_full_names[event.repository_name] = event.repository_full_name
+    for row in activity:
+        repo_rows[row.repository_name].append(row)
+        if row.repository_name not in repo_full_names:
+            repo_full_names[row.repository_name] = row.repository_full_name
 
     results: list[RepoComparison] = []
-    for repo_name, repo_evts in repo_events.items():
-        commits = len(repo_evts)
-        additions = sum(e.additions or 0 for e in repo_evts)
-        deletions = sum(e.deletions or 0 for e in repo_evts)
+    for repo_name, rows in repo_rows.items():
+        commits = sum(r.commits for r in rows)
+        additions = sum(r.additions for r in rows)
+        deletions = sum(r.deletions for r in rows)
         unique_authors: set[str] = set()
         active_dates: set[str] = set()
 
-        for e in repo_evts:
-            unique_authors.add(e.commit_author)
-            active_dates.add(e.timestamp.split("T")[0])
+        for r in rows:
+            unique_authors.add(r.author)
+            active_dates.add(r.date)
 
         active_days = len(active_dates)
         contributors = len(unique_authors)
@@ -10,7 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import ProductAccessContext, get_current_user, get_db_with_rls, get_product_access
 from app.api.v1.progress import _resolve_github_token
-from app.domain import commit_stats_cache_ops, repository_ops
+from app.api.v1.progress.commit_fetcher import fetch_commit_files, fetch_commit_stats
+from app.domain import repository_ops
 from app.domain.preferences_operations import preferences_ops
 from app.models import User
 from app.models.repository import Repository
@@ -22,8 +23,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/timeline", tags=["timeline"])
 
-# Concurrency limit for fetching commit stats (avoid rate limiting)
-
 
 async def _handle_repo_rename(
     db: AsyncSession,
@@ -64,9 +63,6 @@ async def _handle_repo_rename(
     return updated_repo
 
 
-MAX_CONCURRENT_STAT_FETCHES = 10
-
-
 @router.get("/products/{product_id}")
 async def get_product_timeline(
     product_id: uuid_pkg.UUID,
@@ -211,68 +207,8 @@ async def get_product_timeline(
         last = events[-1]
         next_cursor = f"{last.timestamp}:{last.commit_sha}"
 
-    # 8. Fetch commit stats: cache-first, then GitHub API for misses
-    # Build a map of repo full_name -> (owner, repo_name) for stat fetching
-    repo_map: dict[str, tuple[str, str]] = {}
-    for repo in repos:
-        if repo.full_name:
-            owner_name, repo_name = repo.full_name.split("/")
-            repo_map[repo.full_name] = (owner_name, repo_name)
-
-    # 8a. Build lookup keys for all events
-    lookup_keys = [(e.repository_full_name, e.commit_sha) for e in events]
-
-    # 8b. Bulk fetch from cache
-    cached_stats = await commit_stats_cache_ops.get_bulk_by_repo_shas(db, lookup_keys)
-
-    # 8c. Identify cache misses and populate hits
-    events_needing_fetch: list[TimelineEvent] = []
-    for event in events:
-        key = (event.repository_full_name, event.commit_sha)
-        if key in cached_stats:
-            cached = cached_stats[key]
-            event.additions = cached.additions
-            event.deletions = cached.deletions
-            event.files_changed = cached.files_changed
-        else:
-            events_needing_fetch.append(event)
-
-    # 8d. Fetch missing stats from GitHub (with concurrency limit)
-    if events_needing_fetch:
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STAT_FETCHES)
-        stats_to_cache: list[dict[str, str | int]] = []
-
-        async def fetch_and_cache_stats(event: TimelineEvent) -> None:
-            """Fetch stats from GitHub and queue for caching."""
-            repo_info = repo_map.get(event.repository_full_name)
-            if not repo_info:
-                return
-            owner_name, repo_name = repo_info
-
-            async with semaphore:
-                stats = await github.get_commit_detail(owner_name, repo_name, event.commit_sha)
-                if stats:
-                    event.additions = stats["additions"]
-                    event.deletions = stats["deletions"]
-                    event.files_changed = stats["files_changed"]
-                    stats_to_cache.append(
-                        {
-                            "full_name": event.repository_full_name,
-                            "sha": event.commit_sha,
-                            "additions": stats["additions"],
-                            "deletions": stats["deletions"],
-                            "files_changed": stats["files_changed"],
-                        }
-                    )
-
-        await asyncio.gather(
-            *[fetch_and_cache_stats(e) for e in events_needing_fetch],
-            return_exceptions=True,
-        )
-
-        # 8e. Bulk insert newly fetched stats into cache
-        if stats_to_cache:
-            await commit_stats_cache_ops.bulk_upsert(db, stats_to_cache)
+    # 8. Fetch commit stats: cache-first, then GitHub (GraphQL, REST fallback)
+    events = await fetch_commit_stats(db, github, repos, events)
 
     return {
         "events": [e.__dict__ for e in events],
@@ -304,11 +240,10 @@ async def get_commit_files(
     if "/" not in repo_full_name:
         raise HTTPException(status_code=400, detail="Invalid repository format")
 
-    owner, repo = repo_full_name.split("/", 1)
-
-    # 3. Fetch commit files from GitHub
+    # 3. Fetch commit files: cache-first, then GitHub
     github = GitHubReadOperations(github_token)
-    files = await github.get_commit_files(owner, repo, sha)
+    found = await fetch_commit_files(db, github, [(repo_full_name, sha)])
+    files = found.get((repo_full_name, sha))
 
     if files is None:
         raise HTTPException(status_code=404, detail="Commit not found or fetch failed")
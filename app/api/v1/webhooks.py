@@ -4,6 +4,8 @@ Receives events from GitHub when:
 - App is installed/uninstalled on an org
 - Repos are added/removed from an installation
 - Installation is suspended/unsuspended
+- Commits are pushed, or pull requests are merged (ingested into the local
+  commit store for tracked repositories)
 
 No authentication required (validated via HMAC-SHA256 webhook signature).
 Uses DbSession (raw, no RLS) since there is no user context.
@@ -20,6 +22,7 @@ from app.api.deps import DbSession
 from app.config import settings
 from app.core.audit import log_installation_event, log_webhook_received
 from app.domain import github_app_installation_ops, github_app_installation_repo_ops
+from app.services.progress import commit_store
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +64,10 @@ async def github_webhook(request: Request, db: DbSession) -> dict:
             await _handle_installation(db, payload)
         case "installation_repositories":
             await _handle_repo_change(db, payload)
+        case "push":
+            await commit_store.ingest_push(db, payload)
+        case "pull_request":
+            await commit_store.ingest_pull_request(db, payload)
 
     return {"ok": True}
 
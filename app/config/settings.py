@@ -50,6 +50,39 @@ class Settings(BaseSettings):
     github_app_client_secret: str = ""
     github_app_webhook_secret: str = ""
 
+    # GitHub request scheduling (rate-limit budget shared by interactive and background work)
+    # Fraction of each token's hourly budget reserved for interactive requests
+    github_background_reserve_ratio: float = 0.2
+    # Background requests at the reserve wait for the reset if it is at most this far away,
+    # otherwise they are shed
+    github_background_max_wait_seconds: float = 60.0
+    # Max concurrent background GitHub requests per process
+    github_background_max_concurrency: int = 8
+
+    # Persistent git object cache (blob contents and trees keyed by SHA, stored in Postgres)
+    github_object_store_enabled: bool = True
+    # Total content size retained before least-recently-used objects are evicted
+    github_object_store_max_bytes: int = 512 * 1024 * 1024
+
+    # Incremental commit sync (background worker filling the local commit store)
+    # Minutes between sync runs
+    commit_sync_interval_minutes: int = 15
+    # History fetched the first time a repository is synced (covers 90-day progress views)
+    commit_sync_backfill_days: int = 90
+    # Stored commits are only served for repositories synced within this many minutes
+    commit_sync_max_staleness_minutes: int = 30
+    # Hours re-read behind the newest synced commit on every run, so commits pushed
+    # after a sync but dated before it (late pushes, rebases, merged older branches)
+    # are still fetched
+    commit_sync_overlap_hours: int = 72
+
+    # Progress response cache (stale-while-revalidate, per user, product and query)
+    # Seconds a cached response is served as-is
+    progress_cache_fresh_seconds: int = 60
+    # Seconds a cached response may be served at all; older than fresh, it is
+    # served while a background refresh checks for new commits
+    progress_cache_max_age_seconds: int = 1800
+
     # Stripe - Payment processing
     # Use sk_test_*/pk_test_* for development, sk_live_*/pk_live_* for production
     # Empty string = Stripe disabled (feature gating still works, just no payments)
@@ -94,6 +127,21 @@ class Settings(BaseSettings):
     weekly_digest_hour: int = 17
     # Weekly digest: day of week (default: fri)
     weekly_digest_day: str = "fri"
+    # Sharded scheduler: auto-progress and digest runs are split into this many
+    # organization shards, claimed by instances one at a time (1 = one instance does all)
+    scheduler_shard_count: int = 1
+    # How long an instance keeps retrying shards held by other instances, so
+    # shards of an instance that died are still processed (seconds)
+    scheduler_shard_wait_seconds: int = 900
+
+    # Background job queue (Postgres-backed, see app/services/jobs)
+    # Run a job worker inside the API process. Set False when workers run
+    # separately (python -m app.tasks.job_worker) to keep LLM jobs off the API.
+    job_worker_in_api: bool = True
+    # Seconds between queue polls when no job was claimed
+    job_poll_interval_seconds: float = 2.0
+    # Days completed and failed jobs are kept
+    job_retention_days: int = 7
 
     @property
     def stripe_enabled(self) -> bool:
@@ -0,0 +1,153 @@
+"""Concurrent database work with one session per task.
+
+An AsyncSession is not safe for concurrent use, so work that runs under
+asyncio.gather must not share the request session. fan_out() runs one unit
+of work per item, each in its own pooled session with the RLS user context
+set, with a bound on how many run (and hold a connection) at once and a
+deadline per task.
+
+Usage:
+    async def load(session: AsyncSession, product: Product) -> list[Event]:
+        return await fetch_events(session, product.id)
+
+    for outcome in await fan_out(products, load, user_id=user.id):
+        if outcome.ok:
+            ...
+
+Each task's session commits when its work succeeds (so cache writes made
+along the way persist) and rolls back otherwise. Objects loaded in a task
+session are detached when it closes; with expire_on_commit=False their
+loaded attributes stay readable.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session_maker
+from app.core.rls import set_rls_user_context
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Tasks holding a pooled connection at once, per fan-out (pool max is 30)
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Seconds one task may run once it has a slot, including opening its session
+DEFAULT_TASK_TIMEOUT = 30.0
+
+
+@dataclass
+class FanOutResult(Generic[T, R]):
+    """Outcome of the work for one item."""
+
+    item: T
+    value: R | None = None
+    error: BaseException | None = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+async def _run_one(
+    item: T,
+    work: Callable[[AsyncSession, T], Awaitable[R]],
+    user_id: UUID,
+    semaphore: asyncio.Semaphore,
+    timeout: float,
+    session_maker: Callable[[], Any],
+) -> FanOutResult[T, R]:
+    async def run() -> R:
+        async with session_maker() as session:
+            try:
+                await set_rls_user_context(session, user_id)
+                value = await work(session, item)
+                await session.commit()
+                return value
+            except Exception:
+                await session.rollback()
+                raise
+
+    async with semaphore:
+        try:
+            return FanOutResult(item=item, value=await asyncio.wait_for(run(), timeout))
+        except TimeoutError:
+            return FanOutResult(item=item, timed_out=True)
+        except Exception as e:
+            return FanOutResult(item=item, error=e)
+
+
+def _start(
+    items: Sequence[T],
+    work: Callable[[AsyncSession, T], Awaitable[R]],
+    user_id: UUID,
+    max_concurrency: int,
+    timeout: float,
+    session_maker: Callable[[], Any] | None,
+) -> list[asyncio.Task[FanOutResult[T, R]]]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+    factory = session_maker or async_session_maker
+    return [
+        asyncio.ensure_future(_run_one(item, work, user_id, semaphore, timeout, factory))
+        for item in items
+    ]
+
+
+async def fan_out(
+    items: Sequence[T],
+    work: Callable[[AsyncSession, T], Awaitable[R]],
+    *,
+    user_id: UUID,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float = DEFAULT_TASK_TIMEOUT,
+    session_maker: Callable[[], Any] | None = None,
+) -> list[FanOutResult[T, R]]:
+    """Run `work(session, item)` for every item concurrently, one session each.
+
+    Args:
+        items: Items to process
+        work: Coroutine function taking a task session and an item
+        user_id: User whose RLS context is set on every task session
+        max_concurrency: Tasks running (and holding a connection) at once
+        timeout: Seconds each task may run once it starts
+        session_maker: Session factory (default: the transaction pooler's)
+
+    Returns:
+        One result per item, in the order given. Failures and timeouts are
+        reported on the result rather than raised.
+    """
+    tasks = _start(items, work, user_id, max_concurrency, timeout, session_maker)
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fan_out_as_completed(
+    items: Sequence[T],
+    work: Callable[[AsyncSession, T], Awaitable[R]],
+    *,
+    user_id: UUID,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float = DEFAULT_TASK_TIMEOUT,
+    session_maker: Callable[[], Any] | None = None,
+) -> AsyncIterator[FanOutResult[T, R]]:
+    """Like fan_out(), but yield each result as soon as its task finishes.
+
+    Tasks still running when the iterator is closed early (e.g. a streaming
+    client disconnects) are cancelled.
+    """
+    tasks = _start(items, work, user_id, max_concurrency, timeout, session_maker)
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
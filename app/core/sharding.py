@@ -0,0 +1,32 @@
+"""Organization sharding for scheduled jobs.
+
+Scheduled jobs split their work into `count` shards, each covering a
+contiguous range of organization id hashes. Instances claim shards one at a
+time (see app.services.scheduler.run_sharded), so nightly work spreads over
+every running instance instead of one.
+"""
+
+import uuid as uuid_pkg
+from dataclasses import dataclass
+
+
+def shard_index(org_id: uuid_pkg.UUID, count: int) -> int:
+    """The shard an organization belongs to, for `count` shards.
+
+    Maps the upper 64 bits of the (random) UUID onto `count` equal ranges.
+    """
+    return ((org_id.int >> 64) * count) >> 64
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """One of `count` hash ranges of organization ids."""
+
+    index: int
+    count: int
+
+    def contains(self, org_id: uuid_pkg.UUID) -> bool:
+        return shard_index(org_id, self.count) == self.index
+
+    def __str__(self) -> str:
+        return f"{self.index + 1}/{self.count}"
@@ -1,14 +1,20 @@
 from app.domain.announcement_operations import announcement_ops
 from app.domain.app_info_operations import app_info_ops
+from app.domain.auto_progress_checkpoint_operations import auto_progress_checkpoint_ops
+from app.domain.commit_activity_daily_operations import commit_activity_daily_ops
+from app.domain.commit_file_cache_operations import commit_file_cache_ops
 from app.domain.commit_stats_cache_operations import commit_stats_cache_ops
 from app.domain.dashboard_shipped_operations import dashboard_shipped_ops
+from app.domain.digest_delivery_operations import digest_delivery_ops
 from app.domain.document_operations import document_ops
 from app.domain.feedback_operations import feedback_ops
+from app.domain.git_object_cache_operations import git_object_cache_ops
 from app.domain.github_app_installation_operations import (
     github_app_installation_ops,
     github_app_installation_repo_ops,
 )
 from app.domain.infra_component_operations import infra_component_ops
+from app.domain.job_queue_operations import job_queue_ops
 from app.domain.org_digest_preference_operations import org_digest_preference_ops
 from app.domain.org_member_operations import org_member_ops
 from app.domain.organization_operations import organization_ops
@@ -17,7 +23,11 @@ from app.domain.product_access_operations import product_access_ops
 from app.domain.product_api_key_operations import api_key_ops
 from app.domain.product_operations import product_ops
 from app.domain.progress_summary_operations import progress_summary_ops
+from app.domain.repository_commit_operations import repository_commit_ops
 from app.domain.repository_operations import repository_ops
+from app.domain.repository_sync_cursor_operations import repository_sync_cursor_ops
+from app.domain.scheduler_job_run_operations import scheduler_job_run_ops
+from app.domain.scheduler_shard_run_operations import scheduler_shard_run_ops
 from app.domain.section_operations import section_ops, subsection_ops
 from app.domain.subscription_operations import subscription_ops
 from app.domain.team_contributor_summary_operations import team_contributor_summary_ops
@@ -27,13 +37,19 @@ from app.domain.work_item_operations import work_item_ops
 __all__ = [
     "org_digest_preference_ops",
     "announcement_ops",
+    "auto_progress_checkpoint_ops",
     "commit_stats_cache_ops",
+    "commit_activity_daily_ops",
+    "commit_file_cache_ops",
+    "git_object_cache_ops",
     "dashboard_shipped_ops",
     "progress_summary_ops",
     "team_contributor_summary_ops",
     "product_ops",
     "product_access_ops",
     "repository_ops",
+    "repository_commit_ops",
+    "repository_sync_cursor_ops",
     "work_item_ops",
     "document_ops",
     "section_ops",
@@ -49,4 +65,8 @@ __all__ = [
     "api_key_ops",
     "github_app_installation_ops",
     "github_app_installation_repo_ops",
+    "job_queue_ops",
+    "scheduler_shard_run_ops",
+    "scheduler_job_run_ops",
+    "digest_delivery_ops",
 ]
@@ -0,0 +1,88 @@
+"""Domain operations for auto-progress run checkpoints."""
+
+import uuid as uuid_pkg
+from datetime import UTC, date, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.auto_progress_checkpoint import AutoProgressCheckpoint
+
+
+class AutoProgressCheckpointOperations:
+    """
+    Operations for auto-progress checkpoints.
+
+    Note: This doesn't extend BaseOperations because checkpoints are written
+    by the background job only (not user-scoped).
+    """
+
+    def __init__(self) -> None:
+        self.model = AutoProgressCheckpoint
+
+    async def get_outcomes(
+        self, db: AsyncSession, run_date: date
+    ) -> dict[uuid_pkg.UUID, tuple[str, int]]:
+        """
+        Get the outcome of each product the run for a day has checkpointed.
+
+        Returns:
+            Dict mapping product ID to (outcome, attempts).
+        """
+        statement = select(  # type: ignore[call-overload]
+            AutoProgressCheckpoint.product_id,
+            AutoProgressCheckpoint.outcome,
+            AutoProgressCheckpoint.attempts,
+        ).where(
+            AutoProgressCheckpoint.run_date == run_date,
+        )
+        result = await db.execute(statement)
+        return {product_id: (outcome, attempts) for product_id, outcome, attempts in result.all()}
+
+    async def record(
+        self,
+        db: AsyncSession,
+        run_date: date,
+        product_id: uuid_pkg.UUID,
+        organization_id: uuid_pkg.UUID,
+        outcome: str,
+    ) -> None:
+        """
+        Record that the run for a day finished with a product.
+
+        Recording a product again (a retry) replaces the outcome and counts
+        another attempt.
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            insert(self.model)
+            .values(
+                run_date=run_date,
+                product_id=product_id,
+                organization_id=organization_id,
+                outcome=outcome,
+                attempts=1,
+                completed_at=now,
+            )
+            .on_conflict_do_update(
+                index_elements=["run_date", "product_id"],
+                set_={
+                    "outcome": outcome,
+                    "attempts": AutoProgressCheckpoint.attempts + 1,
+                    "completed_at": now,
+                },
+            )
+        )
+        await db.execute(stmt)
+
+    async def delete_before(self, db: AsyncSession, run_date: date) -> int:
+        """Delete checkpoints of runs before a day. Returns the number deleted."""
+        stmt = delete(AutoProgressCheckpoint).where(
+            AutoProgressCheckpoint.run_date < run_date,  # type: ignore[arg-type]
+        )
+        result = await db.execute(stmt)
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+auto_progress_checkpoint_ops = AutoProgressCheckpointOperations()
@@ -0,0 +1,179 @@
+"""Domain operations for the daily commit activity rollup."""
+
+from datetime import date, timedelta
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    cast,
+    delete,
+    func,
+    literal_column,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.commit_activity_daily import CommitActivityDaily
+from app.models.repository_commit import RepositoryCommit
+
+# (repository, day) pairs rebuilt per statement (two bind parameters each)
+REFRESH_CHUNK_SIZE = 1000
+
+# Columns replaced when a rebuilt row already exists
+_ROLLUP_COLUMNS = (
+    "author_login",
+    "author_avatar_url",
+    "commits",
+    "additions",
+    "deletions",
+    "files_changed",
+    "updated_at",
+)
+
+
+def _commit_day() -> ColumnElement[date]:
+    """UTC calendar day of a stored commit."""
+    return cast(func.timezone("UTC", RepositoryCommit.committed_at), Date)
+
+
+class CommitActivityDailyOperations:
+    """
+    Operations for the daily commit activity rollup.
+
+    Note: This doesn't extend BaseOperations because the rollup is shared
+    (not user-scoped) and derived entirely from repository_commits.
+    """
+
+    def __init__(self) -> None:
+        self.model = CommitActivityDaily
+
+    async def refresh_days(
+        self,
+        db: AsyncSession,
+        repo_days: set[tuple[str, date]],
+    ) -> None:
+        """
+        Rebuild rollup rows for (repository_full_name, day) pairs.
+
+        Each pair is recomputed from repository_commits rather than adjusted
+        by deltas, so re-ingesting a commit, filling in its stats later or
+        replacing a merged-PR approximation never double counts.
+
+        Webhook ingests and the commit sync refresh the same recent days at
+        the same time, so each repository's rebuild holds a transaction-scoped
+        advisory lock; the insert also upserts in case a row appears anyway.
+        """
+        if not repo_days:
+            return
+
+        pairs = sorted(repo_days)
+        # Sorted, so writers covering several repositories never deadlock
+        for name in sorted({name for name, _ in pairs}):
+            await db.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                {"key": f"commit_activity_daily:{name}"},
+            )
+
+        day_expr = _commit_day()
+        for start in range(0, len(pairs), REFRESH_CHUNK_SIZE):
+            chunk = pairs[start : start + REFRESH_CHUNK_SIZE]
+            names = sorted({name for name, _ in chunk})
+            first_day = min(day for _, day in chunk)
+            last_day = max(day for _, day in chunk)
+
+            await db.execute(
+                delete(CommitActivityDaily).where(
+                    tuple_(CommitActivityDaily.repository_full_name, CommitActivityDaily.day).in_(
+                        chunk
+                    )
+                )
+            )
+
+            aggregate = (
+                select(  # type: ignore[call-overload]
+                    RepositoryCommit.repository_full_name,
+                    RepositoryCommit.author_name,
+                    func.max(RepositoryCommit.author_login),
+                    func.max(RepositoryCommit.author_avatar_url),
+                    day_expr,
+                    func.count(),
+                    func.coalesce(func.sum(RepositoryCommit.additions), 0),
+                    func.coalesce(func.sum(RepositoryCommit.deletions), 0),
+                    func.coalesce(func.sum(RepositoryCommit.files_changed), 0),
+                    literal_column("now()"),
+                )
+                .where(
+                    RepositoryCommit.repository_full_name.in_(names),  # type: ignore[attr-defined]
+                    # Range predicate lets the (repository, committed_at) index narrow the scan
+                    RepositoryCommit.committed_at >= first_day - timedelta(days=1),
+                    RepositoryCommit.committed_at < last_day + timedelta(days=2),
+                    tuple_(RepositoryCommit.repository_full_name, day_expr).in_(chunk),
+                )
+                .group_by(
+                    RepositoryCommit.repository_full_name,
+                    RepositoryCommit.author_name,
+                    day_expr,
+                )
+            )
+            stmt = insert(CommitActivityDaily).from_select(
+                [
+                    "repository_full_name",
+                    "author_name",
+                    "author_login",
+                    "author_avatar_url",
+                    "day",
+                    "commits",
+                    "additions",
+                    "deletions",
+                    "files_changed",
+                    "updated_at",
+                ],
+                aggregate,
+            )
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["repository_full_name", "day", "author_name"],
+                    set_={col: stmt.excluded[col] for col in _ROLLUP_COLUMNS},
+                )
+            )
+
+        await db.flush()
+
+    async def get_in_window(
+        self,
+        db: AsyncSession,
+        repository_full_names: list[str],
+        since: date,
+        until: date | None = None,
+    ) -> list[CommitActivityDaily]:
+        """
+        Get rollup rows for repositories within a range of days.
+
+        Args:
+            db: Database session
+            repository_full_names: Repositories to include
+            since: First day included
+            until: Optional last day included
+
+        Returns:
+            Rows ordered by day, oldest first.
+        """
+        if not repository_full_names:
+            return []
+
+        statement = select(CommitActivityDaily).where(
+            CommitActivityDaily.repository_full_name.in_(repository_full_names),  # type: ignore[attr-defined]
+            CommitActivityDaily.day >= since,  # type: ignore[arg-type]
+        )
+        if until is not None:
+            statement = statement.where(CommitActivityDaily.day <= until)  # type: ignore[arg-type]
+        statement = statement.order_by(CommitActivityDaily.day)  # type: ignore[arg-type]
+
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
+
+commit_activity_daily_ops = CommitActivityDailyOperations()
@@ -0,0 +1,93 @@
+"""Domain operations for commit file cache."""
+
+from typing import Any
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.commit_file_cache import CommitFileCache
+
+# Keys per lookup or insert statement
+CHUNK_SIZE = 500
+
+
+class CommitFileCacheOperations:
+    """
+    Operations for commit file cache.
+
+    Note: This doesn't extend BaseOperations because the cache
+    is shared (not user-scoped) and has different access patterns.
+    """
+
+    def __init__(self) -> None:
+        self.model = CommitFileCache
+
+    async def get_bulk_by_repo_shas(
+        self,
+        db: AsyncSession,
+        lookups: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """
+        Bulk fetch cached file changes for multiple commits.
+
+        Args:
+            db: Database session
+            lookups: List of (repository_full_name, commit_sha) tuples
+
+        Returns:
+            Dict mapping (full_name, sha) -> list of file change dicts.
+            Missing entries are simply not in the returned dict.
+        """
+        keys = list(dict.fromkeys(lookups))
+        found: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for start in range(0, len(keys), CHUNK_SIZE):
+            statement = select(  # type: ignore[call-overload]
+                CommitFileCache.repository_full_name,
+                CommitFileCache.commit_sha,
+                CommitFileCache.files,
+            ).where(
+                tuple_(CommitFileCache.repository_full_name, CommitFileCache.commit_sha).in_(
+                    keys[start : start + CHUNK_SIZE]
+                )
+            )
+            result = await db.execute(statement)
+            for full_name, sha, files in result.all():
+                found[(full_name, sha)] = files
+        return found
+
+    async def bulk_upsert(
+        self,
+        db: AsyncSession,
+        entries: dict[tuple[str, str], list[dict[str, Any]]],
+    ) -> int:
+        """
+        Bulk insert file changes, ignoring commits already cached.
+
+        Args:
+            db: Database session
+            entries: Dict mapping (full_name, sha) -> list of file change dicts
+
+        Returns:
+            Count of rows submitted.
+        """
+        if not entries:
+            return 0
+
+        values = [
+            {"repository_full_name": full_name, "commit_sha": sha, "files": files}
+            for (full_name, sha), files in entries.items()
+        ]
+        for start in range(0, len(values), CHUNK_SIZE):
+            stmt = (
+                insert(self.model)
+                .values(values[start : start + CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=["repository_full_name", "commit_sha"])
+            )
+            await db.execute(stmt)
+        await db.flush()
+
+        return len(values)
+
+
+commit_file_cache_ops = CommitFileCacheOperations()
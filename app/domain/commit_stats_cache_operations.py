@@ -1,11 +1,42 @@
 """Domain operations for commit stats cache."""
 
-from sqlalchemy import and_, or_, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Select, String, and_, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.commit_stats_cache import CommitStatsCache
 
+# (full_name, sha) pairs per lookup statement
+LOOKUP_CHUNK_SIZE = 1000
+
+
+def bulk_lookup_statement(lookups: list[tuple[str, str]]) -> Select[CommitStatsCache]:
+    """
+    Build a lookup of cache rows for (full_name, sha) pairs.
+
+    The pairs are sent as two array parameters and expanded server-side with
+    unnest(), then joined against the unique (repository_full_name,
+    commit_sha) index. The SQL text is the same for any number of pairs, so
+    it stays small and Postgres plans a single join instead of a long OR.
+    """
+    full_names = [full_name for full_name, _ in lookups]
+    shas = [sha for _, sha in lookups]
+    keys = (
+        func.unnest(
+            literal(full_names, ARRAY(String)),
+            literal(shas, ARRAY(String)),
+        )
+        .table_valued("full_name", "sha")
+        .render_derived(name="keys")
+    )
+    return select(CommitStatsCache).join(
+        keys,
+        and_(
+            CommitStatsCache.repository_full_name == keys.c.full_name,  # type: ignore[arg-type]
+            CommitStatsCache.commit_sha == keys.c.sha,  # type: ignore[arg-type]
+        ),
+    )
+
 
 class CommitStatsCacheOperations:
     """
@@ -34,22 +65,15 @@ class CommitStatsCacheOperations:
             Dict mapping (full_name, sha) -> cached stats.
             Missing entries are simply not in the returned dict.
         """
-        if not lookups:
-            return {}
-
-        conditions = [
-            and_(
-                CommitStatsCache.repository_full_name == full_name,  # type: ignore[arg-type]
-                CommitStatsCache.commit_sha == sha,  # type: ignore[arg-type]
-            )
-            for full_name, sha in lookups
-        ]
-
-        statement = select(CommitStatsCache).where(or_(*conditions))
-        result = await db.execute(statement)
-        rows = result.scalars().all()
-
-        return {(row.repository_full_name, row.commit_sha): row for row in rows}
+        keys = list(dict.fromkeys(lookups))
+        found: dict[tuple[str, str], CommitStatsCache] = {}
+        for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            statement = bulk_lookup_statement(keys[start : start + LOOKUP_CHUNK_SIZE])
+            result = await db.execute(statement)
+            for row in result.scalars().all():
+                found[(row.repository_full_name, row.commit_sha)] = row
+
+        return found
 
     async def bulk_upsert(
         self,
@@ -0,0 +1,98 @@
+"""Domain operations for digest emails sent by scheduled digest runs."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.digest_delivery import DigestDelivery
+
+
+class DigestDeliveryOperations:
+    """
+    Operations for digest deliveries.
+
+    Note: This doesn't extend BaseOperations because deliveries are written
+    by the digest job only (not user-scoped).
+    """
+
+    def __init__(self) -> None:
+        self.model = DigestDelivery
+
+    async def get_delivered(
+        self,
+        db: AsyncSession,
+        frequency: str,
+        run_key: str,
+        preference_ids: list[uuid_pkg.UUID],
+    ) -> set[uuid_pkg.UUID]:
+        """Get the preferences of a run that already have a delivery recorded."""
+        if not preference_ids:
+            return set()
+        statement = select(DigestDelivery.preference_id).where(  # type: ignore[call-overload]
+            DigestDelivery.frequency == frequency,
+            DigestDelivery.run_key == run_key,
+            DigestDelivery.preference_id.in_(preference_ids),  # type: ignore[attr-defined]
+        )
+        result = await db.execute(statement)
+        return set(result.scalars().all())
+
+    async def record(
+        self,
+        db: AsyncSession,
+        frequency: str,
+        run_key: str,
+        preference_ids: list[uuid_pkg.UUID],
+    ) -> None:
+        """Record deliveries for a run; already recorded ones are left as they are."""
+        if not preference_ids:
+            return
+        now = datetime.now(UTC)
+        stmt = (
+            insert(self.model)
+            .values(
+                [
+                    {
+                        "frequency": frequency,
+                        "run_key": run_key,
+                        "preference_id": preference_id,
+                        "sent_at": now,
+                    }
+                    for preference_id in preference_ids
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=["frequency", "run_key", "preference_id"],
+            )
+        )
+        await db.execute(stmt)
+
+    async def remove(
+        self,
+        db: AsyncSession,
+        frequency: str,
+        run_key: str,
+        preference_ids: list[uuid_pkg.UUID],
+    ) -> None:
+        """Remove deliveries of a run, e.g. for sends Postmark rejected."""
+        if not preference_ids:
+            return
+        stmt = delete(DigestDelivery).where(
+            DigestDelivery.frequency == frequency,  # type: ignore[arg-type]
+            DigestDelivery.run_key == run_key,  # type: ignore[arg-type]
+            DigestDelivery.preference_id.in_(preference_ids),  # type: ignore[attr-defined]
+        )
+        await db.execute(stmt)
+
+    async def delete_before(self, db: AsyncSession, before: datetime) -> int:
+        """Delete deliveries sent before a time. Returns the number deleted."""
+        stmt = delete(DigestDelivery).where(
+            DigestDelivery.sent_at < before,  # type: ignore[arg-type]
+        )
+        result = await db.execute(stmt)
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+digest_delivery_ops = DigestDeliveryOperations()
@@ -0,0 +1,142 @@
+"""Domain operations for the content-addressed git object cache."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.git_object_cache import GitObjectCache
+
+# Skip last_accessed_at updates for rows touched more recently than this,
+# so hot objects don't turn every read into a write.
+TOUCH_INTERVAL = timedelta(hours=1)
+
+
+class GitObjectCacheOperations:
+    """
+    Operations for the git object cache.
+
+    Note: This doesn't extend BaseOperations because the cache
+    is shared (not user-scoped) and keyed by SHA rather than id.
+    """
+
+    def __init__(self) -> None:
+        self.model = GitObjectCache
+
+    async def get_many(
+        self,
+        db: AsyncSession,
+        object_type: str,
+        shas: list[str],
+    ) -> dict[str, bytes]:
+        """
+        Bulk fetch cached objects and refresh their LRU timestamp.
+
+        Args:
+            db: Database session
+            object_type: "blob" or "tree"
+            shas: Object SHAs to look up
+
+        Returns:
+            Dict mapping sha -> content. Missing objects are not in the dict.
+        """
+        if not shas:
+            return {}
+
+        statement = select(GitObjectCache.sha, GitObjectCache.content).where(  # type: ignore[call-overload]
+            GitObjectCache.object_type == object_type,
+            GitObjectCache.sha.in_(shas),  # type: ignore[attr-defined]
+        )
+        result = await db.execute(statement)
+        found: dict[str, bytes] = {row.sha: row.content for row in result.all()}
+
+        if found:
+            now = datetime.now(UTC)
+            await db.execute(
+                update(GitObjectCache)
+                .where(
+                    GitObjectCache.object_type == object_type,  # type: ignore[arg-type]
+                    GitObjectCache.sha.in_(list(found)),  # type: ignore[attr-defined]
+                    GitObjectCache.last_accessed_at < now - TOUCH_INTERVAL,  # type: ignore[arg-type]
+                )
+                .values(last_accessed_at=now)
+            )
+            await db.flush()
+
+        return found
+
+    async def bulk_insert(
+        self,
+        db: AsyncSession,
+        object_type: str,
+        objects: dict[str, bytes],
+    ) -> int:
+        """
+        Bulk insert objects, ignoring SHAs that are already cached.
+
+        Args:
+            db: Database session
+            object_type: "blob" or "tree"
+            objects: Dict mapping sha -> content
+
+        Returns:
+            Count of objects submitted.
+        """
+        if not objects:
+            return 0
+
+        stmt = (
+            insert(self.model)
+            .values(
+                [
+                    {
+                        "object_type": object_type,
+                        "sha": sha,
+                        "content": content,
+                        "size": len(content),
+                    }
+                    for sha, content in objects.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["object_type", "sha"])
+        )
+
+        await db.execute(stmt)
+        await db.flush()
+
+        return len(objects)
+
+    async def evict_to_size(self, db: AsyncSession, max_bytes: int) -> int:
+        """
+        Delete least-recently-used objects until total size fits in max_bytes.
+
+        Args:
+            db: Database session
+            max_bytes: Total content size to retain
+
+        Returns:
+            Count of deleted rows.
+        """
+        running_size = (
+            select(  # type: ignore[call-overload]
+                GitObjectCache.id,
+                func.sum(GitObjectCache.size)
+                .over(order_by=GitObjectCache.last_accessed_at.desc())  # type: ignore[attr-defined]
+                .label("running_size"),
+            )
+        ).subquery()
+
+        stmt = delete(GitObjectCache).where(
+            GitObjectCache.id.in_(  # type: ignore[attr-defined]
+                select(running_size.c.id).where(running_size.c.running_size > max_bytes)
+            )
+        )
+        result = await db.execute(stmt)
+        await db.flush()
+
+        deleted: int = result.rowcount  # type: ignore[attr-defined]
+        return deleted
+
+
+git_object_cache_ops = GitObjectCacheOperations()
@@ -0,0 +1,278 @@
+"""Domain operations for the durable background job queue."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.queued_job import QueuedJob, QueuedJobStatus
+
+QUEUED = QueuedJobStatus.QUEUED.value
+RUNNING = QueuedJobStatus.RUNNING.value
+COMPLETED = QueuedJobStatus.COMPLETED.value
+FAILED = QueuedJobStatus.FAILED.value
+
+
+class JobQueueOperations:
+    """
+    Operations for queued background jobs.
+
+    Note: This doesn't extend BaseOperations because jobs are only read and
+    written by the service role (enqueue helpers and workers), not per user.
+    """
+
+    def __init__(self) -> None:
+        self.model = QueuedJob
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        job_type: str,
+        payload: dict[str, Any],
+        *,
+        dedupe_key: str | None = None,
+        max_attempts: int = 3,
+        run_after: datetime | None = None,
+    ) -> uuid_pkg.UUID | None:
+        """
+        Add a job to the queue.
+
+        Returns the job ID, or None if a queued or running job with the same
+        dedupe_key already exists.
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            insert(QueuedJob)  # type: ignore[call-overload]
+            .values(
+                id=uuid_pkg.uuid4(),
+                job_type=job_type,
+                payload=payload,
+                status=QUEUED,
+                dedupe_key=dedupe_key,
+                attempts=0,
+                max_attempts=max_attempts,
+                run_after=run_after or now,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(
+                index_elements=["dedupe_key"],
+                index_where=text("status IN ('queued', 'running')"),
+            )
+            .returning(QueuedJob.id)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def claim(
+        self,
+        db: AsyncSession,
+        job_type: str,
+        worker_id: str,
+        limit: int,
+        max_running: int,
+        visibility_timeout: float,
+    ) -> list[QueuedJob]:
+        """
+        Claim up to `limit` due jobs of a type for a worker.
+
+        Due jobs are queued jobs whose run_after has passed and running jobs
+        whose lock expired (their worker died). Rows are selected with
+        FOR UPDATE SKIP LOCKED, so concurrent workers never claim the same
+        job or wait for each other. A transaction-scoped advisory lock per
+        job type makes the running count and the claim atomic, so at most
+        `max_running` jobs of the type run across all workers.
+        """
+        now = datetime.now(UTC)
+        await db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": f"job_queue:{job_type}"},
+        )
+        running = await self.count_running(db, job_type)
+        limit = min(limit, max_running - running)
+        if limit <= 0:
+            return []
+
+        due = (
+            select(QueuedJob.id)  # type: ignore[call-overload]
+            .where(
+                QueuedJob.job_type == job_type,
+                or_(
+                    and_(
+                        QueuedJob.status == QUEUED,  # type: ignore[arg-type]
+                        QueuedJob.run_after <= now,  # type: ignore[arg-type]
+                    ),
+                    and_(
+                        QueuedJob.status == RUNNING,  # type: ignore[arg-type]
+                        QueuedJob.locked_until < now,  # type: ignore[arg-type, operator]
+                        QueuedJob.attempts < QueuedJob.max_attempts,  # type: ignore[arg-type]
+                    ),
+                ),
+            )
+            .order_by(QueuedJob.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(QueuedJob)
+            .where(QueuedJob.id.in_(due))  # type: ignore[attr-defined]
+            .values(
+                status=RUNNING,
+                attempts=QueuedJob.attempts + 1,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=visibility_timeout),
+                updated_at=now,
+            )
+            .returning(QueuedJob)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_running(self, db: AsyncSession, job_type: str) -> int:
+        """Count jobs of a type currently held by a live worker."""
+        stmt = select(func.count()).where(
+            QueuedJob.job_type == job_type,  # type: ignore[arg-type]
+            QueuedJob.status == RUNNING,  # type: ignore[arg-type]
+            QueuedJob.locked_until >= datetime.now(UTC),  # type: ignore[arg-type, operator]
+        )
+        result = await db.execute(stmt)
+        return int(result.scalar() or 0)
+
+    async def extend(
+        self,
+        db: AsyncSession,
+        job_id: uuid_pkg.UUID,
+        worker_id: str,
+        visibility_timeout: float,
+    ) -> bool:
+        """Extend a running job's lock. Returns False if the worker lost the job."""
+        now = datetime.now(UTC)
+        stmt = (
+            update(QueuedJob)
+            .where(
+                QueuedJob.id == job_id,  # type: ignore[arg-type]
+                QueuedJob.locked_by == worker_id,  # type: ignore[arg-type]
+                QueuedJob.status == RUNNING,  # type: ignore[arg-type]
+            )
+            .values(locked_until=now + timedelta(seconds=visibility_timeout), updated_at=now)
+        )
+        result = await db.execute(stmt)
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def complete(self, db: AsyncSession, job_id: uuid_pkg.UUID, worker_id: str) -> None:
+        """Mark a job the worker holds as completed."""
+        now = datetime.now(UTC)
+        await db.execute(
+            update(QueuedJob)
+            .where(
+                QueuedJob.id == job_id,  # type: ignore[arg-type]
+                QueuedJob.locked_by == worker_id,  # type: ignore[arg-type]
+            )
+            .values(
+                status=COMPLETED,
+                locked_by=None,
+                locked_until=None,
+                completed_at=now,
+                updated_at=now,
+            )
+        )
+
+    async def fail(
+        self,
+        db: AsyncSession,
+        job_id: uuid_pkg.UUID,
+        worker_id: str,
+        error: str,
+        retry_at: datetime | None,
+    ) -> None:
+        """
+        Record a failed attempt of a job the worker holds.
+
+        The job is queued again for retry_at, or marked failed if retry_at is None.
+        """
+        now = datetime.now(UTC)
+        values: dict[str, Any] = {
+            "last_error": error[:2000],
+            "locked_by": None,
+            "locked_until": None,
+            "updated_at": now,
+        }
+        if retry_at is None:
+            values.update(status=FAILED, completed_at=now)
+        else:
+            values.update(status=QUEUED, run_after=retry_at)
+
+        await db.execute(
+            update(QueuedJob)
+            .where(
+                QueuedJob.id == job_id,  # type: ignore[arg-type]
+                QueuedJob.locked_by == worker_id,  # type: ignore[arg-type]
+            )
+            .values(**values)
+        )
+
+    async def release(self, db: AsyncSession, job_id: uuid_pkg.UUID, worker_id: str) -> None:
+        """
+        Return an interrupted job to the queue.
+
+        The interrupted run keeps its attempt, so a job that never finishes
+        within the shutdown grace still reaches max_attempts.
+        """
+        now = datetime.now(UTC)
+        await db.execute(
+            update(QueuedJob)
+            .where(
+                QueuedJob.id == job_id,  # type: ignore[arg-type]
+                QueuedJob.locked_by == worker_id,  # type: ignore[arg-type]
+                QueuedJob.status == RUNNING,  # type: ignore[arg-type]
+            )
+            .values(
+                status=QUEUED,
+                locked_by=None,
+                locked_until=None,
+                run_after=now,
+                updated_at=now,
+            )
+        )
+
+    async def fail_abandoned(self, db: AsyncSession) -> int:
+        """
+        Mark jobs whose lock expired on their last attempt as failed.
+
+        Returns the number of jobs marked failed.
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            update(QueuedJob)
+            .where(
+                QueuedJob.status == RUNNING,  # type: ignore[arg-type]
+                QueuedJob.locked_until < now,  # type: ignore[arg-type, operator]
+                QueuedJob.attempts >= QueuedJob.max_attempts,  # type: ignore[arg-type]
+            )
+            .values(
+                status=FAILED,
+                last_error="Worker stopped responding",
+                locked_by=None,
+                locked_until=None,
+                completed_at=now,
+                updated_at=now,
+            )
+        )
+        result = await db.execute(stmt)
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+    async def delete_finished_before(self, db: AsyncSession, before: datetime) -> int:
+        """Delete completed and failed jobs finished before a time. Returns the number deleted."""
+        stmt = delete(QueuedJob).where(
+            QueuedJob.status.in_([COMPLETED, FAILED]),  # type: ignore[attr-defined]
+            QueuedJob.completed_at < before,  # type: ignore[arg-type, operator]
+        )
+        result = await db.execute(stmt)
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+job_queue_ops = JobQueueOperations()
@@ -275,6 +275,32 @@ class OrganizationOperations:
         set_request_cache_value(cache_key, role)
         return role
 
+    async def get_member_roles_bulk(
+        self,
+        db: AsyncSession,
+        organization_ids: set[uuid_pkg.UUID],
+        user_ids: set[uuid_pkg.UUID],
+    ) -> dict[tuple[uuid_pkg.UUID, uuid_pkg.UUID], str]:
+        """
+        Get the roles of many users in many organizations in a single query.
+
+        Returns a dict mapping (organization_id, user_id) -> role for every
+        membership among the given organizations and users.
+        """
+        if not organization_ids or not user_ids:
+            return {}
+
+        statement = select(  # type: ignore[call-overload]
+            OrganizationMember.organization_id,
+            OrganizationMember.user_id,
+            OrganizationMember.role,
+        ).where(
+            OrganizationMember.organization_id.in_(organization_ids),  # type: ignore[attr-defined]
+            OrganizationMember.user_id.in_(user_ids),  # type: ignore[attr-defined]
+        )
+        result = await db.execute(statement)
+        return {(org_id, user_id): role for org_id, user_id, role in result.all()}
+
     async def get_member(
         self,
         db: AsyncSession,
@@ -147,6 +147,54 @@ class ProductAccessOperations:
             for pid in product_ids
         }
 
+    async def get_effective_access_for_members(
+        self,
+        db: AsyncSession,
+        org_product_ids: dict[uuid_pkg.UUID, list[uuid_pkg.UUID]],
+        member_roles: dict[tuple[uuid_pkg.UUID, uuid_pkg.UUID], str],
+    ) -> dict[tuple[uuid_pkg.UUID, uuid_pkg.UUID], dict[uuid_pkg.UUID, str]]:
+        """
+        Get effective access of many org members to their org's products in a single query.
+
+        Like get_effective_access_bulk, for many (organization, user) pairs at
+        once: explicit access is only loaded for members whose org role
+        doesn't already grant admin access.
+
+        Args:
+            db: Database session
+            org_product_ids: Mapping of organization_id -> its product IDs
+            member_roles: Mapping of (organization_id, user_id) -> the user's role there
+
+        Returns:
+            Nested dict: (organization_id, user_id) -> { product_id -> access_level }
+        """
+        admin_roles = (MemberRole.OWNER.value, MemberRole.ADMIN.value)
+        restricted = {
+            (org_id, user_id)
+            for (org_id, user_id), role in member_roles.items()
+            if role not in admin_roles and org_product_ids.get(org_id)
+        }
+
+        explicit: dict[tuple[uuid_pkg.UUID, uuid_pkg.UUID], str] = {}
+        if restricted:
+            product_ids = {pid for org_id, _ in restricted for pid in org_product_ids[org_id]}
+            statement = select(ProductAccess).where(
+                ProductAccess.product_id.in_(product_ids),  # type: ignore[attr-defined]
+                ProductAccess.user_id.in_({user_id for _, user_id in restricted}),  # type: ignore[attr-defined]
+            )
+            result = await db.execute(statement)
+            explicit = {
+                (pa.user_id, pa.product_id): pa.access_level for pa in result.scalars().all()
+            }
+
+        return {
+            (org_id, user_id): {
+                pid: self._compute_effective_access(role, explicit.get((user_id, pid)))
+                for pid in org_product_ids.get(org_id, [])
+            }
+            for (org_id, user_id), role in member_roles.items()
+        }
+
     async def get_product_collaborators(
         self,
         db: AsyncSession,
@@ -48,6 +48,35 @@ class ProgressSummaryOperations:
         result = await db.execute(statement)
         return result.scalar_one_or_none()
 
+    async def get_by_products_period(
+        self,
+        db: AsyncSession,
+        product_ids: list[uuid_pkg.UUID],
+        period: str,
+    ) -> list[ProgressSummary]:
+        """
+        Get existing summaries for multiple products and a period.
+
+        Args:
+            db: Database session
+            product_ids: List of Product UUIDs
+            period: Time period string (e.g., "7d", "30d")
+
+        Returns:
+            List of ProgressSummary for products that have summaries
+        """
+        if not product_ids:
+            return []
+
+        statement = select(ProgressSummary).where(
+            and_(
+                ProgressSummary.product_id.in_(product_ids),  # type: ignore[attr-defined]
+                ProgressSummary.period == period,  # type: ignore[arg-type]
+            )
+        )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
     async def upsert(
         self,
         db: AsyncSession,
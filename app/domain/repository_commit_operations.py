@@ -0,0 +1,211 @@
+"""Domain operations for the local repository commit store."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import case, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.repository_commit import RepositoryCommit
+
+# Rows per INSERT statement (asyncpg caps bind parameters at 32767)
+UPSERT_CHUNK_SIZE = 1000
+
+# How much each source is trusted; a row is only overwritten by an equal or
+# better source. The REST API (sync) is authoritative, push payloads are
+# accurate, and merged-PR rows are approximations.
+SOURCE_RANK = {"pull_request": 0, "push": 1, "sync": 2}
+
+_DESCRIPTIVE_COLUMNS = (
+    "message",
+    "author_name",
+    "html_url",
+    "authored_at",
+    "committed_at",
+    "source",
+)
+_OPTIONAL_COLUMNS = ("github_repo_id", "author_email", "author_login", "author_avatar_url")
+_STAT_COLUMNS = ("additions", "deletions", "files_changed")
+
+
+class RepositoryCommitOperations:
+    """
+    Operations for the repository commit store.
+
+    Note: This doesn't extend BaseOperations because commits are shared
+    (not user-scoped) and keyed by (repository_full_name, commit_sha).
+    """
+
+    def __init__(self) -> None:
+        self.model = RepositoryCommit
+
+    async def bulk_upsert(self, db: AsyncSession, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert commits, merging with rows already stored for the same SHA.
+
+        Descriptive fields are replaced only when the incoming row's source
+        ranks at least as high as the stored one (see SOURCE_RANK). Stats
+        are filled in whenever the incoming row has them.
+
+        Args:
+            db: Database session
+            rows: Dicts with RepositoryCommit column values
+
+        Returns:
+            Count of distinct commits submitted.
+        """
+        if not rows:
+            return 0
+
+        # A statement may not touch the same row twice; keep the best row per key
+        deduped: dict[tuple[str, str], dict[str, Any]] = {}
+        for row in rows:
+            key = (row["repository_full_name"], row["commit_sha"])
+            existing = deduped.get(key)
+            if existing is None or SOURCE_RANK[row["source"]] >= SOURCE_RANK[existing["source"]]:
+                deduped[key] = row
+
+        table = RepositoryCommit.__table__  # type: ignore[attr-defined]
+        values = list(deduped.values())
+        for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+            stmt = insert(self.model).values(values[start : start + UPSERT_CHUNK_SIZE])
+            excluded = stmt.excluded
+            replace = self._source_rank(table.c.source) <= self._source_rank(excluded.source)
+
+            set_: dict[str, Any] = {
+                col: case((replace, excluded[col]), else_=table.c[col])
+                for col in _DESCRIPTIVE_COLUMNS
+            }
+            set_.update(
+                {
+                    col: case(
+                        (replace, func.coalesce(excluded[col], table.c[col])),
+                        else_=func.coalesce(table.c[col], excluded[col]),
+                    )
+                    for col in _OPTIONAL_COLUMNS
+                }
+            )
+            set_.update({col: func.coalesce(excluded[col], table.c[col]) for col in _STAT_COLUMNS})
+
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["repository_full_name", "commit_sha"],
+                    set_=set_,
+                )
+            )
+
+        await db.flush()
+        return len(values)
+
+    async def get_in_window(
+        self,
+        db: AsyncSession,
+        repository_full_names: list[str],
+        since: datetime,
+        until: datetime | None = None,
+    ) -> list[RepositoryCommit]:
+        """
+        Get stored commits for repositories within a time window.
+
+        Args:
+            db: Database session
+            repository_full_names: Repositories to include
+            since: Inclusive lower bound on committed_at
+            until: Optional exclusive upper bound on committed_at
+
+        Returns:
+            Commits ordered newest first.
+        """
+        if not repository_full_names:
+            return []
+
+        statement = select(RepositoryCommit).where(
+            RepositoryCommit.repository_full_name.in_(repository_full_names),  # type: ignore[attr-defined]
+            RepositoryCommit.committed_at >= since,  # type: ignore[arg-type]
+        )
+        if until is not None:
+            statement = statement.where(RepositoryCommit.committed_at < until)  # type: ignore[arg-type]
+        statement = statement.order_by(RepositoryCommit.committed_at.desc())  # type: ignore[attr-defined]
+
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
+    async def get_committed_at(
+        self,
+        db: AsyncSession,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], datetime]:
+        """
+        Get the stored commit time for (repository_full_name, commit_sha) keys.
+
+        Missing commits are simply not in the returned dict.
+        """
+        found: dict[tuple[str, str], datetime] = {}
+        for start in range(0, len(keys), UPSERT_CHUNK_SIZE):
+            statement = select(  # type: ignore[call-overload]
+                RepositoryCommit.repository_full_name,
+                RepositoryCommit.commit_sha,
+                RepositoryCommit.committed_at,
+            ).where(
+                tuple_(RepositoryCommit.repository_full_name, RepositoryCommit.commit_sha).in_(
+                    keys[start : start + UPSERT_CHUNK_SIZE]
+                )
+            )
+            result = await db.execute(statement)
+            for full_name, sha, committed_at in result.all():
+                found[(full_name, sha)] = committed_at
+        return found
+
+    async def get_with_stats(
+        self,
+        db: AsyncSession,
+        keys: list[tuple[str, str]],
+    ) -> set[tuple[str, str]]:
+        """
+        Get the (repository_full_name, commit_sha) keys stored with line stats.
+
+        Commits that are missing, or stored without stats (e.g. from a push
+        webhook), are not in the returned set.
+        """
+        found: set[tuple[str, str]] = set()
+        for start in range(0, len(keys), UPSERT_CHUNK_SIZE):
+            statement = select(  # type: ignore[call-overload]
+                RepositoryCommit.repository_full_name,
+                RepositoryCommit.commit_sha,
+            ).where(
+                tuple_(RepositoryCommit.repository_full_name, RepositoryCommit.commit_sha).in_(
+                    keys[start : start + UPSERT_CHUNK_SIZE]
+                ),
+                RepositoryCommit.additions.is_not(None),  # type: ignore[union-attr]
+            )
+            result = await db.execute(statement)
+            found.update((full_name, sha) for full_name, sha in result.all())
+        return found
+
+    async def get_latest_committed_at(
+        self,
+        db: AsyncSession,
+        repository_full_names: list[str],
+    ) -> dict[str, datetime]:
+        """Get the newest stored commit time per repository."""
+        if not repository_full_names:
+            return {}
+
+        statement = (
+            select(  # type: ignore[call-overload]
+                RepositoryCommit.repository_full_name,
+                func.max(RepositoryCommit.committed_at),
+            )
+            .where(RepositoryCommit.repository_full_name.in_(repository_full_names))  # type: ignore[attr-defined]
+            .group_by(RepositoryCommit.repository_full_name)
+        )
+        result = await db.execute(statement)
+        return dict(result.all())
+
+    @staticmethod
+    def _source_rank(column: Any) -> Any:
+        return case(SOURCE_RANK, value=column, else_=0)
+
+
+repository_commit_ops = RepositoryCommitOperations()
@@ -147,6 +147,56 @@ class RepositoryOperations:
         result = await db.execute(statement)
         return list(result.scalars().all())
 
+    async def get_github_repos_by_products(
+        self,
+        db: AsyncSession,
+        product_ids: list[uuid_pkg.UUID],
+    ) -> dict[uuid_pkg.UUID, list[Repository]]:
+        """Get GitHub-linked repositories for many products in one query.
+
+        Returns:
+            Dict mapping product_id -> repositories (newest first). Products
+            without GitHub repositories are not in the dict.
+        """
+        if not product_ids:
+            return {}
+
+        statement = (
+            select(Repository)
+            .where(
+                Repository.product_id.in_(product_ids),  # type: ignore[union-attr]
+                Repository.github_id.isnot(None),  # type: ignore[union-attr]
+            )
+            .order_by(Repository.created_at.desc())
+        )
+        result = await db.execute(statement)
+        repos_by_product: dict[uuid_pkg.UUID, list[Repository]] = {}
+        for repo in result.scalars().all():
+            if repo.product_id is not None:
+                repos_by_product.setdefault(repo.product_id, []).append(repo)
+        return repos_by_product
+
+    async def get_github_repos_with_org(
+        self,
+        db: AsyncSession,
+    ) -> list[tuple[Repository, uuid_pkg.UUID]]:
+        """Get all GitHub-linked repositories with their product's organization ID.
+
+        Used by background jobs (service role) to resolve a token per org.
+        """
+        statement = (
+            select(Repository, Product.organization_id)  # type: ignore[call-overload]
+            .join(Product, Repository.product_id == Product.id)
+            .where(
+                Repository.github_id.isnot(None),  # type: ignore[union-attr]
+                Repository.full_name.isnot(None),  # type: ignore[union-attr]
+                Product.organization_id.isnot(None),  # type: ignore[union-attr]
+            )
+            .order_by(Repository.created_at)
+        )
+        result = await db.execute(statement)
+        return [(repo, org_id) for repo, org_id in result.all()]
+
     async def create(
         self,
         db: AsyncSession,
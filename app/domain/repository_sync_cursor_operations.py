@@ -0,0 +1,115 @@
+"""Domain operations for commit sync cursors."""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.repository_sync_cursor import RepositorySyncCursor
+
+
+class RepositorySyncCursorOperations:
+    """
+    Operations for commit sync cursors.
+
+    Note: This doesn't extend BaseOperations because cursors are shared
+    (not user-scoped) and keyed by repository_full_name.
+    """
+
+    def __init__(self) -> None:
+        self.model = RepositorySyncCursor
+
+    async def get_by_full_names(
+        self,
+        db: AsyncSession,
+        repository_full_names: list[str],
+    ) -> dict[str, RepositorySyncCursor]:
+        """Get cursors for repositories, keyed by full name."""
+        if not repository_full_names:
+            return {}
+
+        statement = select(RepositorySyncCursor).where(
+            RepositorySyncCursor.repository_full_name.in_(repository_full_names)  # type: ignore[attr-defined]
+        )
+        result = await db.execute(statement)
+        return {cursor.repository_full_name: cursor for cursor in result.scalars().all()}
+
+    async def get_covering(
+        self,
+        db: AsyncSession,
+        repository_full_names: list[str],
+        since: datetime,
+        synced_after: datetime,
+    ) -> set[str]:
+        """
+        Get the repositories whose stored commits are complete for a window.
+
+        Args:
+            db: Database session
+            repository_full_names: Repositories to check
+            since: Start of the window to be read
+            synced_after: Oldest acceptable last sync time
+
+        Returns:
+            Full names of repositories covered from `since` up to a recent sync.
+        """
+        if not repository_full_names:
+            return set()
+
+        statement = select(RepositorySyncCursor.repository_full_name).where(  # type: ignore[call-overload]
+            RepositorySyncCursor.repository_full_name.in_(repository_full_names),  # type: ignore[attr-defined]
+            RepositorySyncCursor.covered_since <= since,
+            RepositorySyncCursor.last_synced_at >= synced_after,
+        )
+        result = await db.execute(statement)
+        return set(result.scalars().all())
+
+    async def record_sync(
+        self,
+        db: AsyncSession,
+        repository_full_name: str,
+        covered_since: datetime,
+        synced_at: datetime,
+        last_commit_sha: str | None = None,
+        last_commit_at: datetime | None = None,
+        reset_coverage: bool = False,
+    ) -> None:
+        """
+        Advance a repository's cursor after a successful sync.
+
+        Coverage only widens unless reset_coverage is set (a run that could
+        not read every commit since the cursor leaves a gap behind it). A run
+        that found no new commits keeps the previous last commit.
+        """
+        stmt = insert(self.model).values(
+            repository_full_name=repository_full_name,
+            covered_since=covered_since,
+            last_synced_at=synced_at,
+            last_commit_sha=last_commit_sha,
+            last_commit_at=last_commit_at,
+        )
+        table = RepositorySyncCursor.__table__  # type: ignore[attr-defined]
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["repository_full_name"],
+                set_={
+                    "covered_since": (
+                        stmt.excluded.covered_since
+                        if reset_coverage
+                        else func.least(table.c.covered_since, stmt.excluded.covered_since)
+                    ),
+                    "last_synced_at": stmt.excluded.last_synced_at,
+                    "last_commit_sha": func.coalesce(
+                        stmt.excluded.last_commit_sha, table.c.last_commit_sha
+                    ),
+                    "last_commit_at": func.coalesce(
+                        stmt.excluded.last_commit_at, table.c.last_commit_at
+                    ),
+                },
+            )
+        )
+        await db.flush()
+
+
+repository_sync_cursor_ops = RepositorySyncCursorOperations()
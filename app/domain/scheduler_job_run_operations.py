@@ -0,0 +1,146 @@
+"""Domain operations for the scheduler job-run ledger."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.scheduler_job_run import SchedulerJobRun
+
+
+class SchedulerJobRunOperations:
+    """
+    Operations for scheduler job runs.
+
+    Note: This doesn't extend BaseOperations because job runs are written
+    by the scheduler only (not user-scoped).
+    """
+
+    def __init__(self) -> None:
+        self.model = SchedulerJobRun
+
+    async def record(
+        self,
+        db: AsyncSession,
+        *,
+        job_name: str,
+        run_key: str,
+        shard_index: int,
+        shard_count: int,
+        instance_id: str,
+        started_at: datetime,
+        finished_at: datetime,
+        duration_seconds: float,
+        status: str,
+        items_processed: int = 0,
+        error_count: int = 0,
+        errors: list[str] | None = None,
+        org_timings: dict[str, float] | None = None,
+    ) -> None:
+        """Add a finished (or failed) shard run to the ledger."""
+        stmt = insert(self.model).values(
+            job_name=job_name,
+            run_key=run_key,
+            shard_index=shard_index,
+            shard_count=shard_count,
+            instance_id=instance_id,
+            started_at=started_at,
+            finished_at=finished_at,
+            duration_seconds=duration_seconds,
+            status=status,
+            items_processed=items_processed,
+            error_count=error_count,
+            errors=errors or [],
+            org_timings=org_timings or {},
+        )
+        await db.execute(stmt)
+
+    async def get_recent(
+        self, db: AsyncSession, job_name: str | None = None, limit: int = 20
+    ) -> list[SchedulerJobRun]:
+        """Get the most recently started runs, optionally of one job."""
+        statement = select(SchedulerJobRun)
+        if job_name:
+            statement = statement.where(
+                SchedulerJobRun.job_name == job_name  # type: ignore[arg-type]
+            )
+        statement = statement.order_by(
+            SchedulerJobRun.started_at.desc()  # type: ignore[attr-defined]
+        ).limit(limit)
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
+    async def get_duration_stats(
+        self,
+        db: AsyncSession,
+        job_name: str,
+        since: datetime,
+        bucket: str = "day",
+    ) -> list[dict[str, Any]]:
+        """
+        Duration percentiles and throughput of a job, per time bucket.
+
+        Args:
+            db: Database session
+            job_name: Job to report on
+            since: Only runs started at or after this time
+            bucket: date_trunc unit to group runs by ("hour", "day", "week")
+
+        Returns:
+            One dict per bucket, oldest first, with run counts, p50/p95/max
+            durations, items processed and errors.
+        """
+        period = func.date_trunc(bucket, SchedulerJobRun.started_at).label("period")
+        duration: Any = SchedulerJobRun.duration_seconds
+        failed: Any = SchedulerJobRun.status == "failed"
+        statement = (
+            select(
+                period,
+                func.count().label("runs"),
+                func.count().filter(failed).label("failed_runs"),
+                func.percentile_cont(0.5).within_group(duration).label("p50"),
+                func.percentile_cont(0.95).within_group(duration).label("p95"),
+                func.max(duration).label("max"),
+                func.sum(duration).label("total_seconds"),
+                func.sum(SchedulerJobRun.items_processed).label("items_processed"),
+                func.sum(SchedulerJobRun.error_count).label("errors"),
+            )
+            .where(
+                SchedulerJobRun.job_name == job_name,  # type: ignore[arg-type]
+                SchedulerJobRun.started_at >= since,  # type: ignore[arg-type]
+            )
+            .group_by(period)
+            .order_by(period)
+        )
+        result = await db.execute(statement)
+
+        stats: list[dict[str, Any]] = []
+        for row in result.all():
+            total_seconds = float(row.total_seconds or 0)
+            items = int(row.items_processed or 0)
+            stats.append(
+                {
+                    "period": row.period.isoformat(),
+                    "runs": row.runs,
+                    "failed_runs": row.failed_runs,
+                    "p50_seconds": round(float(row.p50), 2),
+                    "p95_seconds": round(float(row.p95), 2),
+                    "max_seconds": round(float(row.max), 2),
+                    "items_processed": items,
+                    "items_per_second": round(items / total_seconds, 3) if total_seconds else None,
+                    "errors": int(row.errors or 0),
+                }
+            )
+        return stats
+
+    async def delete_before(self, db: AsyncSession, before: datetime) -> int:
+        """Delete runs started before a time. Returns the number deleted."""
+        stmt = delete(SchedulerJobRun).where(
+            SchedulerJobRun.started_at < before,  # type: ignore[arg-type]
+        )
+        result = await db.execute(stmt)
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+scheduler_job_run_ops = SchedulerJobRunOperations()
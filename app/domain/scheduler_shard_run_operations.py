@@ -0,0 +1,70 @@
+"""Domain operations for completed shards of sharded scheduler runs."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.scheduler_shard_run import SchedulerShardRun
+
+
+class SchedulerShardRunOperations:
+    """
+    Operations for scheduler shard runs.
+
+    Note: This doesn't extend BaseOperations because shard runs are written
+    by the scheduler only (not user-scoped).
+    """
+
+    def __init__(self) -> None:
+        self.model = SchedulerShardRun
+
+    async def get_completed(
+        self, db: AsyncSession, job_name: str, run_key: str, shard_count: int
+    ) -> set[int]:
+        """Get the indexes of the completed shards of a run."""
+        statement = select(SchedulerShardRun.shard_index).where(  # type: ignore[call-overload]
+            SchedulerShardRun.job_name == job_name,
+            SchedulerShardRun.run_key == run_key,
+            SchedulerShardRun.shard_count == shard_count,
+        )
+        result = await db.execute(statement)
+        return set(result.scalars().all())
+
+    async def mark_completed(
+        self,
+        db: AsyncSession,
+        job_name: str,
+        run_key: str,
+        shard_index: int,
+        shard_count: int,
+        instance_id: str,
+    ) -> None:
+        """Record that a shard of a run is done."""
+        stmt = (
+            insert(self.model)
+            .values(
+                job_name=job_name,
+                run_key=run_key,
+                shard_index=shard_index,
+                shard_count=shard_count,
+                instance_id=instance_id,
+                completed_at=datetime.now(UTC),
+            )
+            .on_conflict_do_nothing(
+                index_elements=["job_name", "run_key", "shard_count", "shard_index"],
+            )
+        )
+        await db.execute(stmt)
+
+    async def delete_before(self, db: AsyncSession, before: datetime) -> int:
+        """Delete shard runs completed before a time. Returns the number deleted."""
+        stmt = delete(SchedulerShardRun).where(
+            SchedulerShardRun.completed_at < before,  # type: ignore[arg-type]
+        )
+        result = await db.execute(stmt)
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+scheduler_shard_run_ops = SchedulerShardRunOperations()
@@ -45,6 +45,7 @@ logger = logging.getLogger(__name__)
 async def lifespan(_app: FastAPI):
     """Application lifespan: startup and shutdown events."""
     from app.services.github import close_github_client
+    from app.services.jobs import job_worker
     from app.services.scheduler import scheduler
 
     # Startup
@@ -53,9 +54,12 @@ async def lifespan(_app: FastAPI):
     if settings.debug:
         await init_db()
     scheduler.start()
+    if settings.job_worker_in_api:
+        job_worker.start()
     yield
     # Shutdown
     scheduler.stop()
+    await job_worker.stop()
     await close_github_client()  # Clean up HTTP connection pool
     logger.info("Trajan API shutting down")
 
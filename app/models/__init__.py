@@ -5,9 +5,13 @@ from app.models.announcement import (
     AnnouncementVariant,
 )
 from app.models.app_info import AppInfo, AppInfoCreate, AppInfoUpdate
+from app.models.auto_progress_checkpoint import AutoProgressCheckpoint
+from app.models.commit_activity_daily import CommitActivityDaily
+from app.models.commit_file_cache import CommitFileCache
 from app.models.commit_stats_cache import CommitStatsCache
 from app.models.custom_doc_job import CustomDocJob, JobStatus
 from app.models.dashboard_shipped_summary import DashboardShippedSummary
+from app.models.digest_delivery import DigestDelivery
 from app.models.document import Document, DocumentCreate, DocumentUpdate
 from app.models.document_section import (
     DocumentSection,
@@ -25,6 +29,7 @@ from app.models.feedback import (
     FeedbackStatus,
     FeedbackType,
 )
+from app.models.git_object_cache import GitObjectCache
 from app.models.github_app_installation import (
     GitHubAppInstallation,
     GitHubAppInstallationRepo,
@@ -57,7 +62,12 @@ from app.models.product_api_key import (
     ProductApiKeyRead,
 )
 from app.models.progress_summary import ProgressSummary
+from app.models.queued_job import QueuedJob, QueuedJobStatus
 from app.models.repository import Repository, RepositoryCreate, RepositoryUpdate
+from app.models.repository_commit import RepositoryCommit
+from app.models.repository_sync_cursor import RepositorySyncCursor
+from app.models.scheduler_job_run import SchedulerJobRun
+from app.models.scheduler_shard_run import SchedulerShardRun
 from app.models.subscription import (
     PlanTier,
     Subscription,
@@ -74,7 +84,11 @@ __all__ = [
     "AnnouncementRead",
     "AnnouncementVariant",
     "AnnouncementTargetAudience",
+    "AutoProgressCheckpoint",
+    "CommitActivityDaily",
+    "CommitFileCache",
     "CommitStatsCache",
+    "GitObjectCache",
     "DashboardShippedSummary",
     "ProgressSummary",
     "TeamContributorSummary",
@@ -109,6 +123,8 @@ __all__ = [
     "Repository",
     "RepositoryCreate",
     "RepositoryUpdate",
+    "RepositoryCommit",
+    "RepositorySyncCursor",
     "WorkItem",
     "WorkItemComplete",
     "WorkItemCreate",
@@ -124,6 +140,11 @@ __all__ = [
     "DocumentSubsectionUpdate",
     "CustomDocJob",
     "JobStatus",
+    "QueuedJob",
+    "QueuedJobStatus",
+    "SchedulerShardRun",
+    "SchedulerJobRun",
+    "DigestDelivery",
     "AppInfo",
     "AppInfoCreate",
     "AppInfoUpdate",
@@ -0,0 +1,55 @@
+"""Per-product progress of the daily auto-progress run."""
+
+import uuid as uuid_pkg
+from datetime import UTC, date, datetime
+
+from sqlalchemy import Date, DateTime, Index, text
+from sqlmodel import Field, SQLModel
+
+
+class AutoProgressCheckpoint(SQLModel, table=True):
+    """
+    A product the auto-progress run for a UTC day has finished with.
+
+    Written as each product completes (regenerated, skipped or failed), so a
+    run stopped by the job timeout resumes with the products it had not
+    reached yet instead of starting over the next day. Failed products are
+    not final: later invocations on the same day retry them until `attempts`
+    reaches the generator's retry cap.
+    """
+
+    __tablename__ = "auto_progress_checkpoints"
+    __table_args__ = (
+        Index(
+            "ix_auto_progress_checkpoints_run_product",
+            "run_date",
+            "product_id",
+            unique=True,
+        ),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    run_date: date = Field(nullable=False, sa_type=Date)
+    product_id: uuid_pkg.UUID = Field(nullable=False)
+    organization_id: uuid_pkg.UUID = Field(nullable=False)
+    # regenerated | skipped | failed
+    outcome: str = Field(max_length=20, nullable=False)
+    # Times the day's run has processed the product, this outcome included
+    attempts: int = Field(
+        default=1,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("1")},
+    )
+
+    completed_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
@@ -0,0 +1,56 @@
+"""Daily per-author commit activity rolled up from the local commit store."""
+
+import uuid as uuid_pkg
+from datetime import UTC, date, datetime
+
+from sqlalchemy import Date, DateTime, Index, text
+from sqlmodel import Field, SQLModel
+
+
+class CommitActivityDaily(SQLModel, table=True):
+    """
+    Commits, additions, deletions and files changed per repository, author
+    and UTC day.
+
+    Rebuilt from repository_commits for each (repository, day) touched when
+    commits are ingested, so progress analytics over long windows read a few
+    rows per author-day instead of every commit. Authors are identified by
+    commit author name, matching how the progress endpoints group commits.
+    Commits whose stats are not known yet count as zero lines.
+    """
+
+    __tablename__ = "commit_activity_daily"
+    __table_args__ = (
+        Index(
+            "ix_commit_activity_daily_repo_day_author",
+            "repository_full_name",
+            "day",
+            "author_name",
+            unique=True,
+        ),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    repository_full_name: str = Field(max_length=500, nullable=False)
+    author_name: str = Field(max_length=255, nullable=False)
+    author_login: str | None = Field(default=None, max_length=255)
+    author_avatar_url: str | None = Field(default=None, max_length=500)
+    day: date = Field(nullable=False, sa_type=Date)
+
+    commits: int = Field(default=0, nullable=False)
+    additions: int = Field(default=0, nullable=False)
+    deletions: int = Field(default=0, nullable=False)
+    files_changed: int = Field(default=0, nullable=False)
+
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
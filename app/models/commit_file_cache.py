@@ -0,0 +1,66 @@
+"""Commit file cache model for per-commit file changes from GitHub."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class CommitFileCache(SQLModel, table=True):
+    """
+    Cached list of files changed by a commit.
+
+    Like commit_stats_cache this is shared (not user-scoped): a commit's file
+    changes are fixed by its SHA, so one row serves every viewer forever.
+    Keyed by (repository_full_name, commit_sha) for the same reasons.
+    """
+
+    __tablename__ = "commit_file_cache"
+    __table_args__ = (
+        Index(
+            "ix_commit_file_cache_repo_sha",
+            "repository_full_name",
+            "commit_sha",
+            unique=True,
+        ),
+        Index("ix_commit_file_cache_created_at", "created_at"),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    repository_full_name: str = Field(
+        max_length=500,
+        nullable=False,
+        description="GitHub repo full name (owner/repo)",
+    )
+    commit_sha: str = Field(
+        max_length=40,
+        nullable=False,
+        description="Full 40-character git SHA",
+    )
+
+    # JSON array of file changes
+    files: list[dict[str, Any]] = Field(
+        default_factory=list,
+        sa_column=Column(
+            JSONB,
+            nullable=False,
+            server_default=text("'[]'::jsonb"),
+            comment="Array of file changes: [{filename, status, additions, deletions}]",
+        ),
+    )
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
@@ -0,0 +1,49 @@
+"""Digest emails sent by a scheduled digest run."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Index, text
+from sqlmodel import Field, SQLModel
+
+
+class DigestDelivery(SQLModel, table=True):
+    """
+    A digest preference a scheduled digest run has sent (or is sending) to.
+
+    Recorded and committed before the email goes to Postmark, so an instance
+    that re-runs or takes over a digest shard skips recipients that were
+    already handled for the same run. Rows of sends Postmark rejected are
+    removed again.
+    """
+
+    __tablename__ = "digest_deliveries"
+    __table_args__ = (
+        Index(
+            "ix_digest_deliveries_run_preference",
+            "frequency",
+            "run_key",
+            "preference_id",
+            unique=True,
+        ),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    # "daily" | "weekly"
+    frequency: str = Field(max_length=20, nullable=False)
+    # The scheduler run key (UTC hour) of the run that sent the digest
+    run_key: str = Field(max_length=100, nullable=False)
+    preference_id: uuid_pkg.UUID = Field(nullable=False)
+
+    sent_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
@@ -0,0 +1,61 @@
+"""Content-addressed cache of git objects (blobs and trees) fetched from GitHub."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Index, LargeBinary, text
+from sqlmodel import Field, SQLModel
+
+
+class GitObjectCache(SQLModel, table=True):
+    """
+    Git object contents keyed by SHA.
+
+    This is a shared cache (not user-scoped) because git objects are
+    content-addressed: a SHA identifies exactly one content, so a row can
+    only be served to a caller that already learned the SHA from a tree it
+    was allowed to read. Blob rows are verified against their SHA on write.
+
+    object_type:
+    - "blob": raw file bytes
+    - "tree": JSON-encoded recursive listing of a root tree
+
+    Eviction is LRU by last_accessed_at, bounded by total `size`.
+    """
+
+    __tablename__ = "git_object_cache"
+    __table_args__ = (
+        Index(
+            "ix_git_object_cache_type_sha",
+            "object_type",
+            "sha",
+            unique=True,
+        ),
+        Index("ix_git_object_cache_last_accessed_at", "last_accessed_at"),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    object_type: str = Field(max_length=10, nullable=False, description="blob or tree")
+    sha: str = Field(max_length=40, nullable=False, description="Full 40-character git SHA")
+
+    content: bytes = Field(sa_type=LargeBinary, nullable=False)
+    size: int = Field(nullable=False, description="Length of content in bytes")
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
+    last_accessed_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
@@ -0,0 +1,85 @@
+"""QueuedJob model for the durable background job queue.
+
+Background work (docs generation, analysis, custom docs, team summary
+regeneration) is enqueued here instead of started with asyncio.create_task,
+so it survives deploys and crashes and can run on separate worker processes.
+"""
+
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+from app.models.base import TimestampMixin, UUIDMixin
+
+
+class QueuedJobStatus(str, Enum):
+    """Status of a queued background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class QueuedJob(UUIDMixin, TimestampMixin, SQLModel, table=True):
+    """A unit of background work claimed by workers with FOR UPDATE SKIP LOCKED.
+
+    A claimed job is RUNNING until `locked_until`; the worker extends the lock
+    while the job runs. If the worker dies, the lock expires and another
+    worker claims the job again (visibility timeout).
+    """
+
+    __tablename__ = "job_queue"
+    __table_args__ = (
+        Index("ix_job_queue_type_status_run_after", "job_type", "status", "run_after"),
+        # At most one pending job per dedupe key
+        Index(
+            "ix_job_queue_dedupe_key",
+            "dedupe_key",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    job_type: str = Field(max_length=50, nullable=False)
+    payload: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(
+            JSONB,
+            nullable=False,
+            server_default=text("'{}'::jsonb"),
+            comment="Keyword arguments for the job handler",
+        ),
+    )
+    status: str = Field(
+        default=QueuedJobStatus.QUEUED.value,
+        max_length=20,
+        nullable=False,
+    )
+    dedupe_key: str | None = Field(default=None, max_length=200)
+
+    # Retries
+    attempts: int = Field(default=0, nullable=False)
+    max_attempts: int = Field(default=3, nullable=False)
+    last_error: str | None = Field(default=None, max_length=2000)
+
+    # Scheduling and claiming
+    run_after: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
+    locked_by: str | None = Field(default=None, max_length=100)
+    locked_until: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+    )
+    completed_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+    )
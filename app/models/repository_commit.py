@@ -0,0 +1,79 @@
+"""Local store of commits on tracked repositories' default branches."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Text, text
+from sqlmodel import Field, SQLModel
+
+
+class RepositoryCommit(SQLModel, table=True):
+    """
+    A commit on a repository's default branch, ingested locally.
+
+    Shared across products (keyed by repository full name and SHA, like
+    commit_stats_cache) so a repository linked to several products is stored
+    once. Rows are written by GitHub webhooks and the commit sync worker;
+    progress views read them instead of polling GitHub.
+
+    source records where the row came from. "pull_request" rows are
+    approximations (PR title as message, merge time as commit time) and are
+    overwritten when the same commit arrives from "push" or "sync".
+
+    Stats are NULL until known.
+    """
+
+    __tablename__ = "repository_commits"
+    __table_args__ = (
+        Index(
+            "ix_repository_commits_repo_sha",
+            "repository_full_name",
+            "commit_sha",
+            unique=True,
+        ),
+        Index(
+            "ix_repository_commits_repo_committed_at",
+            "repository_full_name",
+            "committed_at",
+        ),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    repository_full_name: str = Field(max_length=500, nullable=False)
+    github_repo_id: int | None = Field(default=None, sa_type=BigInteger)
+    commit_sha: str = Field(max_length=40, nullable=False, description="Full 40-character SHA")
+
+    message: str = Field(sa_type=Text, nullable=False)
+    author_name: str = Field(max_length=255, nullable=False)
+    author_email: str | None = Field(default=None, max_length=255)
+    author_login: str | None = Field(default=None, max_length=255)
+    author_avatar_url: str | None = Field(default=None, max_length=500)
+    html_url: str = Field(max_length=500, nullable=False)
+
+    authored_at: datetime = Field(
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+    )
+    committed_at: datetime = Field(
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+    )
+
+    additions: int | None = Field(default=None)
+    deletions: int | None = Field(default=None)
+    files_changed: int | None = Field(default=None)
+
+    source: str = Field(max_length=20, nullable=False, description="push, pull_request or sync")
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
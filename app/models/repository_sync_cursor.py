@@ -0,0 +1,60 @@
+"""Per-repository position of the incremental commit sync."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Index, text
+from sqlmodel import Field, SQLModel
+
+
+class RepositorySyncCursor(SQLModel, table=True):
+    """
+    How far the commit sync worker has read a repository's default branch.
+
+    Keyed by repository full name, like repository_commits, so a repository
+    linked to several products is synced once. Each run fetches only commits
+    newer than last_commit_at and advances the cursor.
+
+    covered_since is the oldest commit time the store is complete from: reads
+    of a window starting at or after it (on a recently synced cursor) can be
+    served from repository_commits instead of GitHub.
+    """
+
+    __tablename__ = "repository_sync_cursors"
+    __table_args__ = (
+        Index(
+            "ix_repository_sync_cursors_full_name",
+            "repository_full_name",
+            unique=True,
+        ),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    repository_full_name: str = Field(max_length=500, nullable=False)
+
+    last_commit_sha: str | None = Field(default=None, max_length=40)
+    last_commit_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+    )
+    covered_since: datetime = Field(
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+    )
+    last_synced_at: datetime = Field(
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+    )
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
@@ -0,0 +1,62 @@
+"""Ledger of scheduled job runs with duration and throughput metrics."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class SchedulerJobRun(SQLModel, table=True):
+    """
+    One shard of a scheduled job run, as executed by one instance.
+
+    Written when the shard finishes or fails, so duration percentiles over
+    time show a job slowing down long before it hits its timeout.
+    """
+
+    __tablename__ = "scheduler_job_runs"
+    __table_args__ = (Index("ix_scheduler_job_runs_job_started", "job_name", "started_at"),)
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    job_name: str = Field(max_length=50, nullable=False)
+    run_key: str = Field(max_length=100, nullable=False)
+    shard_index: int = Field(nullable=False)
+    shard_count: int = Field(nullable=False)
+    instance_id: str = Field(max_length=100, nullable=False)
+
+    started_at: datetime = Field(
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+    )
+    finished_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+    )
+    duration_seconds: float = Field(nullable=False)
+
+    # "completed" or "failed" (the shard raised and is retried)
+    status: str = Field(max_length=20, nullable=False)
+    # Products processed (auto-progress) or emails sent (digests)
+    items_processed: int = Field(default=0, nullable=False)
+    error_count: int = Field(default=0, nullable=False)
+    # First errors of the run (capped), as reported by the job
+    errors: list[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'::jsonb")),
+    )
+    # Seconds spent per organization, by org id (summed over concurrent work,
+    # not elapsed time)
+    org_timings: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    )
@@ -0,0 +1,50 @@
+"""Completed shards of sharded scheduler runs."""
+
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Index, text
+from sqlmodel import Field, SQLModel
+
+
+class SchedulerShardRun(SQLModel, table=True):
+    """
+    A shard of a scheduled job run that an instance has finished.
+
+    Instances skip completed shards and keep retrying the others until every
+    shard of the run is done, so shards of an instance that died mid-run are
+    picked up by the remaining instances.
+    """
+
+    __tablename__ = "scheduler_shard_runs"
+    __table_args__ = (
+        Index(
+            "ix_scheduler_shard_runs_job_run_shard",
+            "job_name",
+            "run_key",
+            "shard_count",
+            "shard_index",
+            unique=True,
+        ),
+    )
+
+    id: uuid_pkg.UUID = Field(
+        default_factory=uuid_pkg.uuid4,
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
+
+    job_name: str = Field(max_length=50, nullable=False)
+    # Identifies one scheduled run, e.g. the UTC date or hour
+    run_key: str = Field(max_length=100, nullable=False)
+    shard_index: int = Field(nullable=False)
+    shard_count: int = Field(nullable=False)
+    instance_id: str = Field(max_length=100, nullable=False)
+
+    completed_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": text("now()")},
+    )
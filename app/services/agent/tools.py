@@ -123,7 +123,7 @@ class AgentToolExecutor:
         owner, name = repo_name.split("/", 1)
         branch = getattr(repo, "default_branch", None) or "main"
 
-        result = await self._gh.get_file_content(owner, name, file_path, branch)
+        result = await self._gh.get_file_content_via_tree(owner, name, file_path, branch)
         if not result:
             return f"File not found: {file_path} (branch: {branch})"
 
@@ -1,7 +1,7 @@
 """
 Analysis background task for AI-powered product analysis.
 
-This module provides the background task entry point for product analysis.
+This module provides the background job entry point for product analysis.
 The actual analysis workflow is coordinated by AnalysisOrchestrator.
 
 Part of the Analysis Agent refactoring (Phase 5).
@@ -15,10 +15,25 @@ from app.models.product import Product
 from app.schemas.product_overview import ProductOverview
 from app.services.analysis_orchestrator import AnalysisOrchestrator
 from app.services.docs.file_source import create_github_service_factory, get_fallback_github_service
+from app.services.github import background_github_work
+from app.services.jobs import enqueue_job, job_handler
 
 logger = logging.getLogger(__name__)
 
+ANALYSIS_JOB = "product_analysis"
 
+
+async def enqueue_analysis(product_id: uuid_pkg.UUID, user_id: uuid_pkg.UUID) -> None:
+    """Queue analysis for a product (at most one pending per product)."""
+    await enqueue_job(
+        ANALYSIS_JOB,
+        {"product_id": str(product_id), "user_id": str(user_id)},
+        dedupe_key=f"{ANALYSIS_JOB}:{product_id}",
+    )
+
+
+@job_handler(ANALYSIS_JOB, concurrency=2, visibility_timeout_seconds=300, max_attempts=2)
+@background_github_work
 async def run_analysis_task(
     product_id: str,
     user_id: str,
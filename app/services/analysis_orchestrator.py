@@ -347,6 +347,8 @@ class AnalysisOrchestrator:
                         repo=repo_name,
                         paths=result.selected_files,
                         branch=context.default_branch,
+                        use_snapshot=True,
+                        tree=context.tree,
                     )
 
                     # Merge with existing files (key files + selected architecture files)
@@ -378,6 +380,8 @@ class AnalysisOrchestrator:
                                 repo=repo_name,
                                 paths=additional_files,
                                 branch=context.default_branch,
+                                use_snapshot=True,
+                                tree=context.tree,
                             )
                             context.files.update(additional_contents)
                             logger.info(
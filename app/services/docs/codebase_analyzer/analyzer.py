@@ -176,7 +176,8 @@ class CodebaseAnalyzer:
         Fetch files using priority tiers with token budget management.
 
         Tier 1 files are always fetched, Tier 2 if budget allows,
-        Tier 3 only summarized (not content).
+        Tier 3 only summarized (not content). Both passes read from one
+        tarball snapshot of the branch rather than per-file API calls.
         """
         # Classify files by tier
         tier_1_files: list[str] = []
@@ -200,7 +201,13 @@ class CodebaseAnalyzer:
 
         # Fetch Tier 1 (always)
         t1_contents = await github_service.fetch_files_by_paths(
-            owner, repo, tier_1_files, branch, max_size=MAX_FILE_SIZE
+            owner,
+            repo,
+            tier_1_files,
+            branch,
+            max_size=MAX_FILE_SIZE,
+            use_snapshot=True,
+            tree=tree,
         )
         for path, content in t1_contents.items():
             tokens = len(content) // CHARS_PER_TOKEN
@@ -223,7 +230,7 @@ class CodebaseAnalyzer:
             t2_to_fetch = tier_2_files[:max_tier_2]
 
             t2_contents = await github_service.fetch_files_by_paths(
-                owner, repo, t2_to_fetch, branch, max_size=MAX_FILE_SIZE
+                owner, repo, t2_to_fetch, branch, max_size=MAX_FILE_SIZE, tree=tree
             )
             for path, content in t2_contents.items():
                 tokens = len(content) // CHARS_PER_TOKEN
@@ -515,7 +515,7 @@ class DocumentOrchestrator:
 
             try:
                 file_content = await github_service.get_file_content(
-                    owner, repo_name, item.path, branch
+                    owner, repo_name, item.path, branch, blob_sha=item.sha
                 )
                 if not file_content:
                     continue
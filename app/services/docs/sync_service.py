@@ -421,7 +421,7 @@ class DocsSyncService:
         branch = repo.sync_branch or repo.default_branch or "main"
 
         try:
-            file_content = await self.github_service.get_file_content(
+            file_content = await self.github_service.get_file_content_via_tree(
                 owner, repo_name, doc.github_path, branch
             )
             if not file_content:
@@ -531,7 +531,7 @@ class DocsSyncService:
         owner, repo_name = repository.full_name.split("/", 1)
 
         file_content = await self.github_service.get_file_content(
-            owner, repo_name, item.path, branch
+            owner, repo_name, item.path, branch, blob_sha=item.sha
         )
         if not file_content:
             raise ValueError(f"Could not fetch content for {item.path}")
@@ -571,7 +571,7 @@ class DocsSyncService:
         owner, repo_name = repository.full_name.split("/", 1)
 
         file_content = await self.github_service.get_file_content(
-            owner, repo_name, item.path, branch
+            owner, repo_name, item.path, branch, blob_sha=item.sha
         )
         if not file_content:
             return
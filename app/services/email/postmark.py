@@ -8,6 +8,7 @@ Auth-related emails (invites, password reset) remain with Supabase.
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
 import httpx
 
@@ -16,12 +17,25 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 POSTMARK_API_URL = "https://api.postmarkapp.com/email"
+POSTMARK_BATCH_URL = "https://api.postmarkapp.com/email/batch"
+# Postmark accepts at most 500 messages per batch request
+POSTMARK_BATCH_SIZE = 500
 POSTMARK_HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
 }
 
 
+@dataclass
+class EmailMessage:
+    """One transactional email for send_batch()."""
+
+    to: str
+    subject: str
+    html_body: str
+    text_body: str
+
+
 class PostmarkService:
     """Send transactional emails via Postmark's REST API."""
 
@@ -101,6 +115,90 @@ class PostmarkService:
             logger.error(f"[postmark] Request failed sending to {to}: {e}")
             return False
 
+    async def send_batch(self, messages: list[EmailMessage]) -> list[bool]:
+        """
+        Send many transactional emails via Postmark's batch endpoint.
+
+        Messages go out in requests of up to POSTMARK_BATCH_SIZE. Returns one
+        result per message, in order: True if Postmark accepted it. A failed
+        request marks its whole chunk as failed (logs the error, never raises).
+        """
+        if not messages:
+            return []
+        if not settings.postmark_enabled:
+            logger.warning("[postmark] Skipped (POSTMARK_API_KEY not configured)")
+            return [False] * len(messages)
+
+        headers = {
+            **POSTMARK_HEADERS,
+            "X-Postmark-Server-Token": settings.postmark_api_key,
+        }
+
+        client = getattr(self, "_shared_client", None)
+        if client:
+            return await self._send_chunks(client, messages, headers)
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            return await self._send_chunks(client, messages, headers)
+
+    async def _send_chunks(
+        self,
+        client: httpx.AsyncClient,
+        messages: list[EmailMessage],
+        headers: dict[str, str],
+    ) -> list[bool]:
+        """Send messages in chunks of POSTMARK_BATCH_SIZE, one request each."""
+        results: list[bool] = []
+        for i in range(0, len(messages), POSTMARK_BATCH_SIZE):
+            chunk = messages[i : i + POSTMARK_BATCH_SIZE]
+            results.extend(await self._send_chunk(client, chunk, headers))
+        return results
+
+    async def _send_chunk(
+        self,
+        client: httpx.AsyncClient,
+        chunk: list[EmailMessage],
+        headers: dict[str, str],
+    ) -> list[bool]:
+        """POST one batch request. Returns one result per message."""
+        payload = [
+            {
+                "From": settings.postmark_from_email,
+                "To": message.to,
+                "Subject": message.subject,
+                "HtmlBody": message.html_body,
+                "TextBody": message.text_body,
+                "MessageStream": "outbound",
+            }
+            for message in chunk
+        ]
+
+        try:
+            response = await client.post(POSTMARK_BATCH_URL, json=payload, headers=headers)
+            response.raise_for_status()
+            responses = response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"[postmark] HTTP {e.response.status_code} sending batch of {len(chunk)}: "
+                f"{e.response.text}"
+            )
+            return [False] * len(chunk)
+        except (httpx.RequestError, ValueError) as e:
+            logger.error(f"[postmark] Batch request of {len(chunk)} failed: {e}")
+            return [False] * len(chunk)
+
+        # Postmark answers each message in order, with ErrorCode 0 on success
+        results: list[bool] = []
+        for message, item in zip(chunk, responses, strict=False):
+            ok = isinstance(item, dict) and item.get("ErrorCode") == 0
+            if not ok:
+                error = item.get("Message") if isinstance(item, dict) else item
+                logger.error(f"[postmark] Rejected email to {message.to}: {error}")
+            results.append(ok)
+        results.extend([False] * (len(chunk) - len(results)))
+
+        logger.info(f"[postmark] Sent batch: {sum(results)}/{len(chunk)} accepted")
+        return results
+
     async def send_team_invite(
         self,
         to: str,
@@ -9,6 +9,13 @@ data — zero AI cost at send time.
 Since v0.16.15 this job iterates OrgDigestPreference rows (one per user
 per org) instead of global UserPreferences, and enforces product-level
 access. Each org produces a separate email.
+
+Everything a run needs is prefetched in set-based queries, and the emails
+are sent through Postmark's batch endpoint (up to 500 per request).
+
+Scheduled runs record each recipient in digest_deliveries before sending, so
+a shard that is re-run or taken over by another instance does not email the
+same recipients twice.
 """
 
 import logging
@@ -17,13 +24,16 @@ import uuid as uuid_pkg
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from html import escape as html_escape
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core.sharding import ShardSpec
 from app.domain.dashboard_shipped_operations import dashboard_shipped_ops
+from app.domain.digest_delivery_operations import digest_delivery_ops
 from app.domain.org_digest_preference_operations import org_digest_preference_ops
 from app.domain.organization_operations import organization_ops
 from app.domain.product_access_operations import product_access_ops
@@ -32,7 +42,7 @@ from app.models.org_digest_preference import OrgDigestPreference
 from app.models.organization import Organization
 from app.models.product import Product
 from app.models.user import User
-from app.services.email.postmark import postmark_service
+from app.services.email.postmark import EmailMessage, postmark_service
 
 logger = logging.getLogger(__name__)
 
@@ -270,75 +280,88 @@ def _build_plain_text(
 # ---------------------------------------------------------------------------
 
 
-async def _get_org_products(
+@dataclass
+class _ProductSection:
+    """A product's digest content, rendered once and shared by all recipients."""
+
+    name: str
+    narrative: str
+    items: list[dict[str, Any]]
+    contributor_summaries: list[dict[str, Any]] | None
+    html: str
+
+
+@dataclass
+class _Recipient:
+    """An eligible user + org pair and the products their digest may cover."""
+
+    pref: OrgDigestPreference
+    email: str
+    org_name: str
+    products: list[Product]
+
+
+def _count_skip(report: WeeklyDigestReport, reason: str) -> None:
+    report.skipped_reasons[reason] = report.skipped_reasons.get(reason, 0) + 1
+
+
+async def _get_products_by_org(
     db: AsyncSession,
-    organization_id: uuid_pkg.UUID,
-) -> list[Product]:
-    """Get all products belonging to a single organization."""
+    organization_ids: set[uuid_pkg.UUID],
+) -> dict[uuid_pkg.UUID, list[Product]]:
+    """Get the products of several organizations in a single query."""
+    if not organization_ids:
+        return {}
     stmt = select(Product).where(
-        Product.organization_id == organization_id  # type: ignore[arg-type]
+        Product.organization_id.in_(organization_ids)  # type: ignore[union-attr]
     )
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    products_by_org: dict[uuid_pkg.UUID, list[Product]] = {}
+    for product in result.scalars().all():
+        if product.organization_id is not None:
+            products_by_org.setdefault(product.organization_id, []).append(product)
+    return products_by_org
 
 
-async def _filter_accessible_products(
-    db: AsyncSession,
+def _select_products(
     products: list[Product],
-    user_id: uuid_pkg.UUID,
-    org_role: str,
+    access: dict[uuid_pkg.UUID, str],
+    digest_product_ids: list[str] | None,
 ) -> list[Product]:
-    """Filter products to only those the user has access != 'none'."""
-    if not products:
-        return []
-    product_ids = [p.id for p in products]
-    access_map = await product_access_ops.get_effective_access_bulk(
-        db, product_ids, user_id, org_role
-    )
-    return [p for p in products if access_map.get(p.id, "viewer") != "none"]
+    """Products a digest covers: accessible ones, narrowed to the user's selection."""
+    accessible = [p for p in products if access.get(p.id, "viewer") != "none"]
+    if not digest_product_ids:
+        return accessible
+    selected = {str(pid) for pid in digest_product_ids}
+    return [p for p in accessible if str(p.id) in selected]
 
 
-async def _send_digest_for_org(
+async def _load_product_sections(
     db: AsyncSession,
-    pref: OrgDigestPreference,
-    user_email: str,
-    org_name: str,
-    org_role: str,
-    report: WeeklyDigestReport,
-    frequency: str = "weekly",
-) -> bool:
-    """Build and send the digest email for a single user + org pair.
+    products: dict[uuid_pkg.UUID, Product],
+    frequency: str,
+) -> dict[uuid_pkg.UUID, _ProductSection]:
+    """Load cached progress for all products at once and render each one.
 
-    Returns True if at least one email was sent.
+    Products with neither a narrative nor significant shipped items are left out.
     """
     config = FREQUENCY_CONFIG.get(frequency, FREQUENCY_CONFIG["weekly"])
     period = config["period"]
+    product_ids = list(products)
 
-    # Fetch org products and enforce product-level access
-    all_products = await _get_org_products(db, pref.organization_id)
-    accessible = await _filter_accessible_products(
-        db, all_products, pref.user_id, org_role
-    )
-
-    # Apply user's product filter on top of access-checked list
-    if pref.digest_product_ids:
-        selected = {str(pid) for pid in pref.digest_product_ids}
-        products = [p for p in accessible if str(p.id) in selected]
-    else:
-        products = accessible
-
-    if not products:
-        report.skipped_reasons["no_products"] = (
-            report.skipped_reasons.get("no_products", 0) + 1
-        )
-        return False
-
-    # Gather cached progress data per product
-    product_data: list[tuple[str, str, list[dict], list[dict] | None]] = []
+    summaries = {
+        s.product_id: s
+        for s in await progress_summary_ops.get_by_products_period(db, product_ids, period)
+    }
+    shipped_by_product = {
+        s.product_id: s
+        for s in await dashboard_shipped_ops.get_by_products_period(db, product_ids, period)
+    }
 
-    for product in products:
-        summary = await progress_summary_ops.get_by_product_period(db, product.id, period)
-        shipped = await dashboard_shipped_ops.get_by_product_period(db, product.id, period)
+    sections: dict[uuid_pkg.UUID, _ProductSection] = {}
+    for product_id, product in products.items():
+        summary = summaries.get(product_id)
+        shipped = shipped_by_product.get(product_id)
 
         narrative = summary.summary_text if summary else ""
         items = shipped.items if shipped and shipped.has_significant_changes else []
@@ -347,46 +370,56 @@ async def _send_digest_for_org(
         if not narrative and not items:
             continue
 
-        product_data.append((
-            product.name or "Untitled Project",
-            narrative,
-            items,
-            contrib_summaries,
-        ))
-
-    if not product_data:
-        report.skipped_reasons["no_activity"] = (
-            report.skipped_reasons.get("no_activity", 0) + 1
+        name = product.name or "Untitled Project"
+        sections[product_id] = _ProductSection(
+            name=name,
+            narrative=narrative,
+            items=items,
+            contributor_summaries=contrib_summaries,
+            html=_build_product_html(name, narrative, items, contrib_summaries),
         )
-        return False
+    return sections
 
-    # Build one consolidated email per org
-    sections = [
-        _build_product_html(name, narrative, items, contribs)
-        for name, narrative, items, contribs in product_data
-    ]
-    html_body = _build_email_html(sections, settings.frontend_url, frequency)
-    text_body = _build_plain_text(product_data, frequency)
 
-    subject = config["subject_all"].format(org=org_name)
+def _build_digest_message(
+    recipient: _Recipient,
+    sections: dict[uuid_pkg.UUID, _ProductSection],
+    frequency: str = "weekly",
+) -> EmailMessage | None:
+    """Assemble one consolidated digest email from pre-rendered product sections.
 
-    sent = await postmark_service.send(
-        to=user_email,
-        subject=subject,
+    Returns None if none of the recipient's products had activity.
+    """
+    config = FREQUENCY_CONFIG.get(frequency, FREQUENCY_CONFIG["weekly"])
+    product_sections = [
+        sections[p.id] for p in recipient.products if p.id in sections
+    ]
+    if not product_sections:
+        return None
+
+    html_body = _build_email_html(
+        [section.html for section in product_sections], settings.frontend_url, frequency
+    )
+    text_body = _build_plain_text(
+        [
+            (s.name, s.narrative, s.items, s.contributor_summaries)
+            for s in product_sections
+        ],
+        frequency,
+    )
+    return EmailMessage(
+        to=recipient.email,
+        subject=config["subject_all"].format(org=recipient.org_name),
         html_body=html_body,
         text_body=text_body,
     )
-    if sent:
-        report.emails_sent += 1
-        return True
-    else:
-        report.errors += 1
-        return False
 
 
 async def send_digests(
     db: AsyncSession,
     frequency: str = "weekly",
+    shard: ShardSpec | None = None,
+    run_key: str | None = None,
 ) -> WeeklyDigestReport:
     """Send digest emails to eligible users for the given frequency.
 
@@ -394,7 +427,18 @@ async def send_digests(
     filters to users whose local time matches their configured digest_hour,
     then sends one email per org with product-level access enforcement.
 
+    Users, orgs, roles, product access, summaries and shipped items for the
+    whole run are loaded in a handful of set-based queries, each product
+    section is rendered once for everyone who receives it, and the emails
+    go out through Postmark's batch endpoint.
+
     For weekly: only on the configured digest day. For daily: every day.
+    With a shard, only preferences of organizations in that shard are handled.
+
+    With a run_key, recipients already delivered for that run are skipped and
+    the rest are recorded (and committed) before the batch goes to Postmark.
+    A crash mid-send therefore loses those emails for the run rather than
+    sending them twice; rejected sends are un-recorded after the batch.
     """
     label = f"{frequency}-digest"
     report = WeeklyDigestReport()
@@ -409,6 +453,8 @@ async def send_digests(
     all_prefs = await org_digest_preference_ops.get_all_active_for_frequency(
         db, frequency
     )
+    if shard is not None:
+        all_prefs = [p for p in all_prefs if shard.contains(p.organization_id)]
 
     report.users_checked = len(all_prefs)
     logger.info(
@@ -462,53 +508,102 @@ async def send_digests(
         o.id: o for o in org_result.scalars().all()
     }
 
-    # Track which users actually received at least one email
-    users_emailed: set[uuid_pkg.UUID] = set()
+    # Batch-load roles, products and product access for every recipient
+    roles = await organization_ops.get_member_roles_bulk(db, org_ids, user_ids)
+    products_by_org = await _get_products_by_org(db, org_ids)
+    access = await product_access_ops.get_effective_access_for_members(
+        db,
+        {org_id: [p.id for p in products] for org_id, products in products_by_org.items()},
+        {
+            (pref.organization_id, pref.user_id): roles[(pref.organization_id, pref.user_id)]
+            for pref in eligible
+            if (pref.organization_id, pref.user_id) in roles
+        },
+    )
 
-    async with postmark_service.batch():
-        for pref in eligible:
-            user = users_by_id.get(pref.user_id)
-            if not user or not user.email:
-                report.skipped_reasons["no_email"] = (
-                    report.skipped_reasons.get("no_email", 0) + 1
-                )
-                continue
+    recipients: list[_Recipient] = []
+    for pref in eligible:
+        user = users_by_id.get(pref.user_id)
+        if not user or not user.email:
+            _count_skip(report, "no_email")
+            continue
 
-            org = orgs_by_id.get(pref.organization_id)
-            if not org:
-                report.skipped_reasons["no_org"] = (
-                    report.skipped_reasons.get("no_org", 0) + 1
-                )
-                continue
+        org = orgs_by_id.get(pref.organization_id)
+        if not org:
+            _count_skip(report, "no_org")
+            continue
+
+        member = (pref.organization_id, pref.user_id)
+        if member not in roles:
+            _count_skip(report, "not_member")
+            continue
+
+        products = _select_products(
+            products_by_org.get(pref.organization_id, []),
+            access.get(member, {}),
+            pref.digest_product_ids,
+        )
+        if not products:
+            _count_skip(report, "no_products")
+            continue
 
-            # Resolve the user's role in this org for access checks
-            role = await organization_ops.get_member_role(
-                db, pref.organization_id, pref.user_id
+        recipients.append(_Recipient(pref, user.email, org.name, products))
+
+    if run_key is not None and recipients:
+        delivered = await digest_delivery_ops.get_delivered(
+            db, frequency, run_key, [r.pref.id for r in recipients]
+        )
+        pending: list[_Recipient] = []
+        for recipient in recipients:
+            if recipient.pref.id in delivered:
+                _count_skip(report, "already_sent")
+            else:
+                pending.append(recipient)
+        recipients = pending
+
+    # Load and render every product section once, then assemble the emails
+    sections = await _load_product_sections(
+        db, {p.id: p for r in recipients for p in r.products}, frequency
+    )
+
+    outgoing: list[tuple[_Recipient, EmailMessage]] = []
+    for recipient in recipients:
+        try:
+            message = _build_digest_message(recipient, sections, frequency)
+        except Exception:
+            logger.exception(
+                f"[{label}] Error building digest for user {recipient.pref.user_id} "
+                f"org {recipient.pref.organization_id}"
             )
-            if role is None:
-                report.skipped_reasons["not_member"] = (
-                    report.skipped_reasons.get("not_member", 0) + 1
-                )
-                continue
-
-            try:
-                sent = await _send_digest_for_org(
-                    db,
-                    pref,
-                    user.email,
-                    org.name,
-                    role.value if hasattr(role, "value") else str(role),
-                    report,
-                    frequency,
-                )
-                if sent:
-                    users_emailed.add(pref.user_id)
-            except Exception:
-                logger.exception(
-                    f"[{label}] Error processing user {pref.user_id} "
-                    f"org {pref.organization_id}"
-                )
+            report.errors += 1
+            continue
+        if message is None:
+            _count_skip(report, "no_activity")
+            continue
+        outgoing.append((recipient, message))
+
+    # Track which users actually received at least one email
+    users_emailed: set[uuid_pkg.UUID] = set()
+    if outgoing:
+        if run_key is not None:
+            # Committed before sending, so a re-run of this shard skips them
+            await digest_delivery_ops.record(
+                db, frequency, run_key, [r.pref.id for r, _ in outgoing]
+            )
+            await db.commit()
+
+        results = await postmark_service.send_batch([message for _, message in outgoing])
+        rejected: list[uuid_pkg.UUID] = []
+        for (recipient, _), sent in zip(outgoing, results, strict=True):
+            if sent:
+                report.emails_sent += 1
+                users_emailed.add(recipient.pref.user_id)
+            else:
                 report.errors += 1
+                rejected.append(recipient.pref.id)
+
+        if run_key is not None and rejected:
+            await digest_delivery_ops.remove(db, frequency, run_key, rejected)
 
     report.users_emailed = len(users_emailed)
     report.duration_seconds = round(time.monotonic() - start, 2)
@@ -8,6 +8,9 @@ Module structure:
 - service.py: Main GitHubService facade
 - read_operations.py: All read-only API operations
 - write_operations.py: All write/mutation API operations
+- snapshot.py: Tarball snapshots for bulk file reads
+- rate_limiter.py: Rate-limit-aware request scheduling with priority lanes
+- object_store.py: Persistent SHA-keyed store of blob contents and trees
 - helpers.py: Rate limit handling and error utilities
 - types.py: Data types and response models
 - exceptions.py: Custom exceptions
@@ -17,11 +20,21 @@ Module structure:
 from app.services.github.cache import clear_all_caches as clear_github_caches
 from app.services.github.cache import get_cache_stats as get_github_cache_stats
 from app.services.github.constants import GITHUB_LANGUAGE_COLORS, KEY_FILES
-from app.services.github.exceptions import GitHubAPIError
+from app.services.github.exceptions import (
+    GitHubAPIError,
+    GitHubRequestShed,
+    SnapshotTooLargeError,
+)
 from app.services.github.helpers import RateLimitInfo, handle_error_response
 from app.services.github.http_client import close_github_client
+from app.services.github.rate_limiter import (
+    RequestPriority,
+    background_github_work,
+    github_priority,
+)
 from app.services.github.read_operations import GitHubReadOperations
 from app.services.github.service import GitHubService, calculate_lines_of_code
+from app.services.github.snapshot import RepoSnapshot
 from app.services.github.types import (
     CommitStats,
     ContributorInfo,
@@ -43,6 +56,10 @@ __all__ = [
     "GitHubWriteOperations",
     # HTTP client lifecycle
     "close_github_client",
+    # Request scheduling
+    "RequestPriority",
+    "background_github_work",
+    "github_priority",
     # Cache management
     "clear_github_caches",
     "get_github_cache_stats",
@@ -52,6 +69,8 @@ __all__ = [
     "RateLimitInfo",
     # Exceptions
     "GitHubAPIError",
+    "GitHubRequestShed",
+    "SnapshotTooLargeError",
     # Types
     "CommitStats",
     "ContributorInfo",
@@ -60,6 +79,7 @@ __all__ = [
     "LanguageStat",
     "RepoContext",
     "RepoFile",
+    "RepoSnapshot",
     "RepoTree",
     "RepoTreeItem",
     # Constants
@@ -9,15 +9,29 @@ Cache durations are tuned based on how frequently the underlying data changes:
 - Languages: 1 hour (rarely changes)
 - Contributors: 1 hour (rarely changes)
 - Repo details: 10 minutes (stars/forks can change, but not frequently)
+- Snapshots: 5 minutes, few entries (each holds extracted tarball contents)
+
+Behind the TTL caches sits a conditional-request store: raw GET response
+bodies are kept alongside their ETag/Last-Modified validators so that a
+repeat request can be revalidated with If-None-Match. GitHub answers an
+unchanged resource with a 304, which does not count against the rate limit.
+
+Cache misses are single-flighted: concurrent callers asking for the same key
+share one in-flight request instead of each issuing their own.
 """
 
+import asyncio
 import hashlib
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
 from functools import wraps
 from typing import Any, ParamSpec, TypeVar
 
-from cachetools import TTLCache  # type: ignore[import-untyped]
+import httpx
+from cachetools import LRUCache, TTLCache  # type: ignore[import-untyped]
+
+from app.services.github.rate_limiter import current_priority
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +45,54 @@ _languages_cache: TTLCache[str, Any] = TTLCache(maxsize=200, ttl=3600)  # 1 hour
 _contributors_cache: TTLCache[str, Any] = TTLCache(maxsize=200, ttl=3600)  # 1 hour
 _repo_details_cache: TTLCache[str, Any] = TTLCache(maxsize=200, ttl=600)  # 10 min
 _agent_context_cache: TTLCache[str, Any] = TTLCache(maxsize=50, ttl=60)  # 60s
+_snapshot_cache: TTLCache[str, Any] = TTLCache(maxsize=4, ttl=300)  # 5 min
+
+# Response headers worth replaying when a stored body is served for a 304.
+# Content-Length/Encoding are deliberately excluded: the stored body is decoded.
+_REPLAYED_HEADERS = ("Content-Type", "Link", "ETag", "Last-Modified")
+
+
+@dataclass
+class ConditionalEntry:
+    """A stored GET response body together with its revalidation validators."""
+
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def validator_headers(self) -> dict[str, str]:
+        """Headers that turn a repeat GET into a conditional request."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, not_modified: httpx.Response) -> httpx.Response:
+        """
+        Rebuild a 200 response from the stored body.
+
+        Headers from the 304 (fresh rate-limit counters, refreshed validators)
+        take precedence over the stored ones.
+        """
+        headers = dict(self.headers)
+        headers.update(
+            (name, value)
+            for name, value in not_modified.headers.items()
+            if name.lower().startswith("x-ratelimit-") or name.lower() in ("etag", "last-modified")
+        )
+        return httpx.Response(200, content=self.content, headers=headers)
+
+
+# Conditional-request store, bounded by total body bytes rather than entry count
+# since tree and commit-list payloads vary from a few hundred bytes to megabytes.
+# Entries are evicted LRU; there is no TTL because every hit is revalidated.
+_conditional_cache: LRUCache[str, ConditionalEntry] = LRUCache(
+    maxsize=64 * 1024 * 1024,  # 64 MB
+    getsizeof=lambda entry: max(len(entry.content), 1),
+)
 
 
 def _make_cache_key(func_name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
@@ -53,6 +115,62 @@ def _make_cache_key(func_name: str, args: tuple[Any, ...], kwargs: dict[str, Any
     return hashlib.md5(key_data.encode()).hexdigest()
 
 
+# In-flight requests by single-flight key. Entries live only while the request runs.
+_inflight: dict[str, asyncio.Task[Any]] = {}
+
+
+def _discard_inflight(key: str, task: asyncio.Task[Any]) -> None:
+    """Done-callback: drop a finished task and mark its exception as retrieved."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def coalesce(key: str, load: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run `load` once for all concurrent callers with the same key.
+
+    The first caller starts the load as a task; callers arriving while it
+    runs await the same task. Each caller awaits through asyncio.shield, so
+    one caller being cancelled does not cancel the load for the others.
+
+    The key includes the request priority lane so interactive callers never
+    wait on (or inherit a shed error from) a background load.
+    """
+    flight_key = f"{key}:{current_priority().value}"
+    task = _inflight.get(flight_key)
+    if task is None:
+        task = asyncio.ensure_future(load())
+        _inflight[flight_key] = task
+        task.add_done_callback(lambda t: _discard_inflight(flight_key, t))
+    else:
+        logger.debug("Coalesced in-flight GitHub call")
+
+    result: T = await asyncio.shield(task)
+    return result
+
+
+def coalesced_github_call() -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """
+    Decorator that deduplicates concurrent identical calls without caching results.
+
+    For calls whose results should not outlive the request (commit lists, file
+    contents) but which are often issued concurrently with the same arguments.
+    Keys are generated with _make_cache_key, as for cached_github_call.
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            key = _make_cache_key(func.__name__, args, kwargs)
+            return await coalesce(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
 def cached_github_call(
     cache: TTLCache[str, Any],
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
@@ -66,7 +184,8 @@ def cached_github_call(
 
     The cache key is generated from the function name and arguments (excluding 'self').
     On cache hit, returns immediately without making an API call.
-    On cache miss, executes the function and stores the result.
+    On cache miss, executes the function and stores the result; concurrent
+    misses for the same key share a single execution.
     """
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
@@ -80,17 +199,64 @@ def cached_github_call(
                 cached_result: T = cache[key]
                 return cached_result
 
-            # Cache miss - execute and store
+            # Cache miss - execute once for all concurrent callers and store
             logger.debug(f"Cache MISS: {func.__name__}")
-            result = await func(*args, **kwargs)
-            cache[key] = result
-            return result
+
+            async def load() -> T:
+                result = await func(*args, **kwargs)
+                cache[key] = result
+                return result
+
+            return await coalesce(key, load)
 
         return wrapper
 
     return decorator
 
 
+def make_conditional_key(token: str, url: str, params: Mapping[str, Any] | None = None) -> str:
+    """
+    Generate a conditional-request cache key for a GET.
+
+    Keyed by token as well as URL because GitHub varies ETags on Authorization,
+    and a body fetched with one token must never be replayed for another.
+    """
+    token_hash = hashlib.md5(token.encode()).hexdigest()[:8]
+    key_data = f"{token_hash}:{url}:{sorted((params or {}).items())}"
+    return hashlib.md5(key_data.encode()).hexdigest()
+
+
+def get_conditional_entry(key: str) -> ConditionalEntry | None:
+    """Look up stored validators and body for a conditional GET."""
+    entry: ConditionalEntry | None = _conditional_cache.get(key)
+    return entry
+
+
+def store_conditional_response(key: str, response: httpx.Response) -> None:
+    """
+    Store a 200 response for later revalidation.
+
+    Responses without an ETag or Last-Modified cannot be revalidated and are
+    skipped, as are bodies larger than the whole store.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    entry = ConditionalEntry(
+        content=response.content,
+        etag=etag,
+        last_modified=last_modified,
+        headers={
+            name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers
+        },
+    )
+    if _conditional_cache.getsizeof(entry) > _conditional_cache.maxsize:
+        return
+    _conditional_cache[key] = entry
+
+
 def clear_all_caches() -> None:
     """Clear all GitHub caches. Useful for testing or when data is known to be stale."""
     _tree_cache.clear()
@@ -98,6 +264,8 @@ def clear_all_caches() -> None:
     _contributors_cache.clear()
     _repo_details_cache.clear()
     _agent_context_cache.clear()
+    _snapshot_cache.clear()
+    _conditional_cache.clear()
     logger.debug("Cleared all GitHub caches")
 
 
@@ -118,6 +286,12 @@ def get_cache_stats() -> dict[str, dict[str, int]]:
             "size": len(_agent_context_cache),
             "maxsize": _agent_context_cache.maxsize,
         },
+        "snapshot": {"size": len(_snapshot_cache), "maxsize": int(_snapshot_cache.maxsize)},
+        "conditional": {
+            "size": len(_conditional_cache),
+            "maxsize": int(_conditional_cache.maxsize),
+            "bytes": int(_conditional_cache.currsize),
+        },
     }
 
 
@@ -127,3 +301,4 @@ languages_cache = _languages_cache
 contributors_cache = _contributors_cache
 repo_details_cache = _repo_details_cache
 agent_context_cache = _agent_context_cache
+snapshot_cache = _snapshot_cache
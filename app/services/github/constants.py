@@ -128,3 +128,47 @@ def is_documentation_file(path: str) -> bool:
 
     # .md files at root level
     return len(parts) == 1 and ext in DOC_FILE_EXTENSIONS
+
+
+# Largest page size the REST commits endpoint accepts
+COMMITS_MAX_PER_PAGE = 100
+
+
+# GraphQL query for commit history with per-commit line stats.
+# One page returns up to 100 commits with additions/deletions/changed files —
+# the REST equivalent is one GET /commits/{sha} per commit.
+# `expression` is a branch name or "HEAD" (the default branch).
+COMMIT_HISTORY_STATS_QUERY = """
+query CommitHistoryStats(
+  $owner: String!, $name: String!, $expression: String!, $since: GitTimestamp, $cursor: String
+) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      ... on Commit {
+        history(first: 100, since: $since, after: $cursor) {
+          pageInfo { hasNextPage endCursor }
+          nodes {
+            oid
+            additions
+            deletions
+            changedFilesIfAvailable
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# Repositories per GraphQL request when probing branch heads
+BRANCH_HEADS_BATCH_SIZE = 50
+
+# One aliased field of the branch heads query, per repository: the head
+# commit of a branch ("HEAD" for the default branch).
+BRANCH_HEAD_FIELD = """
+  r{index}: repository(owner: $owner{index}, name: $name{index}) {{
+    object(expression: $expression{index}) {{
+      ... on Commit {{ oid committedDate }}
+    }}
+  }}"""
@@ -46,3 +46,31 @@ class GitHubRepoRenamed(GitHubAPIError):
             message = f"Repository {old_full_name} was moved"
 
         super().__init__(message, status_code=301)
+
+
+class GitHubRequestShed(GitHubAPIError):
+    """Background request refused locally to protect the interactive rate-limit reserve.
+
+    Raised before the request is sent, so it costs no GitHub quota.
+    Callers should skip the work and retry after rate_limit_reset.
+    """
+
+    def __init__(self, remaining: int, rate_limit_reset: int):
+        self.remaining = remaining
+        super().__init__(
+            f"GitHub budget reserved for interactive use ({remaining} remaining)",
+            429,
+            rate_limit_reset=rate_limit_reset,
+        )
+
+
+class SnapshotTooLargeError(GitHubAPIError):
+    """Repository tarball exceeds the snapshot size limit.
+
+    Callers should fall back to fetching files individually.
+    """
+
+    def __init__(self, full_name: str, limit_bytes: int):
+        self.full_name = full_name
+        self.limit_bytes = limit_bytes
+        super().__init__(f"Tarball for {full_name} exceeds {limit_bytes} bytes")
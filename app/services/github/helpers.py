@@ -33,6 +33,21 @@ class RateLimitInfo:
         return self.remaining is not None and int(self.remaining) == 0
 
 
+def decode_text(content: bytes, max_size: int) -> str | None:
+    """
+    Decode file bytes as UTF-8 text.
+
+    Returns None for content larger than max_size and for binary (non-UTF-8)
+    content, matching what get_file_content() returns for such files.
+    """
+    if len(content) > max_size:
+        return None
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
 def parse_redirect_location(location: str) -> tuple[str, str] | None:
     """
     Extract owner/repo from GitHub redirect Location header.
@@ -3,12 +3,17 @@ Shared HTTP client for GitHub API operations.
 
 Provides a singleton AsyncClient with connection pooling for all GitHub API calls.
 This eliminates ~50-100ms SSL handshake overhead per request by reusing connections.
+
+Requests are routed through the rate-limit-aware scheduler (rate_limiter.py),
+which applies per-token budgets and interactive/background priority.
 """
 
 import logging
 
 import httpx
 
+from app.services.github.rate_limiter import RateLimitedTransport, github_request_scheduler
+
 logger = logging.getLogger(__name__)
 
 # Module-level singleton client
@@ -27,11 +32,14 @@ def get_github_client() -> httpx.AsyncClient:
     """
     global _client
     if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0, connect=5.0),
+        transport = httpx.AsyncHTTPTransport(
             limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
             http2=True,  # Enable HTTP/2 for GitHub API
         )
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=RateLimitedTransport(transport, github_request_scheduler),
+        )
         logger.debug("Created new GitHub HTTP client with connection pooling")
     return _client
 
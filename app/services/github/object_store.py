@@ -0,0 +1,153 @@
+"""
+Persistent content-addressed store for git objects.
+
+Blob contents and recursive tree listings are immutable for a given SHA, so
+once fetched they can be served forever without asking GitHub again. The
+in-memory caches in cache.py are per-process and expire within minutes; this
+store lives in Postgres (git_object_cache) and survives restarts and deploys.
+
+Keys are derived from content where possible: blobs are stored under the git
+blob SHA computed from their bytes, so a row can never hold content that does
+not match its key. Trees are stored under the root tree SHA GitHub returned
+for them, and only when the listing is complete (not truncated).
+
+Store failures never fail a GitHub read — every operation logs and degrades
+to a cache miss. Total size is bounded by LRU eviction, run at most once per
+eviction interval per process.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from app.config import settings
+from app.core.database import async_session_maker
+from app.domain.git_object_cache_operations import git_object_cache_ops
+
+logger = logging.getLogger(__name__)
+
+BLOB = "blob"
+TREE = "tree"
+
+
+def git_blob_sha(content: bytes) -> str:
+    """Compute the git object SHA of a blob with the given content."""
+    header = f"blob {len(content)}\0".encode()
+    return hashlib.sha1(header + content, usedforsecurity=False).hexdigest()
+
+
+class GitObjectStore:
+    """Postgres-backed store of git blobs and trees keyed by SHA."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        max_bytes: int,
+        eviction_interval: float = 600.0,
+    ) -> None:
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.eviction_interval = eviction_interval
+        self._last_eviction = 0.0
+
+    async def get_blobs(self, shas: Iterable[str]) -> dict[str, bytes]:
+        """
+        Look up blob contents by SHA.
+
+        Returns:
+            Dict mapping sha -> content for the SHAs found in the store
+        """
+        unique = list(set(shas))
+        if not self.enabled or not unique:
+            return {}
+        try:
+            async with async_session_maker() as db:
+                found = await git_object_cache_ops.get_many(db, BLOB, unique)
+                await db.commit()
+            return found
+        except Exception as e:
+            logger.warning(f"Git object store blob lookup failed: {e}")
+            return {}
+
+    async def put_blobs(self, contents: Iterable[bytes]) -> None:
+        """Store blob contents under their computed git SHAs."""
+        if not self.enabled:
+            return
+        objects = {git_blob_sha(content): content for content in contents}
+        await self._put(BLOB, objects)
+
+    async def get_tree(self, sha: str) -> dict[str, Any] | None:
+        """
+        Look up a recursive tree listing by root tree SHA.
+
+        Returns:
+            The listing in GitHub's Trees API shape, or None if not stored
+        """
+        if not self.enabled:
+            return None
+        try:
+            async with async_session_maker() as db:
+                found = await git_object_cache_ops.get_many(db, TREE, [sha])
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Git object store tree lookup failed: {e}")
+            return None
+
+        if sha not in found:
+            return None
+        data: dict[str, Any] = json.loads(found[sha])
+        return data
+
+    async def put_tree(self, data: dict[str, Any]) -> None:
+        """
+        Store a recursive tree listing (GitHub Trees API response).
+
+        Truncated listings are not stored, since the same SHA would later be
+        served as if it were complete.
+        """
+        if not self.enabled or data.get("truncated") or not data.get("sha"):
+            return
+        listing = {
+            "sha": data["sha"],
+            "tree": [
+                {
+                    "path": item["path"],
+                    "type": item["type"],
+                    "size": item.get("size"),
+                    "sha": item["sha"],
+                }
+                for item in data.get("tree", [])
+            ],
+        }
+        encoded = json.dumps(listing, separators=(",", ":")).encode()
+        await self._put(TREE, {data["sha"]: encoded})
+
+    async def _put(self, object_type: str, objects: dict[str, bytes]) -> None:
+        if not objects:
+            return
+        try:
+            async with async_session_maker() as db:
+                await git_object_cache_ops.bulk_insert(db, object_type, objects)
+                await self._maybe_evict(db)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Git object store write failed ({object_type}): {e}")
+
+    async def _maybe_evict(self, db: Any) -> None:
+        now = time.monotonic()
+        if now - self._last_eviction < self.eviction_interval:
+            return
+        self._last_eviction = now
+        deleted = await git_object_cache_ops.evict_to_size(db, self.max_bytes)
+        if deleted:
+            logger.info(f"Evicted {deleted} objects from git object store")
+
+
+# Module-level singleton used by GitHubReadOperations
+git_object_store = GitObjectStore(
+    enabled=settings.github_object_store_enabled,
+    max_bytes=settings.github_object_store_max_bytes,
+)
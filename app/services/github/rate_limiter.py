@@ -0,0 +1,249 @@
+"""
+Rate-limit-aware scheduling for GitHub API traffic.
+
+Tracks the X-RateLimit-* budget GitHub reports for each credential (PATs,
+OAuth tokens, App JWTs and installation tokens alike — keyed by the
+Authorization header) and applies it *before* a request is sent:
+
+- Interactive requests (timeline, progress pages, agent tools) may spend the
+  whole budget. When it is known to be exhausted they fail fast instead of
+  burning a request GitHub will refuse.
+- Background requests (auto-progress, analysis, docs generation) stop at a
+  reserve kept for interactive use. Near the reserve they wait for the reset
+  window if it is close, otherwise they are shed with GitHubRequestShed.
+  Background traffic is also capped in concurrency so it cannot occupy the
+  whole shared connection pool.
+
+Priority is carried in a context variable, so background entry points only
+need to be wrapped once (see background_github_work) and every GitHub call
+beneath them — including tasks they spawn — inherits the lane.
+
+The scheduler is installed as a transport wrapper on the shared HTTP client,
+so it sees all GitHub traffic without changes at individual call sites.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+import httpx
+from cachetools import TTLCache
+
+from app.config import settings
+from app.services.github.exceptions import GitHubAPIError, GitHubRequestShed
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+GITHUB_API_HOST = "api.github.com"
+
+
+class RequestPriority(str, Enum):
+    """Scheduling lane for a GitHub request."""
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+_priority: ContextVar[RequestPriority] = ContextVar(
+    "github_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+def current_priority() -> RequestPriority:
+    """Priority lane of GitHub requests made from the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def github_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run GitHub requests made within the block in the given lane."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def background_github_work(
+    func: Callable[P, Awaitable[T]],
+) -> Callable[P, Awaitable[T]]:
+    """
+    Mark an async entry point as background GitHub work.
+
+    Usage:
+        @background_github_work
+        async def run_for_all_orgs(self, db: AsyncSession) -> AutoProgressReport:
+            ...
+    """
+
+    @wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        with github_priority(RequestPriority.BACKGROUND):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+@dataclass
+class RateLimitBudget:
+    """Last known rate-limit state for one credential and resource."""
+
+    limit: int
+    remaining: int
+    reset_at: float  # Unix timestamp
+
+    def is_current(self, now: float) -> bool:
+        """Whether the budget still describes the active reset window."""
+        return now < self.reset_at
+
+
+def _resource_for(url: httpx.URL) -> str:
+    """GitHub rate-limit resource a request is billed against."""
+    if url.path == "/graphql":
+        return "graphql"
+    if url.path.startswith("/search/"):
+        return "search"
+    return "core"
+
+
+class GitHubRequestScheduler:
+    """
+    Per-credential rate-limit tracker with interactive/background lanes.
+
+    Budgets are refreshed from every response's headers and decremented
+    optimistically as requests are sent, so bursts of concurrent calls see
+    the budget shrink before their responses arrive.
+    """
+
+    def __init__(
+        self,
+        reserve_ratio: float,
+        max_background_wait: float,
+        background_concurrency: int,
+    ) -> None:
+        self.reserve_ratio = reserve_ratio
+        self.max_background_wait = max_background_wait
+        # Reset windows are one hour; stale budgets age out with them
+        self._budgets: TTLCache[str, RateLimitBudget] = TTLCache(maxsize=1000, ttl=3600)
+        self._background_slots = asyncio.Semaphore(background_concurrency)
+
+    @staticmethod
+    def _budget_key(authorization: str, resource: str) -> str:
+        credential = hashlib.md5(authorization.encode()).hexdigest()[:12]
+        return f"{credential}:{resource}"
+
+    def get_budget(self, authorization: str, resource: str = "core") -> RateLimitBudget | None:
+        """Last known budget for a credential, or None if none is tracked."""
+        budget: RateLimitBudget | None = self._budgets.get(
+            self._budget_key(authorization, resource)
+        )
+        return budget
+
+    def record(self, key: str, response: httpx.Response) -> None:
+        """Update the tracked budget from a response's rate-limit headers."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            self._budgets[key] = RateLimitBudget(
+                limit=int(response.headers.get("X-RateLimit-Limit", 5000)),
+                remaining=int(remaining),
+                reset_at=float(reset),
+            )
+        except ValueError:
+            logger.debug(f"Unparseable rate-limit headers: remaining={remaining!r} reset={reset!r}")
+
+    async def admit(self, key: str, priority: RequestPriority) -> None:
+        """
+        Decide whether a request may be sent now.
+
+        Returns once the request is admitted (possibly after waiting for the
+        reset window). Raises instead of sending a request that would be
+        refused or that would eat into the interactive reserve.
+        """
+        budget = self._budgets.get(key)
+        now = time.time()
+        if budget is None or not budget.is_current(now):
+            return
+
+        wait = budget.reset_at - now
+        if priority is RequestPriority.BACKGROUND:
+            reserve = int(budget.limit * self.reserve_ratio)
+            if budget.remaining <= reserve:
+                if wait > self.max_background_wait:
+                    raise GitHubRequestShed(budget.remaining, int(budget.reset_at))
+                logger.info(
+                    f"GitHub budget at reserve ({budget.remaining}/{budget.limit}), "
+                    f"delaying background request {wait:.0f}s until reset"
+                )
+                await asyncio.sleep(wait)
+                return
+        elif budget.remaining <= 0:
+            raise GitHubAPIError(
+                "GitHub API rate limit exceeded",
+                403,
+                rate_limit_reset=int(budget.reset_at),
+            )
+
+        budget.remaining -= 1
+
+    async def send(
+        self,
+        request: httpx.Request,
+        send: Callable[[httpx.Request], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Admit, send and account for a single request."""
+        authorization = request.headers.get("Authorization")
+        if request.url.host != GITHUB_API_HOST or not authorization:
+            return await send(request)
+
+        key = self._budget_key(authorization, _resource_for(request.url))
+        priority = current_priority()
+        await self.admit(key, priority)
+
+        if priority is RequestPriority.BACKGROUND:
+            async with self._background_slots:
+                response = await send(request)
+        else:
+            response = await send(request)
+
+        self.record(key, response)
+        return response
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that routes every request through the scheduler."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        scheduler: GitHubRequestScheduler,
+    ) -> None:
+        self._transport = transport
+        self._scheduler = scheduler
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._scheduler.send(request, self._transport.handle_async_request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Module-level singleton shared by the GitHub HTTP client
+github_request_scheduler = GitHubRequestScheduler(
+    reserve_ratio=settings.github_background_reserve_ratio,
+    max_background_wait=settings.github_background_max_wait_seconds,
+    background_concurrency=settings.github_background_max_concurrency,
+)
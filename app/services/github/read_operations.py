@@ -7,30 +7,50 @@ Provides all read-only operations for fetching repository data:
 - Language statistics
 - Contributors
 - Commit statistics
+- Tarball snapshots for bulk file reads
+- Persistent SHA-keyed blob/tree store lookups
 """
 
 import asyncio
 import base64
 import logging
 import re
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from app.services.github.cache import (
     cached_github_call,
+    coalesced_github_call,
     contributors_cache,
+    get_conditional_entry,
     languages_cache,
+    make_conditional_key,
     repo_details_cache,
+    snapshot_cache,
+    store_conditional_response,
     tree_cache,
 )
 from app.services.github.constants import (
+    BRANCH_HEAD_FIELD,
+    BRANCH_HEADS_BATCH_SIZE,
+    COMMIT_HISTORY_STATS_QUERY,
+    COMMITS_MAX_PER_PAGE,
     GITHUB_LANGUAGE_COLORS,
     KEY_FILES,
 )
-from app.services.github.exceptions import GitHubAPIError
-from app.services.github.helpers import RateLimitInfo, handle_error_response
+from app.services.github.exceptions import GitHubAPIError, SnapshotTooLargeError
+from app.services.github.helpers import RateLimitInfo, decode_text, handle_error_response
 from app.services.github.http_client import get_github_client
+from app.services.github.object_store import git_object_store
+from app.services.github.snapshot import (
+    SNAPSHOT_MAX_ARCHIVE_BYTES,
+    SNAPSHOT_MIN_FILES,
+    RepoSnapshot,
+    extract_snapshot,
+    new_spool,
+)
 from app.services.github.types import (
     CommitStats,
     ContributorInfo,
@@ -55,9 +75,14 @@ class GitHubReadOperations:
 
     Uses a shared HTTP client singleton for connection pooling. This eliminates
     ~50-100ms SSL handshake overhead per request by reusing connections.
+
+    Every GET goes through _get(), which revalidates previously seen responses
+    with If-None-Match / If-Modified-Since so unchanged data costs a 304
+    instead of a rate-limited request.
     """
 
     BASE_URL = "https://api.github.com"
+    GRAPHQL_URL = "https://api.github.com/graphql"
     API_VERSION = "2022-11-28"
 
     def __init__(self, token: str):
@@ -68,6 +93,51 @@ class GitHubReadOperations:
             "X-GitHub-Api-Version": self.API_VERSION,
         }
 
+    async def _get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Issue a conditional GET against the GitHub API.
+
+        If a previous 200 for the same token/URL/params carried an ETag or
+        Last-Modified, the request is sent with the matching validators. A 304
+        is answered from the stored body as a synthetic 200, so callers parse
+        it exactly like a fresh response.
+
+        Args:
+            url: Absolute API URL
+            params: Optional query parameters
+            timeout: Optional per-request timeout override
+
+        Returns:
+            The httpx.Response (real, or rebuilt from the store on 304)
+        """
+        key = make_conditional_key(self.token, url, params)
+        entry = get_conditional_entry(key)
+
+        request_kwargs: dict[str, Any] = {
+            "headers": {**self._headers, **entry.validator_headers()} if entry else self._headers,
+        }
+        if params is not None:
+            request_kwargs["params"] = params
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
+
+        client = get_github_client()
+        response = await client.get(url, **request_kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"GitHub 304 Not Modified: {url}")
+            return entry.to_response(response)
+
+        if response.status_code == 200:
+            store_conditional_response(key, response)
+
+        return response
+
     def _normalize_repo(self, data: dict[str, Any]) -> GitHubRepo:
         """Convert GitHub API response to GitHubRepo dataclass."""
         license_data = data.get("license")
@@ -115,10 +185,8 @@ class GitHubReadOperations:
             "per_page": min(per_page, 100),
         }
 
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/installation/repositories",
-            headers=self._headers,
             params=params,
         )
 
@@ -182,10 +250,8 @@ class GitHubReadOperations:
             "direction": direction,
         }
 
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/user/repos",
-            headers=self._headers,
             params=params,
         )
 
@@ -232,10 +298,8 @@ class GitHubReadOperations:
         Returns:
             GitHubRepo with full repository details
         """
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}",
-            headers=self._headers,
         )
 
         rate_info = RateLimitInfo(response)
@@ -270,10 +334,8 @@ class GitHubReadOperations:
         Returns:
             GitHubRepo with full repository details including current owner/name
         """
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repositories/{repo_id}",
-            headers=self._headers,
         )
 
         rate_info = RateLimitInfo(response)
@@ -302,10 +364,8 @@ class GitHubReadOperations:
         Returns:
             Dict with user info (login, name, avatar_url, etc.)
         """
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/user",
-            headers=self._headers,
             timeout=10.0,
         )
 
@@ -329,7 +389,9 @@ class GitHubReadOperations:
 
         Uses the Git Trees API with recursive=1 to get all files in a single call.
         Results are cached for 5 minutes - tree changes with commits but within
-        a session we typically see the same data.
+        a session we typically see the same data. When the git object store is
+        enabled, the branch is first resolved to its root tree SHA and complete
+        listings are served from (and written to) the persistent store.
 
         Args:
             owner: Repository owner (username or org)
@@ -339,17 +401,45 @@ class GitHubReadOperations:
         Returns:
             RepoTree with file paths, directory paths, and truncation status
         """
-        client = get_github_client()
-        response = await client.get(
-            f"{self.BASE_URL}/repos/{owner}/{repo}/git/trees/{branch}",
-            headers=self._headers,
+        tree_sha = None
+        if git_object_store.enabled:
+            tree_sha = await self._resolve_tree_sha(owner, repo, branch)
+            if tree_sha:
+                stored = await git_object_store.get_tree(tree_sha)
+                if stored:
+                    return self._build_repo_tree(stored)
+
+        response = await self._get(
+            f"{self.BASE_URL}/repos/{owner}/{repo}/git/trees/{tree_sha or branch}",
             params={"recursive": "1"},
         )
 
         handle_error_response(response, f"{owner}/{repo}")
 
         data = response.json()
+        await git_object_store.put_tree(data)
+        return self._build_repo_tree(data)
+
+    async def _resolve_tree_sha(self, owner: str, repo: str, branch: str) -> str | None:
+        """
+        Resolve a branch to the SHA of its head commit's root tree.
+
+        Returns None if the ref is not a branch or the lookup fails, in which
+        case the caller fetches the tree by ref name as before.
+        """
+        try:
+            response = await self._get(f"{self.BASE_URL}/repos/{owner}/{repo}/branches/{branch}")
+            if response.status_code != 200:
+                return None
+            tree_sha: str = response.json()["commit"]["commit"]["tree"]["sha"]
+            return tree_sha
+        except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Could not resolve tree SHA for {owner}/{repo}@{branch}: {e}")
+            return None
 
+    @staticmethod
+    def _build_repo_tree(data: dict[str, Any]) -> RepoTree:
+        """Build a RepoTree from a Git Trees API response (or stored listing)."""
         files: list[str] = []
         directories: list[str] = []
         all_items: list[RepoTreeItem] = []
@@ -376,6 +466,7 @@ class GitHubReadOperations:
             truncated=data.get("truncated", False),
         )
 
+    @coalesced_github_call()
     async def get_file_content(
         self,
         owner: str,
@@ -383,24 +474,43 @@ class GitHubReadOperations:
         path: str,
         branch: str = "main",
         max_size: int = 100_000,
+        blob_sha: str | None = None,
     ) -> RepoFile | None:
         """
         Fetch the content of a specific file from a repository.
 
+        When the caller knows the file's blob SHA (e.g. from a repo tree), the
+        persistent git object store is consulted first and the fetched content
+        is written back to it.
+
         Args:
             owner: Repository owner
             repo: Repository name
             path: File path within the repository
             branch: Branch name (default: "main")
             max_size: Maximum file size in bytes to fetch (default: 100KB)
+            blob_sha: Optional git blob SHA of the file at this ref
 
         Returns:
             RepoFile with decoded content, or None if file is too large/binary
         """
-        client = get_github_client()
-        response = await client.get(
+        if blob_sha:
+            stored = await git_object_store.get_blobs([blob_sha])
+            if blob_sha in stored:
+                content_bytes = stored[blob_sha]
+                text = decode_text(content_bytes, max_size)
+                if text is None:
+                    return None
+                return RepoFile(
+                    path=path,
+                    content=text,
+                    size=len(content_bytes),
+                    sha=blob_sha,
+                    encoding="base64",
+                )
+
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/contents/{path}",
-            headers=self._headers,
             params={"ref": branch},
         )
 
@@ -428,6 +538,9 @@ class GitHubReadOperations:
         except (ValueError, UnicodeDecodeError):
             return None
 
+        if blob_sha:
+            await git_object_store.put_blobs([content_bytes])
+
         return RepoFile(
             path=path,
             content=content,
@@ -455,10 +568,8 @@ class GitHubReadOperations:
         Returns:
             List of LanguageStat sorted by percentage (descending)
         """
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/languages",
-            headers=self._headers,
             timeout=15.0,
         )
 
@@ -507,10 +618,8 @@ class GitHubReadOperations:
         Returns:
             List of ContributorInfo sorted by contributions (descending)
         """
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/contributors",
-            headers=self._headers,
             params={"per_page": limit, "anon": "false"},
             timeout=15.0,
         )
@@ -548,10 +657,8 @@ class GitHubReadOperations:
         Returns:
             CommitStats with total commits and date range
         """
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/commits",
-            headers=self._headers,
             params={"sha": branch, "per_page": 1},
             timeout=15.0,
         )
@@ -575,9 +682,8 @@ class GitHubReadOperations:
 
         first_commit_date = None
         if total_commits > 1:
-            last_page_response = await client.get(
+            last_page_response = await self._get(
                 f"{self.BASE_URL}/repos/{owner}/{repo}/commits",
-                headers=self._headers,
                 params={"sha": branch, "per_page": 1, "page": total_commits},
                 timeout=15.0,
             )
@@ -617,10 +723,8 @@ class GitHubReadOperations:
             Dict with additions, deletions, files_changed or None if fetch fails
         """
         try:
-            client = get_github_client()
-            response = await client.get(
+            response = await self._get(
                 f"{self.BASE_URL}/repos/{owner}/{repo}/commits/{sha}",
-                headers=self._headers,
                 timeout=timeout,
             )
 
@@ -639,6 +743,156 @@ class GitHubReadOperations:
         except (httpx.TimeoutException, httpx.RequestError):
             return None
 
+    async def _graphql(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        repo_name: str,
+        timeout: float = 15.0,
+        allow_partial: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Execute a GraphQL query and return its `data` payload.
+
+        GraphQL reports most failures as a 200 with an `errors` list, so both
+        HTTP-level and GraphQL-level errors are raised as GitHubAPIError.
+        With allow_partial, errors next to a `data` payload (e.g. one missing
+        repository in an aliased query) are logged and the data is returned.
+        """
+        client = get_github_client()
+        response = await client.post(
+            self.GRAPHQL_URL,
+            headers=self._headers,
+            json={"query": query, "variables": variables},
+            timeout=timeout,
+        )
+
+        handle_error_response(response, repo_name)
+
+        body: dict[str, Any] = response.json()
+        if body.get("errors") and allow_partial and body.get("data"):
+            logger.debug(f"GitHub GraphQL partial errors for {repo_name}: {body['errors']}")
+        elif body.get("errors"):
+            message = body["errors"][0].get("message", "unknown error")
+            raise GitHubAPIError(f"GitHub GraphQL error for {repo_name}: {message}")
+        data: dict[str, Any] = body.get("data") or {}
+        return data
+
+    async def get_commit_history_stats(
+        self,
+        owner: str,
+        repo: str,
+        branch: str | None = None,
+        since: str | None = None,
+        shas: set[str] | None = None,
+        max_pages: int = 10,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Fetch line stats for a branch's commit history via GraphQL, 100 per page.
+
+        Replaces one REST commit fetch per commit with one request per 100
+        commits. Commits for which GitHub cannot report a changed-file count
+        (very large commits) are omitted so callers can fall back to REST.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name (default: repo's default branch)
+            since: ISO timestamp; only commits after this are walked
+            shas: If given, stop paging once all of these have been seen
+            max_pages: Upper bound on pages walked (100 commits each)
+
+        Returns:
+            Dict mapping commit SHA to additions, deletions, files_changed
+        """
+        stats: dict[str, dict[str, int]] = {}
+        pending = set(shas) if shas is not None else None
+        variables: dict[str, Any] = {
+            "owner": owner,
+            "name": repo,
+            "expression": branch or "HEAD",
+            "since": since,
+            "cursor": None,
+        }
+
+        for _ in range(max_pages):
+            data = await self._graphql(COMMIT_HISTORY_STATS_QUERY, variables, f"{owner}/{repo}")
+
+            repository = data.get("repository")
+            if repository is None:
+                raise GitHubAPIError(f"Repository {owner}/{repo} not found", 404)
+            history = (repository.get("object") or {}).get("history")
+            if history is None:
+                break
+
+            for node in history.get("nodes") or []:
+                if pending is not None:
+                    pending.discard(node["oid"])
+                if node.get("changedFilesIfAvailable") is None:
+                    continue
+                stats[node["oid"]] = {
+                    "additions": node.get("additions", 0),
+                    "deletions": node.get("deletions", 0),
+                    "files_changed": node["changedFilesIfAvailable"],
+                }
+
+            page_info = history.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or (pending is not None and not pending):
+                break
+            variables["cursor"] = page_info.get("endCursor")
+
+        return stats
+
+    async def get_branch_heads(
+        self,
+        repos: list[tuple[str, str | None]],
+    ) -> dict[str, dict[str, str]]:
+        """
+        Fetch the head commit of many repositories' branches via GraphQL.
+
+        One aliased query covers BRANCH_HEADS_BATCH_SIZE repositories, so
+        probing a whole organization costs a few requests instead of one
+        commits request per repository.
+
+        Args:
+            repos: (full_name, branch) pairs; a None branch means the default branch
+
+        Returns:
+            Dict mapping full_name to {"sha", "committed_at"} of the head
+            commit. Repositories that are missing, empty or inaccessible are
+            omitted.
+        """
+        heads: dict[str, dict[str, str]] = {}
+        for start in range(0, len(repos), BRANCH_HEADS_BATCH_SIZE):
+            chunk = repos[start : start + BRANCH_HEADS_BATCH_SIZE]
+            declarations: list[str] = []
+            fields: list[str] = []
+            variables: dict[str, Any] = {}
+            for index, (full_name, branch) in enumerate(chunk):
+                owner, name = full_name.split("/", 1)
+                declarations.append(
+                    f"$owner{index}: String!, $name{index}: String!, $expression{index}: String!"
+                )
+                fields.append(BRANCH_HEAD_FIELD.format(index=index))
+                variables[f"owner{index}"] = owner
+                variables[f"name{index}"] = name
+                variables[f"expression{index}"] = branch or "HEAD"
+
+            query = f"query BranchHeads({', '.join(declarations)}) {{{''.join(fields)}\n}}"
+            data = await self._graphql(
+                query, variables, f"{len(chunk)} repositories", allow_partial=True
+            )
+
+            for index, (full_name, _branch) in enumerate(chunk):
+                commit = (data.get(f"r{index}") or {}).get("object") or {}
+                if commit.get("oid") and commit.get("committedDate"):
+                    heads[full_name] = {
+                        "sha": commit["oid"],
+                        "committed_at": commit["committedDate"],
+                    }
+        return heads
+
+    @coalesced_github_call()
     async def get_commits_for_timeline(
         self,
         owner: str,
@@ -647,10 +901,15 @@ class GitHubReadOperations:
         per_page: int = 50,
         sha_cursor: str | None = None,
         path: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
     ) -> tuple[list[dict[str, Any]], bool]:
         """
         Fetch commits for timeline display.
 
+        Returns a single page. To read every commit in a time window, use
+        iter_commits() instead.
+
         Args:
             owner: Repository owner
             repo: Repository name
@@ -658,6 +917,8 @@ class GitHubReadOperations:
             per_page: Number of commits per page
             sha_cursor: SHA to start from (for pagination)
             path: Optional file path to filter commits (partial match)
+            since: Optional ISO 8601 lower bound on commit date
+            until: Optional ISO 8601 upper bound on commit date
 
         Returns:
             Tuple of (commits list, has_more flag)
@@ -672,11 +933,13 @@ class GitHubReadOperations:
             params["sha"] = branch
         if path:
             params["path"] = path
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
 
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/commits",
-            headers=self._headers,
             params=params,
         )
 
@@ -686,6 +949,67 @@ class GitHubReadOperations:
         has_more = len(commits) > per_page
         return commits[:per_page], has_more
 
+    async def iter_commits(
+        self,
+        owner: str,
+        repo: str,
+        branch: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        path: str | None = None,
+        max_commits: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream every commit in a time window, newest first.
+
+        The window is applied by GitHub (since/until), and pages are followed
+        via the Link header until the window is exhausted, so callers get the
+        exact window with the fewest requests. Pages are fetched lazily —
+        stopping iteration early skips the remaining requests.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name or SHA (default: repo's default branch)
+            since: Optional ISO 8601 lower bound on commit date
+            until: Optional ISO 8601 upper bound on commit date
+            path: Optional file path to filter commits
+            max_commits: Optional safety cap on the number of commits yielded
+
+        Yields:
+            Commit objects as returned by the GitHub commits API
+        """
+        params: dict[str, str | int] = {"per_page": COMMITS_MAX_PER_PAGE}
+        if branch:
+            params["sha"] = branch
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+        if path:
+            params["path"] = path
+
+        url: str | None = f"{self.BASE_URL}/repos/{owner}/{repo}/commits"
+        page_params: dict[str, str | int] | None = params
+        yielded = 0
+        while url:
+            response = await self._get(url, params=page_params)
+            handle_error_response(response, f"{owner}/{repo}")
+
+            for commit in response.json():
+                if max_commits is not None and yielded >= max_commits:
+                    logger.warning(
+                        f"Commit window for {owner}/{repo} exceeds {max_commits} commits, "
+                        "truncating"
+                    )
+                    return
+                yield commit
+                yielded += 1
+
+            # The next-page URL carries all query parameters
+            url = response.links.get("next", {}).get("url")
+            page_params = None
+
     async def get_commit_files(
         self,
         owner: str,
@@ -707,10 +1031,8 @@ class GitHubReadOperations:
             or None if fetch fails
         """
         try:
-            client = get_github_client()
-            response = await client.get(
+            response = await self._get(
                 f"{self.BASE_URL}/repos/{owner}/{repo}/commits/{sha}",
-                headers=self._headers,
                 timeout=timeout,
             )
 
@@ -742,10 +1064,8 @@ class GitHubReadOperations:
 
         Returns list of dicts with sha, message, author, date.
         """
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/commits",
-            headers=self._headers,
             params={"per_page": per_page},
             timeout=10.0,
         )
@@ -783,14 +1103,12 @@ class GitHubReadOperations:
         Returns:
             Number of merged PRs since the cutoff date
         """
-        client = get_github_client()
         merged_count = 0
         page = 1
 
         while True:
-            response = await client.get(
+            response = await self._get(
                 f"{self.BASE_URL}/repos/{owner}/{repo}/pulls",
-                headers=self._headers,
                 params={
                     "state": "closed",
                     "sort": "updated",
@@ -830,10 +1148,8 @@ class GitHubReadOperations:
         per_page: int = 10,
     ) -> list[dict[str, Any]]:
         """Fetch open pull requests for a repo (lightweight, for agent context)."""
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/pulls",
-            headers=self._headers,
             params={"state": "open", "per_page": per_page, "sort": "updated"},
             timeout=10.0,
         )
@@ -857,10 +1173,8 @@ class GitHubReadOperations:
         per_page: int = 10,
     ) -> list[dict[str, Any]]:
         """Fetch open issues (excluding PRs) for a repo (lightweight, for agent context)."""
-        client = get_github_client()
-        response = await client.get(
+        response = await self._get(
             f"{self.BASE_URL}/repos/{owner}/{repo}/issues",
-            headers=self._headers,
             params={"state": "open", "per_page": per_page, "sort": "updated"},
             timeout=10.0,
         )
@@ -879,6 +1193,94 @@ class GitHubReadOperations:
             if "pull_request" not in issue
         ]
 
+    @cached_github_call(snapshot_cache)
+    async def get_repo_snapshot(
+        self,
+        owner: str,
+        repo: str,
+        ref: str = "main",
+    ) -> RepoSnapshot:
+        """
+        Download the repository tarball for a ref and extract it into a snapshot.
+
+        GET /repos/{owner}/{repo}/tarball/{ref} redirects to a short-lived
+        codeload URL; the archive is streamed to a spooled temp file and parsed
+        in a worker thread. Results are cached for 5 minutes so repeated bulk
+        reads of the same ref (e.g. tiered analysis passes) share one download.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch name or commit SHA
+
+        Returns:
+            RepoSnapshot with small text-file contents for the ref
+
+        Raises:
+            SnapshotTooLargeError: If the archive exceeds the size limit
+            GitHubAPIError: If the tarball cannot be downloaded
+        """
+        full_name = f"{owner}/{repo}"
+        client = get_github_client()
+        response = await client.get(
+            f"{self.BASE_URL}/repos/{owner}/{repo}/tarball/{ref}",
+            headers=self._headers,
+            timeout=15.0,
+        )
+
+        if response.status_code != 302:
+            handle_error_response(response, full_name)
+            raise GitHubAPIError(
+                f"Unexpected tarball response: {response.status_code}", response.status_code
+            )
+
+        spool = new_spool()
+        try:
+            async with client.stream(
+                "GET",
+                response.headers["Location"],
+                timeout=httpx.Timeout(120.0, connect=5.0),
+            ) as download:
+                if download.status_code != 200:
+                    raise GitHubAPIError(
+                        f"Tarball download failed: {download.status_code}", download.status_code
+                    )
+
+                received = 0
+                async for chunk in download.aiter_bytes():
+                    received += len(chunk)
+                    if received > SNAPSHOT_MAX_ARCHIVE_BYTES:
+                        raise SnapshotTooLargeError(full_name, SNAPSHOT_MAX_ARCHIVE_BYTES)
+                    spool.write(chunk)
+
+            spool.seek(0)
+            return await asyncio.to_thread(extract_snapshot, spool, full_name, ref)
+        finally:
+            spool.close()
+
+    async def _snapshot_for_bulk_read(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        file_count: int,
+        use_snapshot: bool | None,
+    ) -> RepoSnapshot | None:
+        """
+        Get a snapshot to serve a bulk file read from, or None to fetch per-file.
+
+        With use_snapshot=None the decision is made by request size. Snapshot
+        failures are logged and swallowed so callers degrade to per-file reads.
+        """
+        if use_snapshot is False or (use_snapshot is None and file_count < SNAPSHOT_MIN_FILES):
+            return None
+
+        try:
+            return await self.get_repo_snapshot(owner, repo, ref)
+        except Exception as e:
+            logger.warning(f"Snapshot unavailable for {owner}/{repo}@{ref}, fetching per-file: {e}")
+            return None
+
     async def get_key_files(
         self,
         owner: str,
@@ -886,6 +1288,7 @@ class GitHubReadOperations:
         branch: str = "main",
         tree: RepoTree | None = None,
         max_concurrent: int = 5,
+        use_snapshot: bool | None = None,
     ) -> dict[str, str]:
         """
         Fetch contents of key files for AI analysis (parallel).
@@ -896,6 +1299,7 @@ class GitHubReadOperations:
             branch: Branch name (default: "main")
             tree: Optional pre-fetched RepoTree (avoids extra API call)
             max_concurrent: Maximum concurrent requests (default: 5)
+            use_snapshot: Serve from a tarball snapshot (None = decide by file count)
 
         Returns:
             Dict mapping file paths to their contents
@@ -906,24 +1310,15 @@ class GitHubReadOperations:
         else:
             files_to_fetch = list(KEY_FILES)
 
-        if not files_to_fetch:
-            return {}
-
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def fetch_with_limit(file_path: str) -> tuple[str, str | None]:
-            async with semaphore:
-                content = await self.get_file_content(owner, repo, file_path, branch)
-                return (file_path, content.content if content else None)
-
-        tasks = [fetch_with_limit(fp) for fp in files_to_fetch]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        return {
-            path: content
-            for result in results
-            if isinstance(result, tuple) and (path := result[0]) and (content := result[1])
-        }
+        return await self.fetch_files_by_paths(
+            owner,
+            repo,
+            files_to_fetch,
+            branch,
+            max_concurrent=max_concurrent,
+            use_snapshot=use_snapshot,
+            tree=tree,
+        )
 
     async def fetch_files_by_paths(
         self,
@@ -933,10 +1328,19 @@ class GitHubReadOperations:
         branch: str = "main",
         max_concurrent: int = 5,
         max_size: int = 100_000,
+        use_snapshot: bool | None = None,
+        tree: RepoTree | None = None,
     ) -> dict[str, str]:
         """
         Fetch contents of specific files by their paths.
 
+        Given the branch's tree, blob SHAs are looked up in the persistent git
+        object store first and only the misses are fetched from GitHub (and
+        then written back). Large requests (or use_snapshot=True) are served
+        from a tarball snapshot of the branch — one download instead of one
+        Contents API call per file. Files the snapshot did not retain fall
+        back to per-file fetching.
+
         Args:
             owner: Repository owner
             repo: Repository name
@@ -944,6 +1348,8 @@ class GitHubReadOperations:
             branch: Branch name (default: "main")
             max_concurrent: Maximum concurrent requests (default: 5)
             max_size: Maximum file size in bytes (default: 100KB)
+            use_snapshot: Serve from a tarball snapshot (None = decide by file count)
+            tree: Optional pre-fetched RepoTree for this branch (enables the object store)
 
         Returns:
             Dict mapping file paths to their contents (excludes missing/binary files)
@@ -951,6 +1357,59 @@ class GitHubReadOperations:
         if not paths:
             return {}
 
+        contents: dict[str, str] = {}
+        blob_shas: dict[str, str] = {}
+        if tree is not None and git_object_store.enabled:
+            blob_shas = {item.path: item.sha for item in tree.all_items if item.type == "blob"}
+            stored = await git_object_store.get_blobs(blob_shas[p] for p in paths if p in blob_shas)
+            remaining: list[str] = []
+            for file_path in paths:
+                sha = blob_shas.get(file_path)
+                if sha is None or sha not in stored:
+                    remaining.append(file_path)
+                elif text := decode_text(stored[sha], max_size):
+                    contents[file_path] = text
+            paths = remaining
+            if not paths:
+                return contents
+
+        fetched = await self._fetch_files_uncached(
+            owner, repo, paths, branch, max_concurrent, max_size, use_snapshot
+        )
+        contents.update(fetched)
+
+        if blob_shas:
+            await git_object_store.put_blobs(
+                content.encode("utf-8") for path, content in fetched.items() if path in blob_shas
+            )
+        return contents
+
+    async def _fetch_files_uncached(
+        self,
+        owner: str,
+        repo: str,
+        paths: list[str],
+        branch: str,
+        max_concurrent: int,
+        max_size: int,
+        use_snapshot: bool | None,
+    ) -> dict[str, str]:
+        """Fetch file contents from GitHub via snapshot and/or per-file requests."""
+        contents: dict[str, str] = {}
+        snapshot = await self._snapshot_for_bulk_read(owner, repo, branch, len(paths), use_snapshot)
+        if snapshot:
+            remaining: list[str] = []
+            for file_path in paths:
+                if snapshot.is_retained(file_path):
+                    text = snapshot.read_text(file_path, max_size)
+                    if text:
+                        contents[file_path] = text
+                elif snapshot.has_path(file_path) and snapshot.sizes[file_path] <= max_size:
+                    remaining.append(file_path)
+            paths = remaining
+            if not paths:
+                return contents
+
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def fetch_with_limit(file_path: str) -> tuple[str, str | None]:
@@ -963,11 +1422,61 @@ class GitHubReadOperations:
         tasks = [fetch_with_limit(fp) for fp in paths]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        return {
-            path: content
-            for result in results
-            if isinstance(result, tuple) and (path := result[0]) and (content := result[1])
-        }
+        contents.update(
+            {
+                path: content
+                for result in results
+                if isinstance(result, tuple) and (path := result[0]) and (content := result[1])
+            }
+        )
+        return contents
+
+    async def get_file_content_via_tree(
+        self,
+        owner: str,
+        repo: str,
+        path: str,
+        branch: str = "main",
+        max_size: int = 100_000,
+    ) -> RepoFile | None:
+        """
+        Fetch a single file, resolving its blob SHA from the branch's tree.
+
+        For one-off reads (agent tools, MCP) where the caller has no tree at
+        hand. The tree is usually already cached, and with the blob SHA known
+        the content can be served from the persistent git object store.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            path: File path within the repository
+            branch: Branch name (default: "main")
+            max_size: Maximum file size in bytes to fetch (default: 100KB)
+
+        Returns:
+            RepoFile with decoded content, or None if missing/too large/binary
+        """
+        blob_sha = None
+        if git_object_store.enabled:
+            try:
+                tree = await self.get_repo_tree(owner, repo, branch)
+            except GitHubAPIError as e:
+                logger.debug(f"Tree unavailable for {owner}/{repo}@{branch}: {e}")
+            else:
+                blob_sha = next(
+                    (
+                        item.sha
+                        for item in tree.all_items
+                        if item.path == path and item.type == "blob"
+                    ),
+                    None,
+                )
+                if blob_sha is None and not tree.truncated:
+                    return None
+
+        return await self.get_file_content(
+            owner, repo, path, branch, max_size=max_size, blob_sha=blob_sha
+        )
 
     async def get_repo_context(
         self,
@@ -15,6 +15,7 @@ Handles:
 from typing import Any
 
 from app.services.github.read_operations import GitHubReadOperations
+from app.services.github.snapshot import RepoSnapshot
 from app.services.github.types import (
     CommitStats,
     ContributorInfo,
@@ -62,11 +63,13 @@ class GitHubService(GitHubReadOperations, GitHubWriteOperations):
         - get_authenticated_user
         - get_repo_tree
         - get_file_content
+        - get_file_content_via_tree
         - get_repo_languages
         - get_repo_contributors
         - get_commit_stats
         - get_key_files
         - fetch_files_by_paths
+        - get_repo_snapshot
         - get_repo_context
 
     Write operations (from GitHubWriteOperations):
@@ -142,9 +145,23 @@ class GitHubService(GitHubReadOperations, GitHubWriteOperations):
         path: str,
         branch: str = "main",
         max_size: int = 100_000,
+        blob_sha: str | None = None,
     ) -> RepoFile | None:
         """Fetch the content of a specific file from a repository."""
         return await GitHubReadOperations.get_file_content(
+            self, owner, repo, path, branch, max_size, blob_sha
+        )
+
+    async def get_file_content_via_tree(
+        self,
+        owner: str,
+        repo: str,
+        path: str,
+        branch: str = "main",
+        max_size: int = 100_000,
+    ) -> RepoFile | None:
+        """Fetch a single file, resolving its blob SHA from the branch's tree."""
+        return await GitHubReadOperations.get_file_content_via_tree(
             self, owner, repo, path, branch, max_size
         )
 
@@ -181,10 +198,11 @@ class GitHubService(GitHubReadOperations, GitHubWriteOperations):
         branch: str = "main",
         tree: RepoTree | None = None,
         max_concurrent: int = 5,
+        use_snapshot: bool | None = None,
     ) -> dict[str, str]:
         """Fetch contents of key files for AI analysis (parallel)."""
         return await GitHubReadOperations.get_key_files(
-            self, owner, repo, branch, tree, max_concurrent
+            self, owner, repo, branch, tree, max_concurrent, use_snapshot
         )
 
     async def fetch_files_by_paths(
@@ -195,12 +213,18 @@ class GitHubService(GitHubReadOperations, GitHubWriteOperations):
         branch: str = "main",
         max_concurrent: int = 5,
         max_size: int = 100_000,
+        use_snapshot: bool | None = None,
+        tree: RepoTree | None = None,
     ) -> dict[str, str]:
         """Fetch contents of specific files by their paths."""
         return await GitHubReadOperations.fetch_files_by_paths(
-            self, owner, repo, paths, branch, max_concurrent, max_size
+            self, owner, repo, paths, branch, max_concurrent, max_size, use_snapshot, tree
         )
 
+    async def get_repo_snapshot(self, owner: str, repo: str, ref: str = "main") -> RepoSnapshot:
+        """Download and extract the repository tarball for a ref."""
+        return await GitHubReadOperations.get_repo_snapshot(self, owner, repo, ref)
+
     async def get_repo_context(
         self,
         owner: str,
@@ -0,0 +1,146 @@
+"""
+Tarball-based repository snapshots.
+
+Instead of one Contents API round trip per file, a snapshot downloads the
+repository tarball for a ref once and serves file contents from it. This is
+used by bulk readers (docs generation, analysis) that need hundreds of files
+from the same commit.
+
+The tarball is spooled to a temporary file while downloading and then read
+with tarfile in streaming mode, so neither the archive nor the full set of
+files is ever held in memory — only small text files up to the retention
+limits below are kept.
+"""
+
+import logging
+import tarfile
+import tempfile
+from dataclasses import dataclass, field
+from typing import IO
+
+from app.services.github.helpers import decode_text
+
+logger = logging.getLogger(__name__)
+
+# Only fetch files in bulk via snapshot when at least this many are requested;
+# below it the per-file Contents API is cheaper than a full tarball download.
+SNAPSHOT_MIN_FILES = 20
+
+# Abort (and fall back to per-file fetching) for archives larger than this.
+SNAPSHOT_MAX_ARCHIVE_BYTES = 200 * 1024 * 1024  # 200 MB
+
+# Individual files larger than this are not retained in the snapshot.
+SNAPSHOT_MAX_FILE_SIZE = 100_000
+
+# Total bytes of file content retained per snapshot. Files seen after the
+# budget is exhausted are recorded as "not retained" and fetched per-file.
+SNAPSHOT_MAX_RETAINED_BYTES = 32 * 1024 * 1024  # 32 MB
+
+# Archives are spooled in memory up to this size before rolling over to disk.
+_SPOOL_MAX_MEMORY = 8 * 1024 * 1024  # 8 MB
+
+
+@dataclass
+class RepoSnapshot:
+    """
+    File contents of a repository at a single ref, extracted from its tarball.
+
+    Attributes:
+        full_name: Repository "owner/repo"
+        ref: Branch name or commit SHA the tarball was requested for
+        files: Retained file contents keyed by repo-relative path
+        sizes: Size of every regular file in the archive, retained or not
+    """
+
+    full_name: str
+    ref: str
+    files: dict[str, bytes] = field(default_factory=dict)
+    sizes: dict[str, int] = field(default_factory=dict)
+
+    def has_path(self, path: str) -> bool:
+        """Whether the archive contained a regular file at this path."""
+        return path in self.sizes
+
+    def is_retained(self, path: str) -> bool:
+        """Whether the file's content is available from the snapshot."""
+        return path in self.files
+
+    def read_text(self, path: str, max_size: int = SNAPSHOT_MAX_FILE_SIZE) -> str | None:
+        """
+        Return a file's content decoded as UTF-8.
+
+        Mirrors get_file_content(): returns None for missing files, files
+        larger than max_size, and binary (non-UTF-8) files.
+        """
+        content = self.files.get(path)
+        if content is None:
+            return None
+        return decode_text(content, max_size)
+
+
+def _strip_archive_root(name: str) -> str | None:
+    """
+    Remove the "<owner>-<repo>-<sha>/" prefix GitHub puts on every member.
+
+    Returns None for the root directory itself.
+    """
+    _, sep, path = name.partition("/")
+    return path if sep and path else None
+
+
+def extract_snapshot(
+    archive: IO[bytes],
+    full_name: str,
+    ref: str,
+    max_file_size: int = SNAPSHOT_MAX_FILE_SIZE,
+    max_retained_bytes: int = SNAPSHOT_MAX_RETAINED_BYTES,
+) -> RepoSnapshot:
+    """
+    Build a RepoSnapshot from a gzipped tarball.
+
+    Reads the archive in a single forward pass ("r|gz" stream mode), so the
+    file object does not need to be seekable and members are never buffered
+    beyond the one currently being read. Blocking — run in a thread.
+
+    Args:
+        archive: Readable file object positioned at the start of the tarball
+        full_name: Repository "owner/repo"
+        ref: Ref the tarball was requested for
+        max_file_size: Largest file to retain
+        max_retained_bytes: Total content budget for retained files
+
+    Returns:
+        RepoSnapshot with retained contents and the size of every file
+    """
+    snapshot = RepoSnapshot(full_name=full_name, ref=ref)
+    retained = 0
+
+    with tarfile.open(fileobj=archive, mode="r|gz") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            path = _strip_archive_root(member.name)
+            if path is None:
+                continue
+
+            snapshot.sizes[path] = member.size
+            if member.size > max_file_size or retained + member.size > max_retained_bytes:
+                continue
+
+            extracted = tar.extractfile(member)
+            if extracted is None:
+                continue
+            content = extracted.read()
+            snapshot.files[path] = content
+            retained += len(content)
+
+    logger.debug(
+        f"Extracted snapshot of {full_name}@{ref}: "
+        f"{len(snapshot.files)}/{len(snapshot.sizes)} files retained ({retained} bytes)"
+    )
+    return snapshot
+
+
+def new_spool() -> tempfile.SpooledTemporaryFile[bytes]:
+    """Temporary file for a downloading archive; rolls over to disk when large."""
+    return tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY)
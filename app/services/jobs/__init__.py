@@ -0,0 +1,15 @@
+"""Durable Postgres-backed background job queue."""
+
+from app.services.jobs.queue import enqueue_job
+from app.services.jobs.registry import JobHandler, get_handler, job_handler, registered_handlers
+from app.services.jobs.worker import JobWorker, job_worker
+
+__all__ = [
+    "JobHandler",
+    "JobWorker",
+    "enqueue_job",
+    "get_handler",
+    "job_handler",
+    "job_worker",
+    "registered_handlers",
+]
@@ -0,0 +1,49 @@
+"""Enqueueing background jobs."""
+
+import logging
+import uuid as uuid_pkg
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.core.database import async_session_maker
+from app.domain.job_queue_operations import job_queue_ops
+from app.services.jobs.registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+
+async def enqueue_job(
+    job_type: str,
+    payload: dict[str, Any],
+    *,
+    dedupe_key: str | None = None,
+    delay_seconds: float = 0,
+) -> uuid_pkg.UUID | None:
+    """
+    Durably enqueue a job for the worker pool.
+
+    Commits in its own session (the job table is service-role only, and the
+    job must not depend on the caller's transaction). Returns the job ID, or
+    None if a queued or running job with the same dedupe_key exists.
+    """
+    handler = get_handler(job_type)
+    if handler is None:
+        raise ValueError(f"No handler registered for job type {job_type!r}")
+
+    run_after = datetime.now(UTC) + timedelta(seconds=delay_seconds)
+    async with async_session_maker() as session:
+        job_id = await job_queue_ops.enqueue(
+            session,
+            job_type,
+            payload,
+            dedupe_key=dedupe_key,
+            max_attempts=handler.max_attempts,
+            run_after=run_after,
+        )
+        await session.commit()
+
+    if job_id is None:
+        logger.debug(f"[jobs] {job_type} already pending for {dedupe_key}")
+    else:
+        logger.info(f"[jobs] Enqueued {job_type} job {job_id}")
+    return job_id
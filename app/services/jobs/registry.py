@@ -0,0 +1,84 @@
+"""Job handler registry.
+
+Background entry points register themselves as job types:
+
+    @job_handler("docs_generation", concurrency=2, max_attempts=2)
+    async def run_document_orchestrator(product_id: str, user_id: str, mode: str = "full"):
+        ...
+
+The job payload is passed to the handler as keyword arguments, so it must be
+JSON-serializable (pass IDs as strings, never ORM objects or secrets).
+A handler that raises is retried with exponential backoff until
+max_attempts; handlers that record their own failure (e.g. on the product)
+and return normally are not retried.
+"""
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+HandlerFunc = Callable[..., Awaitable[Any]]
+F = TypeVar("F", bound=HandlerFunc)
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    """A registered job type and its execution limits."""
+
+    job_type: str
+    func: HandlerFunc
+    # Jobs of this type running at once, across all workers
+    concurrency: int = 2
+    # Lock held while running; extended by heartbeats, so it only bounds how
+    # long a job of a crashed worker waits before another worker takes it
+    visibility_timeout_seconds: float = 120.0
+    max_attempts: int = 3
+    retry_base_seconds: float = 30.0
+    retry_max_seconds: float = 1800.0
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next attempt, after `attempts` attempts."""
+        return float(
+            min(self.retry_base_seconds * 2 ** max(attempts - 1, 0), self.retry_max_seconds)
+        )
+
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(
+    job_type: str,
+    *,
+    concurrency: int = 2,
+    visibility_timeout_seconds: float = 120.0,
+    max_attempts: int = 3,
+    retry_base_seconds: float = 30.0,
+    retry_max_seconds: float = 1800.0,
+) -> Callable[[F], F]:
+    """Register an async function as the handler for a job type."""
+
+    def decorator(func: F) -> F:
+        if job_type in _handlers and _handlers[job_type].func is not func:
+            raise ValueError(f"Job type {job_type!r} is already registered")
+        _handlers[job_type] = JobHandler(
+            job_type=job_type,
+            func=func,
+            concurrency=concurrency,
+            visibility_timeout_seconds=visibility_timeout_seconds,
+            max_attempts=max_attempts,
+            retry_base_seconds=retry_base_seconds,
+            retry_max_seconds=retry_max_seconds,
+        )
+        return func
+
+    return decorator
+
+
+def get_handler(job_type: str) -> JobHandler | None:
+    """Get the handler registered for a job type."""
+    return _handlers.get(job_type)
+
+
+def registered_handlers() -> list[JobHandler]:
+    """All registered handlers."""
+    return list(_handlers.values())
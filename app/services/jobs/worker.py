@@ -0,0 +1,243 @@
+"""Worker pool for the durable job queue.
+
+A JobWorker polls the job_queue table for each registered job type, claims
+as many due jobs as it has free slots for (FOR UPDATE SKIP LOCKED), and runs
+them as tasks. While a job runs, a heartbeat extends its lock; if the worker
+dies, the lock expires and another worker takes the job over.
+
+The API process runs one worker (unless JOB_WORKER_IN_API=false); more can
+run as separate processes with `python -m app.tasks.job_worker`.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid as uuid_pkg
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.database import async_session_maker
+from app.domain.job_queue_operations import job_queue_ops
+from app.models.queued_job import QueuedJob
+from app.services.jobs.registry import JobHandler, registered_handlers
+
+logger = logging.getLogger(__name__)
+
+# Seconds between failing abandoned jobs and deleting old finished ones
+MAINTENANCE_INTERVAL_SECONDS = 300
+# Seconds running jobs get to finish on shutdown before they are released
+SHUTDOWN_GRACE_SECONDS = 30.0
+
+
+class JobWorker:
+    """Claims and runs queued jobs with per-job-type concurrency limits."""
+
+    def __init__(
+        self,
+        handlers: list[JobHandler] | None = None,
+        *,
+        worker_id: str | None = None,
+        poll_interval: float = settings.job_poll_interval_seconds,
+    ) -> None:
+        self._handlers = handlers
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid_pkg.uuid4().hex[:8]}"
+        )
+        self.poll_interval = poll_interval
+        self._running: dict[str, set[asyncio.Task[None]]] = defaultdict(set)
+        self._stopping = asyncio.Event()
+        self._loop_task: asyncio.Future[None] | None = None
+        self._last_maintenance = 0.0
+
+    @property
+    def handlers(self) -> list[JobHandler]:
+        """Handlers this worker runs (all registered ones by default)."""
+        return self._handlers if self._handlers is not None else registered_handlers()
+
+    def start(self) -> None:
+        """Run the poll loop in the background (for the API process)."""
+        if self._loop_task is None:
+            self._stopping.clear()
+            self._loop_task = asyncio.ensure_future(self.run())
+
+    def request_stop(self) -> None:
+        """Stop claiming new jobs; running jobs continue."""
+        self._stopping.set()
+
+    async def stop(self, grace_seconds: float = SHUTDOWN_GRACE_SECONDS) -> None:
+        """
+        Stop polling, let running jobs finish, then release the rest.
+
+        Released jobs keep the attempt they used; one interrupted on its
+        last attempt is marked failed instead.
+        """
+        self.request_stop()
+        if self._loop_task is not None:
+            await self._loop_task
+            self._loop_task = None
+
+        tasks = [task for tasks in self._running.values() for task in tasks]
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=grace_seconds)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.info(f"[jobs] Worker {self.worker_id} stopped, released {len(pending)} jobs")
+
+    async def run(self) -> None:
+        """Poll for jobs until stopped."""
+        logger.info(
+            f"[jobs] Worker {self.worker_id} started for "
+            f"{', '.join(h.job_type for h in self.handlers) or 'no job types'}"
+        )
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.poll_once()
+            except Exception:
+                logger.exception("[jobs] Poll failed")
+                claimed = 0
+            if claimed:
+                continue
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+
+    async def poll_once(self) -> int:
+        """Claim due jobs for every job type with free slots. Returns the number claimed."""
+        await self._maybe_maintain()
+
+        claimed = 0
+        for handler in self.handlers:
+            running = self._running[handler.job_type]
+            free = handler.concurrency - len(running)
+            if free <= 0:
+                continue
+
+            async with async_session_maker() as session:
+                jobs = await job_queue_ops.claim(
+                    session,
+                    handler.job_type,
+                    self.worker_id,
+                    limit=free,
+                    max_running=handler.concurrency,
+                    visibility_timeout=handler.visibility_timeout_seconds,
+                )
+                await session.commit()
+
+            for job in jobs:
+                task = asyncio.ensure_future(self._execute(handler, job))
+                running.add(task)
+                task.add_done_callback(running.discard)
+            claimed += len(jobs)
+        return claimed
+
+    def running_count(self, job_type: str) -> int:
+        """Jobs of a type this worker is running."""
+        return len(self._running[job_type])
+
+    async def _execute(self, handler: JobHandler, job: QueuedJob) -> None:
+        """Run one claimed job and record the outcome."""
+        logger.info(
+            f"[jobs] Running {handler.job_type} job {job.id} "
+            f"(attempt {job.attempts}/{job.max_attempts})"
+        )
+        heartbeat = asyncio.ensure_future(self._heartbeat(handler, job.id))
+        try:
+            await handler.func(**job.payload)
+        except asyncio.CancelledError:
+            if job.attempts < job.max_attempts:
+                await self._record(
+                    job.id, lambda db: job_queue_ops.release(db, job.id, self.worker_id)
+                )
+            else:
+                logger.warning(
+                    f"[jobs] {handler.job_type} job {job.id} interrupted on its last attempt"
+                )
+                await self._record(
+                    job.id,
+                    lambda db: job_queue_ops.fail(
+                        db, job.id, self.worker_id, "Interrupted on its last attempt", None
+                    ),
+                )
+            raise
+        except Exception as e:
+            error = str(e)
+            if job.attempts < job.max_attempts:
+                delay = handler.retry_delay(job.attempts)
+                retry_at: datetime | None = datetime.now(UTC) + timedelta(seconds=delay)
+                logger.warning(
+                    f"[jobs] {handler.job_type} job {job.id} failed, retrying in {delay:.0f}s: {e}"
+                )
+            else:
+                retry_at = None
+                logger.exception(f"[jobs] {handler.job_type} job {job.id} failed permanently")
+            await self._record(
+                job.id,
+                lambda db: job_queue_ops.fail(db, job.id, self.worker_id, error, retry_at),
+            )
+        else:
+            await self._record(
+                job.id, lambda db: job_queue_ops.complete(db, job.id, self.worker_id)
+            )
+            logger.info(f"[jobs] {handler.job_type} job {job.id} completed")
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, handler: JobHandler, job_id: uuid_pkg.UUID) -> None:
+        """Extend the job's lock while it runs."""
+        interval = handler.visibility_timeout_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with async_session_maker() as session:
+                    held = await job_queue_ops.extend(
+                        session, job_id, self.worker_id, handler.visibility_timeout_seconds
+                    )
+                    await session.commit()
+                if not held:
+                    logger.warning(f"[jobs] Lost the lock on job {job_id}")
+                    return
+            except Exception as e:
+                logger.warning(f"[jobs] Heartbeat for job {job_id} failed: {e}")
+
+    async def _record(
+        self, job_id: uuid_pkg.UUID, write: Callable[[AsyncSession], Awaitable[Any]]
+    ) -> None:
+        """Write a job's outcome in its own session.
+
+        If this fails the job stays locked until its lock expires and is then
+        run again.
+        """
+        try:
+            async with async_session_maker() as session:
+                await write(session)
+                await session.commit()
+        except Exception:
+            logger.exception(f"[jobs] Failed to record the outcome of job {job_id}")
+
+    async def _maybe_maintain(self) -> None:
+        """Periodically fail abandoned jobs and delete old finished ones."""
+        now = time.monotonic()
+        if now - self._last_maintenance < MAINTENANCE_INTERVAL_SECONDS:
+            return
+        self._last_maintenance = now
+
+        async with async_session_maker() as session:
+            abandoned = await job_queue_ops.fail_abandoned(session)
+            deleted = await job_queue_ops.delete_finished_before(
+                session, datetime.now(UTC) - timedelta(days=settings.job_retention_days)
+            )
+            await session.commit()
+        if abandoned or deleted:
+            logger.info(f"[jobs] Failed {abandoned} abandoned jobs, deleted {deleted} old jobs")
+
+
+job_worker = JobWorker()
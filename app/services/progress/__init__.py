@@ -2,6 +2,8 @@
 
 from app.services.progress.activity_checker import activity_checker
 from app.services.progress.auto_generator import auto_progress_generator
+from app.services.progress.commit_store import commit_store
+from app.services.progress.commit_sync import commit_sync_worker
 from app.services.progress.shipped_summarizer import shipped_summarizer
 from app.services.progress.summarizer import contributor_summarizer, progress_summarizer
 from app.services.progress.token_resolver import token_resolver
@@ -9,6 +11,8 @@ from app.services.progress.token_resolver import token_resolver
 __all__ = [
     "activity_checker",
     "auto_progress_generator",
+    "commit_store",
+    "commit_sync_worker",
     "contributor_summarizer",
     "progress_summarizer",
     "shipped_summarizer",
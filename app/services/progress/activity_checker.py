@@ -1,11 +1,16 @@
 """Lightweight activity checker for auto-progress smart-skip logic.
 
 Checks if a product has new commits without fetching full commit data.
-Uses GitHub's per_page=1 trick to minimize API usage.
+Repositories kept current by the commit sync worker are answered from the
+local commit store; the rest use GitHub's per_page=1 trick to minimize API usage,
+or, for a whole organization at once, one batched GraphQL probe of branch heads.
 """
 
 import logging
-from datetime import datetime
+import uuid as uuid_pkg
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.repository import Repository
 from app.services.github import GitHubReadOperations
@@ -20,16 +25,31 @@ class ActivityChecker:
         self,
         repos: list[Repository],
         github: GitHubReadOperations,
+        db: AsyncSession | None = None,
     ) -> datetime | None:
         """
         Get the most recent commit timestamp across all repos.
 
-        Uses GET /repos/{owner}/{repo}/commits?per_page=1 for minimal API usage.
+        With a db session, repos with a fresh sync cursor are read from the
+        commit store. Others use GET /repos/{owner}/{repo}/commits?per_page=1.
         Returns the latest committer date across all repos, or None if no commits.
         """
         latest: datetime | None = None
+        remaining = [r for r in repos if r.full_name]
+
+        if db is not None and remaining:
+            from app.domain import repository_commit_ops
+            from app.services.progress.commit_sync import covered_repositories
+
+            names = [r.full_name for r in remaining if r.full_name]
+            covered = await covered_repositories(db, names, since=datetime.now(UTC))
+            stored = await repository_commit_ops.get_latest_committed_at(db, list(covered))
+            for commit_dt in stored.values():
+                if latest is None or commit_dt > latest:
+                    latest = commit_dt
+            remaining = [r for r in remaining if r.full_name not in covered]
 
-        for repo in repos:
+        for repo in remaining:
             if not repo.full_name:
                 continue
 
@@ -55,5 +75,50 @@ class ActivityChecker:
 
         return latest
 
+    async def get_latest_commit_dates(
+        self,
+        repos_by_product: dict[uuid_pkg.UUID, list[Repository]],
+        github: GitHubReadOperations,
+        db: AsyncSession,
+    ) -> dict[uuid_pkg.UUID, datetime | None]:
+        """
+        Get the most recent commit timestamp of many products at once.
+
+        Like get_latest_commit_date for every product of an organization:
+        synced repos are read from the commit store in one query, and the
+        branch heads of all others come from GitHub in one GraphQL request
+        per BRANCH_HEADS_BATCH_SIZE repositories. Raises if the probe fails.
+
+        Returns a dict mapping product_id -> latest committer date (None if
+        its repositories have no commits).
+        """
+        from app.domain import repository_commit_ops
+        from app.services.progress.commit_sync import covered_repositories
+
+        branches = {
+            r.full_name: r.default_branch
+            for repos in repos_by_product.values()
+            for r in repos
+            if r.full_name
+        }
+        covered = await covered_repositories(db, list(branches), since=datetime.now(UTC))
+        latest_by_repo = await repository_commit_ops.get_latest_committed_at(db, list(covered))
+
+        heads = await github.get_branch_heads(
+            [(name, branch) for name, branch in branches.items() if name not in covered]
+        )
+        for name, head in heads.items():
+            latest_by_repo[name] = datetime.fromisoformat(
+                head["committed_at"].replace("Z", "+00:00")
+            )
+
+        return {
+            product_id: max(
+                (latest_by_repo[r.full_name] for r in repos if r.full_name in latest_by_repo),
+                default=None,
+            )
+            for product_id, repos in repos_by_product.items()
+        }
+
 
 activity_checker = ActivityChecker()
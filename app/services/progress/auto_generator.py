@@ -1,8 +1,10 @@
 """Auto-progress orchestrator for daily AI summary generation.
 
-Main entry point for the cron job. Iterates over all organizations with
-auto_progress_enabled, checks for new activity, and regenerates summaries
-only when new commits exist.
+Main entry point for the cron job. Processes the products of all
+organizations with auto_progress_enabled in a worker pool, checks for new
+activity, and regenerates summaries only when new commits exist. Progress is
+checkpointed per product so a run cut short by the job timeout resumes later
+the same day.
 """
 
 import asyncio
@@ -10,24 +12,43 @@ import logging
 import time
 import uuid as uuid_pkg
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import func, or_, select
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import async_session_maker
+from app.core.sharding import ShardSpec
 from app.models.product import Product
-from app.services.github import GitHubReadOperations
+from app.services.github import GitHubReadOperations, background_github_work
 from app.services.progress.activity_checker import activity_checker
+from app.services.progress.commit_store import api_commit_from_row
+from app.services.progress.commit_sync import covered_repositories
 from app.services.progress.token_resolver import token_resolver
 
 logger = logging.getLogger(__name__)
 
 # Safety caps
 MAX_PRODUCTS_PER_ORG = 50
-PRODUCT_TIMEOUT_SECONDS = 30
+# Per product, including time spent waiting for shared GitHub and LLM slots
+PRODUCT_TIMEOUT_SECONDS = 90
+# Per invocation; products not reached are picked up by the next invocation
 TOTAL_JOB_TIMEOUT_SECONDS = 600  # 10 minutes max
+MAX_WINDOW_COMMITS = 5000  # per repository, for repos read from GitHub
+
+# Worker pool
+MAX_CONCURRENT_PRODUCTS = 8  # products in progress at once
+MAX_CONCURRENT_PRODUCTS_PER_ORG = 2  # per org (one GitHub token each)
+MAX_CONCURRENT_GITHUB_FETCHES = 6  # products checking or fetching commits at once
+MAX_CONCURRENT_LLM_CALLS = 4  # summarizer calls at once
+
+# Checkpoints kept for inspection
+CHECKPOINT_RETENTION_DAYS = 7
+# Attempts per product and day before a failure is final; the hourly resume
+# job would otherwise retry a product that always fails all day long
+MAX_PRODUCT_ATTEMPTS = 3
 
 
 @dataclass
@@ -38,36 +59,137 @@ class AutoProgressReport:
     products_regenerated: int = 0
     products_skipped: int = 0
     products_failed: int = 0
+    # Finished by an earlier invocation of the same day's run
+    products_already_done: int = 0
     errors: list[str] = field(default_factory=list)
     duration_seconds: float = 0.0
+    # Seconds spent per org (setup, activity probe and its products), by org id.
+    # Products run concurrently, so this sums their durations: it is the work
+    # spent on the org, not the elapsed time from its first to last product.
+    org_timings: dict[str, float] = field(default_factory=dict)
+
+    def add_org_time(self, org_id: uuid_pkg.UUID, seconds: float) -> None:
+        key = str(org_id)
+        self.org_timings[key] = self.org_timings.get(key, 0.0) + seconds
+
+
+@dataclass
+class _RunLimits:
+    """Concurrency limits shared by all workers of one run."""
+
+    github: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(MAX_CONCURRENT_GITHUB_FETCHES)
+    )
+    llm: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+    )
+
+
+@dataclass
+class _OrgWork:
+    """Products of one org still to process in this run."""
+
+    org_id: uuid_pkg.UUID
+    github: GitHubReadOperations
+    products: list[Product]
+    slots: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(MAX_CONCURRENT_PRODUCTS_PER_ORG)
+    )
+    # Latest commit dates from the org-wide activity probe, by product
+    latest_activity: dict[uuid_pkg.UUID, datetime] = field(default_factory=dict)
+
+
+async def _rollback(db: AsyncSession, product: Product) -> None:
+    """Roll back a product's session; a broken connection must not stop the pool."""
+    try:
+        await db.rollback()
+    except Exception as e:
+        logger.warning(f"[auto-progress] Rollback for product {product.id} failed: {e}")
+
+
+def _interleave(orgs: list[_OrgWork]) -> list[tuple[_OrgWork, Product]]:
+    """Order products round-robin across orgs, so every org is started early."""
+    queue: list[tuple[_OrgWork, Product]] = []
+    for i in range(max((len(o.products) for o in orgs), default=0)):
+        queue.extend((org, org.products[i]) for org in orgs if i < len(org.products))
+    return queue
 
 
 class AutoProgressGenerator:
     """Orchestrator that runs auto-progress for all eligible organizations."""
 
+    @background_github_work
     async def run_for_all_orgs(
         self,
         db: AsyncSession,
+        resume_only: bool = False,
+        shard: ShardSpec | None = None,
     ) -> AutoProgressReport:
         """
         Main entry point for the cron job.
 
         1. Find all orgs with auto_progress_enabled = true
-        2. For each org, resolve a GitHub token and process products
-        3. Return a report of what was generated/skipped
+        2. Skip products today's run has already finished with (checkpoints)
+        3. Resolve a GitHub token per org and process the remaining products
+           with a worker pool, round-robin across orgs
+        4. Return a report of what was generated/skipped
+
+        Each product is checkpointed when it finishes. If the job timeout
+        stops the run, the next invocation on the same UTC day resumes with
+        the products it had not reached, and retries the ones that failed
+        (up to MAX_PRODUCT_ATTEMPTS attempts per product and day).
+
+        Args:
+            db: Database session (for org lookup and checkpoints; each
+                product is processed in its own session)
+            resume_only: Only continue (or retry failures of) a run started
+                earlier today; do nothing if there is none
+            shard: Only process the organizations in this shard
         """
-        from app.domain import organization_ops
+        from app.domain import auto_progress_checkpoint_ops, organization_ops, product_ops
 
         start = time.monotonic()
         report = AutoProgressReport()
+        run_date = datetime.now(UTC).date()
+
+        outcomes = await auto_progress_checkpoint_ops.get_outcomes(db, run_date)
+        if resume_only and not outcomes:
+            return report
+        # Failures (often transient GitHub or LLM errors) are retried, up to a cap
+        done = {
+            product_id
+            for product_id, (outcome, attempts) in outcomes.items()
+            if outcome != "failed" or attempts >= MAX_PRODUCT_ATTEMPTS
+        }
+        if not outcomes:
+            await auto_progress_checkpoint_ops.delete_before(
+                db, run_date - timedelta(days=CHECKPOINT_RETENTION_DAYS)
+            )
+            await db.commit()
 
         orgs = await organization_ops.get_orgs_with_auto_progress(db)
-        logger.info(f"[auto-progress] Found {len(orgs)} orgs with auto-progress enabled")
+        if shard is not None:
+            orgs = [org for org in orgs if shard.contains(org.id)]
+        logger.info(
+            f"[auto-progress] Found {len(orgs)} orgs with auto-progress enabled"
+            + (f", resuming after {len(done)} products" if done else "")
+        )
 
+        limits = _RunLimits()
         try:
             async with asyncio.timeout(TOTAL_JOB_TIMEOUT_SECONDS):
+                work: list[_OrgWork] = []
                 for org in orgs:
+                    org_start = time.monotonic()
                     try:
+                        products = await product_ops.get_by_organization(db, org.id)
+                        products = products[:MAX_PRODUCTS_PER_ORG]
+                        remaining = [p for p in products if p.id not in done]
+                        report.products_already_done += len(products) - len(remaining)
+                        if not remaining:
+                            report.orgs_processed += 1
+                            continue
+
                         github_token = await token_resolver.resolve_for_org(db, org.id)
                         if not github_token:
                             logger.warning(
@@ -76,71 +198,197 @@ class AutoProgressGenerator:
                             )
                             continue
 
-                        await self._process_org(db, org.id, github_token, report)
+                        org_work = _OrgWork(
+                            org_id=org.id,
+                            github=GitHubReadOperations(github_token),
+                            products=remaining,
+                        )
+                        org_work.products = await self._select_active_products(
+                            db, org_work, run_date, limits, report
+                        )
+                        if org_work.products:
+                            work.append(org_work)
                         report.orgs_processed += 1
 
                     except Exception as e:
                         error_msg = f"Org {org.id} ({org.name}): {e}"
                         logger.error(f"[auto-progress] {error_msg}")
                         report.errors.append(error_msg)
+                    finally:
+                        report.add_org_time(org.id, time.monotonic() - org_start)
+
+                await self._run_pool(_interleave(work), run_date, limits, report)
         except TimeoutError:
-            error_msg = f"Total job timeout ({TOTAL_JOB_TIMEOUT_SECONDS}s) exceeded"
+            error_msg = (
+                f"Total job timeout ({TOTAL_JOB_TIMEOUT_SECONDS}s) exceeded, "
+                "remaining products resume on the next run"
+            )
             logger.error(f"[auto-progress] {error_msg}")
             report.errors.append(error_msg)
 
         report.duration_seconds = round(time.monotonic() - start, 2)
+        report.org_timings = {k: round(v, 2) for k, v in report.org_timings.items()}
 
         logger.info(
             f"[auto-progress] Completed: {report.orgs_processed} orgs, "
             f"{report.products_regenerated} regenerated, "
             f"{report.products_skipped} skipped, "
-            f"{report.products_failed} failed "
+            f"{report.products_failed} failed, "
+            f"{report.products_already_done} already done "
             f"({report.duration_seconds}s)"
         )
 
         return report
 
-    async def _process_org(
+    async def _select_active_products(
         self,
         db: AsyncSession,
-        org_id: uuid_pkg.UUID,
-        github_token: str,
+        org: _OrgWork,
+        run_date: date,
+        limits: _RunLimits,
+        report: AutoProgressReport,
+    ) -> list[Product]:
+        """
+        Probe the activity of all of an org's products at once.
+
+        One batched branch-head probe (see ActivityChecker.get_latest_commit_dates)
+        replaces a commits request per repository. Products whose latest commit
+        is not newer than their stored summary are skipped and checkpointed
+        right away; the rest are returned for processing. If the probe fails,
+        all products are returned and checked one by one.
+        """
+        from app.domain import (
+            auto_progress_checkpoint_ops,
+            progress_summary_ops,
+            repository_ops,
+        )
+
+        product_ids = [p.id for p in org.products]
+        try:
+            repos_by_product = await repository_ops.get_github_repos_by_products(db, product_ids)
+            async with limits.github:
+                latest = await activity_checker.get_latest_commit_dates(
+                    repos_by_product, org.github, db
+                )
+            # The period _process_product regenerates and compares against
+            summaries = {
+                s.product_id: s
+                for s in await progress_summary_ops.get_by_products_period(db, product_ids, "7d")
+            }
+        except Exception as e:
+            logger.warning(
+                f"[auto-progress] Org {org.org_id}: activity probe failed, "
+                f"checking products one by one: {e}"
+            )
+            await db.rollback()
+            return org.products
+
+        active: list[Product] = []
+        for product in org.products:
+            latest_commit_date = latest.get(product.id)
+            summary = summaries.get(product.id)
+            if latest_commit_date is None or (
+                summary
+                and summary.last_activity_at
+                and latest_commit_date <= summary.last_activity_at
+            ):
+                report.products_skipped += 1
+                await auto_progress_checkpoint_ops.record(
+                    db, run_date, product.id, org.org_id, "skipped"
+                )
+                continue
+            org.latest_activity[product.id] = latest_commit_date
+            active.append(product)
+
+        await db.commit()
+        logger.info(
+            f"[auto-progress] Org {org.org_id}: {len(active)}/{len(org.products)} "
+            "products have new activity"
+        )
+        return active
+
+    async def _run_pool(
+        self,
+        queue: list[tuple[_OrgWork, Product]],
+        run_date: date,
+        limits: _RunLimits,
         report: AutoProgressReport,
     ) -> None:
-        """Process all products in an organization."""
-        from app.domain import product_ops, repository_ops
+        """Process queued products with up to MAX_CONCURRENT_PRODUCTS workers."""
+        items = iter(queue)
 
-        products = await product_ops.get_by_organization(db, org_id)
-        products = products[:MAX_PRODUCTS_PER_ORG]
+        async def worker() -> None:
+            for org, product in items:
+                async with org.slots:
+                    await self._run_product(org, product, run_date, limits, report)
 
-        github = GitHubReadOperations(github_token)
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(min(MAX_CONCURRENT_PRODUCTS, len(queue)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
 
-        for product in products:
-            try:
-                async with asyncio.timeout(PRODUCT_TIMEOUT_SECONDS):
-                    repos = await repository_ops.get_github_repos_by_product(db, product.id)
-                    if not repos:
-                        report.products_skipped += 1
-                        continue
+    async def _run_product(
+        self,
+        org: _OrgWork,
+        product: Product,
+        run_date: date,
+        limits: _RunLimits,
+        report: AutoProgressReport,
+    ) -> None:
+        """Process one product in its own session and checkpoint the outcome."""
+        from app.domain import auto_progress_checkpoint_ops, repository_ops
 
-                    regenerated = await self._process_product(db, product, repos, github)
+        start = time.monotonic()
+        try:
+            async with async_session_maker() as db:
+                try:
+                    async with asyncio.timeout(PRODUCT_TIMEOUT_SECONDS):
+                        repos = await repository_ops.get_github_repos_by_product(db, product.id)
+                        regenerated = bool(repos) and await self._process_product(
+                            db,
+                            product,
+                            repos,
+                            org.github,
+                            limits,
+                            latest_commit_date=org.latest_activity.get(product.id),
+                        )
+                    outcome = "regenerated" if regenerated else "skipped"
                     if regenerated:
                         report.products_regenerated += 1
                     else:
                         report.products_skipped += 1
 
-            except TimeoutError:
-                error_msg = (
-                    f"Product {product.id} ({product.name}): timeout ({PRODUCT_TIMEOUT_SECONDS}s)"
-                )
-                logger.error(f"[auto-progress] {error_msg}")
-                report.errors.append(error_msg)
-                report.products_failed += 1
-            except Exception as e:
-                error_msg = f"Product {product.id} ({product.name}): {e}"
-                logger.error(f"[auto-progress] {error_msg}")
-                report.errors.append(error_msg)
-                report.products_failed += 1
+                except TimeoutError:
+                    error_msg = f"Product {product.id} ({product.name}): timeout ({PRODUCT_TIMEOUT_SECONDS}s)"
+                    logger.error(f"[auto-progress] {error_msg}")
+                    report.errors.append(error_msg)
+                    report.products_failed += 1
+                    outcome = "failed"
+                    await _rollback(db, product)
+                except Exception as e:
+                    error_msg = f"Product {product.id} ({product.name}): {e}"
+                    logger.error(f"[auto-progress] {error_msg}")
+                    report.errors.append(error_msg)
+                    report.products_failed += 1
+                    outcome = "failed"
+                    await _rollback(db, product)
+
+                try:
+                    await auto_progress_checkpoint_ops.record(
+                        db, run_date, product.id, org.org_id, outcome
+                    )
+                    await db.commit()
+                except Exception as e:
+                    # The product is processed again by the next invocation
+                    logger.error(f"[auto-progress] Checkpoint for product {product.id} failed: {e}")
+                    await _rollback(db, product)
+        finally:
+            # Also for products cancelled by the job timeout
+            report.add_org_time(org.org_id, time.monotonic() - start)
 
     async def _process_product(
         self,
@@ -148,11 +396,14 @@ class AutoProgressGenerator:
         product: Product,
         repos: list,
         github: GitHubReadOperations,
+        limits: _RunLimits,
+        latest_commit_date: datetime | None = None,
     ) -> bool:
         """
         Process a single product.
 
-        1. Check latest commit date via ActivityChecker
+        1. Check latest commit date via ActivityChecker (unless already
+           known from the org-wide probe, passed as latest_commit_date)
         2. Compare with stored last_activity_at
         3. If newer commits exist → regenerate both summaries (7d)
         4. If daily subscribers exist → also generate 1d summaries
@@ -163,13 +414,18 @@ class AutoProgressGenerator:
         from app.domain import (
             dashboard_shipped_ops,
             progress_summary_ops,
+            repository_commit_ops,
         )
 
         # Default period for auto-generation
         progress_period = "7d"
 
-        # 1. Check latest commit date (lightweight — per_page=1 per repo)
-        latest_commit_date = await activity_checker.get_latest_commit_date(repos, github)
+        # 1. Check latest commit date (commit store, or per_page=1 per unsynced repo)
+        if latest_commit_date is None:
+            async with limits.github:
+                latest_commit_date = await activity_checker.get_latest_commit_date(
+                    repos, github, db=db
+                )
 
         if latest_commit_date is None:
             logger.debug(f"[auto-progress] Product {product.id}: no commits found")
@@ -199,20 +455,32 @@ class AutoProgressGenerator:
         # Track which repo each commit came from (for branch info)
         commit_repo_map: dict[str, str] = {}  # sha → repo default_branch
 
-        for repo in repos:
-            if not repo.full_name:
-                continue
-            try:
-                owner, name = repo.full_name.split("/")
-                commits, _ = await github.get_commits_for_timeline(
-                    owner, name, repo.default_branch, per_page=200
-                )
-                for c in commits:
-                    if c["commit"]["committer"]["date"] >= since_str:
+        # Synced repos are read from the commit store, the rest from GitHub
+        branches = {r.full_name: r.default_branch or "main" for r in repos if r.full_name}
+        covered = await covered_repositories(db, list(branches), period_start_7d)
+        for row in await repository_commit_ops.get_in_window(db, list(covered), period_start_7d):
+            all_commits_raw.append(api_commit_from_row(row))
+            commit_repo_map[row.commit_sha] = branches[row.repository_full_name]
+
+        async with limits.github:
+            for repo in repos:
+                if not repo.full_name or repo.full_name in covered:
+                    continue
+                try:
+                    owner, name = repo.full_name.split("/")
+                    async for c in github.iter_commits(
+                        owner,
+                        name,
+                        repo.default_branch,
+                        since=since_str,
+                        max_commits=MAX_WINDOW_COMMITS,
+                    ):
                         all_commits_raw.append(c)
                         commit_repo_map[c["sha"]] = repo.default_branch or "main"
-            except Exception as e:
-                logger.warning(f"[auto-progress] Failed to fetch commits for {repo.full_name}: {e}")
+                except Exception as e:
+                    logger.warning(
+                        f"[auto-progress] Failed to fetch commits for {repo.full_name}: {e}"
+                    )
 
         if not all_commits_raw:
             # Update last_activity_at even if no commits in period
@@ -233,6 +501,7 @@ class AutoProgressGenerator:
             commit_repo_map=commit_repo_map,
             period="7d",
             latest_commit_date=latest_commit_date,
+            limits=limits,
         )
 
         # --- Conditionally generate 1d summaries for daily digest subscribers ---
@@ -256,6 +525,7 @@ class AutoProgressGenerator:
                     commit_repo_map=commit_repo_map,
                     period="1d",
                     latest_commit_date=latest_commit_date,
+                    limits=limits,
                     use_haiku=True,
                 )
 
@@ -271,11 +541,13 @@ class AutoProgressGenerator:
         commit_repo_map: dict[str, str],
         period: str,
         latest_commit_date: datetime,
+        limits: _RunLimits,
         use_haiku: bool = False,
     ) -> None:
         """Generate progress, shipped, and contributor summaries for a given period.
 
         Args:
+            limits: Run limits; each summarizer call takes an LLM slot.
             use_haiku: If True, use Haiku model (for daily summaries to reduce cost).
         """
         from app.domain import (
@@ -336,9 +608,10 @@ class AutoProgressGenerator:
             )
 
             haiku_model = "claude-haiku-4-5-20251001" if use_haiku else None
-            narrative = await progress_summarizer.interpret(
-                progress_data, model_override=haiku_model
-            )
+            async with limits.llm:
+                narrative = await progress_summarizer.interpret(
+                    progress_data, model_override=haiku_model
+                )
 
             # --- Generate Per-Contributor Summaries ---
             try:
@@ -369,9 +642,10 @@ class AutoProgressGenerator:
                     contributors=contrib_data,
                 )
 
-                contrib_result = await contributor_summarizer.interpret(
-                    contrib_input, model_override=haiku_model
-                )
+                async with limits.llm:
+                    contrib_result = await contributor_summarizer.interpret(
+                        contrib_input, model_override=haiku_model
+                    )
 
                 contributor_summaries_data = [
                     {
@@ -426,7 +700,8 @@ class AutoProgressGenerator:
                 commits=commit_infos,
             )
 
-            summary = await shipped_summarizer.interpret(input_data, model_override=haiku_model)
+            async with limits.llm:
+                summary = await shipped_summarizer.interpret(input_data, model_override=haiku_model)
 
             items_as_dicts = [
                 {"description": item.description, "category": item.category}
@@ -482,8 +757,6 @@ async def _has_daily_subscribers_for_product(
 
 def _get_period_start(period: str) -> datetime:
     """Convert period string to start datetime (duplicated from progress.py to avoid circular)."""
-    from datetime import timedelta
-
     now = datetime.now(UTC)
     period_map = {
         "1d": timedelta(days=1),
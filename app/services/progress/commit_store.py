@@ -0,0 +1,227 @@
+"""Ingestion of commits into the local repository commit store.
+
+Commits on tracked repositories' default branches are written to
+repository_commits from GitHub webhooks, so progress views can read recent
+activity from Postgres instead of polling GitHub on every page view.
+
+Sources:
+- push: one row per pushed commit (exact message, author, timestamp)
+- pull_request (closed + merged): the merge commit, approximated from the PR
+  until the same SHA arrives from a push or the sync worker
+- sync: commits read from the REST API by the commit sync worker, with stats
+
+Writes are idempotent upserts keyed by (repository_full_name, commit_sha).
+Each ingest also rebuilds the affected days of the commit_activity_daily rollup.
+"""
+
+import logging
+from datetime import UTC, date, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain import commit_activity_daily_ops, repository_commit_ops, repository_ops
+from app.models.repository_commit import RepositoryCommit
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _format_timestamp(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _utc_day(value: datetime) -> date:
+    return value.astimezone(UTC).date()
+
+
+def rows_from_push(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Build commit rows from a push webhook payload.
+
+    Only pushes to the repository's default branch are ingested — progress
+    views follow default-branch history. Branch deletions and tag pushes
+    carry no commits and produce no rows.
+    """
+    repository = payload.get("repository") or {}
+    full_name = repository.get("full_name")
+    default_branch = repository.get("default_branch")
+    if not full_name or payload.get("ref") != f"refs/heads/{default_branch}":
+        return []
+
+    rows: list[dict[str, Any]] = []
+    for commit in payload.get("commits") or []:
+        author = commit.get("author") or {}
+        timestamp = _parse_timestamp(commit["timestamp"])
+        rows.append(
+            {
+                "repository_full_name": full_name,
+                "github_repo_id": repository.get("id"),
+                "commit_sha": commit["id"],
+                "message": commit.get("message") or "",
+                "author_name": author.get("name") or author.get("username") or "unknown",
+                "author_email": author.get("email"),
+                "author_login": author.get("username"),
+                "author_avatar_url": None,
+                "html_url": commit.get("url") or "",
+                "authored_at": timestamp,
+                "committed_at": timestamp,
+                "additions": None,
+                "deletions": None,
+                "files_changed": None,
+                "source": "push",
+            }
+        )
+    return rows
+
+
+def row_from_merged_pull_request(payload: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Build the merge commit row from a closed pull_request webhook payload.
+
+    Returns None unless the PR was merged into the default branch.
+    """
+    repository = payload.get("repository") or {}
+    pull_request = payload.get("pull_request") or {}
+    full_name = repository.get("full_name")
+    merge_sha = pull_request.get("merge_commit_sha")
+    if (
+        payload.get("action") != "closed"
+        or not pull_request.get("merged")
+        or not full_name
+        or not merge_sha
+        or not pull_request.get("merged_at")
+        or (pull_request.get("base") or {}).get("ref") != repository.get("default_branch")
+    ):
+        return None
+
+    user = pull_request.get("user") or {}
+    merged_at = _parse_timestamp(pull_request["merged_at"])
+    return {
+        "repository_full_name": full_name,
+        "github_repo_id": repository.get("id"),
+        "commit_sha": merge_sha,
+        "message": f"{pull_request.get('title', '')} (#{pull_request.get('number')})",
+        "author_name": user.get("login") or "unknown",
+        "author_email": None,
+        "author_login": user.get("login"),
+        "author_avatar_url": user.get("avatar_url"),
+        "html_url": f"{repository.get('html_url', '')}/commit/{merge_sha}",
+        "authored_at": merged_at,
+        "committed_at": merged_at,
+        "additions": None,
+        "deletions": None,
+        "files_changed": None,
+        "source": "pull_request",
+    }
+
+
+def row_from_api_commit(
+    full_name: str,
+    github_repo_id: int | None,
+    commit: dict[str, Any],
+    stats: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """Build a commit row from a REST API commit object."""
+    git_commit = commit["commit"]
+    git_author = git_commit.get("author") or {}
+    author = commit.get("author") or {}
+    committed_at = _parse_timestamp(git_commit["committer"]["date"])
+    return {
+        "repository_full_name": full_name,
+        "github_repo_id": github_repo_id,
+        "commit_sha": commit["sha"],
+        "message": git_commit.get("message") or "",
+        "author_name": git_author.get("name") or author.get("login") or "unknown",
+        "author_email": git_author.get("email"),
+        "author_login": author.get("login"),
+        "author_avatar_url": author.get("avatar_url"),
+        "html_url": commit.get("html_url") or "",
+        "authored_at": _parse_timestamp(git_author["date"])
+        if git_author.get("date")
+        else committed_at,
+        "committed_at": committed_at,
+        "additions": stats["additions"] if stats else None,
+        "deletions": stats["deletions"] if stats else None,
+        "files_changed": stats["files_changed"] if stats else None,
+        "source": "sync",
+    }
+
+
+def api_commit_from_row(row: RepositoryCommit) -> dict[str, Any]:
+    """
+    Render a stored commit in the REST API commit shape.
+
+    Lets code written against GitHub responses read from the store unchanged.
+    """
+    return {
+        "sha": row.commit_sha,
+        "html_url": row.html_url,
+        "commit": {
+            "message": row.message,
+            "author": {
+                "name": row.author_name,
+                "email": row.author_email,
+                "date": _format_timestamp(row.authored_at),
+            },
+            "committer": {"date": _format_timestamp(row.committed_at)},
+        },
+        "author": (
+            {"login": row.author_login, "avatar_url": row.author_avatar_url}
+            if row.author_login
+            else None
+        ),
+    }
+
+
+class CommitStore:
+    """Writes commits into the local store."""
+
+    async def ingest_push(self, db: AsyncSession, payload: dict[str, Any]) -> int:
+        """Ingest a push webhook. Returns the number of commits written."""
+        rows = rows_from_push(payload)
+        if not rows or not await self._is_tracked(db, payload):
+            return 0
+        return await self.ingest(db, rows)
+
+    async def ingest_pull_request(self, db: AsyncSession, payload: dict[str, Any]) -> int:
+        """Ingest a pull_request webhook. Returns the number of commits written."""
+        row = row_from_merged_pull_request(payload)
+        if row is None or not await self._is_tracked(db, payload):
+            return 0
+        return await self.ingest(db, [row])
+
+    async def ingest(self, db: AsyncSession, rows: list[dict[str, Any]]) -> int:
+        """
+        Upsert commit rows into the store and refresh the daily activity rollup.
+
+        Rollup days are rebuilt for every (repository, day) an ingested commit
+        lands on, plus the day it was stored under before, in case an
+        approximate row moved to its real commit time.
+        """
+        if not rows:
+            return 0
+
+        keys = [(row["repository_full_name"], row["commit_sha"]) for row in rows]
+        previous = await repository_commit_ops.get_committed_at(db, keys)
+        written = await repository_commit_ops.bulk_upsert(db, rows)
+
+        repo_days = {(row["repository_full_name"], _utc_day(row["committed_at"])) for row in rows}
+        repo_days.update((full_name, _utc_day(ts)) for (full_name, _), ts in previous.items())
+        await commit_activity_daily_ops.refresh_days(db, repo_days)
+
+        logger.info(f"Ingested {written} commits into {rows[0]['repository_full_name']}")
+        return written
+
+    async def _is_tracked(self, db: AsyncSession, payload: dict[str, Any]) -> bool:
+        """Whether the payload's repository is linked to any product."""
+        github_id = (payload.get("repository") or {}).get("id")
+        if not github_id:
+            return False
+        return await repository_ops.find_by_github_id(db, github_id) is not None
+
+
+commit_store = CommitStore()
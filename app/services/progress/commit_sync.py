@@ -0,0 +1,263 @@
+"""Incremental commit sync into the local commit store.
+
+Background worker that keeps repository_commits complete for every tracked
+repository, including those without webhooks. Each repository has a durable
+cursor (repository_sync_cursors); a run re-reads the branch history from
+commit_sync_overlap_hours before the cursor, stores the commits it does not
+have yet (with stats) and advances the cursor. A repository seen for the
+first time is backfilled for commit_sync_backfill_days.
+
+Readers use covered_repositories() to decide which repositories can be read
+from the store for a window and which still need GitHub.
+"""
+
+import asyncio
+import logging
+import time
+import uuid as uuid_pkg
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain import (
+    commit_stats_cache_ops,
+    repository_commit_ops,
+    repository_ops,
+    repository_sync_cursor_ops,
+)
+from app.models.repository import Repository
+from app.models.repository_sync_cursor import RepositorySyncCursor
+from app.services.github import GitHubReadOperations, background_github_work
+from app.services.progress.commit_store import commit_store, row_from_api_commit
+from app.services.progress.token_resolver import token_resolver
+
+logger = logging.getLogger(__name__)
+
+# Safety caps
+MAX_SYNC_COMMITS = 5000  # per repository per run
+REPO_TIMEOUT_SECONDS = 60
+TOTAL_JOB_TIMEOUT_SECONDS = 600  # 10 minutes max
+
+
+def _committed_at(commit: dict[str, Any]) -> datetime:
+    return datetime.fromisoformat(commit["commit"]["committer"]["date"].replace("Z", "+00:00"))
+
+
+@dataclass
+class CommitSyncReport:
+    """Summary of a commit sync run (for logging/monitoring)."""
+
+    repos_synced: int = 0
+    repos_unchanged: int = 0
+    repos_failed: int = 0
+    commits_ingested: int = 0
+    errors: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+
+async def covered_repositories(
+    db: AsyncSession,
+    repository_full_names: list[str],
+    since: datetime,
+) -> set[str]:
+    """
+    Get the repositories whose stored commits can be served for a window.
+
+    A repository is covered when its cursor reaches back to `since` and it
+    was synced within commit_sync_max_staleness_minutes.
+    """
+    synced_after = datetime.now(UTC) - timedelta(minutes=settings.commit_sync_max_staleness_minutes)
+    return await repository_sync_cursor_ops.get_covering(
+        db, repository_full_names, since, synced_after
+    )
+
+
+class CommitSyncWorker:
+    """Syncs new commits for all tracked repositories into the commit store."""
+
+    @background_github_work
+    async def run(self, db: AsyncSession) -> CommitSyncReport:
+        """
+        Main entry point for the scheduler.
+
+        1. Find all GitHub-linked repositories, grouped by organization
+        2. For each org, resolve a GitHub token
+        3. Sync each repository from its cursor, committing per repository
+        """
+        start = time.monotonic()
+        report = CommitSyncReport()
+
+        # A repository linked to several products is synced once, with the
+        # token of the first organization that has one
+        repos_by_org: dict[uuid_pkg.UUID, list[Repository]] = {}
+        seen: set[str] = set()
+        for repo, org_id in await repository_ops.get_github_repos_with_org(db):
+            if repo.full_name and repo.full_name not in seen:
+                seen.add(repo.full_name)
+                repos_by_org.setdefault(org_id, []).append(repo)
+
+        cursors = await repository_sync_cursor_ops.get_by_full_names(db, list(seen))
+        logger.info(f"[commit-sync] Syncing {len(seen)} repositories")
+
+        try:
+            async with asyncio.timeout(TOTAL_JOB_TIMEOUT_SECONDS):
+                for org_id, repos in repos_by_org.items():
+                    github_token = await token_resolver.resolve_for_org(db, org_id)
+                    if not github_token:
+                        logger.warning(
+                            f"[commit-sync] Org {org_id}: no GitHub token available, skipping"
+                        )
+                        continue
+
+                    github = GitHubReadOperations(github_token)
+                    for repo in repos:
+                        await self._sync_with_report(db, github, repo, cursors, report)
+        except TimeoutError:
+            error_msg = f"Total job timeout ({TOTAL_JOB_TIMEOUT_SECONDS}s) exceeded"
+            logger.error(f"[commit-sync] {error_msg}")
+            report.errors.append(error_msg)
+
+        report.duration_seconds = round(time.monotonic() - start, 2)
+
+        logger.info(
+            f"[commit-sync] Completed: {report.repos_synced} synced, "
+            f"{report.repos_unchanged} unchanged, "
+            f"{report.repos_failed} failed, "
+            f"{report.commits_ingested} commits "
+            f"({report.duration_seconds}s)"
+        )
+
+        return report
+
+    async def _sync_with_report(
+        self,
+        db: AsyncSession,
+        github: GitHubReadOperations,
+        repo: Repository,
+        cursors: dict[str, RepositorySyncCursor],
+        report: CommitSyncReport,
+    ) -> None:
+        """Sync one repository, committing on success and recording failures."""
+        try:
+            async with asyncio.timeout(REPO_TIMEOUT_SECONDS):
+                written = await self.sync_repository(
+                    db, github, repo, cursors.get(repo.full_name or "")
+                )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            error_msg = f"{repo.full_name}: {e}"
+            logger.warning(f"[commit-sync] {error_msg}")
+            report.errors.append(error_msg)
+            report.repos_failed += 1
+            return
+
+        if written:
+            report.repos_synced += 1
+            report.commits_ingested += written
+        else:
+            report.repos_unchanged += 1
+
+    async def sync_repository(
+        self,
+        db: AsyncSession,
+        github: GitHubReadOperations,
+        repo: Repository,
+        cursor: RepositorySyncCursor | None,
+    ) -> int:
+        """
+        Fetch commits the store is missing since the repository's cursor.
+
+        GitHub filters commits by committer date, so a commit dated before
+        the last sync but pushed after it would never match `since` again.
+        Each run therefore re-reads commit_sync_overlap_hours behind the
+        cursor and skips the SHAs already stored with stats; commits pushed
+        later than that window after their date are still missed.
+
+        Stats come from one GraphQL history walk; they are also written to
+        commit_stats_cache so stat lookups for these commits hit the cache.
+        Rows stored by webhooks without stats are re-ingested to fill them in.
+
+        Returns:
+            Number of new commits stored.
+        """
+        full_name = repo.full_name or ""
+        owner, name = full_name.split("/")
+        now = datetime.now(UTC)
+
+        if cursor and cursor.last_commit_at:
+            since = cursor.last_commit_at - timedelta(hours=settings.commit_sync_overlap_hours)
+        else:
+            since = now - timedelta(days=settings.commit_sync_backfill_days)
+        since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        fetched = [
+            c
+            async for c in github.iter_commits(
+                owner, name, repo.default_branch, since=since_str, max_commits=MAX_SYNC_COMMITS
+            )
+        ]
+
+        covered_since = since
+        capped = len(fetched) >= MAX_SYNC_COMMITS
+        if capped:
+            # The store is only complete back to the oldest commit read
+            covered_since = min(_committed_at(c) for c in fetched)
+
+        # Webhook rows are stored without stats, so a SHA only counts as
+        # stored once it has them; anything else is (re)ingested with stats
+        complete = await repository_commit_ops.get_with_stats(
+            db, [(full_name, c["sha"]) for c in fetched]
+        )
+        commits = [c for c in fetched if (full_name, c["sha"]) not in complete]
+
+        if not commits:
+            await repository_sync_cursor_ops.record_sync(
+                db, full_name, covered_since=covered_since, synced_at=now
+            )
+            return 0
+
+        try:
+            stats = await github.get_commit_history_stats(
+                owner,
+                name,
+                repo.default_branch,
+                since=since_str,
+                shas={c["sha"] for c in commits},
+            )
+        except Exception as e:
+            logger.warning(f"[commit-sync] Stats unavailable for {full_name}: {e}")
+            stats = {}
+
+        rows = [
+            row_from_api_commit(full_name, repo.github_id, c, stats.get(c["sha"])) for c in commits
+        ]
+        written = await commit_store.ingest(db, rows)
+
+        if stats:
+            await commit_stats_cache_ops.bulk_upsert(
+                db,
+                [
+                    {"full_name": full_name, "sha": sha, **sha_stats}
+                    for sha, sha_stats in stats.items()
+                ],
+            )
+
+        # New commits may be older than the cursor; it moves to the newest commit read
+        newest = max(fetched, key=_committed_at)
+        await repository_sync_cursor_ops.record_sync(
+            db,
+            full_name,
+            covered_since=covered_since,
+            synced_at=now,
+            last_commit_sha=newest["sha"],
+            last_commit_at=_committed_at(newest),
+            reset_coverage=capped,
+        )
+        return written
+
+
+commit_sync_worker = CommitSyncWorker()
@@ -1,21 +1,44 @@
 """Internal task scheduler using APScheduler — Community Edition.
 
-Runs scheduled jobs (like auto-progress) within the FastAPI process.
+Runs scheduled jobs (like auto-progress and commit sync) within the FastAPI process.
 Uses PostgreSQL advisory locks to prevent duplicate execution when
 multiple instances are running (e.g., Fly.io auto-scaling).
+
+Auto-progress and digest runs are sharded: organizations are split into
+`scheduler_shard_count` hash ranges, and every instance claims shards one at a
+time through per-shard advisory locks (see run_sharded), so the work spreads
+over all running instances.
+
+Every shard an instance processes is recorded in the job-run ledger
+(scheduler_job_runs) with its duration, items processed, errors and
+per-organization timings; GET /internal/job-runs reports p50/p95 durations
+over time.
 """
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
+import os
+import random
+import socket
+import time
+import uuid as uuid_pkg
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy import text
 
 from app.config import settings
 from app.core.database import async_session_maker
+from app.core.sharding import ShardSpec
+from app.domain.digest_delivery_operations import digest_delivery_ops
+from app.domain.scheduler_job_run_operations import scheduler_job_run_ops
+from app.domain.scheduler_shard_run_operations import scheduler_shard_run_ops
 
 logger = logging.getLogger(__name__)
 
@@ -23,22 +46,49 @@ logger = logging.getLogger(__name__)
 AUTO_PROGRESS_LOCK_ID = 891247
 WEEKLY_DIGEST_LOCK_ID = 891249
 DAILY_DIGEST_LOCK_ID = 891250
+COMMIT_SYNC_LOCK_ID = 891251
+
+# Seconds between attempts to claim shards held by other instances
+SHARD_RETRY_SECONDS = 15.0
+# Days completed shard records and digest deliveries are kept
+SHARD_RUN_RETENTION_DAYS = 7
+# Days job-run ledger entries are kept
+JOB_RUN_RETENTION_DAYS = 90
+# Errors stored per job-run ledger entry (the count is always complete)
+MAX_JOB_RUN_ERRORS = 20
+# Attempts to record a finished shard as completed, and seconds between them
+MARK_COMPLETED_ATTEMPTS = 3
+MARK_COMPLETED_RETRY_SECONDS = 2.0
+
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass
+class JobRunResult:
+    """What a shard's work returns: its report plus the ledger metrics."""
+
+    report: dict[str, Any]
+    items_processed: int = 0
+    errors: list[str] = field(default_factory=list)
+    error_count: int = 0
+    org_timings: dict[str, float] = field(default_factory=dict)
 
 
 @asynccontextmanager
-async def advisory_lock(lock_id: int) -> AsyncIterator[bool]:
+async def advisory_lock(lock_id: int, shard: int | None = None) -> AsyncIterator[bool]:
     """
     Acquire a PostgreSQL advisory lock for the duration of the context.
 
     Advisory locks are session-level and automatically released when the
     session ends. We use pg_try_advisory_lock() which returns immediately
     (non-blocking) — if the lock is held by another process, we skip.
+
+    With a shard, the two-key form (lock_id, shard) locks one shard of a job.
     """
+    key = "(:lock_id)" if shard is None else "(:lock_id, :shard)"
+    params = {"lock_id": lock_id, "shard": shard}
     async with async_session_maker() as session:
-        result = await session.execute(
-            text("SELECT pg_try_advisory_lock(:lock_id)"),
-            {"lock_id": lock_id},
-        )
+        result = await session.execute(text(f"SELECT pg_try_advisory_lock{key}"), params)
         acquired = result.scalar()
 
         if not acquired:
@@ -48,118 +98,341 @@ async def advisory_lock(lock_id: int) -> AsyncIterator[bool]:
         try:
             yield True
         finally:
-            await session.execute(
-                text("SELECT pg_advisory_unlock(:lock_id)"),
-                {"lock_id": lock_id},
-            )
+            await session.execute(text(f"SELECT pg_advisory_unlock{key}"), params)
             await session.commit()
 
 
-async def run_auto_progress() -> dict[str, Any] | None:
+async def _completed_shards(job_name: str, run_key: str, count: int) -> set[int]:
+    async with async_session_maker() as session:
+        return await scheduler_shard_run_ops.get_completed(session, job_name, run_key, count)
+
+
+async def _mark_shard_completed(job_name: str, run_key: str, shard: ShardSpec) -> None:
+    async with async_session_maker() as session:
+        await scheduler_shard_run_ops.mark_completed(
+            session, job_name, run_key, shard.index, shard.count, INSTANCE_ID
+        )
+        await session.commit()
+
+
+async def _mark_shard_completed_with_retry(job_name: str, run_key: str, shard: ShardSpec) -> None:
     """
-    Execute the auto-progress job with advisory lock protection.
+    Record a finished shard as completed, retrying transient failures.
 
-    Returns the report dict if executed, None if skipped (lock held by another instance).
+    Failures are logged, never raised: the shard's work is done, and an
+    exception here would stop the remaining shards of the run. If every
+    attempt fails, other instances may run the shard again.
     """
-    async with advisory_lock(AUTO_PROGRESS_LOCK_ID) as acquired:
-        if not acquired:
-            logger.info("[scheduler] Auto-progress: skipped (another instance is running)")
-            return None
+    for attempt in range(1, MARK_COMPLETED_ATTEMPTS + 1):
+        try:
+            await _mark_shard_completed(job_name, run_key, shard)
+            return
+        except Exception as e:
+            if attempt == MARK_COMPLETED_ATTEMPTS:
+                logger.error(
+                    f"[scheduler] {job_name}: failed to record shard {shard} as completed "
+                    f"({run_key}): {e}"
+                )
+                return
+            logger.warning(
+                f"[scheduler] {job_name}: recording shard {shard} as completed failed "
+                f"(attempt {attempt}/{MARK_COMPLETED_ATTEMPTS}): {e}"
+            )
+            await asyncio.sleep(MARK_COMPLETED_RETRY_SECONDS * attempt)
 
-        logger.info("[scheduler] Auto-progress: starting")
 
-        try:
-            from dataclasses import asdict
+async def _delete_old_shard_runs() -> None:
+    try:
+        async with async_session_maker() as session:
+            await scheduler_shard_run_ops.delete_before(
+                session, datetime.now(UTC) - timedelta(days=SHARD_RUN_RETENTION_DAYS)
+            )
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"[scheduler] Failed to delete old shard runs: {e}")
 
-            from app.core.database import async_session_maker
-            from app.services.progress.auto_generator import auto_progress_generator
 
-            async with async_session_maker() as db:
-                report = await auto_progress_generator.run_for_all_orgs(db)
-                await db.commit()
+async def _delete_old_digest_deliveries() -> None:
+    try:
+        async with async_session_maker() as session:
+            await digest_delivery_ops.delete_before(
+                session, datetime.now(UTC) - timedelta(days=SHARD_RUN_RETENTION_DAYS)
+            )
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"[scheduler] Failed to delete old digest deliveries: {e}")
 
-            logger.info(
-                f"[scheduler] Auto-progress: completed "
-                f"({report.products_regenerated} regenerated, "
-                f"{report.products_skipped} skipped, "
-                f"{report.duration_seconds}s)"
+
+async def _record_job_run(run: dict[str, Any]) -> None:
+    """Add a shard run to the ledger; failures are logged, never raised."""
+    try:
+        async with async_session_maker() as session:
+            await scheduler_job_run_ops.record(session, **run)
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"[scheduler] Failed to record {run['job_name']} run: {e}")
+
+
+async def _delete_old_job_runs() -> None:
+    try:
+        async with async_session_maker() as session:
+            await scheduler_job_run_ops.delete_before(
+                session, datetime.now(UTC) - timedelta(days=JOB_RUN_RETENTION_DAYS)
             )
-            return asdict(report)
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"[scheduler] Failed to delete old job runs: {e}")
+
+
+async def _run_shard(
+    job_name: str,
+    run_key: str,
+    shard: ShardSpec,
+    work: Callable[[ShardSpec], Awaitable[JobRunResult]],
+) -> JobRunResult:
+    """Run the work of one shard and record it in the job-run ledger."""
+    run: dict[str, Any] = {
+        "job_name": job_name,
+        "run_key": run_key,
+        "shard_index": shard.index,
+        "shard_count": shard.count,
+        "instance_id": INSTANCE_ID,
+        "started_at": datetime.now(UTC),
+        # Until the work returns (also covers cancellation)
+        "status": "failed",
+    }
+    start = time.monotonic()
+    try:
+        result = await work(shard)
+    except Exception as e:
+        run.update(error_count=1, errors=[str(e)[:500]])
+        raise
+    else:
+        run.update(
+            status="completed",
+            items_processed=result.items_processed,
+            error_count=result.error_count,
+            errors=result.errors[:MAX_JOB_RUN_ERRORS],
+            org_timings=result.org_timings,
+        )
+        return result
+    finally:
+        run["duration_seconds"] = round(time.monotonic() - start, 2)
+        run["finished_at"] = datetime.now(UTC)
+        await _record_job_run(run)
+
+
+async def run_sharded(
+    job_name: str,
+    lock_id: int,
+    run_key: str,
+    work: Callable[[ShardSpec], Awaitable[JobRunResult]],
+) -> dict[str, Any] | None:
+    """
+    Process the shards of one job run that no other instance has done.
+
+    Each instance walks the shards from a random starting point, taking a
+    per-shard advisory lock (lock_id, shard) and skipping shards that are
+    locked or recorded as completed for run_key. Until every shard is
+    completed (or scheduler_shard_wait_seconds pass), it retries the shards
+    held by others: the lock of an instance that dies is released with its
+    connection, so its shard is taken over. Every shard this instance runs,
+    completed or failed, is recorded in the job-run ledger.
+
+    A shard can still run twice (its instance dies after the work but before
+    it is recorded as completed), so the work must be safe to repeat for the
+    same run_key.
+
+    Returns the per-shard reports of this instance, or None if it processed
+    no shard.
+    """
+    count = max(settings.scheduler_shard_count, 1)
+    offset = random.randrange(count)
+    order = [(offset + i) % count for i in range(count)]
+    deadline = time.monotonic() + settings.scheduler_shard_wait_seconds
+    reports: dict[int, dict[str, Any]] = {}
+    failed: set[int] = set()
+
+    await _delete_old_shard_runs()
+    await _delete_old_job_runs()
+
+    while True:
+        completed = await _completed_shards(job_name, run_key, count)
+        remaining = [
+            i for i in order if i not in completed and i not in failed and i not in reports
+        ]
+        if not remaining:
+            break
+
+        for index in remaining:
+            async with advisory_lock(lock_id, index) as acquired:
+                if not acquired:
+                    continue
+                # Another instance may have finished the shard since the check
+                if index in await _completed_shards(job_name, run_key, count):
+                    continue
+
+                shard = ShardSpec(index=index, count=count)
+                logger.info(f"[scheduler] {job_name}: shard {shard} starting ({run_key})")
+                try:
+                    reports[index] = (await _run_shard(job_name, run_key, shard, work)).report
+                except Exception as e:
+                    logger.exception(f"[scheduler] {job_name}: shard {shard} failed: {e}")
+                    failed.add(index)
+                    continue
+                await _mark_shard_completed_with_retry(job_name, run_key, shard)
+
+        if time.monotonic() >= deadline:
+            logger.warning(
+                f"[scheduler] {job_name}: stopped waiting for shards held by other instances "
+                f"({run_key})"
+            )
+            break
+        await asyncio.sleep(SHARD_RETRY_SECONDS)
 
-        except Exception as e:
-            logger.exception(f"[scheduler] Auto-progress: failed with error: {e}")
-            return None
+    if not reports:
+        logger.info(f"[scheduler] {job_name}: no shards processed by this instance ({run_key})")
+        return None
+    return {"run_key": run_key, "shard_count": count, "shards": reports}
 
 
-async def run_weekly_digest() -> dict[str, Any] | None:
+def _run_key(period: str, manual: bool) -> str:
+    """Key of the current run: the UTC date ("day") or hour ("hour")."""
+    now = datetime.now(UTC)
+    key = f"{now:%Y-%m-%d}" if period == "day" else f"{now:%Y-%m-%dT%H}"
+    if manual:
+        # Manual triggers never count as the scheduled run (or skip it)
+        key = f"{key}:manual:{uuid_pkg.uuid4().hex[:8]}"
+    return key
+
+
+async def run_auto_progress(
+    resume_only: bool = False, manual: bool = False
+) -> dict[str, Any] | None:
     """
-    Execute the weekly digest email job with advisory lock protection.
+    Execute the auto-progress job, sharded by organization.
 
-    Returns the report dict if executed, None if skipped (lock held by another instance).
+    With resume_only, only continues a run started earlier today that was
+    stopped by the job timeout or had failed products (no-op otherwise).
+
+    Returns the shard reports if this instance processed any, None otherwise.
     """
-    async with advisory_lock(WEEKLY_DIGEST_LOCK_ID) as acquired:
-        if not acquired:
-            logger.info("[scheduler] Weekly-digest: skipped (another instance is running)")
-            return None
+    from dataclasses import asdict
 
-        logger.info("[scheduler] Weekly-digest: starting")
+    from app.services.progress.auto_generator import auto_progress_generator
 
-        try:
-            from dataclasses import asdict
+    async def work(shard: ShardSpec) -> JobRunResult:
+        async with async_session_maker() as db:
+            report = await auto_progress_generator.run_for_all_orgs(
+                db, resume_only=resume_only, shard=shard
+            )
+            await db.commit()
 
-            from app.core.database import async_session_maker
-            from app.services.email.weekly_digest import send_digests
+        logger.info(
+            f"[scheduler] Auto-progress: shard {shard} completed "
+            f"({report.products_regenerated} regenerated, "
+            f"{report.products_skipped} skipped, "
+            f"{report.products_already_done} already done, "
+            f"{report.duration_seconds}s)"
+        )
+        return JobRunResult(
+            report=asdict(report),
+            items_processed=(
+                report.products_regenerated + report.products_skipped + report.products_failed
+            ),
+            errors=report.errors,
+            error_count=len(report.errors),
+            org_timings=report.org_timings,
+        )
 
-            async with async_session_maker() as db:
-                report = await send_digests(db, frequency="weekly")
-                await db.commit()
+    job_name = "auto_progress_resume" if resume_only else "auto_progress"
+    run_key = _run_key("hour" if resume_only else "day", manual)
+    return await run_sharded(job_name, AUTO_PROGRESS_LOCK_ID, run_key, work)
 
-            logger.info(
-                f"[scheduler] Weekly-digest: completed "
-                f"({report.users_emailed} emailed, "
-                f"{report.emails_sent} emails sent, "
-                f"{report.duration_seconds}s)"
-            )
-            return asdict(report)
 
-        except Exception as e:
-            logger.exception(f"[scheduler] Weekly-digest: failed with error: {e}")
-            return None
+async def _run_digest(frequency: str, lock_id: int, manual: bool) -> dict[str, Any] | None:
+    """Execute a digest email job (hourly, per-user timezone), sharded by organization."""
+    from dataclasses import asdict
+
+    from app.services.email.weekly_digest import send_digests
+
+    label = f"{frequency.capitalize()}-digest"
+    run_key = _run_key("hour", manual)
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        async with async_session_maker() as db:
+            # The run_key makes a repeated shard skip recipients already sent to
+            report = await send_digests(db, frequency=frequency, shard=shard, run_key=run_key)
+            await db.commit()
 
+        logger.info(
+            f"[scheduler] {label}: shard {shard} completed "
+            f"({report.users_emailed} emailed, "
+            f"{report.emails_sent} emails sent, "
+            f"{report.duration_seconds}s)"
+        )
+        # Digests are built in bulk across orgs, so there are no per-org timings
+        return JobRunResult(
+            report=asdict(report),
+            items_processed=report.emails_sent,
+            error_count=report.errors,
+        )
+
+    await _delete_old_digest_deliveries()
+    return await run_sharded(f"{frequency}_digest", lock_id, run_key, work)
+
+
+async def run_weekly_digest(manual: bool = False) -> dict[str, Any] | None:
+    """
+    Execute the weekly digest email job, sharded by organization.
+
+    Returns the shard reports if this instance processed any, None otherwise.
+    """
+    return await _run_digest("weekly", WEEKLY_DIGEST_LOCK_ID, manual)
+
+
+async def run_daily_digest(manual: bool = False) -> dict[str, Any] | None:
+    """
+    Execute the daily digest email job, sharded by organization.
 
-async def run_daily_digest() -> dict[str, Any] | None:
+    Returns the shard reports if this instance processed any, None otherwise.
     """
-    Execute the daily digest email job with advisory lock protection.
+    return await _run_digest("daily", DAILY_DIGEST_LOCK_ID, manual)
+
+
+async def run_commit_sync() -> dict[str, Any] | None:
+    """
+    Execute the incremental commit sync job with advisory lock protection.
 
     Returns the report dict if executed, None if skipped (lock held by another instance).
     """
-    async with advisory_lock(DAILY_DIGEST_LOCK_ID) as acquired:
+    async with advisory_lock(COMMIT_SYNC_LOCK_ID) as acquired:
         if not acquired:
-            logger.info("[scheduler] Daily-digest: skipped (another instance is running)")
+            logger.info("[scheduler] Commit-sync: skipped (another instance is running)")
             return None
 
-        logger.info("[scheduler] Daily-digest: starting")
+        logger.info("[scheduler] Commit-sync: starting")
 
         try:
             from dataclasses import asdict
 
             from app.core.database import async_session_maker
-            from app.services.email.weekly_digest import send_digests
+            from app.services.progress.commit_sync import commit_sync_worker
 
             async with async_session_maker() as db:
-                report = await send_digests(db, frequency="daily")
+                report = await commit_sync_worker.run(db)
                 await db.commit()
 
             logger.info(
-                f"[scheduler] Daily-digest: completed "
-                f"({report.users_emailed} emailed, "
-                f"{report.emails_sent} emails sent, "
+                f"[scheduler] Commit-sync: completed "
+                f"({report.repos_synced} synced, "
+                f"{report.commits_ingested} commits, "
                 f"{report.duration_seconds}s)"
             )
             return asdict(report)
 
         except Exception as e:
-            logger.exception(f"[scheduler] Daily-digest: failed with error: {e}")
+            logger.exception(f"[scheduler] Commit-sync: failed with error: {e}")
             return None
 
 
@@ -186,6 +459,17 @@ class Scheduler:
             replace_existing=True,
         )
 
+        # Auto-progress resume: hourly, continues a daily run cut short by its timeout
+        # and retries its failed products
+        self._scheduler.add_job(
+            run_auto_progress,
+            trigger=CronTrigger(minute=30),
+            id="auto_progress_resume",
+            name="Auto-Progress Resume",
+            kwargs={"resume_only": True},
+            replace_existing=True,
+        )
+
         # Weekly digest: hourly check (per-user timezone filtering happens in the service)
         self._scheduler.add_job(
             run_weekly_digest,
@@ -204,11 +488,21 @@ class Scheduler:
             replace_existing=True,
         )
 
+        # Commit sync: incremental, every few minutes
+        self._scheduler.add_job(
+            run_commit_sync,
+            trigger=IntervalTrigger(minutes=settings.commit_sync_interval_minutes),
+            id="commit_sync",
+            name="Incremental Commit Sync",
+            replace_existing=True,
+        )
+
         self._scheduler.start()
         logger.info(
             f"[scheduler] Started with auto-progress at "
             f"{settings.auto_progress_hour:02d}:00 UTC, "
-            f"digest emails hourly (per-user timezone)"
+            f"digest emails hourly (per-user timezone), "
+            f"commit sync every {settings.commit_sync_interval_minutes} min"
         )
 
     def stop(self) -> None:
@@ -224,11 +518,15 @@ class Scheduler:
         Returns the job result or None if job not found.
         """
         if job_id == "auto_progress":
-            return await run_auto_progress()
+            return await run_auto_progress(manual=True)
+        if job_id == "auto_progress_resume":
+            return await run_auto_progress(resume_only=True, manual=True)
         if job_id == "weekly_digest":
-            return await run_weekly_digest()
+            return await run_weekly_digest(manual=True)
         if job_id == "daily_digest":
-            return await run_daily_digest()
+            return await run_daily_digest(manual=True)
+        if job_id == "commit_sync":
+            return await run_commit_sync()
         return None
 
 
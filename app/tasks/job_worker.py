@@ -0,0 +1,56 @@
+"""Standalone background job worker.
+
+Runs queued jobs (docs generation, analysis, custom docs, team summaries)
+outside the API process:
+
+    python -m app.tasks.job_worker
+
+Run as many as needed; per-job-type concurrency limits hold across all of
+them. Set JOB_WORKER_IN_API=false on the API to run jobs only here.
+"""
+
+import asyncio
+import importlib
+import logging
+import signal
+
+from app.main import setup_logging
+from app.services.github import close_github_client
+from app.services.jobs import JobWorker
+
+logger = logging.getLogger(__name__)
+
+# Modules that register job handlers
+JOB_MODULES = (
+    "app.api.v1.documents.custom",
+    "app.api.v1.organizations.team_summaries",
+    "app.api.v1.products.docs_generation",
+    "app.services.analysis",
+)
+
+
+def load_job_handlers() -> None:
+    """Import every module that registers a job handler."""
+    for module in JOB_MODULES:
+        importlib.import_module(module)
+
+
+async def main() -> None:
+    setup_logging()
+    load_job_handlers()
+
+    worker = JobWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.request_stop)
+
+    try:
+        await worker.run()
+    finally:
+        await worker.stop()
+        await close_github_client()
+        logger.info("Job worker shut down")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""Benchmark commit_stats_cache bulk lookups against batch size.
+
+Compares the unnest() join used by CommitStatsCacheOperations with the
+previous OR-of-ANDs query (one `full_name = ? AND sha = ?` clause per
+commit) on a real database.
+
+Usage:
+    cd backend && python -m scripts.benchmark_commit_stats_lookup
+    cd backend && python -m scripts.benchmark_commit_stats_lookup --rows 50000 --repeat 7
+
+Synthetic cache rows are inserted inside a transaction that is rolled back
+at the end, so nothing is left behind. Half of each batch hits seeded rows
+and half misses, like a timeline with partially cached stats.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+BATCH_SIZES = [10, 100, 500, 1000, 2000, 5000]
+REPOSITORIES = 25
+
+
+def _sha(i: int) -> str:
+    return hashlib.sha1(str(i).encode(), usedforsecurity=False).hexdigest()
+
+
+def _key(i: int) -> tuple[str, str]:
+    return (f"benchmark-org/repo-{i % REPOSITORIES}", _sha(i))
+
+
+async def _seed(db: AsyncSession, rows: int) -> None:
+    from app.domain.commit_stats_cache_operations import commit_stats_cache_ops
+
+    for start in range(0, rows, 1000):
+        await commit_stats_cache_ops.bulk_upsert(
+            db,
+            [
+                {
+                    "full_name": _key(i)[0],
+                    "sha": _key(i)[1],
+                    "additions": i % 100,
+                    "deletions": i % 10,
+                    "files_changed": i % 5,
+                }
+                for i in range(start, min(start + 1000, rows))
+            ],
+        )
+
+
+async def _or_of_ands(db: AsyncSession, lookups: list[tuple[str, str]]) -> int:
+    """The previous lookup: one AND clause per commit, ORed together."""
+    from app.models.commit_stats_cache import CommitStatsCache
+
+    conditions = [
+        and_(
+            CommitStatsCache.repository_full_name == full_name,  # type: ignore[arg-type]
+            CommitStatsCache.commit_sha == sha,  # type: ignore[arg-type]
+        )
+        for full_name, sha in lookups
+    ]
+    result = await db.execute(select(CommitStatsCache).where(or_(*conditions)))
+    return len(result.scalars().all())
+
+
+async def _unnest_join(db: AsyncSession, lookups: list[tuple[str, str]]) -> int:
+    from app.domain.commit_stats_cache_operations import commit_stats_cache_ops
+
+    return len(await commit_stats_cache_ops.get_bulk_by_repo_shas(db, lookups))
+
+
+Lookup = Callable[[AsyncSession, list[tuple[str, str]]], Awaitable[int]]
+
+
+async def _time(
+    db: AsyncSession, lookup: Lookup, lookups: list[tuple[str, str]], repeat: int
+) -> float:
+    """Median wall time in milliseconds over `repeat` runs, after one warm-up."""
+    await lookup(db, lookups)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await lookup(db, lookups)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def run_benchmark(rows: int, repeat: int) -> None:
+    from app.config.settings import settings
+
+    engine = create_async_engine(settings.database_url_direct, echo=False)
+    try:
+        async with AsyncSession(engine) as db:
+            await _seed(db, rows)
+
+            print(f"{rows} seeded rows, median of {repeat} runs")
+            print(f"{'batch':>7} {'or-of-ands ms':>14} {'unnest ms':>10} {'speedup':>8}")
+            for size in BATCH_SIZES:
+                # Half hits from the seeded range, half misses beyond it
+                lookups = [_key(i * 2) for i in range(size // 2)]
+                lookups += [_key(rows + i) for i in range(size - len(lookups))]
+
+                legacy = await _time(db, _or_of_ands, lookups, repeat)
+                current = await _time(db, _unnest_join, lookups, repeat)
+                print(f"{size:>7} {legacy:>14.1f} {current:>10.1f} {legacy / current:>7.1f}x")
+
+            await db.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=20000, help="Cache rows to seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per batch size")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.repeat))
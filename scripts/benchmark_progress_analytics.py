@@ -0,0 +1,250 @@
+"""Benchmark columnar Progress analytics against the per-event loops.
+
+Compares the EventColumns implementations of the daily rollup, contributor
+stats, activity heatmap and day-of-week pattern with the TimelineEvent loops
+they replaced, on synthetic commits spread over a period. Each pair is checked to return
+the same result before it is timed.
+
+Usage:
+    cd backend && python -m scripts.benchmark_progress_analytics
+    cd backend && python -m scripts.benchmark_progress_analytics --events 20000 --repeat 7
+
+No database or network access is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.api.v1.progress.contributors import (
+    _compute_contributors,
+    _compute_day_of_week,
+    _compute_heatmap,
+)
+from app.api.v1.progress.event_columns import EventColumns
+from app.api.v1.progress.types import (
+    ContributorDetail,
+    DailyAuthorActivity,
+    DayOfWeekEntry,
+    HeatmapRow,
+)
+from app.api.v1.progress.utils import generate_daily_activity, get_period_days
+from app.services.github.timeline_types import TimelineEvent
+
+REPOSITORIES = 40
+AUTHORS = 300
+REPOSITORIES_PER_AUTHOR = 3
+
+
+def _events(count: int, period: str, seed: int = 1) -> list[TimelineEvent]:
+    """Synthetic commits with stats, uniformly spread over the period.
+
+    Commits are newest first, like the commit list from GitHub, and each
+    author commits to a few repositories of their own.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    seconds = get_period_days(period) * 86400
+    home = [
+        [rng.randrange(REPOSITORIES) for _ in range(REPOSITORIES_PER_AUTHOR)]
+        for _ in range(AUTHORS)
+    ]
+    ages = sorted(rng.randrange(seconds) for _ in range(count))
+    events = []
+    for i, age in enumerate(ages):
+        author = rng.randrange(AUTHORS)
+        repo = rng.choice(home[author])
+        sha = f"{i:040x}"
+        events.append(
+            TimelineEvent(
+                id=f"commit:{sha}",
+                event_type="commit",
+                timestamp=(now - timedelta(seconds=age)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                repository_id=str(repo),
+                repository_name=f"repo-{repo}",
+                repository_full_name=f"benchmark-org/repo-{repo}",
+                commit_sha=sha,
+                commit_message="feat: change",
+                commit_author=f"dev-{author}",
+                commit_author_avatar=f"https://avatars/{author}",
+                commit_url=f"https://github.com/benchmark-org/repo-{repo}/commit/{sha}",
+                additions=rng.randrange(200),
+                deletions=rng.randrange(50),
+                files_changed=rng.randrange(10),
+            )
+        )
+    return events
+
+
+# The per-event implementations, as they were before EventColumns
+
+
+def _loop_rollup(events: list[TimelineEvent]) -> list[DailyAuthorActivity]:
+    groups: dict[tuple[str, str, str], DailyAuthorActivity] = {}
+    for event in sorted(events, key=lambda e: e.timestamp, reverse=True):
+        date = event.timestamp.split("T")[0]
+        key = (event.repository_full_name, event.commit_author, date)
+        row = groups.get(key)
+        if row is None:
+            row = groups[key] = DailyAuthorActivity(
+                repository_name=event.repository_name,
+                repository_full_name=event.repository_full_name,
+                author=event.commit_author,
+                avatar_url=event.commit_author_avatar,
+                date=date,
+                commits=0,
+                additions=0,
+                deletions=0,
+                files_changed=0,
+            )
+        row.commits += 1
+        row.additions += event.additions or 0
+        row.deletions += event.deletions or 0
+        row.files_changed += event.files_changed or 0
+    return sorted(groups.values(), key=lambda r: r.date)
+
+
+def _loop_contributors(events: list[TimelineEvent], period: str) -> list[dict[str, Any]]:
+    events.sort(key=lambda e: e.timestamp, reverse=True)
+    author_events: dict[str, list[TimelineEvent]] = defaultdict(list)
+    for event in events:
+        author_events[event.commit_author].append(event)
+    contributors: list[ContributorDetail] = []
+    for author, author_commits in author_events.items():
+        repo_counts: dict[str, int] = defaultdict(int)
+        for event in author_commits:
+            repo_counts[event.repository_name] += 1
+        daily_counts: dict[str, int] = defaultdict(int)
+        for event in author_commits:
+            daily_counts[event.timestamp.split("T")[0]] += 1
+        contributors.append(
+            ContributorDetail(
+                author=author,
+                avatar_url=author_commits[0].commit_author_avatar,
+                commits=len(author_commits),
+                additions=sum(e.additions or 0 for e in author_commits),
+                deletions=sum(e.deletions or 0 for e in author_commits),
+                files_changed=sum(e.files_changed or 0 for e in author_commits),
+                last_active=author_commits[0].timestamp,
+                focus_areas=[
+                    repo
+                    for repo, _ in sorted(repo_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+                ],
+                daily_activity=generate_daily_activity(daily_counts, period),
+                recent_commits=[
+                    {
+                        "sha": e.commit_sha[:7],
+                        "message": e.commit_message,
+                        "repository": e.repository_name,
+                        "timestamp": e.timestamp,
+                        "url": e.commit_url,
+                    }
+                    for e in author_commits[:3]
+                ],
+            )
+        )
+    contributors.sort(key=lambda c: c.commits, reverse=True)
+    return [asdict(c) for c in contributors]
+
+
+def _loop_heatmap(events: list[TimelineEvent], period: str) -> dict[str, Any]:
+    period_days = get_period_days(period)
+    today = datetime.now(UTC).date()
+    dates = [
+        (today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(period_days - 1, -1, -1)
+    ]
+    author_date_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    author_totals: dict[str, int] = defaultdict(int)
+    author_avatars: dict[str, str | None] = {}
+    for event in events:
+        author = event.commit_author
+        date = event.timestamp.split("T")[0]
+        author_date_counts[author][date] += 1
+        author_totals[author] += 1
+        if author not in author_avatars:
+            author_avatars[author] = event.commit_author_avatar
+    sorted_authors = sorted(author_totals.keys(), key=lambda a: author_totals[a], reverse=True)
+    rows = [
+        asdict(
+            HeatmapRow(
+                author=author,
+                avatar_url=author_avatars.get(author),
+                cells=[{"date": d, "commits": author_date_counts[author].get(d, 0)} for d in dates],
+            )
+        )
+        for author in sorted_authors
+    ]
+    return {"rows": rows, "dates": dates}
+
+
+def _loop_day_of_week(events: list[TimelineEvent]) -> list[DayOfWeekEntry]:
+    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    counts: dict[int, int] = defaultdict(int)
+    for event in events:
+        dt = datetime.fromisoformat(event.timestamp.replace("Z", "+00:00"))
+        counts[dt.weekday()] += 1
+    return [DayOfWeekEntry(day=day_names[i], commits=counts.get(i, 0)) for i in range(7)]
+
+
+def _time(run: Callable[[], object], repeat: int) -> float:
+    """Median wall time in milliseconds over `repeat` runs, after one warm-up."""
+    run()
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run_benchmark(count: int, period: str, repeat: int) -> None:
+    events = _events(count, period)
+    columns = EventColumns.from_events(events)
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        ("rollup", lambda: _loop_rollup(events), lambda: columns.rollup()),
+        (
+            "contributors",
+            lambda: _loop_contributors(events, period),
+            lambda: _compute_contributors(events, columns, period, "commits"),
+        ),
+        (
+            "heatmap",
+            lambda: _loop_heatmap(events, period),
+            lambda: _compute_heatmap(columns, period),
+        ),
+        (
+            "day of week",
+            lambda: _loop_day_of_week(events),
+            lambda: _compute_day_of_week(columns),
+        ),
+    ]
+
+    print(f"{count} events over {period}, median of {repeat} runs")
+    build = _time(lambda: EventColumns.from_events(events), repeat)
+    print(f"{'build columns':>14} {'':>10} {build:>10.1f}")
+    print(f"{'':>14} {'loop ms':>10} {'column ms':>10} {'speedup':>8}")
+    for name, legacy, columnar in cases:
+        assert legacy() == columnar(), f"{name}: results differ"
+        loop_ms = _time(legacy, repeat)
+        column_ms = _time(columnar, repeat)
+        print(f"{name:>14} {loop_ms:>10.1f} {column_ms:>10.1f} {loop_ms / column_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--events", type=int, default=100_000, help="Synthetic commits")
+    parser.add_argument("--period", default="90d", help="Period the commits span")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    args = parser.parse_args()
+    run_benchmark(args.events, args.period, args.repeat)
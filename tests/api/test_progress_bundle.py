@@ -0,0 +1,134 @@
+"""Tests for the Progress bundle endpoint.
+
+The commit window and GitHub-backed enrichment are mocked; tests cover
+section selection and that commits are enriched once per bundle.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.progress.bundle import BUNDLE_SECTIONS, get_progress_bundle, parse_sections
+from app.api.v1.progress.commit_fetcher import FetchResult
+from app.services.github.timeline_types import TimelineEvent
+
+MODULE = "app.api.v1.progress.bundle"
+REPO = SimpleNamespace(id=uuid.uuid4(), full_name="org/a")
+
+
+def _event(days_ago: int) -> TimelineEvent:
+    timestamp = (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    sha = uuid.uuid4().hex
+    return TimelineEvent(
+        id=f"commit:{sha}",
+        event_type="commit",
+        timestamp=timestamp,
+        repository_id=str(REPO.id),
+        repository_name="a",
+        repository_full_name=REPO.full_name,
+        commit_sha=sha,
+        commit_message="feat: change",
+        commit_author="Alice",
+        commit_author_avatar=None,
+        commit_url=f"https://github.com/org/a/commit/{sha}",
+        additions=3,
+        deletions=1,
+        files_changed=1,
+    )
+
+
+@pytest.fixture
+def deps():
+    """Window with commits 2 days (current) and 10 days (comparison) old."""
+    result = FetchResult(events=[_event(2), _event(10)], repos=[REPO], github=MagicMock())
+    with (
+        patch(f"{MODULE}.product_commit_window") as window,
+        patch(f"{MODULE}.fetch_commit_stats", new=AsyncMock(side_effect=lambda *a: a[3])) as stats,
+        patch(
+            f"{MODULE}._fetch_file_activity",
+            new=AsyncMock(
+                return_value={"a/app.py": {"commits": 1, "additions": 3, "deletions": 1}}
+            ),
+        ) as files,
+    ):
+        window.fetch = AsyncMock(return_value=result)
+        yield SimpleNamespace(window=window, stats=stats, files=files)
+
+
+async def _bundle(sections: str | None = None, **kwargs):
+    params = {"period": "7d", "repo_ids": None, "sort_by": "commits", "rank_by": "commits"}
+    params.update(kwargs)
+    # Call the endpoint itself, past the response cache
+    return await get_progress_bundle.__wrapped__(
+        product_id=uuid.uuid4(),
+        sections=sections,
+        _access_ctx=MagicMock(),
+        current_user=SimpleNamespace(id=uuid.uuid4()),
+        db=AsyncMock(),
+        **params,
+    )
+
+
+class TestParseSections:
+    """Tests for parse_sections."""
+
+    def test_defaults_to_all_sections(self):
+        assert parse_sections(None) == list(BUNDLE_SECTIONS)
+
+    def test_keeps_canonical_order_and_drops_duplicates(self):
+        assert parse_sections("velocity, summary,velocity") == ["summary", "velocity"]
+
+    def test_unknown_section_is_rejected(self):
+        with pytest.raises(HTTPException) as exc:
+            parse_sections("summary,heatmap")
+        assert exc.value.status_code == 400
+        assert "heatmap" in exc.value.detail
+
+
+class TestGetProgressBundle:
+    """Tests for get_progress_bundle."""
+
+    @pytest.mark.asyncio
+    async def test_all_sections_share_one_fetch_and_enrichment(self, deps):
+        bundle = await _bundle()
+
+        assert list(bundle) == list(BUNDLE_SECTIONS)
+        deps.window.fetch.assert_awaited_once()
+        assert deps.window.fetch.call_args.kwargs["extended"] is True
+        deps.stats.assert_awaited_once()
+        # Velocity needs the comparison period, so both commits are enriched
+        assert len(deps.stats.call_args.args[3]) == 2
+        assert bundle["summary"]["total_commits"] == 1
+        assert bundle["leaderboard"]["total_contributors"] == 1
+        assert bundle["active_code"]["total_files_changed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_only_requested_sections_are_computed(self, deps):
+        bundle = await _bundle("contributors")
+
+        assert list(bundle) == ["contributors"]
+        assert len(deps.stats.call_args.args[3]) == 1
+        deps.files.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_active_code_alone_skips_stats(self, deps):
+        await _bundle("active_code")
+
+        deps.stats.assert_not_called()
+        deps.files.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_commits_returns_empty_sections(self, deps):
+        deps.window.fetch.return_value = None
+
+        bundle = await _bundle("summary,leaderboard")
+
+        assert bundle["summary"]["total_commits"] == 0
+        assert bundle["leaderboard"]["entries"] == []
+        deps.stats.assert_not_called()
@@ -0,0 +1,183 @@
+"""Tests for the shared product commit window used by Progress endpoints.
+
+fetch_product_commits and sessions are mocked; tests cover window reuse,
+slicing, single-flight loading and loading in a session of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.v1.progress.commit_fetcher import FetchResult
+from app.api.v1.progress.commit_window import ProductCommitWindow
+from app.services.github.timeline_types import TimelineEvent
+
+REPO_A = SimpleNamespace(id=uuid.uuid4(), full_name="org/a")
+REPO_B = SimpleNamespace(id=uuid.uuid4(), full_name="org/b")
+
+
+def _event(repo: SimpleNamespace, days_ago: int) -> TimelineEvent:
+    timestamp = (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    sha = uuid.uuid4().hex
+    return TimelineEvent(
+        id=f"commit:{sha}",
+        event_type="commit",
+        timestamp=timestamp,
+        repository_id=str(repo.id),
+        repository_name=repo.full_name.split("/")[1],
+        repository_full_name=repo.full_name,
+        commit_sha=sha,
+        commit_message="change",
+        commit_author="Alice",
+        commit_author_avatar=None,
+        commit_url=f"https://github.com/{repo.full_name}/commit/{sha}",
+    )
+
+
+MODULE = "app.api.v1.progress.commit_window"
+
+
+class FakeSession:
+    """Session opened by a window load; records its own lifecycle."""
+
+    opened: list[FakeSession] = []
+
+    def __init__(self) -> None:
+        self.committed = False
+        self.closed = False
+        FakeSession.opened.append(self)
+
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.closed = True
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fetch():
+    """Patched fetch_product_commits returning commits 2, 10 and 20 days old."""
+    result = FetchResult(
+        events=[_event(REPO_A, 2), _event(REPO_B, 10), _event(REPO_A, 20)],
+        repos=[REPO_A, REPO_B],
+        github=MagicMock(),
+    )
+    FakeSession.opened = []
+    with (
+        patch(f"{MODULE}.fetch_product_commits", new=AsyncMock(return_value=result)) as mocked,
+        patch(f"{MODULE}.async_session_maker", new=FakeSession),
+        patch(f"{MODULE}.set_rls_user_context", new=AsyncMock()) as rls,
+    ):
+        mocked.rls = rls
+        yield mocked
+
+
+class TestProductCommitWindow:
+    """Tests for ProductCommitWindow.fetch."""
+
+    def setup_method(self):
+        self.window = ProductCommitWindow()
+        self.user = SimpleNamespace(id=uuid.uuid4())
+        self.product_id = uuid.uuid4()
+
+    async def _fetch(self, period: str, **kwargs):
+        return await self.window.fetch(self.product_id, self.user, period, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_period_and_comparison_share_one_fetch(self, fetch):
+        current = await self._fetch("7d")
+        extended = await self._fetch("7d", extended=True)
+
+        fetch.assert_awaited_once()
+        assert fetch.call_args.kwargs["period"] == "14d"
+        assert len(current.events) == 1
+        assert len(extended.events) == 2
+
+    @pytest.mark.asyncio
+    async def test_shorter_period_is_served_from_wider_window(self, fetch):
+        await self._fetch("14d")
+        result = await self._fetch("7d")
+
+        fetch.assert_awaited_once()
+        assert len(result.events) == 1
+
+    @pytest.mark.asyncio
+    async def test_wider_period_fetches_again(self, fetch):
+        await self._fetch("7d")
+        await self._fetch("30d")
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_repo_filter_slices_events_and_repos(self, fetch):
+        result = await self._fetch("30d", repo_ids=str(REPO_B.id))
+
+        assert [e.repository_full_name for e in result.events] == ["org/b"]
+        assert result.repos == [REPO_B]
+
+    @pytest.mark.asyncio
+    async def test_empty_slice_returns_none(self, fetch):
+        assert await self._fetch("24h") is None
+
+    @pytest.mark.asyncio
+    async def test_windows_are_per_user(self, fetch):
+        await self._fetch("7d")
+        await self.window.fetch(self.product_id, SimpleNamespace(id=uuid.uuid4()), "7d")
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_load(self, fetch):
+        results = await asyncio.gather(*[self._fetch("7d") for _ in range(5)])
+
+        fetch.assert_awaited_once()
+        assert all(r is not None for r in results)
+
+    @pytest.mark.asyncio
+    async def test_load_runs_in_its_own_rls_session(self, fetch):
+        await self._fetch("7d")
+
+        [session] = FakeSession.opened
+        assert fetch.call_args.kwargs["db"] is session
+        fetch.rls.assert_awaited_once_with(session, self.user.id)
+        assert session.committed and session.closed
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_window_when_initiating_request_is_cancelled(self, fetch):
+        started = asyncio.Event()
+        finish = asyncio.Event()
+        result = fetch.return_value
+
+        async def slow_fetch(**_kwargs):
+            started.set()
+            await finish.wait()
+            return result
+
+        fetch.side_effect = slow_fetch
+
+        first = asyncio.ensure_future(self._fetch("7d"))
+        await started.wait()
+        second = asyncio.ensure_future(self._fetch("7d"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        finish.set()
+
+        assert (await second) is not None
+        fetch.assert_awaited_once()
+        [session] = FakeSession.opened
+        assert session.committed
@@ -0,0 +1,153 @@
+"""Tests for concurrent dashboard commit fetching.
+
+Domain operations and GitHub are mocked; tests cover bulk loading, store
+reads, token resolution per organization and the fetch deadline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.v1.progress.dashboard_fetcher import fetch_dashboard_commits
+
+MODULE = "app.api.v1.progress.dashboard_fetcher"
+SINCE = datetime.now(UTC) - timedelta(days=7)
+
+
+def _commit(sha: str, days_ago: int) -> dict:
+    date = (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {
+        "sha": sha,
+        "commit": {"author": {"name": "Alice"}, "committer": {"date": date}, "message": "m"},
+        "author": None,
+    }
+
+
+def _product(org_id: uuid.UUID | None = None) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), organization_id=org_id or uuid.uuid4(), name="P")
+
+
+def _repo(full_name: str) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), full_name=full_name, default_branch="main")
+
+
+@pytest.fixture
+def deps():
+    with (
+        patch(f"{MODULE}.repository_ops") as repo_ops,
+        patch(f"{MODULE}.preferences_ops") as prefs_ops,
+        patch(f"{MODULE}.resolve_github_token", new=AsyncMock(return_value="org-token")) as resolve,
+        patch(f"{MODULE}.covered_repositories", new=AsyncMock(return_value=set())) as covered,
+        patch(f"{MODULE}.repository_commit_ops") as commit_ops,
+        patch(f"{MODULE}.GitHubReadOperations") as github_cls,
+    ):
+        prefs_ops.get_by_user_id = AsyncMock(return_value=None)
+        commit_ops.get_in_window = AsyncMock(return_value=[])
+        github = MagicMock()
+        github.get_commits_for_timeline = AsyncMock(return_value=([_commit("a", 1)], None))
+        github.get_merged_pulls_count = AsyncMock(return_value=2)
+        github_cls.return_value = github
+        yield SimpleNamespace(
+            repo_ops=repo_ops,
+            resolve=resolve,
+            covered=covered,
+            commit_ops=commit_ops,
+            github=github,
+        )
+
+
+class TestFetchDashboardCommits:
+    """Tests for fetch_dashboard_commits."""
+
+    @pytest.mark.asyncio
+    async def test_loads_repos_once_and_resolves_token_per_org(self, deps):
+        org_id = uuid.uuid4()
+        products = [_product(org_id), _product(org_id)]
+        deps.repo_ops.get_github_repos_by_products = AsyncMock(
+            return_value={products[0].id: [_repo("org/a")], products[1].id: [_repo("org/b")]}
+        )
+
+        results = await fetch_dashboard_commits(
+            AsyncMock(), SimpleNamespace(id=uuid.uuid4()), products, SINCE, include_merged_prs=True
+        )
+
+        deps.repo_ops.get_github_repos_by_products.assert_awaited_once()
+        deps.resolve.assert_awaited_once()
+        assert [len(r.commits) for r in results] == [1, 1]
+        assert [r.merged_prs for r in results] == [2, 2]
+        assert all(r.complete for r in results)
+
+    @pytest.mark.asyncio
+    async def test_covered_repos_are_read_from_store(self, deps):
+        product = _product()
+        deps.repo_ops.get_github_repos_by_products = AsyncMock(
+            return_value={product.id: [_repo("org/a")]}
+        )
+        deps.covered.return_value = {"org/a"}
+        row = SimpleNamespace(repository_full_name="org/a")
+
+        with patch(f"{MODULE}.api_commit_from_row", return_value=_commit("s", 2)):
+            deps.commit_ops.get_in_window = AsyncMock(return_value=[row])
+            results = await fetch_dashboard_commits(
+                AsyncMock(), SimpleNamespace(id=uuid.uuid4()), [product], SINCE
+            )
+
+        deps.github.get_commits_for_timeline.assert_not_called()
+        assert [c["sha"] for c in results[0].commits] == ["s"]
+
+    @pytest.mark.asyncio
+    async def test_commits_before_period_are_dropped(self, deps):
+        product = _product()
+        deps.repo_ops.get_github_repos_by_products = AsyncMock(
+            return_value={product.id: [_repo("org/a")]}
+        )
+        deps.github.get_commits_for_timeline = AsyncMock(
+            return_value=([_commit("new", 1), _commit("old", 30)], None)
+        )
+
+        results = await fetch_dashboard_commits(
+            AsyncMock(), SimpleNamespace(id=uuid.uuid4()), [product], SINCE
+        )
+
+        assert [c["sha"] for c in results[0].commits] == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_partial_results(self, deps):
+        fast, slow = _product(), _product()
+        deps.repo_ops.get_github_repos_by_products = AsyncMock(
+            return_value={fast.id: [_repo("org/fast")], slow.id: [_repo("org/slow")]}
+        )
+
+        async def get_commits(owner, name, *_args, **_kwargs):
+            if name == "slow":
+                await asyncio.sleep(10)
+            return [_commit(name, 1)], None
+
+        deps.github.get_commits_for_timeline = AsyncMock(side_effect=get_commits)
+
+        results = await fetch_dashboard_commits(
+            AsyncMock(), SimpleNamespace(id=uuid.uuid4()), [fast, slow], SINCE, deadline=0.1
+        )
+
+        assert results[0].complete and len(results[0].commits) == 1
+        assert not results[1].complete and results[1].commits == []
+
+    @pytest.mark.asyncio
+    async def test_products_without_token_are_skipped(self, deps):
+        product = _product()
+        deps.repo_ops.get_github_repos_by_products = AsyncMock(
+            return_value={product.id: [_repo("org/a")]}
+        )
+        deps.resolve.return_value = None
+
+        results = await fetch_dashboard_commits(
+            AsyncMock(), SimpleNamespace(id=uuid.uuid4()), [product], SINCE
+        )
+
+        assert results == []
@@ -0,0 +1,158 @@
+"""Tests for columnar Progress analytics.
+
+Covers the group-bys on EventColumns and the endpoint helpers built on them
+(daily rollup, contributors, heatmap, day-of-week pattern).
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+
+from app.api.v1.progress.activity_fetcher import rollup_events
+from app.api.v1.progress.contributors import _contributors_response
+from app.api.v1.progress.event_columns import EventColumns
+from app.services.github.timeline_types import TimelineEvent
+
+TODAY = datetime.now(UTC).date()
+
+
+def _event(
+    sha: str,
+    timestamp: str,
+    author: str = "Alice",
+    repo: str = "a",
+    avatar: str | None = None,
+    additions: int | None = 1,
+) -> TimelineEvent:
+    return TimelineEvent(
+        id=f"commit:{sha}",
+        event_type="commit",
+        timestamp=timestamp,
+        repository_id=repo,
+        repository_name=repo,
+        repository_full_name=f"org/{repo}",
+        commit_sha=sha,
+        commit_message="change",
+        commit_author=author,
+        commit_author_avatar=avatar,
+        commit_url=f"https://github.com/org/{repo}/commit/{sha}",
+        additions=additions,
+        deletions=0,
+        files_changed=1,
+    )
+
+
+def _at(days_ago: int, hour: int = 12) -> str:
+    return f"{(TODAY - timedelta(days=days_ago)).isoformat()}T{hour:02d}:00:00Z"
+
+
+class TestEventColumns:
+    """Tests for EventColumns group-bys."""
+
+    def test_encodes_in_order_of_first_appearance(self):
+        columns = EventColumns.from_events(
+            [
+                _event("1", _at(0), author="Bob", repo="b", avatar="bob-new"),
+                _event("2", _at(1), author="Alice"),
+                _event("3", _at(2), author="Bob", avatar="bob-old"),
+            ]
+        )
+
+        assert columns.authors == ["Bob", "Alice"]
+        assert columns.author_avatars == ["bob-new", None]
+        assert columns.repo_full_names == ["org/b", "org/a"]
+        assert columns.author_totals() == [2, 1]
+
+    def test_missing_stats_count_as_zero(self):
+        columns = EventColumns.from_events(
+            [_event("1", _at(0), additions=None), _event("2", _at(0), additions=5)]
+        )
+
+        assert columns.author_totals(columns.additions) == [5]
+
+    def test_weekday_commits(self):
+        # 2026-03-02 was a Monday, 2026-03-08 a Sunday
+        columns = EventColumns.from_events(
+            [
+                _event("1", "2026-03-02T00:00:00Z"),
+                _event("2", "2026-03-02T23:59:59Z"),
+                _event("3", "2026-03-08T10:00:00Z"),
+            ]
+        )
+
+        assert columns.weekday_commits() == [2, 0, 0, 0, 0, 0, 1]
+
+    def test_author_day_commits_ignores_days_outside_range(self):
+        columns = EventColumns.from_events(
+            [_event("1", "2026-03-01T10:00:00Z"), _event("2", "2026-03-05T10:00:00Z")]
+        )
+
+        assert columns.author_day_commits(date(2026, 3, 2), 4) == [[0, 0, 0, 1]]
+
+    def test_top_repositories_break_ties_by_first_seen(self):
+        columns = EventColumns.from_events(
+            [
+                _event("1", _at(0), repo="c"),
+                _event("2", _at(1), repo="b"),
+                _event("3", _at(2), repo="a"),
+                _event("4", _at(3), repo="a"),
+            ]
+        )
+
+        assert columns.author_top_repositories(2) == [["a", "c"]]
+
+    def test_empty(self):
+        columns = EventColumns.from_events([])
+
+        assert len(columns) == 0
+        assert columns.rollup() == []
+        assert columns.author_events() == []
+        assert columns.weekday_commits() == [0] * 7
+
+
+class TestRollupEvents:
+    """Tests for rollup_events."""
+
+    def test_groups_by_repo_author_and_day(self):
+        rows = rollup_events(
+            [
+                _event("1", "2026-03-02T09:00:00Z", avatar="old", additions=2),
+                _event("2", "2026-03-02T18:00:00Z", avatar="new", additions=3),
+                _event("3", "2026-03-02T12:00:00Z", repo="b"),
+                _event("4", "2026-03-01T12:00:00Z", author="Bob"),
+            ]
+        )
+
+        assert [(r.date, r.repository_full_name, r.author) for r in rows] == [
+            ("2026-03-01", "org/a", "Bob"),
+            ("2026-03-02", "org/a", "Alice"),
+            ("2026-03-02", "org/b", "Alice"),
+        ]
+        assert rows[1].commits == 2
+        assert rows[1].additions == 5
+        assert rows[1].avatar_url == "new"
+
+
+class TestContributorsResponse:
+    """Tests for _contributors_response."""
+
+    def test_contributors_heatmap_and_day_of_week(self):
+        events = [
+            _event("1", _at(3), author="Bob"),
+            _event("2", _at(0), author="Alice", additions=10),
+            _event("3", _at(1), author="Bob"),
+        ]
+
+        response = _contributors_response(events, "7d", "commits")
+
+        bob, alice = response["contributors"]
+        assert (bob["author"], bob["commits"]) == ("Bob", 2)
+        assert bob["last_active"] == _at(1)
+        assert [c["sha"] for c in bob["recent_commits"]] == ["3", "1"]
+        assert [d["commits"] for d in bob["daily_activity"]] == [0, 0, 0, 1, 0, 1, 0]
+        assert alice["additions"] == 10
+
+        heatmap = response["heatmap"]
+        assert heatmap["dates"][-1] == TODAY.isoformat()
+        assert [row["author"] for row in heatmap["rows"]] == ["Bob", "Alice"]
+        assert sum(d["commits"] for d in response["day_of_week_pattern"]) == 3
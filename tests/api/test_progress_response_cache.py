@@ -0,0 +1,241 @@
+"""Tests for the Progress response cache.
+
+The endpoint, the latest-commit check and sessions are mocked; tests cover
+fresh hits, misses computed in a session of their own, stale-while-revalidate
+refreshes, invalidation when the latest commit moves, and the counters.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.api.v1.progress.response_cache import CachedResponse, ProgressResponseCache
+
+MODULE = "app.api.v1.progress.response_cache"
+OLD_COMMIT = datetime.now(UTC) - timedelta(days=1)
+PRODUCT_ID = uuid.uuid4()
+USER_ID = uuid.uuid4()
+
+
+class FakeSession:
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+@pytest.fixture
+def latest():
+    with (
+        patch(f"{MODULE}.latest_commit_date", new=AsyncMock(return_value=OLD_COMMIT)) as check,
+        patch(f"{MODULE}.async_session_maker", new=FakeSession),
+        patch(f"{MODULE}.set_rls_user_context", new=AsyncMock()),
+        patch(f"{MODULE}.product_commit_window") as window,
+    ):
+        yield SimpleNamespace(check=check, window=window)
+
+
+def _endpoint(cache: ProgressResponseCache):
+    calls: list[dict] = []
+
+    @cache.cached("summary", ("period",))
+    async def endpoint(product_id, period, current_user, db):
+        calls.append({"period": period, "db": db})
+        return {"period": period, "call": len(calls)}
+
+    return endpoint, calls
+
+
+def _kwargs(**overrides):
+    kwargs = {
+        "product_id": PRODUCT_ID,
+        "period": "7d",
+        "current_user": SimpleNamespace(id=USER_ID),
+        "db": "request-db",
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+async def _settle(cache: ProgressResponseCache) -> None:
+    """Wait for background refreshes to finish."""
+    await asyncio.gather(*cache._refreshing.values())
+
+
+class TestProgressResponseCache:
+    """Tests for ProgressResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_fresh_hit(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=60)
+        endpoint, calls = _endpoint(cache)
+
+        first = await endpoint(**_kwargs())
+        second = await endpoint(**_kwargs())
+
+        assert first == second == {"period": "7d", "call": 1}
+        assert len(calls) == 1
+        assert cache.stats.misses == 1 and cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_is_computed_in_its_own_session(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=60)
+        endpoint, calls = _endpoint(cache)
+
+        await endpoint(**_kwargs())
+
+        assert isinstance(calls[0]["db"], FakeSession)
+        assert isinstance(latest.check.call_args.args[0], FakeSession)
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_payload_when_initiating_request_is_cancelled(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=60)
+        started = asyncio.Event()
+        finish = asyncio.Event()
+        calls: list[dict] = []
+
+        @cache.cached("summary", ("period",))
+        async def endpoint(product_id, period, current_user, db):
+            calls.append({"db": db})
+            started.set()
+            await finish.wait()
+            return {"period": period}
+
+        first = asyncio.ensure_future(endpoint(**_kwargs()))
+        await started.wait()
+        second = asyncio.ensure_future(endpoint(**_kwargs(db="other-request-db")))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        finish.set()
+
+        assert await second == {"period": "7d"}
+        assert len(calls) == 1
+        assert isinstance(calls[0]["db"], FakeSession)
+        assert cache.get_stats()["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_key_includes_query_parameters_and_user(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=60)
+        endpoint, calls = _endpoint(cache)
+
+        await endpoint(**_kwargs())
+        await endpoint(**_kwargs(period="30d"))
+        await endpoint(**_kwargs(current_user=SimpleNamespace(id=uuid.uuid4())))
+
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_and_revalidated_without_recomputing(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=0)
+        endpoint, calls = _endpoint(cache)
+        await endpoint(**_kwargs())
+
+        stale = await endpoint(**_kwargs())
+        await _settle(cache)
+
+        assert stale == {"period": "7d", "call": 1}
+        assert len(calls) == 1
+        assert cache.stats.stale_hits == 1 and cache.stats.revalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_new_commit_recomputes_in_background_and_invalidates_product(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=0)
+        endpoint, calls = _endpoint(cache)
+        await endpoint(**_kwargs())
+        await endpoint(**_kwargs(period="30d"))
+
+        latest.check.return_value = datetime.now(UTC) - timedelta(hours=1)
+        stale = await endpoint(**_kwargs())
+        await _settle(cache)
+        refreshed = await endpoint(**_kwargs())
+
+        assert stale["call"] == 1
+        assert refreshed["call"] == 3
+        assert isinstance(calls[-1]["db"], FakeSession)
+        latest.window.invalidate.assert_called_with(PRODUCT_ID)
+        # The 30d entry was computed before the commit and has been dropped
+        assert cache.get_stats()["size"] == 1
+        assert cache.stats.refreshes == 1 and cache.stats.invalidations == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs_once_per_key(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=0)
+        endpoint, _ = _endpoint(cache)
+        await endpoint(**_kwargs())
+
+        for _ in range(5):
+            await endpoint(**_kwargs())
+        await _settle(cache)
+
+        assert cache.stats.stale_hits == 5
+        assert cache.stats.revalidations == 1
+        assert latest.check.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_latest_commit_check_serves_uncached(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=60)
+        endpoint, calls = _endpoint(cache)
+        latest.check.side_effect = RuntimeError("GitHub unavailable")
+
+        await endpoint(**_kwargs())
+        await endpoint(**_kwargs())
+
+        assert len(calls) == 2
+        assert cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_error_keeps_stale_entry(self, latest):
+        cache = ProgressResponseCache(fresh_seconds=0)
+        endpoint, _ = _endpoint(cache)
+        await endpoint(**_kwargs())
+
+        latest.check.side_effect = RuntimeError("GitHub unavailable")
+        await endpoint(**_kwargs())
+        await _settle(cache)
+        latest.check.side_effect = None
+
+        assert (await endpoint(**_kwargs()))["call"] == 1
+        assert cache.stats.refresh_errors == 1
+
+    def test_stats_report_hit_ratio(self):
+        cache = ProgressResponseCache()
+        cache.stats.hits, cache.stats.stale_hits, cache.stats.misses = 6, 2, 2
+
+        stats = cache.get_stats()
+
+        assert stats["hit_ratio"] == pytest.approx(0.8)
+        assert stats["size"] == 0
+
+
+class TestCachedResponse:
+    """Tests for CachedResponse.settled."""
+
+    def test_recent_commit_is_not_settled(self):
+        now = datetime.now(UTC)
+        entry = CachedResponse(
+            payload={}, latest_commit=now - timedelta(seconds=5), computed_at=now, checked_at=0
+        )
+
+        assert not entry.settled()
+
+    def test_old_commit_is_settled(self):
+        now = datetime.now(UTC)
+        entry = CachedResponse(payload={}, latest_commit=OLD_COMMIT, computed_at=now, checked_at=0)
+
+        assert entry.settled()
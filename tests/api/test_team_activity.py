@@ -5,13 +5,25 @@ GET /api/v1/organizations/{org_id}/team-activity
 
 from __future__ import annotations
 
+import asyncio
+import json
 import uuid
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import AsyncClient
 
-from app.api.v1.organizations.team_activity import _compute_streak, _merge_daily_activity
+from app.api.v1.organizations.team_activity import (
+    _compute_streak,
+    _merge_daily_activity,
+    _TeamActivityAccumulator,
+    stream_team_activity,
+)
+from app.services.github.timeline_types import TimelineEvent
+
+TEAM_ACTIVITY = "app.api.v1.organizations.team_activity"
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Unit tests for helper functions
@@ -85,6 +97,157 @@ class TestMergeDailyActivity:
         assert all(d["commits"] == 0 for d in merged)
 
 
+def _event(sha: str, author: str, repo: str = "api", days_ago: int = 0) -> TimelineEvent:
+    timestamp = (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return TimelineEvent(
+        id=f"commit:{sha}",
+        event_type="commit",
+        timestamp=timestamp,
+        repository_id=repo,
+        repository_name=repo,
+        repository_full_name=f"org/{repo}",
+        commit_sha=sha,
+        commit_message="change",
+        commit_author=author,
+        commit_author_avatar=None,
+        commit_url=f"https://github.com/org/{repo}/commit/{sha}",
+        additions=2,
+        deletions=1,
+        files_changed=1,
+    )
+
+
+def _member_map() -> dict:
+    return {
+        "u1": {
+            "user_id": "u1",
+            "display_name": "Alice",
+            "email": "alice@example.com",
+            "avatar_url": None,
+            "role": "admin",
+            "joined_at": None,
+            "github_username": "alice",
+            "has_signed_in": True,
+        },
+        "u2": {
+            "user_id": "u2",
+            "display_name": None,
+            "email": "bob@example.com",
+            "avatar_url": None,
+            "role": "member",
+            "joined_at": None,
+            "github_username": None,
+            "has_signed_in": False,
+        },
+    }
+
+
+class TestTeamActivityAccumulator:
+    """Tests for _TeamActivityAccumulator."""
+
+    def test_merges_contributor_across_products(self):
+        acc = _TeamActivityAccumulator(7, _member_map())
+
+        assert acc.add_product("p1", "One", [_event("a", "Alice")]) == ["Alice"]
+        acc.add_product("p2", "Two", [_event("b", "Alice", days_ago=1), _event("c", "ext")])
+
+        alice = acc.contributor("Alice")
+        assert alice.user_id == "u1"
+        assert alice.stats.commits == 2
+        assert [p.product_id for p in alice.stats.products] == ["p1", "p2"]
+        assert alice.stats.streak_days == 2
+
+    def test_response_adds_idle_members_and_aggregate(self):
+        acc = _TeamActivityAccumulator(7, _member_map())
+        acc.add_product("p1", "One", [_event("a", "ALICE"), _event("b", "ext")])
+        acc.add_product("p2", "Two", [])
+
+        response = acc.response("commits")
+
+        by_status = {m.display_name: m.status for m in response.members}
+        assert by_status == {"Alice": "active", "ext": "active", "bob@example.com": "pending"}
+        assert response.aggregate.total_commits == 2
+        assert response.aggregate.products_touched == 1
+
+
+class _FakeSession:
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+class TestStreamTeamActivity:
+    """Tests for the streaming team activity endpoint."""
+
+    async def _stream(self, stream_format: str, fetch) -> list[str]:
+        products = [SimpleNamespace(id=uuid.uuid4(), name=n) for n in ("Slow", "Fast")]
+        with (
+            patch(f"{TEAM_ACTIVITY}.require_org_access", new=AsyncMock()),
+            patch(f"{TEAM_ACTIVITY}.product_ops") as product_ops,
+            patch(f"{TEAM_ACTIVITY}.org_member_ops") as member_ops,
+            patch(f"{TEAM_ACTIVITY}._fetch_product_events", new=fetch),
+            patch("app.core.fanout.async_session_maker", new=lambda: _FakeSession()),
+            patch("app.core.fanout.set_rls_user_context", new=AsyncMock()),
+        ):
+            product_ops.get_by_organization = AsyncMock(return_value=products)
+            member_ops.get_by_org = AsyncMock(return_value=[])
+            response = await stream_team_activity(
+                org_id=uuid.uuid4(),
+                days=7,
+                sort="commits",
+                stream_format=stream_format,
+                user=SimpleNamespace(id=uuid.uuid4()),
+                db=AsyncMock(),
+            )
+            return [chunk async for chunk in response.body_iterator]
+
+    @staticmethod
+    async def _fetch(_db, _user, product, _period):
+        if product.name == "Slow":
+            await asyncio.sleep(0.05)
+        return [_event(product.name, product.name)]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_emits_products_as_they_complete_then_summary(self):
+        chunks = await self._stream("ndjson", self._fetch)
+
+        messages = [json.loads(c) for c in chunks]
+        assert [m["type"] for m in messages] == ["product", "product", "summary"]
+        assert [m["product_name"] for m in messages[:2]] == ["Fast", "Slow"]
+        assert messages[0]["members"][0]["display_name"] == "Fast"
+        assert messages[1]["completed"] == messages[1]["total"] == 2
+        assert messages[2]["aggregate"]["total_commits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_product_is_sent_without_members(self):
+        async def fetch(_db, _user, product, _period):
+            if product.name == "Slow":
+                raise RuntimeError("GitHub unavailable")
+            return [_event(product.name, product.name)]
+
+        chunks = await self._stream("ndjson", fetch)
+
+        messages = [json.loads(c) for c in chunks]
+        failed = next(m for m in messages if m.get("product_name") == "Slow")
+        assert failed["members"] == []
+        assert messages[-1]["aggregate"]["total_commits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sse_wraps_messages_in_data_events(self):
+        chunks = await self._stream("sse", self._fetch)
+
+        assert all(c.startswith("data: ") and c.endswith("\n\n") for c in chunks)
+        assert json.loads(chunks[-1][len("data: ") :])["type"] == "summary"
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # API endpoint tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,189 @@
+"""Tests for concurrent database work with one session per task.
+
+Sessions are fakes recording what each task did; tests cover session
+isolation, RLS context, the concurrency bound, per-task deadlines and
+early closing of the as-completed iterator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.fanout import fan_out, fan_out_as_completed
+
+MODULE = "app.core.fanout"
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.closed = True
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+
+@pytest.fixture
+def sessions():
+    created: list[FakeSession] = []
+
+    def session_maker() -> FakeSession:
+        created.append(FakeSession())
+        return created[-1]
+
+    with patch(f"{MODULE}.set_rls_user_context", new=AsyncMock()) as set_rls:
+        yield created, session_maker, set_rls
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+
+    @pytest.mark.asyncio
+    async def test_each_task_gets_its_own_session_with_rls(self, sessions):
+        created, session_maker, set_rls = sessions
+        user_id = uuid.uuid4()
+        seen: list[FakeSession] = []
+
+        async def work(session, item):
+            seen.append(session)
+            return item * 2
+
+        results = await fan_out([1, 2, 3], work, user_id=user_id, session_maker=session_maker)
+
+        assert [r.value for r in results] == [2, 4, 6]
+        assert all(r.ok for r in results)
+        assert len(set(map(id, seen))) == 3
+        assert all(s.committed and s.closed for s in created)
+        assert [call.args for call in set_rls.await_args_list] == [(s, user_id) for s in seen]
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, sessions):
+        _, session_maker, _ = sessions
+
+        async def work(_session, delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        results = await fan_out(
+            [0.03, 0.0, 0.01], work, user_id=uuid.uuid4(), session_maker=session_maker
+        )
+
+        assert [r.item for r in results] == [r.value for r in results] == [0.03, 0.0, 0.01]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, sessions):
+        _, session_maker, _ = sessions
+        running = 0
+        peak = 0
+
+        async def work(_session, _item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await fan_out(
+            range(10), work, user_id=uuid.uuid4(), max_concurrency=3, session_maker=session_maker
+        )
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_and_rolled_back(self, sessions):
+        created, session_maker, _ = sessions
+
+        async def work(_session, item):
+            if item == "bad":
+                raise ValueError("boom")
+            return item
+
+        good, bad = await fan_out(
+            ["good", "bad"], work, user_id=uuid.uuid4(), session_maker=session_maker
+        )
+
+        assert good.ok and good.value == "good"
+        assert not bad.ok and isinstance(bad.error, ValueError) and bad.value is None
+        assert [s.committed for s in created] == [True, False]
+        assert created[1].rolled_back
+
+    @pytest.mark.asyncio
+    async def test_timeout_applies_per_task(self, sessions):
+        _, session_maker, _ = sessions
+
+        async def work(_session, delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        fast, slow = await fan_out(
+            [0.0, 10.0], work, user_id=uuid.uuid4(), timeout=0.05, session_maker=session_maker
+        )
+
+        assert fast.ok
+        assert slow.timed_out and not slow.ok and slow.error is None
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_pooled_sessions(self, sessions):
+        created, session_maker, _ = sessions
+
+        async def work(session, _item):
+            return session
+
+        with patch(f"{MODULE}.async_session_maker", new=session_maker):
+            (result,) = await fan_out(["x"], work, user_id=uuid.uuid4())
+
+        assert result.value is created[0]
+
+
+class TestFanOutAsCompleted:
+    """Tests for fan_out_as_completed."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self, sessions):
+        _, session_maker, _ = sessions
+
+        async def work(_session, delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        results = [
+            r.item
+            async for r in fan_out_as_completed(
+                [0.03, 0.0, 0.01], work, user_id=uuid.uuid4(), session_maker=session_maker
+            )
+        ]
+
+        assert results == [0.0, 0.01, 0.03]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_outstanding_tasks(self, sessions):
+        _, session_maker, _ = sessions
+        finished: list[float] = []
+
+        async def work(_session, delay):
+            await asyncio.sleep(delay)
+            finished.append(delay)
+
+        outcomes = fan_out_as_completed(
+            [0.0, 0.05], work, user_id=uuid.uuid4(), session_maker=session_maker
+        )
+        first = await anext(outcomes)
+        await outcomes.aclose()
+        await asyncio.sleep(0.1)
+
+        assert first.item == 0.0
+        assert finished == [0.0]
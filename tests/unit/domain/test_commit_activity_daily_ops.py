@@ -0,0 +1,130 @@
+"""Unit tests for CommitActivityDailyOperations — all DB calls mocked."""
+
+import asyncio
+from collections import defaultdict
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.dialects.postgresql.dml import OnConflictDoUpdate
+
+from app.domain.commit_activity_daily_operations import CommitActivityDailyOperations
+
+
+class TestRefreshDays:
+    """Tests for rebuilding rollup days."""
+
+    def setup_method(self):
+        self.ops = CommitActivityDailyOperations()
+        self.db = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_no_days_is_a_noop(self):
+        await self.ops.refresh_days(self.db, set())
+
+        self.db.execute.assert_not_awaited()
+        self.db.flush.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deletes_then_rebuilds_each_chunk(self):
+        repo_days = {("org/repo", date(2026, 3, d)) for d in range(1, 6)}
+
+        with patch("app.domain.commit_activity_daily_operations.REFRESH_CHUNK_SIZE", 2):
+            await self.ops.refresh_days(self.db, repo_days)
+
+        # Repository lock + 3 chunks × (DELETE + INSERT ... SELECT)
+        assert self.db.execute.await_count == 7
+        statements = [call.args[0] for call in self.db.execute.call_args_list]
+        assert "pg_advisory_xact_lock" in str(statements[0])
+        assert [s.is_delete for s in statements[1::2]] == [True, True, True]
+        assert [s.is_insert for s in statements[2::2]] == [True, True, True]
+        self.db.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_insert_upserts_on_the_unique_index(self):
+        await self.ops.refresh_days(self.db, {("org/repo", date(2026, 3, 1))})
+
+        insert_stmt = self.db.execute.call_args_list[-1].args[0]
+        on_conflict = insert_stmt._post_values_clause
+        assert isinstance(on_conflict, OnConflictDoUpdate)
+        assert on_conflict.inferred_target_elements == [
+            "repository_full_name",
+            "day",
+            "author_name",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_locks_repositories_in_sorted_order(self):
+        await self.ops.refresh_days(
+            self.db, {("org/b", date(2026, 3, 1)), ("org/a", date(2026, 3, 1))}
+        )
+
+        keys = [
+            call.args[1]["key"] for call in self.db.execute.call_args_list if len(call.args) > 1
+        ]
+        assert keys == ["commit_activity_daily:org/a", "commit_activity_daily:org/b"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_of_a_repo_day_are_serialized(self):
+        """A second writer waits for the first transaction before deleting."""
+        locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        log: list[tuple[str, str]] = []
+
+        class FakeTransaction:
+            """Emulates transaction-scoped advisory locks held until commit."""
+
+            def __init__(self, name: str) -> None:
+                self.name = name
+                self.held: list[asyncio.Lock] = []
+
+            async def execute(self, statement, params=None):
+                if params is not None:
+                    lock = locks[params["key"]]
+                    await lock.acquire()
+                    self.held.append(lock)
+                    log.append((self.name, "lock"))
+                else:
+                    log.append((self.name, "delete" if statement.is_delete else "insert"))
+                # Let the other writer run between statements
+                await asyncio.sleep(0)
+
+            async def flush(self) -> None:
+                pass
+
+            async def commit(self) -> None:
+                log.append((self.name, "commit"))
+                for lock in self.held:
+                    lock.release()
+
+        async def writer(name: str) -> None:
+            db = FakeTransaction(name)
+            await self.ops.refresh_days(db, {("org/repo", date(2026, 3, 1))})
+            await asyncio.sleep(0)
+            await db.commit()
+
+        await asyncio.gather(writer("push"), writer("sync"))
+
+        first, second = log[0][0], log[-1][0]
+        assert log == [
+            (first, "lock"),
+            (first, "delete"),
+            (first, "insert"),
+            (first, "commit"),
+            (second, "lock"),
+            (second, "delete"),
+            (second, "insert"),
+            (second, "commit"),
+        ]
+
+
+class TestGetInWindow:
+    """Tests for day-range reads."""
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_list_without_repositories(self):
+        db = AsyncMock()
+
+        result = await CommitActivityDailyOperations().get_in_window(db, [], date(2026, 3, 1))
+
+        assert result == []
+        db.execute.assert_not_awaited()
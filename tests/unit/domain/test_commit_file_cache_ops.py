@@ -0,0 +1,74 @@
+"""Unit tests for CommitFileCacheOperations — all DB calls mocked."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.domain.commit_file_cache_operations import CommitFileCacheOperations
+
+FILES = [{"filename": "app/main.py", "status": "modified", "additions": 3, "deletions": 1}]
+
+
+def _rows_result(rows: list[tuple]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestGetBulkByRepoShas:
+    """Tests for bulk cache lookups."""
+
+    def setup_method(self):
+        self.ops = CommitFileCacheOperations()
+        self.db = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_dict_for_empty_lookups(self):
+        result = await self.ops.get_bulk_by_repo_shas(self.db, [])
+        assert result == {}
+        self.db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_returns_file_lists_keyed_by_tuple(self):
+        self.db.execute = AsyncMock(return_value=_rows_result([("org/repo", "aaa111", FILES)]))
+
+        result = await self.ops.get_bulk_by_repo_shas(
+            self.db, [("org/repo", "aaa111"), ("org/repo", "missing")]
+        )
+
+        assert result == {("org/repo", "aaa111"): FILES}
+
+    @pytest.mark.asyncio
+    async def test_large_lookups_are_chunked_and_deduplicated(self):
+        self.db.execute = AsyncMock(return_value=_rows_result([]))
+        lookups = [("org/repo", f"sha{i}") for i in range(5)] * 2
+
+        with patch("app.domain.commit_file_cache_operations.CHUNK_SIZE", 2):
+            await self.ops.get_bulk_by_repo_shas(self.db, lookups)
+
+        assert self.db.execute.await_count == 3
+
+
+class TestBulkUpsert:
+    """Tests for bulk insert of file lists."""
+
+    def setup_method(self):
+        self.ops = CommitFileCacheOperations()
+        self.db = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_returns_zero_for_empty_entries(self):
+        result = await self.ops.bulk_upsert(self.db, {})
+        assert result == 0
+        self.db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_inserts_in_chunks_then_flushes(self):
+        entries = {("org/repo", f"sha{i}"): FILES for i in range(3)}
+
+        with patch("app.domain.commit_file_cache_operations.CHUNK_SIZE", 2):
+            result = await self.ops.bulk_upsert(self.db, entries)
+
+        assert result == 3
+        assert self.db.execute.await_count == 2
+        self.db.flush.assert_awaited_once()
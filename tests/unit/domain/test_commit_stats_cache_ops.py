@@ -1,6 +1,6 @@
 """Unit tests for CommitStatsCacheOperations — all DB calls mocked."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -46,6 +46,16 @@ class TestGetBulkByRepoShas:
         assert len(result) == 1
         assert ("org/repo2", "missing") not in result
 
+    @pytest.mark.asyncio
+    async def test_large_lookups_are_chunked_and_deduplicated(self):
+        self.db.execute = AsyncMock(return_value=mock_scalars_result([]))
+        lookups = [("org/repo", f"sha{i}") for i in range(5)] * 2
+
+        with patch("app.domain.commit_stats_cache_operations.LOOKUP_CHUNK_SIZE", 2):
+            await self.ops.get_bulk_by_repo_shas(self.db, lookups)
+
+        assert self.db.execute.await_count == 3
+
 
 class TestBulkUpsert:
     """Tests for bulk insert of commit stats."""
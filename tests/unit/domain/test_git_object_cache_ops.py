@@ -0,0 +1,89 @@
+"""Unit tests for GitObjectCacheOperations — all DB calls mocked."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.git_object_cache_operations import GitObjectCacheOperations
+
+
+def _rows_result(rows: list[SimpleNamespace]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestGetMany:
+    """Tests for bulk object lookups."""
+
+    def setup_method(self):
+        self.ops = GitObjectCacheOperations()
+        self.db = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_dict_for_empty_lookups(self):
+        result = await self.ops.get_many(self.db, "blob", [])
+        assert result == {}
+        self.db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_returns_hits_keyed_by_sha_and_touches_them(self):
+        self.db.execute = AsyncMock(
+            side_effect=[
+                _rows_result([SimpleNamespace(sha="aaa", content=b"a")]),
+                MagicMock(),
+            ]
+        )
+
+        result = await self.ops.get_many(self.db, "blob", ["aaa", "bbb"])
+
+        assert result == {"aaa": b"a"}
+        assert self.db.execute.await_count == 2
+        self.db.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_touch_when_nothing_found(self):
+        self.db.execute = AsyncMock(return_value=_rows_result([]))
+
+        result = await self.ops.get_many(self.db, "tree", ["aaa"])
+
+        assert result == {}
+        self.db.execute.assert_awaited_once()
+
+
+class TestBulkInsert:
+    """Tests for bulk insert of objects."""
+
+    def setup_method(self):
+        self.ops = GitObjectCacheOperations()
+        self.db = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_returns_zero_for_empty_dict(self):
+        result = await self.ops.bulk_insert(self.db, "blob", {})
+        assert result == 0
+        self.db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_returns_count_of_submitted_objects(self):
+        result = await self.ops.bulk_insert(self.db, "blob", {"aaa": b"a", "bbb": b"bb"})
+
+        assert result == 2
+        self.db.execute.assert_awaited_once()
+        self.db.flush.assert_awaited_once()
+
+
+class TestEvictToSize:
+    """Tests for LRU eviction."""
+
+    @pytest.mark.asyncio
+    async def test_returns_deleted_row_count(self):
+        ops = GitObjectCacheOperations()
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+
+        result = await ops.evict_to_size(db, 1024)
+
+        assert result == 3
+        db.flush.assert_awaited_once()
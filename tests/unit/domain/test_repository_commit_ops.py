@@ -0,0 +1,80 @@
+"""Unit tests for RepositoryCommitOperations — all DB calls mocked."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.repository_commit_operations import RepositoryCommitOperations
+
+
+def _row(sha: str, source: str = "push", **overrides: object) -> dict:
+    now = datetime.now(UTC)
+    row = {
+        "repository_full_name": "org/repo",
+        "github_repo_id": 1,
+        "commit_sha": sha,
+        "message": "msg",
+        "author_name": "Alice",
+        "author_email": None,
+        "author_login": None,
+        "author_avatar_url": None,
+        "html_url": "https://github.com/org/repo/commit/x",
+        "authored_at": now,
+        "committed_at": now,
+        "additions": None,
+        "deletions": None,
+        "files_changed": None,
+        "source": source,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestBulkUpsert:
+    """Tests for idempotent commit upserts."""
+
+    def setup_method(self):
+        self.ops = RepositoryCommitOperations()
+        self.db = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_returns_zero_for_empty_list(self):
+        result = await self.ops.bulk_upsert(self.db, [])
+        assert result == 0
+        self.db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_shas_keep_best_source(self):
+        rows = [_row("aaa", "push", message="exact"), _row("aaa", "pull_request", message="PR")]
+
+        result = await self.ops.bulk_upsert(self.db, rows)
+
+        assert result == 1
+        params = self.db.execute.call_args.args[0].compile().params
+        assert "exact" in params.values()
+        assert "PR" not in params.values()
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked(self):
+        rows = [_row(f"sha{i}") for i in range(5)]
+
+        with patch("app.domain.repository_commit_operations.UPSERT_CHUNK_SIZE", 2):
+            result = await self.ops.bulk_upsert(self.db, rows)
+
+        assert result == 5
+        assert self.db.execute.await_count == 3
+        self.db.flush.assert_awaited_once()
+
+
+class TestGetInWindow:
+    """Tests for time-window reads."""
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_list_without_repositories(self):
+        db = AsyncMock()
+
+        result = await RepositoryCommitOperations().get_in_window(db, [], datetime.now(UTC))
+
+        assert result == []
+        db.execute.assert_not_awaited()
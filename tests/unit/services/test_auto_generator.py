@@ -0,0 +1,351 @@
+"""Unit tests for the auto-progress worker pool.
+
+Domain operations, sessions and per-product processing are mocked; tests
+cover round-robin ordering across orgs, per-org concurrency, checkpointing,
+resuming a run cut short by the job timeout and the org-wide activity probe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.progress import auto_generator
+from app.services.progress.auto_generator import (
+    AutoProgressGenerator,
+    _interleave,
+    _OrgWork,
+)
+
+MODULE = "app.services.progress.auto_generator"
+
+
+class FakeSession:
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+def _org(name: str, product_count: int) -> tuple[SimpleNamespace, list[SimpleNamespace]]:
+    org = SimpleNamespace(id=uuid.uuid4(), name=name)
+    products = [SimpleNamespace(id=uuid.uuid4(), name=f"{name}-{i}") for i in range(product_count)]
+    return org, products
+
+
+@pytest.fixture
+def env():
+    """Patch domain operations; `env.orgs` lists (org, products) pairs.
+
+    `env.done` and `env.failed` hold product IDs checkpointed earlier today;
+    failed products have been attempted once unless `env.attempts` says otherwise.
+
+    The org-wide activity probe reports new activity for every product unless
+    `env.latest` maps a product ID to another date (or None); `env.summaries`
+    holds stored 7d summaries.
+    """
+    now = datetime.now(UTC)
+    state = SimpleNamespace(
+        orgs=[], done=set(), failed=set(), attempts={}, recorded=[], latest={}, summaries=[]
+    )
+
+    checkpoint_ops = MagicMock()
+    checkpoint_ops.get_outcomes = AsyncMock(
+        side_effect=lambda _db, _day: {
+            **dict.fromkeys(state.done, ("regenerated", 1)),
+            **{pid: ("failed", state.attempts.get(pid, 1)) for pid in state.failed},
+        }
+    )
+    checkpoint_ops.delete_before = AsyncMock(return_value=0)
+    checkpoint_ops.record = AsyncMock(
+        side_effect=lambda _db, _day, product_id, _org_id, outcome: state.recorded.append(
+            (product_id, outcome)
+        )
+    )
+
+    organization_ops = MagicMock()
+    organization_ops.get_orgs_with_auto_progress = AsyncMock(
+        side_effect=lambda _db: [org for org, _products in state.orgs]
+    )
+
+    product_ops = MagicMock()
+    product_ops.get_by_organization = AsyncMock(
+        side_effect=lambda _db, org_id: next(
+            products for org, products in state.orgs if org.id == org_id
+        )
+    )
+
+    repository_ops = MagicMock()
+    repository_ops.get_github_repos_by_product = AsyncMock(return_value=[MagicMock()])
+    repository_ops.get_github_repos_by_products = AsyncMock(
+        side_effect=lambda _db, product_ids: {pid: [MagicMock()] for pid in product_ids}
+    )
+
+    progress_summary_ops = MagicMock()
+    progress_summary_ops.get_by_products_period = AsyncMock(
+        side_effect=lambda _db, _ids, _period: state.summaries
+    )
+
+    checker = MagicMock()
+    checker.get_latest_commit_dates = AsyncMock(
+        side_effect=lambda repos_by_product, _github, _db: {
+            pid: state.latest.get(pid, now) for pid in repos_by_product
+        }
+    )
+
+    with (
+        patch("app.domain.auto_progress_checkpoint_ops", checkpoint_ops),
+        patch("app.domain.organization_ops", organization_ops),
+        patch("app.domain.product_ops", product_ops),
+        patch("app.domain.repository_ops", repository_ops),
+        patch("app.domain.progress_summary_ops", progress_summary_ops),
+        patch(f"{MODULE}.activity_checker", checker),
+        patch(f"{MODULE}.async_session_maker", new=FakeSession),
+        patch(f"{MODULE}.token_resolver") as resolver,
+    ):
+        resolver.resolve_for_org = AsyncMock(return_value="token")
+        state.checkpoint_ops = checkpoint_ops
+        state.checker = checker
+        yield state
+
+
+def _generator(process: AsyncMock | None = None) -> AutoProgressGenerator:
+    generator = AutoProgressGenerator()
+    generator._process_product = process or AsyncMock(return_value=True)  # type: ignore[method-assign]
+    return generator
+
+
+class TestInterleave:
+    """Tests for round-robin ordering across orgs."""
+
+    def test_products_alternate_between_orgs(self):
+        big = _OrgWork(org_id=uuid.uuid4(), github=MagicMock(), products=["a1", "a2", "a3"])
+        small = _OrgWork(org_id=uuid.uuid4(), github=MagicMock(), products=["b1"])
+
+        order = [product for _org, product in _interleave([big, small])]
+
+        assert order == ["a1", "b1", "a2", "a3"]
+
+
+class TestRunForAllOrgs:
+    """Tests for AutoProgressGenerator.run_for_all_orgs."""
+
+    @pytest.mark.asyncio
+    async def test_processes_and_checkpoints_every_product(self, env):
+        big_org, big = _org("big", 4)
+        small_org, small = _org("small", 1)
+        env.orgs = [(big_org, big), (small_org, small)]
+
+        report = await _generator().run_for_all_orgs(MagicMock(commit=AsyncMock()))
+
+        assert report.orgs_processed == 2
+        assert report.products_regenerated == 5
+        assert {product_id for product_id, _ in env.recorded} == {p.id for p in big + small}
+        env.checkpoint_ops.delete_before.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_small_org_is_not_starved_by_large_org(self, env):
+        big_org, big = _org("big", 10)
+        small_org, small = _org("small", 1)
+        env.orgs = [(big_org, big), (small_org, small)]
+
+        await _generator().run_for_all_orgs(MagicMock(commit=AsyncMock()))
+
+        started = [product_id for product_id, _ in env.recorded]
+        assert started.index(small[0].id) < auto_generator.MAX_CONCURRENT_PRODUCTS
+
+    @pytest.mark.asyncio
+    async def test_per_org_concurrency_is_limited(self, env):
+        org, products = _org("org", 6)
+        env.orgs = [(org, products)]
+        running = 0
+        peak = 0
+
+        async def process(*_args, **_kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return False
+
+        report = await _generator(AsyncMock(side_effect=process)).run_for_all_orgs(
+            MagicMock(commit=AsyncMock())
+        )
+
+        assert peak == auto_generator.MAX_CONCURRENT_PRODUCTS_PER_ORG
+        assert report.products_skipped == 6
+
+    @pytest.mark.asyncio
+    async def test_failed_product_is_checkpointed_as_failed(self, env):
+        org, products = _org("org", 2)
+        env.orgs = [(org, products)]
+        process = AsyncMock(side_effect=[RuntimeError("boom"), True])
+
+        report = await _generator(process).run_for_all_orgs(MagicMock(commit=AsyncMock()))
+
+        assert report.products_failed == 1 and report.products_regenerated == 1
+        assert sorted(outcome for _, outcome in env.recorded) == ["failed", "regenerated"]
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpointed_products(self, env):
+        org, products = _org("org", 3)
+        env.orgs = [(org, products)]
+        env.done = {products[0].id}
+
+        report = await _generator().run_for_all_orgs(
+            MagicMock(commit=AsyncMock()), resume_only=True
+        )
+
+        assert report.products_already_done == 1
+        assert report.products_regenerated == 2
+        assert products[0].id not in {product_id for product_id, _ in env.recorded}
+        env.checkpoint_ops.delete_before.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resume_retries_failed_products(self, env):
+        org, products = _org("org", 2)
+        env.orgs = [(org, products)]
+        env.done = {products[0].id}
+        env.failed = {products[1].id}
+
+        report = await _generator().run_for_all_orgs(
+            MagicMock(commit=AsyncMock()), resume_only=True
+        )
+
+        assert report.products_already_done == 1
+        assert report.products_regenerated == 1
+        assert env.recorded == [(products[1].id, "regenerated")]
+
+    @pytest.mark.asyncio
+    async def test_resume_stops_retrying_after_max_attempts(self, env):
+        org, products = _org("org", 2)
+        env.orgs = [(org, products)]
+        env.failed = {products[0].id, products[1].id}
+        env.attempts = {products[0].id: auto_generator.MAX_PRODUCT_ATTEMPTS}
+
+        report = await _generator().run_for_all_orgs(
+            MagicMock(commit=AsyncMock()), resume_only=True
+        )
+
+        assert report.products_already_done == 1
+        assert env.recorded == [(products[1].id, "regenerated")]
+
+    @pytest.mark.asyncio
+    async def test_failed_rollback_does_not_stop_other_products(self, env):
+        org, products = _org("org", 3)
+        env.orgs = [(org, products)]
+        process = AsyncMock(side_effect=[RuntimeError("connection lost"), True, True])
+
+        class BrokenSession(FakeSession):
+            async def rollback(self) -> None:
+                raise RuntimeError("connection is closed")
+
+        with patch(f"{MODULE}.async_session_maker", new=BrokenSession):
+            report = await _generator(process).run_for_all_orgs(MagicMock(commit=AsyncMock()))
+
+        assert report.products_failed == 1
+        assert report.products_regenerated == 2
+        assert sorted(outcome for _, outcome in env.recorded) == [
+            "failed",
+            "regenerated",
+            "regenerated",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_org_time_includes_products_cut_off_by_job_timeout(self, env):
+        org, products = _org("org", 1)
+        env.orgs = [(org, products)]
+
+        async def hang(*_args, **_kwargs):
+            await asyncio.sleep(10)
+
+        with patch(f"{MODULE}.TOTAL_JOB_TIMEOUT_SECONDS", 0.2):
+            report = await _generator(AsyncMock(side_effect=hang)).run_for_all_orgs(
+                MagicMock(commit=AsyncMock())
+            )
+
+        assert report.products_regenerated == 0
+        assert report.org_timings[str(org.id)] >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_resume_only_without_started_run_does_nothing(self, env):
+        org, products = _org("org", 3)
+        env.orgs = [(org, products)]
+        process = AsyncMock(return_value=True)
+
+        report = await _generator(process).run_for_all_orgs(
+            MagicMock(commit=AsyncMock()), resume_only=True
+        )
+
+        assert report.orgs_processed == 0
+        process.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_finished_run_does_not_resolve_tokens(self, env):
+        org, products = _org("org", 2)
+        env.orgs = [(org, products)]
+        env.done = {p.id for p in products}
+
+        with patch(f"{MODULE}.token_resolver") as resolver:
+            resolver.resolve_for_org = AsyncMock(return_value="token")
+            report = await _generator().run_for_all_orgs(
+                MagicMock(commit=AsyncMock()), resume_only=True
+            )
+
+        assert report.products_already_done == 2
+        resolver.resolve_for_org.assert_not_awaited()
+
+
+class TestActivityProbe:
+    """Tests for skipping inactive products with one probe per org."""
+
+    @pytest.mark.asyncio
+    async def test_inactive_products_are_skipped_without_processing(self, env):
+        org, products = _org("org", 3)
+        env.orgs = [(org, products)]
+        stale, empty, active = products
+        seen = datetime.now(UTC) - timedelta(days=1)
+        env.latest = {stale.id: seen, empty.id: None}
+        env.summaries = [SimpleNamespace(product_id=stale.id, last_activity_at=seen)]
+        process = AsyncMock(return_value=True)
+
+        report = await _generator(process).run_for_all_orgs(MagicMock(commit=AsyncMock()))
+
+        env.checker.get_latest_commit_dates.assert_awaited_once()
+        process.assert_awaited_once()
+        assert process.call_args.args[1] is active
+        assert process.call_args.kwargs["latest_commit_date"] is not None
+        assert report.products_skipped == 2 and report.products_regenerated == 1
+        assert set(env.recorded) == {
+            (active.id, "regenerated"),
+            (stale.id, "skipped"),
+            (empty.id, "skipped"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_probe_failure_falls_back_to_per_product_checks(self, env):
+        org, products = _org("org", 2)
+        env.orgs = [(org, products)]
+        env.checker.get_latest_commit_dates.side_effect = RuntimeError("graphql down")
+        process = AsyncMock(return_value=False)
+
+        report = await _generator(process).run_for_all_orgs(
+            MagicMock(commit=AsyncMock(), rollback=AsyncMock())
+        )
+
+        assert process.await_count == 2
+        assert all(c.kwargs["latest_commit_date"] is None for c in process.call_args_list)
+        assert report.products_skipped == 2
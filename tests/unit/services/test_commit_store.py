@@ -0,0 +1,239 @@
+"""Unit tests for commit ingestion from GitHub webhooks.
+
+Tests payload parsing for push and merged pull_request events, and that only
+tracked repositories are written. Domain operations are mocked.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.progress.commit_store import (
+    CommitStore,
+    api_commit_from_row,
+    row_from_api_commit,
+    row_from_merged_pull_request,
+    rows_from_push,
+)
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def _repository(**overrides: object) -> dict:
+    base = {
+        "id": 123,
+        "full_name": "org/repo",
+        "default_branch": "main",
+        "html_url": "https://github.com/org/repo",
+    }
+    base.update(overrides)
+    return base
+
+
+def _push_payload(ref: str = "refs/heads/main", commits: list[dict] | None = None) -> dict:
+    return {
+        "ref": ref,
+        "repository": _repository(),
+        "commits": commits
+        if commits is not None
+        else [
+            {
+                "id": SHA_A,
+                "message": "Fix bug\n\nDetails",
+                "timestamp": "2026-03-01T10:00:00Z",
+                "url": f"https://github.com/org/repo/commit/{SHA_A}",
+                "author": {"name": "Alice", "email": "a@example.com", "username": "alice"},
+            }
+        ],
+    }
+
+
+def _pr_payload(merged: bool = True, base_ref: str = "main", action: str = "closed") -> dict:
+    return {
+        "action": action,
+        "repository": _repository(),
+        "pull_request": {
+            "number": 7,
+            "title": "Add feature",
+            "merged": merged,
+            "merged_at": "2026-03-02T12:00:00Z" if merged else None,
+            "merge_commit_sha": SHA_B,
+            "base": {"ref": base_ref},
+            "user": {"login": "bob", "avatar_url": "https://avatars/bob"},
+        },
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Payload parsing
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestRowsFromPush:
+    """Tests for push payload parsing."""
+
+    def test_parses_default_branch_commits(self):
+        rows = rows_from_push(_push_payload())
+
+        assert len(rows) == 1
+        row = rows[0]
+        assert row["repository_full_name"] == "org/repo"
+        assert row["github_repo_id"] == 123
+        assert row["commit_sha"] == SHA_A
+        assert row["message"] == "Fix bug\n\nDetails"
+        assert row["author_name"] == "Alice"
+        assert row["author_login"] == "alice"
+        assert row["committed_at"] == datetime(2026, 3, 1, 10, 0, tzinfo=UTC)
+        assert row["source"] == "push"
+
+    def test_ignores_other_branches(self):
+        assert rows_from_push(_push_payload(ref="refs/heads/feature")) == []
+
+    def test_ignores_tag_pushes(self):
+        assert rows_from_push(_push_payload(ref="refs/tags/v1.0")) == []
+
+    def test_branch_deletion_has_no_rows(self):
+        assert rows_from_push(_push_payload(commits=[])) == []
+
+
+class TestRowFromMergedPullRequest:
+    """Tests for pull_request payload parsing."""
+
+    def test_builds_merge_commit_row(self):
+        row = row_from_merged_pull_request(_pr_payload())
+
+        assert row is not None
+        assert row["commit_sha"] == SHA_B
+        assert row["message"] == "Add feature (#7)"
+        assert row["author_login"] == "bob"
+        assert row["html_url"] == f"https://github.com/org/repo/commit/{SHA_B}"
+        assert row["committed_at"] == datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+        assert row["source"] == "pull_request"
+
+    def test_closed_without_merge_is_ignored(self):
+        assert row_from_merged_pull_request(_pr_payload(merged=False)) is None
+
+    def test_merge_into_other_branch_is_ignored(self):
+        assert row_from_merged_pull_request(_pr_payload(base_ref="develop")) is None
+
+    def test_other_actions_are_ignored(self):
+        assert row_from_merged_pull_request(_pr_payload(action="opened")) is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Ingestion
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestCommitStoreIngestion:
+    """Tests for writing ingested commits."""
+
+    @pytest.mark.asyncio
+    async def test_push_for_tracked_repo_is_upserted(self):
+        db = AsyncMock()
+        with (
+            patch("app.services.progress.commit_store.repository_ops") as repo_ops,
+            patch("app.services.progress.commit_store.repository_commit_ops") as commit_ops,
+            patch("app.services.progress.commit_store.commit_activity_daily_ops") as rollup_ops,
+        ):
+            repo_ops.find_by_github_id = AsyncMock(return_value=MagicMock())
+            commit_ops.get_committed_at = AsyncMock(return_value={})
+            commit_ops.bulk_upsert = AsyncMock(return_value=1)
+            rollup_ops.refresh_days = AsyncMock()
+
+            written = await CommitStore().ingest_push(db, _push_payload())
+
+        assert written == 1
+        repo_ops.find_by_github_id.assert_awaited_once_with(db, 123)
+        rows = commit_ops.bulk_upsert.call_args.args[1]
+        assert [r["commit_sha"] for r in rows] == [SHA_A]
+        rollup_ops.refresh_days.assert_awaited_once_with(db, {("org/repo", date(2026, 3, 1))})
+
+    @pytest.mark.asyncio
+    async def test_rollup_refreshes_day_a_commit_moved_from(self):
+        db = AsyncMock()
+        with (
+            patch("app.services.progress.commit_store.repository_commit_ops") as commit_ops,
+            patch("app.services.progress.commit_store.commit_activity_daily_ops") as rollup_ops,
+        ):
+            # Stored earlier from the merged PR, under the merge time
+            commit_ops.get_committed_at = AsyncMock(
+                return_value={("org/repo", SHA_A): datetime(2026, 3, 4, 9, 0, tzinfo=UTC)}
+            )
+            commit_ops.bulk_upsert = AsyncMock(return_value=1)
+            rollup_ops.refresh_days = AsyncMock()
+
+            await CommitStore().ingest(db, rows_from_push(_push_payload()))
+
+        rollup_ops.refresh_days.assert_awaited_once_with(
+            db, {("org/repo", date(2026, 3, 1)), ("org/repo", date(2026, 3, 4))}
+        )
+
+    @pytest.mark.asyncio
+    async def test_untracked_repo_is_skipped(self):
+        db = AsyncMock()
+        with (
+            patch("app.services.progress.commit_store.repository_ops") as repo_ops,
+            patch("app.services.progress.commit_store.repository_commit_ops") as commit_ops,
+        ):
+            repo_ops.find_by_github_id = AsyncMock(return_value=None)
+            commit_ops.bulk_upsert = AsyncMock()
+
+            written = await CommitStore().ingest_pull_request(db, _pr_payload())
+
+        assert written == 0
+        commit_ops.bulk_upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_irrelevant_push_skips_repository_lookup(self):
+        db = AsyncMock()
+        with patch("app.services.progress.commit_store.repository_ops") as repo_ops:
+            repo_ops.find_by_github_id = AsyncMock()
+
+            written = await CommitStore().ingest_push(db, _push_payload(ref="refs/heads/wip"))
+
+        assert written == 0
+        repo_ops.find_by_github_id.assert_not_called()
+
+
+class TestApiCommitConversion:
+    """Tests for converting between REST commits and stored rows."""
+
+    def test_round_trip_preserves_fields_read_by_endpoints(self):
+        api_commit = {
+            "sha": SHA_A,
+            "html_url": f"https://github.com/org/repo/commit/{SHA_A}",
+            "commit": {
+                "message": "Fix bug",
+                "author": {
+                    "name": "Alice",
+                    "email": "a@example.com",
+                    "date": "2026-03-01T09:00:00Z",
+                },
+                "committer": {"date": "2026-03-01T10:00:00Z"},
+            },
+            "author": {"login": "alice", "avatar_url": "https://avatars/alice"},
+        }
+
+        row = row_from_api_commit(
+            "org/repo", 123, api_commit, {"additions": 3, "deletions": 1, "files_changed": 1}
+        )
+        assert row["source"] == "sync"
+        assert row["additions"] == 3
+
+        rendered = api_commit_from_row(SimpleNamespace(**row))
+        assert rendered == api_commit
+
+    def test_row_without_login_renders_null_author(self):
+        row = rows_from_push(_push_payload())[0]
+        row["author_login"] = None
+
+        rendered = api_commit_from_row(SimpleNamespace(**row))
+
+        assert rendered["author"] is None
+        assert rendered["commit"]["author"]["name"] == "Alice"
@@ -0,0 +1,234 @@
+"""Unit tests for the incremental commit sync worker.
+
+GitHub and domain operations are mocked; tests cover cursor handling and
+what gets written for a single repository.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.config import settings
+from app.services.progress.commit_sync import CommitSyncWorker
+
+
+def _api_commit(sha: str, date: str) -> dict:
+    return {
+        "sha": sha,
+        "html_url": f"https://github.com/org/repo/commit/{sha}",
+        "commit": {
+            "message": f"commit {sha}",
+            "author": {"name": "Alice", "email": "a@example.com", "date": date},
+            "committer": {"date": date},
+        },
+        "author": {"login": "alice", "avatar_url": "https://avatars/alice"},
+    }
+
+
+def _github(commits: list[dict], stats: dict | None = None) -> MagicMock:
+    github = MagicMock()
+
+    async def iter_commits(*_args, **_kwargs):
+        for commit in commits:
+            yield commit
+
+    github.iter_commits = MagicMock(side_effect=iter_commits)
+    github.get_commit_history_stats = AsyncMock(return_value=stats or {})
+    return github
+
+
+def _repo() -> MagicMock:
+    repo = MagicMock()
+    repo.full_name = "org/repo"
+    repo.default_branch = "main"
+    repo.github_id = 42
+    return repo
+
+
+@pytest.fixture
+def ops():
+    with (
+        patch("app.services.progress.commit_sync.repository_sync_cursor_ops") as cursor_ops,
+        patch("app.services.progress.commit_sync.commit_stats_cache_ops") as stats_ops,
+        patch("app.services.progress.commit_sync.commit_store") as store,
+    ):
+        cursor_ops.record_sync = AsyncMock()
+        stats_ops.bulk_upsert = AsyncMock()
+        store.ingest = AsyncMock(side_effect=lambda _db, rows: len(rows))
+        yield cursor_ops, stats_ops, store
+
+
+@pytest.fixture(autouse=True)
+def stored_shas():
+    """SHAs already in the commit store with stats (mutated by tests)."""
+    shas: set[str] = set()
+
+    async def get_with_stats(_db, keys):
+        return {key for key in keys if key[1] in shas}
+
+    with patch("app.services.progress.commit_sync.repository_commit_ops") as commit_ops:
+        commit_ops.get_with_stats = AsyncMock(side_effect=get_with_stats)
+        yield shas
+
+
+class TestSyncRepository:
+    """Tests for CommitSyncWorker.sync_repository."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_backfills_and_records_cursor(self, ops):
+        cursor_ops, stats_ops, store = ops
+        stats = {"sha2": {"additions": 5, "deletions": 1, "files_changed": 2}}
+        github = _github(
+            [
+                _api_commit("sha2", "2026-03-02T00:00:00Z"),
+                _api_commit("sha1", "2026-03-01T00:00:00Z"),
+            ],
+            stats,
+        )
+
+        written = await CommitSyncWorker().sync_repository(AsyncMock(), github, _repo(), None)
+
+        assert written == 2
+        since = github.iter_commits.call_args.kwargs["since"]
+        expected = datetime.now(UTC) - timedelta(days=settings.commit_sync_backfill_days)
+        assert abs(datetime.fromisoformat(since.replace("Z", "+00:00")) - expected) < timedelta(
+            minutes=1
+        )
+
+        rows = store.ingest.call_args.args[1]
+        assert [r["source"] for r in rows] == ["sync", "sync"]
+        assert rows[0]["additions"] == 5
+        assert rows[1]["additions"] is None
+        stats_ops.bulk_upsert.assert_awaited_once()
+
+        kwargs = cursor_ops.record_sync.call_args.kwargs
+        assert kwargs["last_commit_sha"] == "sha2"
+        assert kwargs["last_commit_at"] == datetime(2026, 3, 2, tzinfo=UTC)
+        assert kwargs["reset_coverage"] is False
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_rereads_overlap_and_skips_stored(self, ops, stored_shas):
+        cursor_ops, _stats_ops, store = ops
+        stored_shas.add("sha1")
+        cursor = MagicMock(
+            last_commit_sha="sha1",
+            last_commit_at=datetime(2026, 3, 1, tzinfo=UTC),
+        )
+        github = _github(
+            [
+                _api_commit("sha2", "2026-03-02T00:00:00Z"),
+                _api_commit("sha1", "2026-03-01T00:00:00Z"),
+            ]
+        )
+
+        written = await CommitSyncWorker().sync_repository(AsyncMock(), github, _repo(), cursor)
+
+        assert written == 1
+        since = datetime(2026, 3, 1, tzinfo=UTC) - timedelta(
+            hours=settings.commit_sync_overlap_hours
+        )
+        assert github.iter_commits.call_args.kwargs["since"] == since.strftime("%Y-%m-%dT%H:%M:%SZ")
+        rows = store.ingest.call_args.args[1]
+        assert [r["commit_sha"] for r in rows] == ["sha2"]
+
+    @pytest.mark.asyncio
+    async def test_no_new_commits_only_refreshes_sync_time(self, ops, stored_shas):
+        cursor_ops, _stats_ops, store = ops
+        stored_shas.add("sha1")
+        cursor = MagicMock(
+            last_commit_sha="sha1",
+            last_commit_at=datetime(2026, 3, 1, tzinfo=UTC),
+        )
+        github = _github([_api_commit("sha1", "2026-03-01T00:00:00Z")])
+
+        written = await CommitSyncWorker().sync_repository(AsyncMock(), github, _repo(), cursor)
+
+        assert written == 0
+        store.ingest.assert_not_called()
+        github.get_commit_history_stats.assert_not_called()
+        kwargs = cursor_ops.record_sync.call_args.kwargs
+        assert "last_commit_sha" not in kwargs
+
+    @pytest.mark.asyncio
+    async def test_late_pushed_commit_dated_before_cursor_is_stored(self, ops, stored_shas):
+        """A commit pushed after the last sync but dated before it is picked up."""
+        cursor_ops, _stats_ops, store = ops
+        stored_shas.update({"sha2", "sha1"})
+        cursor = MagicMock(
+            last_commit_sha="sha2",
+            last_commit_at=datetime(2026, 3, 2, tzinfo=UTC),
+        )
+        github = _github(
+            [
+                _api_commit("sha2", "2026-03-02T00:00:00Z"),
+                _api_commit("late", "2026-03-01T12:00:00Z"),
+                _api_commit("sha1", "2026-03-01T00:00:00Z"),
+            ]
+        )
+
+        written = await CommitSyncWorker().sync_repository(AsyncMock(), github, _repo(), cursor)
+
+        assert written == 1
+        assert [r["commit_sha"] for r in store.ingest.call_args.args[1]] == ["late"]
+        kwargs = cursor_ops.record_sync.call_args.kwargs
+        # The cursor stays on the newest commit, not the late one
+        assert kwargs["last_commit_sha"] == "sha2"
+        assert kwargs["last_commit_at"] == datetime(2026, 3, 2, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_webhook_rows_without_stats_are_reingested(self, ops, stored_shas):
+        """Stored rows lacking stats (push webhooks) are treated as missing."""
+        _cursor_ops, _stats_ops, store = ops
+        # "pushed" is stored by a webhook without stats, so it is not in stored_shas
+        stored_shas.add("sha1")
+        cursor = MagicMock(
+            last_commit_sha="pushed",
+            last_commit_at=datetime(2026, 3, 2, tzinfo=UTC),
+        )
+        stats = {"pushed": {"additions": 7, "deletions": 2, "files_changed": 1}}
+        github = _github(
+            [
+                _api_commit("pushed", "2026-03-02T00:00:00Z"),
+                _api_commit("sha1", "2026-03-01T00:00:00Z"),
+            ],
+            stats,
+        )
+
+        written = await CommitSyncWorker().sync_repository(AsyncMock(), github, _repo(), cursor)
+
+        assert written == 1
+        rows = store.ingest.call_args.args[1]
+        assert [r["commit_sha"] for r in rows] == ["pushed"]
+        assert rows[0]["additions"] == 7
+
+    @pytest.mark.asyncio
+    async def test_capped_run_resets_coverage_to_oldest_commit(self, ops):
+        cursor_ops, _stats_ops, _store = ops
+        github = _github(
+            [
+                _api_commit("sha2", "2026-03-02T00:00:00Z"),
+                _api_commit("sha1", "2026-03-01T00:00:00Z"),
+            ]
+        )
+
+        with patch("app.services.progress.commit_sync.MAX_SYNC_COMMITS", 2):
+            await CommitSyncWorker().sync_repository(AsyncMock(), github, _repo(), None)
+
+        kwargs = cursor_ops.record_sync.call_args.kwargs
+        assert kwargs["covered_since"] == datetime(2026, 3, 1, tzinfo=UTC)
+        assert kwargs["reset_coverage"] is True
+
+    @pytest.mark.asyncio
+    async def test_stats_failure_still_stores_commits(self, ops):
+        _cursor_ops, stats_ops, store = ops
+        github = _github([_api_commit("sha1", "2026-03-01T00:00:00Z")])
+        github.get_commit_history_stats = AsyncMock(side_effect=RuntimeError("graphql down"))
+
+        written = await CommitSyncWorker().sync_repository(AsyncMock(), github, _repo(), None)
+
+        assert written == 1
+        assert store.ingest.call_args.args[1][0]["additions"] is None
+        stats_ops.bulk_upsert.assert_not_called()
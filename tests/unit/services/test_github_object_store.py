@@ -0,0 +1,303 @@
+"""Unit tests for the persistent git object store.
+
+Tests SHA computation, store error handling, and serving file/tree reads
+from the store with write-back of misses. Database access is mocked.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.services.github.cache import clear_all_caches
+from app.services.github.object_store import GitObjectStore, git_blob_sha, git_object_store
+from app.services.github.service import GitHubService
+from app.services.github.types import RepoTree, RepoTreeItem
+
+TOKEN = "ghp_test_token_12345"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _tree(files: dict[str, str]) -> RepoTree:
+    """Build a RepoTree whose blob SHAs are given per path."""
+    return RepoTree(
+        sha="tree-root",
+        files=list(files),
+        directories=[],
+        all_items=[
+            RepoTreeItem(path=path, type="blob", size=1, sha=sha) for path, sha in files.items()
+        ],
+        truncated=False,
+    )
+
+
+def _session_maker(db: AsyncMock) -> MagicMock:
+    """Build a mock for `async with async_session_maker() as db`."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=db)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=ctx)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Clear GitHub caches before each test to prevent cross-test pollution."""
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
+@pytest.fixture
+def store():
+    """Enable the shared store with all database access mocked."""
+    with (
+        patch.object(git_object_store, "enabled", True),
+        patch.object(git_object_store, "get_blobs", new_callable=AsyncMock) as get_blobs,
+        patch.object(git_object_store, "put_blobs", new_callable=AsyncMock) as put_blobs,
+        patch.object(git_object_store, "get_tree", new_callable=AsyncMock) as get_tree,
+        patch.object(git_object_store, "put_tree", new_callable=AsyncMock) as put_tree,
+    ):
+        get_blobs.return_value = {}
+        get_tree.return_value = None
+        yield MagicMock(
+            get_blobs=get_blobs, put_blobs=put_blobs, get_tree=get_tree, put_tree=put_tree
+        )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GitObjectStore
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGitObjectStore:
+    """Tests for the store itself."""
+
+    def test_blob_sha_matches_git(self):
+        # `printf 'hello\n' | git hash-object --stdin`
+        assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+    @pytest.mark.anyio
+    async def test_put_blobs_keys_by_computed_sha(self):
+        db = AsyncMock()
+        object_store = GitObjectStore(enabled=True, max_bytes=1000)
+
+        with (
+            patch("app.services.github.object_store.async_session_maker", _session_maker(db)),
+            patch("app.services.github.object_store.git_object_cache_ops") as ops,
+        ):
+            ops.bulk_insert = AsyncMock()
+            ops.evict_to_size = AsyncMock(return_value=0)
+            await object_store.put_blobs([b"hello\n"])
+
+        ops.bulk_insert.assert_awaited_once_with(
+            db, "blob", {"ce013625030ba8dba906f756967f9e9ca394464a": b"hello\n"}
+        )
+        ops.evict_to_size.assert_awaited_once_with(db, 1000)
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_eviction_is_throttled(self):
+        db = AsyncMock()
+        object_store = GitObjectStore(enabled=True, max_bytes=1000)
+
+        with (
+            patch("app.services.github.object_store.async_session_maker", _session_maker(db)),
+            patch("app.services.github.object_store.git_object_cache_ops") as ops,
+        ):
+            ops.bulk_insert = AsyncMock()
+            ops.evict_to_size = AsyncMock(return_value=0)
+            await object_store.put_blobs([b"a"])
+            await object_store.put_blobs([b"b"])
+
+        assert ops.bulk_insert.await_count == 2
+        ops.evict_to_size.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_truncated_tree_is_not_stored(self):
+        object_store = GitObjectStore(enabled=True, max_bytes=1000)
+
+        with patch("app.services.github.object_store.async_session_maker") as session_maker:
+            await object_store.put_tree({"sha": "t", "tree": [], "truncated": True})
+
+        session_maker.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_tree_round_trips_as_listing(self):
+        db = AsyncMock()
+        object_store = GitObjectStore(enabled=True, max_bytes=1000)
+        data = {
+            "sha": "t1",
+            "url": "https://api.github.com/...",
+            "tree": [{"path": "a.py", "type": "blob", "size": 3, "sha": "b1", "mode": "100644"}],
+            "truncated": False,
+        }
+
+        with (
+            patch("app.services.github.object_store.async_session_maker", _session_maker(db)),
+            patch("app.services.github.object_store.git_object_cache_ops") as ops,
+        ):
+            ops.bulk_insert = AsyncMock()
+            ops.evict_to_size = AsyncMock(return_value=0)
+            await object_store.put_tree(data)
+            stored = ops.bulk_insert.call_args.args[2]
+            ops.get_many = AsyncMock(return_value=stored)
+            listing = await object_store.get_tree("t1")
+
+        assert listing == {
+            "sha": "t1",
+            "tree": [{"path": "a.py", "type": "blob", "size": 3, "sha": "b1"}],
+        }
+
+    @pytest.mark.anyio
+    async def test_database_errors_degrade_to_miss(self):
+        object_store = GitObjectStore(enabled=True, max_bytes=1000)
+
+        with patch(
+            "app.services.github.object_store.async_session_maker",
+            side_effect=ConnectionError("db down"),
+        ):
+            assert await object_store.get_blobs(["abc"]) == {}
+            assert await object_store.get_tree("abc") is None
+            await object_store.put_blobs([b"x"])
+
+    @pytest.mark.anyio
+    async def test_disabled_store_skips_database(self):
+        object_store = GitObjectStore(enabled=False, max_bytes=1000)
+
+        with patch("app.services.github.object_store.async_session_maker") as session_maker:
+            assert await object_store.get_blobs(["abc"]) == {}
+            await object_store.put_blobs([b"x"])
+
+        session_maker.assert_not_called()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Reads served from the store
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestReadsFromStore:
+    """Tests for GitHub reads consulting the store."""
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_file_content_served_by_blob_sha(self, mock_get_client, store):
+        store.get_blobs.return_value = {"sha1": b"print('hi')"}
+
+        svc = GitHubService(TOKEN)
+        result = await svc.get_file_content("owner", "repo", "main.py", blob_sha="sha1")
+
+        assert result is not None
+        assert result.content == "print('hi')"
+        assert result.sha == "sha1"
+        mock_get_client.assert_not_called()
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_file_content_miss_is_written_back(self, mock_get_client, store):
+        client = MagicMock()
+        mock_get_client.return_value = client
+        client.get = AsyncMock(
+            return_value=httpx.Response(
+                200,
+                json={"type": "file", "size": 5, "content": "aGVsbG8=", "sha": "sha1"},
+            )
+        )
+
+        svc = GitHubService(TOKEN)
+        result = await svc.get_file_content("owner", "repo", "a.txt", blob_sha="sha1")
+
+        assert result is not None
+        assert result.content == "hello"
+        store.put_blobs.assert_awaited_once_with([b"hello"])
+
+    @pytest.mark.anyio
+    async def test_bulk_read_fetches_only_misses(self, store):
+        store.get_blobs.return_value = {"s-a": b"a"}
+        svc = GitHubService(TOKEN)
+        tree = _tree({"a.py": "s-a", "b.py": "s-b"})
+
+        with patch.object(svc, "get_file_content", new_callable=AsyncMock) as mock_file:
+            mock_file.return_value = MagicMock(content="b")
+            result = await svc.fetch_files_by_paths("owner", "repo", ["a.py", "b.py"], tree=tree)
+
+        assert result == {"a.py": "a", "b.py": "b"}
+        mock_file.assert_called_once_with("owner", "repo", "b.py", "main", max_size=100_000)
+        assert list(store.put_blobs.call_args.args[0]) == [b"b"]
+
+    @pytest.mark.anyio
+    async def test_bulk_read_without_tree_skips_store(self, store):
+        svc = GitHubService(TOKEN)
+
+        with patch.object(svc, "get_file_content", new_callable=AsyncMock) as mock_file:
+            mock_file.return_value = None
+            await svc.fetch_files_by_paths("owner", "repo", ["a.py"])
+
+        store.get_blobs.assert_not_called()
+        store.put_blobs.assert_not_called()
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_tree_served_after_branch_resolution(self, mock_get_client, store):
+        client = MagicMock()
+        mock_get_client.return_value = client
+        client.get = AsyncMock(
+            return_value=httpx.Response(
+                200, json={"commit": {"commit": {"tree": {"sha": "tree-sha"}}}}
+            )
+        )
+        store.get_tree.return_value = {
+            "sha": "tree-sha",
+            "tree": [{"path": "a.py", "type": "blob", "size": 1, "sha": "s"}],
+        }
+
+        svc = GitHubService(TOKEN)
+        tree = await svc.get_repo_tree("owner", "repo", "main")
+
+        assert tree.sha == "tree-sha"
+        assert tree.files == ["a.py"]
+        client.get.assert_awaited_once()
+        assert client.get.call_args.args[0].endswith("/repos/owner/repo/branches/main")
+        store.get_tree.assert_awaited_once_with("tree-sha")
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_tree_miss_fetched_by_sha_and_stored(self, mock_get_client, store):
+        client = MagicMock()
+        mock_get_client.return_value = client
+        tree_json = {"sha": "tree-sha", "tree": [], "truncated": False}
+        client.get = AsyncMock(
+            side_effect=[
+                httpx.Response(200, json={"commit": {"commit": {"tree": {"sha": "tree-sha"}}}}),
+                httpx.Response(200, json=tree_json),
+            ]
+        )
+
+        svc = GitHubService(TOKEN)
+        await svc.get_repo_tree("owner", "repo", "main")
+
+        assert client.get.call_args.args[0].endswith("/repos/owner/repo/git/trees/tree-sha")
+        store.put_tree.assert_awaited_once_with(tree_json)
+
+    @pytest.mark.anyio
+    async def test_via_tree_resolves_blob_sha(self, store):
+        svc = GitHubService(TOKEN)
+
+        with (
+            patch.object(svc, "get_repo_tree", new_callable=AsyncMock) as mock_tree,
+            patch.object(svc, "get_file_content", new_callable=AsyncMock) as mock_file,
+        ):
+            mock_tree.return_value = _tree({"README.md": "s-readme"})
+            await svc.get_file_content_via_tree("owner", "repo", "README.md")
+            missing = await svc.get_file_content_via_tree("owner", "repo", "nope.md")
+
+        mock_file.assert_awaited_once_with(
+            "owner", "repo", "README.md", "main", max_size=100_000, blob_sha="s-readme"
+        )
+        assert missing is None
@@ -0,0 +1,217 @@
+"""Unit tests for the rate-limit-aware GitHub request scheduler.
+
+Tests budget tracking from response headers, interactive/background lane
+admission, and the transport wrapper used by the shared HTTP client.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.github.exceptions import GitHubAPIError, GitHubRequestShed
+from app.services.github.rate_limiter import (
+    GitHubRequestScheduler,
+    RateLimitedTransport,
+    RequestPriority,
+    background_github_work,
+    current_priority,
+    github_priority,
+)
+
+AUTH = "Bearer ghp_test_token_12345"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _scheduler(**overrides: float) -> GitHubRequestScheduler:
+    params = {"reserve_ratio": 0.2, "max_background_wait": 30.0, "background_concurrency": 2}
+    params.update(overrides)
+    return GitHubRequestScheduler(**params)  # type: ignore[arg-type]
+
+
+def _rate_headers(remaining: int, reset_in: float = 600, limit: int = 5000) -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+    }
+
+
+def _request(url: str = "https://api.github.com/repos/o/r/commits") -> httpx.Request:
+    return httpx.Request("GET", url, headers={"Authorization": AUTH})
+
+
+def _seed_budget(scheduler: GitHubRequestScheduler, remaining: int, reset_in: float = 600) -> str:
+    key = scheduler._budget_key(AUTH, "core")
+    scheduler.record(key, httpx.Response(200, headers=_rate_headers(remaining, reset_in)))
+    return key
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Priority context
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestPriorityContext:
+    """Tests for the priority lane context variable."""
+
+    def test_defaults_to_interactive(self):
+        assert current_priority() is RequestPriority.INTERACTIVE
+
+    def test_context_manager_restores_previous_lane(self):
+        with github_priority(RequestPriority.BACKGROUND):
+            assert current_priority() is RequestPriority.BACKGROUND
+        assert current_priority() is RequestPriority.INTERACTIVE
+
+    @pytest.mark.anyio
+    async def test_decorator_runs_in_background_lane(self):
+        @background_github_work
+        async def job() -> RequestPriority:
+            return current_priority()
+
+        assert await job() is RequestPriority.BACKGROUND
+        assert current_priority() is RequestPriority.INTERACTIVE
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Admission
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestAdmit:
+    """Tests for per-lane admission decisions."""
+
+    @pytest.mark.anyio
+    async def test_unknown_budget_is_admitted(self):
+        scheduler = _scheduler()
+
+        await scheduler.admit("unknown", RequestPriority.BACKGROUND)
+
+    @pytest.mark.anyio
+    async def test_admission_decrements_budget(self):
+        scheduler = _scheduler()
+        key = _seed_budget(scheduler, remaining=100)
+
+        await scheduler.admit(key, RequestPriority.INTERACTIVE)
+
+        assert scheduler.get_budget(AUTH).remaining == 99
+
+    @pytest.mark.anyio
+    async def test_interactive_fails_fast_when_exhausted(self):
+        scheduler = _scheduler()
+        key = _seed_budget(scheduler, remaining=0)
+
+        with pytest.raises(GitHubAPIError) as exc_info:
+            await scheduler.admit(key, RequestPriority.INTERACTIVE)
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.rate_limit_reset is not None
+
+    @pytest.mark.anyio
+    async def test_interactive_may_spend_the_reserve(self):
+        scheduler = _scheduler()
+        key = _seed_budget(scheduler, remaining=10)
+
+        await scheduler.admit(key, RequestPriority.INTERACTIVE)
+
+    @pytest.mark.anyio
+    async def test_background_is_shed_at_reserve_when_reset_is_far(self):
+        scheduler = _scheduler()
+        key = _seed_budget(scheduler, remaining=1000, reset_in=1800)
+
+        with pytest.raises(GitHubRequestShed) as exc_info:
+            await scheduler.admit(key, RequestPriority.BACKGROUND)
+
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.anyio
+    async def test_background_waits_for_reset_when_close(self):
+        scheduler = _scheduler()
+        key = _seed_budget(scheduler, remaining=1000, reset_in=10)
+
+        with patch(
+            "app.services.github.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            await scheduler.admit(key, RequestPriority.BACKGROUND)
+
+        mock_sleep.assert_awaited_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 10
+
+    @pytest.mark.anyio
+    async def test_background_admitted_above_reserve(self):
+        scheduler = _scheduler()
+        key = _seed_budget(scheduler, remaining=1001)
+
+        await scheduler.admit(key, RequestPriority.BACKGROUND)
+
+    @pytest.mark.anyio
+    async def test_expired_budget_is_ignored(self):
+        scheduler = _scheduler()
+        key = _seed_budget(scheduler, remaining=0, reset_in=-5)
+
+        await scheduler.admit(key, RequestPriority.INTERACTIVE)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Transport
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestRateLimitedTransport:
+    """Tests for the transport wrapper on the shared client."""
+
+    @pytest.mark.anyio
+    async def test_records_budget_per_resource(self):
+        scheduler = _scheduler()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            remaining = 4000 if request.url.path == "/graphql" else 4999
+            return httpx.Response(200, json={}, headers=_rate_headers(remaining))
+
+        transport = RateLimitedTransport(httpx.MockTransport(handler), scheduler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://api.github.com/user", headers={"Authorization": AUTH})
+            await client.post("https://api.github.com/graphql", headers={"Authorization": AUTH})
+
+        assert scheduler.get_budget(AUTH, "core").remaining == 4999
+        assert scheduler.get_budget(AUTH, "graphql").remaining == 4000
+
+    @pytest.mark.anyio
+    async def test_budgets_are_tracked_per_token(self):
+        scheduler = _scheduler()
+        transport = RateLimitedTransport(
+            httpx.MockTransport(lambda r: httpx.Response(200, headers=_rate_headers(0))),
+            scheduler,
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://api.github.com/user", headers={"Authorization": AUTH})
+
+            with pytest.raises(GitHubAPIError):
+                await client.get("https://api.github.com/user", headers={"Authorization": AUTH})
+            # A different installation token has its own budget
+            await client.get(
+                "https://api.github.com/user", headers={"Authorization": "Bearer ghs_other"}
+            )
+
+    @pytest.mark.anyio
+    async def test_non_api_hosts_bypass_scheduling(self):
+        scheduler = _scheduler()
+        _seed_budget(scheduler, remaining=0)
+        transport = RateLimitedTransport(
+            httpx.MockTransport(lambda r: httpx.Response(200)), scheduler
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get(
+                "https://codeload.github.com/o/r/legacy.tar.gz/main",
+                headers={"Authorization": AUTH},
+            )
+
+        assert response.status_code == 200
@@ -10,6 +10,7 @@ Tests GitHubService with mocked HTTP responses to verify:
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -17,6 +18,7 @@ import pytest
 
 from app.services.github.cache import clear_all_caches
 from app.services.github.exceptions import GitHubAPIError
+from app.services.github.object_store import git_object_store
 from app.services.github.service import GitHubService, calculate_lines_of_code
 from app.services.github.types import (
     CommitStats,
@@ -89,6 +91,13 @@ def _clear_caches():
     clear_all_caches()
 
 
+@pytest.fixture(autouse=True)
+def _disable_object_store():
+    """Keep reads off the persistent git object store (no database in unit tests)."""
+    with patch.object(git_object_store, "enabled", False):
+        yield
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # calculate_lines_of_code
 # ═══════════════════════════════════════════════════════════════════════════
@@ -546,6 +555,492 @@ class TestGetCommitDetail:
         assert result is None
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# get_commit_history_stats (GraphQL)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _history_page(nodes: list[dict], has_next: bool = False, cursor: str = "c1") -> dict:
+    """GraphQL commit history response payload."""
+    return {
+        "data": {
+            "repository": {
+                "object": {
+                    "history": {
+                        "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                        "nodes": nodes,
+                    }
+                }
+            }
+        }
+    }
+
+
+def _history_node(oid: str, additions: int = 1, deletions: int = 0, files: int | None = 1):
+    return {
+        "oid": oid,
+        "additions": additions,
+        "deletions": deletions,
+        "changedFilesIfAvailable": files,
+    }
+
+
+class TestGetCommitHistoryStats:
+    """Tests for bulk commit stats via the GraphQL history connection."""
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_returns_stats_by_sha(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(
+            json_data=_history_page([_history_node("aaa", 10, 3, 2), _history_node("bbb")])
+        )
+
+        svc = GitHubService(TOKEN)
+        result = await svc.get_commit_history_stats(
+            "owner", "repo", "main", since="2026-01-01T00:00:00Z"
+        )
+
+        assert result == {
+            "aaa": {"additions": 10, "deletions": 3, "files_changed": 2},
+            "bbb": {"additions": 1, "deletions": 0, "files_changed": 1},
+        }
+        variables = client.post.call_args.kwargs["json"]["variables"]
+        assert variables["expression"] == "main"
+        assert variables["since"] == "2026-01-01T00:00:00Z"
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_defaults_to_head(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(json_data=_history_page([]))
+
+        svc = GitHubService(TOKEN)
+        await svc.get_commit_history_stats("owner", "repo")
+
+        assert client.post.call_args.kwargs["json"]["variables"]["expression"] == "HEAD"
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_paginates_until_requested_shas_are_found(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.side_effect = [
+            _make_response(json_data=_history_page([_history_node("aaa")], True, "c1")),
+            _make_response(json_data=_history_page([_history_node("bbb")], True, "c2")),
+            _make_response(json_data=_history_page([_history_node("ccc")], True, "c3")),
+        ]
+
+        svc = GitHubService(TOKEN)
+        result = await svc.get_commit_history_stats("owner", "repo", shas={"aaa", "bbb"})
+
+        assert set(result) == {"aaa", "bbb"}
+        assert client.post.call_count == 2
+        assert client.post.call_args.kwargs["json"]["variables"]["cursor"] == "c1"
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_skips_commits_without_file_count(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(
+            json_data=_history_page([_history_node("huge", files=None)])
+        )
+
+        svc = GitHubService(TOKEN)
+        result = await svc.get_commit_history_stats("owner", "repo")
+
+        assert result == {}
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_raises_on_graphql_errors(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(
+            json_data={"data": None, "errors": [{"message": "Something went wrong"}]}
+        )
+
+        svc = GitHubService(TOKEN)
+        with pytest.raises(GitHubAPIError, match="Something went wrong"):
+            await svc.get_commit_history_stats("owner", "repo")
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_raises_on_missing_repository(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(json_data={"data": {"repository": None}})
+
+        svc = GitHubService(TOKEN)
+        with pytest.raises(GitHubAPIError) as exc_info:
+            await svc.get_commit_history_stats("owner", "repo")
+
+        assert exc_info.value.status_code == 404
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# get_branch_heads (batched GraphQL)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGetBranchHeads:
+    """Tests for probing many repositories' branch heads in one query."""
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_one_query_for_many_repos(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(
+            json_data={
+                "data": {
+                    "r0": {"object": {"oid": "aaa", "committedDate": "2026-01-02T00:00:00Z"}},
+                    "r1": {"object": {"oid": "bbb", "committedDate": "2026-01-03T00:00:00Z"}},
+                }
+            }
+        )
+
+        svc = GitHubService(TOKEN)
+        heads = await svc.get_branch_heads([("acme/api", "main"), ("acme/web", None)])
+
+        assert heads == {
+            "acme/api": {"sha": "aaa", "committed_at": "2026-01-02T00:00:00Z"},
+            "acme/web": {"sha": "bbb", "committed_at": "2026-01-03T00:00:00Z"},
+        }
+        assert client.post.call_count == 1
+        body = client.post.call_args.kwargs["json"]
+        assert "r1: repository(owner: $owner1, name: $name1)" in body["query"]
+        assert body["variables"]["expression0"] == "main"
+        assert body["variables"]["expression1"] == "HEAD"
+        assert body["variables"]["owner1"] == "acme"
+        assert body["variables"]["name1"] == "web"
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_missing_repos_are_omitted(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(
+            json_data={
+                "data": {
+                    "r0": None,
+                    "r1": {"object": None},
+                    "r2": {"object": {"oid": "ccc", "committedDate": "2026-01-04T00:00:00Z"}},
+                },
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve r0"}],
+            }
+        )
+
+        svc = GitHubService(TOKEN)
+        heads = await svc.get_branch_heads([("a/gone", None), ("a/empty", None), ("a/ok", None)])
+
+        assert list(heads) == ["a/ok"]
+
+    @patch("app.services.github.read_operations.BRANCH_HEADS_BATCH_SIZE", 2)
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_batches_large_orgs(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(json_data={"data": {}})
+
+        svc = GitHubService(TOKEN)
+        await svc.get_branch_heads([(f"acme/repo{i}", None) for i in range(5)])
+
+        assert client.post.call_count == 3
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_raises_when_query_fails(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.post.return_value = _make_response(
+            json_data={"data": None, "errors": [{"message": "Something went wrong"}]}
+        )
+
+        svc = GitHubService(TOKEN)
+        with pytest.raises(GitHubAPIError, match="Something went wrong"):
+            await svc.get_branch_heads([("acme/api", None)])
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# iter_commits
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _commit_page(shas: list[str], next_url: str | None = None) -> httpx.Response:
+    headers = {"Link": f'<{next_url}>; rel="next"'} if next_url else None
+    return _make_response(json_data=[{"sha": sha} for sha in shas], headers=headers)
+
+
+class TestIterCommits:
+    """Tests for streaming a commit window with Link pagination."""
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_passes_window_and_follows_link_header(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        next_url = "https://api.github.com/repositories/1/commits?page=2"
+        client.get.side_effect = [
+            _commit_page(["a", "b"], next_url),
+            _commit_page(["c"]),
+        ]
+
+        svc = GitHubService(TOKEN)
+        shas = [
+            c["sha"]
+            async for c in svc.iter_commits(
+                "owner", "repo", "main", since="2026-01-01T00:00:00Z", until="2026-02-01T00:00:00Z"
+            )
+        ]
+
+        assert shas == ["a", "b", "c"]
+        first, second = client.get.call_args_list
+        assert first.kwargs["params"] == {
+            "per_page": 100,
+            "sha": "main",
+            "since": "2026-01-01T00:00:00Z",
+            "until": "2026-02-01T00:00:00Z",
+        }
+        assert second.args[0] == next_url
+        assert "params" not in second.kwargs
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_max_commits_stops_without_fetching_more_pages(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.side_effect = [
+            _commit_page(["a", "b", "c"], "https://api.github.com/next"),
+        ]
+
+        svc = GitHubService(TOKEN)
+        shas = [c["sha"] async for c in svc.iter_commits("owner", "repo", max_commits=2)]
+
+        assert shas == ["a", "b"]
+        assert client.get.call_count == 1
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_raises_on_error(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.return_value = _make_response(404, {"message": "Not Found"})
+
+        svc = GitHubService(TOKEN)
+        with pytest.raises(GitHubAPIError):
+            async for _ in svc.iter_commits("owner", "repo"):
+                pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Conditional requests (ETag / Last-Modified revalidation)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestConditionalRequests:
+    """Tests for ETag revalidation of repeated GETs."""
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_304_serves_stored_body(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        commits = [{"sha": "abc123"}, {"sha": "def456"}]
+        client.get.side_effect = [
+            _make_response(json_data=commits, headers={"ETag": '"v1"'}),
+            _make_response(status_code=304, headers={"X-RateLimit-Remaining": "4999"}),
+        ]
+
+        svc = GitHubService(TOKEN)
+        first = await svc.get_commits_for_timeline("owner", "repo", per_page=5)
+        second = await svc.get_commits_for_timeline("owner", "repo", per_page=5)
+
+        assert first == second == (commits, False)
+        revalidation_headers = client.get.call_args_list[1].kwargs["headers"]
+        assert revalidation_headers["If-None-Match"] == '"v1"'
+        assert revalidation_headers["Authorization"] == f"Bearer {TOKEN}"
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_sends_if_modified_since(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        last_modified = "Wed, 14 Jan 2026 00:00:00 GMT"
+        client.get.side_effect = [
+            _make_response(json_data={"Python": 100}, headers={"Last-Modified": last_modified}),
+            _make_response(status_code=304),
+        ]
+
+        svc = GitHubService(TOKEN)
+        await svc._get("https://api.github.com/repos/o/r/languages")
+        response = await svc._get("https://api.github.com/repos/o/r/languages")
+
+        assert response.status_code == 200
+        assert response.json() == {"Python": 100}
+        assert client.get.call_args_list[1].kwargs["headers"]["If-Modified-Since"] == last_modified
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_replays_link_header_on_304(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        link = '<https://api.github.com/repos/o/r/commits?page=7>; rel="last"'
+        client.get.side_effect = [
+            _make_response(
+                json_data=[{"commit": {"committer": {"date": "2026-01-14T00:00:00Z"}}}],
+                headers={"ETag": '"v1"', "Link": link},
+            ),
+            _make_response(status_code=304),
+        ]
+
+        svc = GitHubService(TOKEN)
+        await svc._get("https://api.github.com/repos/o/r/commits", params={"per_page": 1})
+        response = await svc._get(
+            "https://api.github.com/repos/o/r/commits", params={"per_page": 1}
+        )
+
+        assert response.headers["Link"] == link
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_response_without_validators_is_not_stored(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.return_value = _make_response(json_data=[])
+
+        svc = GitHubService(TOKEN)
+        await svc.get_commits_for_timeline("owner", "repo")
+        await svc.get_commits_for_timeline("owner", "repo")
+
+        assert "If-None-Match" not in client.get.call_args_list[1].kwargs["headers"]
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_validators_are_scoped_per_token(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.return_value = _make_response(json_data=[], headers={"ETag": '"v1"'})
+
+        await GitHubService(TOKEN).get_commits_for_timeline("owner", "repo")
+        await GitHubService("ghp_other_token").get_commits_for_timeline("owner", "repo")
+
+        assert "If-None-Match" not in client.get.call_args_list[1].kwargs["headers"]
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_params_are_part_of_the_key(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.return_value = _make_response(json_data=[], headers={"ETag": '"v1"'})
+
+        svc = GitHubService(TOKEN)
+        await svc.get_commits_for_timeline("owner", "repo", branch="main")
+        await svc.get_commits_for_timeline("owner", "repo", branch="develop")
+
+        assert "If-None-Match" not in client.get.call_args_list[1].kwargs["headers"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Single-flight request coalescing
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _slow_get(response_factory):
+    """Build an async client.get side effect that yields before responding."""
+
+    async def get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return response_factory()
+
+    return get
+
+
+class TestSingleFlight:
+    """Tests for deduplication of concurrent identical calls."""
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_concurrent_tree_misses_share_one_request(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.side_effect = _slow_get(
+            lambda: _make_response(json_data={"sha": "t", "tree": [], "truncated": False})
+        )
+
+        svc = GitHubService(TOKEN)
+        results = await asyncio.gather(*[svc.get_repo_tree("owner", "repo") for _ in range(5)])
+
+        assert client.get.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_uncached_calls_coalesce_only_while_in_flight(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.side_effect = _slow_get(lambda: _make_response(json_data=[]))
+
+        svc = GitHubService(TOKEN)
+        await asyncio.gather(*[svc.get_commits_for_timeline("owner", "repo") for _ in range(3)])
+        assert client.get.call_count == 1
+
+        await svc.get_commits_for_timeline("owner", "repo")
+        assert client.get.call_count == 2
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_concurrent_file_reads_share_one_request(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.side_effect = _slow_get(lambda: _make_response(status_code=404))
+
+        svc = GitHubService(TOKEN)
+        results = await asyncio.gather(
+            svc.get_file_content("owner", "repo", "README.md"),
+            svc.get_file_content("owner", "repo", "README.md"),
+            svc.get_file_content("owner", "repo", "LICENSE"),
+        )
+
+        assert results == [None, None, None]
+        assert client.get.call_count == 2
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_errors_reach_every_waiter(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.side_effect = _slow_get(lambda: _make_response(status_code=401))
+
+        svc = GitHubService(TOKEN)
+        results = await asyncio.gather(
+            svc.get_repo_languages("owner", "repo"),
+            svc.get_repo_languages("owner", "repo"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, GitHubAPIError) for r in results)
+        assert client.get.call_count == 1
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_different_tokens_are_not_coalesced(self, mock_get_client):
+        client = AsyncMock()
+        mock_get_client.return_value = client
+        client.get.side_effect = _slow_get(lambda: _make_response(json_data=[]))
+
+        await asyncio.gather(
+            GitHubService(TOKEN).get_commits_for_timeline("owner", "repo"),
+            GitHubService("ghp_other_token").get_commits_for_timeline("owner", "repo"),
+        )
+
+        assert client.get.call_count == 2
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # get_repo_context (integration of multiple reads)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,258 @@
+"""Unit tests for tarball-based repository snapshots.
+
+Tests archive extraction, snapshot download, and serving bulk file reads
+from a snapshot with per-file fallback.
+"""
+
+from __future__ import annotations
+
+import io
+import tarfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.services.github.cache import clear_all_caches
+from app.services.github.exceptions import GitHubAPIError, SnapshotTooLargeError
+from app.services.github.object_store import git_object_store
+from app.services.github.service import GitHubService
+from app.services.github.snapshot import RepoSnapshot, extract_snapshot
+from app.services.github.types import RepoFile
+
+TOKEN = "ghp_test_token_12345"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_tarball(files: dict[str, bytes], root: str = "owner-repo-abc1234") -> bytes:
+    """Build a gzipped tarball laid out like GitHub's (single root directory)."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        root_info = tarfile.TarInfo(root)
+        root_info.type = tarfile.DIRTYPE
+        tar.addfile(root_info)
+        for path, content in files.items():
+            info = tarfile.TarInfo(f"{root}/{path}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buf.getvalue()
+
+
+def _make_stream(status_code: int, chunks: list[bytes]) -> MagicMock:
+    """Build a mock for `async with client.stream(...) as response`."""
+    response = MagicMock()
+    response.status_code = status_code
+
+    async def aiter_bytes():
+        for chunk in chunks:
+            yield chunk
+
+    response.aiter_bytes = aiter_bytes
+    stream_ctx = MagicMock()
+    stream_ctx.__aenter__ = AsyncMock(return_value=response)
+    stream_ctx.__aexit__ = AsyncMock(return_value=False)
+    return stream_ctx
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Clear GitHub caches before each test to prevent cross-test pollution."""
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
+@pytest.fixture(autouse=True)
+def _disable_object_store():
+    """Keep reads off the persistent git object store (no database in unit tests)."""
+    with patch.object(git_object_store, "enabled", False):
+        yield
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# extract_snapshot
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestExtractSnapshot:
+    """Tests for tarball parsing."""
+
+    def test_strips_archive_root(self):
+        archive = io.BytesIO(_make_tarball({"README.md": b"# Hi", "src/app.py": b"x = 1"}))
+
+        snapshot = extract_snapshot(archive, "owner/repo", "main")
+
+        assert snapshot.read_text("README.md") == "# Hi"
+        assert snapshot.read_text("src/app.py") == "x = 1"
+        assert not snapshot.has_path("owner-repo-abc1234/README.md")
+
+    def test_large_files_are_sized_but_not_retained(self):
+        archive = io.BytesIO(_make_tarball({"big.bin": b"0" * 500, "small.txt": b"ok"}))
+
+        snapshot = extract_snapshot(archive, "owner/repo", "main", max_file_size=100)
+
+        assert snapshot.has_path("big.bin")
+        assert not snapshot.is_retained("big.bin")
+        assert snapshot.sizes["big.bin"] == 500
+        assert snapshot.is_retained("small.txt")
+
+    def test_retention_budget_is_respected(self):
+        files = {f"f{i}.txt": b"x" * 10 for i in range(5)}
+        archive = io.BytesIO(_make_tarball(files))
+
+        snapshot = extract_snapshot(archive, "owner/repo", "main", max_retained_bytes=25)
+
+        assert len(snapshot.files) == 2
+        assert len(snapshot.sizes) == 5
+
+    def test_binary_content_reads_as_none(self):
+        snapshot = RepoSnapshot("owner/repo", "main", files={"logo.png": b"\x89PNG\xff\xfe"})
+
+        assert snapshot.read_text("logo.png") is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# get_repo_snapshot
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGetRepoSnapshot:
+    """Tests for downloading a tarball snapshot."""
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_follows_redirect_and_extracts(self, mock_get_client):
+        client = MagicMock()
+        mock_get_client.return_value = client
+        codeload = "https://codeload.github.com/owner/repo/legacy.tar.gz/main?token=x"
+        client.get = AsyncMock(
+            return_value=httpx.Response(302, headers={"Location": codeload}),
+        )
+        tarball = _make_tarball({"README.md": b"# Hi"})
+        client.stream.return_value = _make_stream(200, [tarball[:10], tarball[10:]])
+
+        svc = GitHubService(TOKEN)
+        snapshot = await svc.get_repo_snapshot("owner", "repo", "main")
+
+        assert snapshot.read_text("README.md") == "# Hi"
+        assert client.get.call_args.args[0].endswith("/repos/owner/repo/tarball/main")
+        assert client.stream.call_args.args == ("GET", codeload)
+
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_raises_on_404(self, mock_get_client):
+        client = MagicMock()
+        mock_get_client.return_value = client
+        client.get = AsyncMock(return_value=httpx.Response(404))
+
+        svc = GitHubService(TOKEN)
+        with pytest.raises(GitHubAPIError) as exc_info:
+            await svc.get_repo_snapshot("owner", "repo", "main")
+
+        assert exc_info.value.status_code == 404
+
+    @patch("app.services.github.read_operations.SNAPSHOT_MAX_ARCHIVE_BYTES", 5)
+    @patch("app.services.github.read_operations.get_github_client")
+    @pytest.mark.anyio
+    async def test_aborts_oversized_archive(self, mock_get_client):
+        client = MagicMock()
+        mock_get_client.return_value = client
+        client.get = AsyncMock(
+            return_value=httpx.Response(302, headers={"Location": "https://codeload/x"}),
+        )
+        client.stream.return_value = _make_stream(200, [b"0123456789"])
+
+        svc = GitHubService(TOKEN)
+        with pytest.raises(SnapshotTooLargeError):
+            await svc.get_repo_snapshot("owner", "repo", "main")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# fetch_files_by_paths (snapshot mode)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestFetchFilesFromSnapshot:
+    """Tests for serving bulk reads from a snapshot."""
+
+    @pytest.mark.anyio
+    async def test_serves_retained_files_without_per_file_calls(self):
+        svc = GitHubService(TOKEN)
+        snapshot = RepoSnapshot(
+            "owner/repo",
+            "main",
+            files={"a.py": b"a", "b.py": b"b"},
+            sizes={"a.py": 1, "b.py": 1},
+        )
+
+        with (
+            patch.object(svc, "get_repo_snapshot", new_callable=AsyncMock) as mock_snapshot,
+            patch.object(svc, "get_file_content", new_callable=AsyncMock) as mock_file,
+        ):
+            mock_snapshot.return_value = snapshot
+            result = await svc.fetch_files_by_paths(
+                "owner", "repo", ["a.py", "b.py", "missing.py"], use_snapshot=True
+            )
+
+        assert result == {"a.py": "a", "b.py": "b"}
+        mock_snapshot.assert_called_once_with("owner", "repo", "main")
+        mock_file.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_unretained_files_fall_back_to_contents_api(self):
+        svc = GitHubService(TOKEN)
+        snapshot = RepoSnapshot(
+            "owner/repo",
+            "main",
+            files={"a.py": b"a"},
+            sizes={"a.py": 1, "late.py": 50, "huge.py": 10_000_000},
+        )
+
+        with (
+            patch.object(svc, "get_repo_snapshot", new_callable=AsyncMock) as mock_snapshot,
+            patch.object(svc, "get_file_content", new_callable=AsyncMock) as mock_file,
+        ):
+            mock_snapshot.return_value = snapshot
+            mock_file.return_value = RepoFile(
+                path="late.py", content="late", size=4, sha="s", encoding="base64"
+            )
+            result = await svc.fetch_files_by_paths(
+                "owner", "repo", ["a.py", "late.py", "huge.py"], use_snapshot=True
+            )
+
+        assert result == {"a.py": "a", "late.py": "late"}
+        mock_file.assert_called_once_with("owner", "repo", "late.py", "main", max_size=100_000)
+
+    @pytest.mark.anyio
+    async def test_snapshot_failure_falls_back_to_per_file(self):
+        svc = GitHubService(TOKEN)
+
+        with (
+            patch.object(svc, "get_repo_snapshot", new_callable=AsyncMock) as mock_snapshot,
+            patch.object(svc, "get_file_content", new_callable=AsyncMock) as mock_file,
+        ):
+            mock_snapshot.side_effect = SnapshotTooLargeError("owner/repo", 1)
+            mock_file.return_value = RepoFile(
+                path="a.py", content="a", size=1, sha="s", encoding="base64"
+            )
+            result = await svc.fetch_files_by_paths("owner", "repo", ["a.py"], use_snapshot=True)
+
+        assert result == {"a.py": "a"}
+
+    @pytest.mark.anyio
+    async def test_small_requests_skip_snapshot_by_default(self):
+        svc = GitHubService(TOKEN)
+
+        with (
+            patch.object(svc, "get_repo_snapshot", new_callable=AsyncMock) as mock_snapshot,
+            patch.object(svc, "get_file_content", new_callable=AsyncMock) as mock_file,
+        ):
+            mock_file.return_value = None
+            await svc.fetch_files_by_paths("owner", "repo", ["a.py", "b.py"])
+
+        mock_snapshot.assert_not_called()
+        assert mock_file.call_count == 2
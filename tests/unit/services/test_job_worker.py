@@ -0,0 +1,202 @@
+"""Unit tests for the durable job queue worker.
+
+Queue operations and sessions are mocked; tests cover claiming per free
+slot, recording success, retry with backoff, permanent failure, releasing
+jobs on shutdown (failing those on their last attempt), and enqueueing with
+dedupe keys.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.jobs import JobHandler, JobWorker, enqueue_job, job_handler
+from app.services.jobs.registry import _handlers
+
+WORKER = "app.services.jobs.worker"
+
+
+class FakeSession:
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+
+def _job(attempts: int = 1, max_attempts: int = 3, **payload) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(), attempts=attempts, max_attempts=max_attempts, payload=payload
+    )
+
+
+@pytest.fixture
+def ops():
+    queue_ops = MagicMock()
+    queue_ops.claim = AsyncMock(return_value=[])
+    queue_ops.complete = AsyncMock()
+    queue_ops.fail = AsyncMock()
+    queue_ops.release = AsyncMock()
+    queue_ops.extend = AsyncMock(return_value=True)
+    queue_ops.fail_abandoned = AsyncMock(return_value=0)
+    queue_ops.delete_finished_before = AsyncMock(return_value=0)
+    with (
+        patch(f"{WORKER}.job_queue_ops", queue_ops),
+        patch(f"{WORKER}.async_session_maker", new=FakeSession),
+    ):
+        yield queue_ops
+
+
+async def _drain(worker: JobWorker) -> None:
+    await asyncio.gather(*[task for tasks in worker._running.values() for task in tasks])
+
+
+class TestJobWorker:
+    """Tests for JobWorker."""
+
+    @pytest.mark.asyncio
+    async def test_claims_only_free_slots(self, ops):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow(**_kwargs):
+            started.set()
+            await release.wait()
+
+        handler = JobHandler(job_type="slow", func=slow, concurrency=2)
+        worker = JobWorker([handler], worker_id="w1")
+        ops.claim.return_value = [_job()]
+
+        await worker.poll_once()
+        await started.wait()
+        await worker.poll_once()
+
+        limits = [call.kwargs["limit"] for call in ops.claim.await_args_list]
+        assert limits == [2, 1]
+        assert ops.claim.await_args.kwargs["max_running"] == 2
+        release.set()
+        await _drain(worker)
+
+    @pytest.mark.asyncio
+    async def test_successful_job_is_completed(self, ops):
+        func = AsyncMock()
+        worker = JobWorker([JobHandler(job_type="ok", func=func)], worker_id="w1")
+        job = _job(product_id="p1")
+        ops.claim.return_value = [job]
+
+        await worker.poll_once()
+        await _drain(worker)
+
+        func.assert_awaited_once_with(product_id="p1")
+        ops.complete.assert_awaited_once()
+        assert ops.complete.await_args.args[1:] == (job.id, "w1")
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried_with_backoff(self, ops):
+        handler = JobHandler(
+            job_type="flaky",
+            func=AsyncMock(side_effect=RuntimeError("boom")),
+            retry_base_seconds=10,
+        )
+        worker = JobWorker([handler], worker_id="w1")
+        ops.claim.return_value = [_job(attempts=2, max_attempts=3)]
+
+        before = datetime.now(UTC)
+        await worker.poll_once()
+        await _drain(worker)
+
+        _db, _job_id, _worker, error, retry_at = ops.fail.await_args.args
+        assert error == "boom"
+        assert 19 <= (retry_at - before).total_seconds() <= 21
+
+    @pytest.mark.asyncio
+    async def test_last_attempt_fails_permanently(self, ops):
+        handler = JobHandler(job_type="flaky", func=AsyncMock(side_effect=RuntimeError("boom")))
+        worker = JobWorker([handler], worker_id="w1")
+        ops.claim.return_value = [_job(attempts=3, max_attempts=3)]
+
+        await worker.poll_once()
+        await _drain(worker)
+
+        assert ops.fail.await_args.args[-1] is None
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_jobs_still_running(self, ops):
+        async def forever(**_kwargs):
+            await asyncio.Event().wait()
+
+        worker = JobWorker([JobHandler(job_type="long", func=forever)], worker_id="w1")
+        job = _job()
+        ops.claim.return_value = [job]
+        await worker.poll_once()
+        await asyncio.sleep(0)
+
+        await worker.stop(grace_seconds=0.01)
+
+        assert ops.release.await_args.args[1:] == (job.id, "w1")
+        ops.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_job_interrupted_on_last_attempt(self, ops):
+        """A job that outlives every shutdown grace is not re-queued forever."""
+
+        async def forever(**_kwargs):
+            await asyncio.Event().wait()
+
+        worker = JobWorker([JobHandler(job_type="long", func=forever)], worker_id="w1")
+        job = _job(attempts=3, max_attempts=3)
+        ops.claim.return_value = [job]
+        await worker.poll_once()
+        await asyncio.sleep(0)
+
+        await worker.stop(grace_seconds=0.01)
+
+        ops.release.assert_not_awaited()
+        assert ops.fail.await_args.args[1:3] == (job.id, "w1")
+        assert ops.fail.await_args.args[-1] is None
+
+
+class TestJobHandler:
+    """Tests for handler registration and backoff."""
+
+    def test_retry_delay_grows_exponentially_up_to_max(self):
+        handler = JobHandler(
+            job_type="t", func=AsyncMock(), retry_base_seconds=30, retry_max_seconds=100
+        )
+
+        assert [handler.retry_delay(n) for n in (1, 2, 3)] == [30, 60, 100]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_uses_handler_max_attempts_and_dedupe_key(self):
+        @job_handler("test_enqueue", max_attempts=5)
+        async def handler(**_kwargs):
+            pass
+
+        job_id = uuid.uuid4()
+        queue_ops = MagicMock(enqueue=AsyncMock(return_value=job_id))
+        try:
+            with (
+                patch("app.services.jobs.queue.job_queue_ops", queue_ops),
+                patch("app.services.jobs.queue.async_session_maker", new=FakeSession),
+            ):
+                result = await enqueue_job("test_enqueue", {"a": 1}, dedupe_key="k")
+        finally:
+            _handlers.pop("test_enqueue", None)
+
+        assert result == job_id
+        kwargs = queue_ops.enqueue.await_args.kwargs
+        assert kwargs["max_attempts"] == 5 and kwargs["dedupe_key"] == "k"
+
+    @pytest.mark.asyncio
+    async def test_enqueue_unknown_job_type_raises(self):
+        with pytest.raises(ValueError):
+            await enqueue_job("no_such_job", {})
@@ -0,0 +1,108 @@
+"""Tests for Postmark batch sending.
+
+Requests go to an httpx.MockTransport; tests cover chunking at the batch
+size limit, per-message results and failed requests.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from app.services.email.postmark import (
+    POSTMARK_BATCH_SIZE,
+    POSTMARK_BATCH_URL,
+    EmailMessage,
+    PostmarkService,
+)
+
+
+def _messages(count: int) -> list[EmailMessage]:
+    return [
+        EmailMessage(to=f"user{i}@test.com", subject="Hi", html_body="<p>Hi</p>", text_body="Hi")
+        for i in range(count)
+    ]
+
+
+def _service(handler) -> PostmarkService:
+    service = PostmarkService()
+    service._shared_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+@pytest.fixture(autouse=True)
+def postmark_settings():
+    settings = MagicMock(
+        postmark_enabled=True,
+        postmark_api_key="token",
+        postmark_from_email="digest@test.com",
+    )
+    with patch("app.services.email.postmark.settings", settings):
+        yield settings
+
+
+@pytest.mark.asyncio
+async def test_send_batch_chunks_requests():
+    sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == POSTMARK_BATCH_URL
+        assert request.headers["X-Postmark-Server-Token"] == "token"
+        payload = json.loads(request.content)
+        sizes.append(len(payload))
+        assert payload[0]["From"] == "digest@test.com"
+        return httpx.Response(200, json=[{"ErrorCode": 0, "Message": "OK"} for _ in payload])
+
+    results = await _service(handler).send_batch(_messages(POSTMARK_BATCH_SIZE * 2 + 1))
+
+    assert sizes == [POSTMARK_BATCH_SIZE, POSTMARK_BATCH_SIZE, 1]
+    assert len(results) == POSTMARK_BATCH_SIZE * 2 + 1
+    assert all(results)
+
+
+@pytest.mark.asyncio
+async def test_send_batch_reports_rejected_messages():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=[
+                {"ErrorCode": 0, "Message": "OK"},
+                {"ErrorCode": 300, "Message": "Invalid 'To' address"},
+                {"ErrorCode": 0, "Message": "OK"},
+            ],
+        )
+
+    results = await _service(handler).send_batch(_messages(3))
+
+    assert results == [True, False, True]
+
+
+@pytest.mark.asyncio
+async def test_failed_request_fails_only_its_chunk():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        payload = json.loads(request.content)
+        if calls == 1:
+            return httpx.Response(500, text="server error")
+        return httpx.Response(200, json=[{"ErrorCode": 0} for _ in payload])
+
+    results = await _service(handler).send_batch(_messages(POSTMARK_BATCH_SIZE + 2))
+
+    assert results == [False] * POSTMARK_BATCH_SIZE + [True, True]
+
+
+@pytest.mark.asyncio
+async def test_send_batch_skipped_when_disabled(postmark_settings):
+    postmark_settings.postmark_enabled = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected")
+
+    assert await _service(handler).send_batch(_messages(2)) == [False, False]
+    assert await _service(handler).send_batch([]) == []
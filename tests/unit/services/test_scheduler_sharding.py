@@ -0,0 +1,281 @@
+"""Tests for sharded scheduler runs.
+
+Advisory locks, the shard-run ledger and the job-run ledger are replaced by
+in-memory fakes, so tests cover shard ranges, skipping completed and locked
+shards, taking over shards released by other instances, keeping failed shards
+incomplete and recording the metrics of every shard run.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.sharding import ShardSpec, shard_index
+from app.services import scheduler
+from app.services.scheduler import JobRunResult
+
+MODULE = "app.services.scheduler"
+
+
+class FakeLedger:
+    """Completed shards and held locks shared by simulated instances."""
+
+    def __init__(self) -> None:
+        self.completed: set[int] = set()
+        self.held: set[int] = set()
+        self.runs: list[dict[str, Any]] = []
+
+    async def completed_shards(self, _job: str, _run_key: str, _count: int) -> set[int]:
+        return set(self.completed)
+
+    async def mark_completed(self, _job: str, _run_key: str, shard: ShardSpec) -> None:
+        self.completed.add(shard.index)
+
+    async def record_run(self, run: dict[str, Any]) -> None:
+        self.runs.append(run)
+
+    @asynccontextmanager
+    async def lock(self, _lock_id: int, shard: int | None = None) -> AsyncIterator[bool]:
+        assert shard is not None
+        if shard in self.held:
+            yield False
+            return
+        self.held.add(shard)
+        try:
+            yield True
+        finally:
+            self.held.discard(shard)
+
+
+@pytest.fixture
+def ledger():
+    ledger = FakeLedger()
+    settings = MagicMock(scheduler_shard_count=4, scheduler_shard_wait_seconds=60)
+
+    async def no_cleanup() -> None:
+        return None
+
+    with (
+        patch(f"{MODULE}.settings", settings),
+        patch(f"{MODULE}.advisory_lock", ledger.lock),
+        patch(f"{MODULE}._completed_shards", ledger.completed_shards),
+        patch(f"{MODULE}._mark_shard_completed", ledger.mark_completed),
+        patch(f"{MODULE}._delete_old_shard_runs", no_cleanup),
+        patch(f"{MODULE}._record_job_run", ledger.record_run),
+        patch(f"{MODULE}._delete_old_job_runs", no_cleanup),
+        patch(f"{MODULE}.SHARD_RETRY_SECONDS", 0),
+        patch(f"{MODULE}.MARK_COMPLETED_RETRY_SECONDS", 0),
+    ):
+        yield ledger
+
+
+def test_shards_partition_org_ids():
+    org_ids = [uuid.uuid4() for _ in range(500)]
+    for count in (1, 3, 8):
+        indexes = {shard_index(org_id, count) for org_id in org_ids}
+        assert indexes == set(range(count))
+        for org_id in org_ids:
+            owners = [i for i in range(count) if ShardSpec(i, count).contains(org_id)]
+            assert len(owners) == 1
+
+
+def test_shard_index_bounds():
+    assert shard_index(uuid.UUID(int=0), 4) == 0
+    assert shard_index(uuid.UUID(int=(1 << 128) - 1), 4) == 3
+    assert str(ShardSpec(0, 4)) == "1/4"
+
+
+@pytest.mark.asyncio
+async def test_runs_every_shard_once(ledger):
+    seen: list[int] = []
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        seen.append(shard.index)
+        return JobRunResult(report={"shard": shard.index})
+
+    result = await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    assert sorted(seen) == [0, 1, 2, 3]
+    assert ledger.completed == {0, 1, 2, 3}
+    assert result is not None
+    assert set(result["shards"]) == {0, 1, 2, 3}
+    assert result["shards"][2] == {"shard": 2}
+
+
+@pytest.mark.asyncio
+async def test_skips_completed_shards(ledger):
+    ledger.completed = {0, 1, 2, 3}
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        raise AssertionError("completed shards must not run")
+
+    assert await scheduler.run_sharded("job", 1, "2026-01-01", work) is None
+
+
+@pytest.mark.asyncio
+async def test_takes_over_shard_released_by_other_instance(ledger):
+    """A locked shard is retried and run once its holder goes away unfinished."""
+    ledger.held = {2}
+    seen: list[int] = []
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        seen.append(shard.index)
+        # The other instance dies while this one works
+        ledger.held.discard(2)
+        return JobRunResult(report={})
+
+    await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    assert sorted(seen) == [0, 1, 2, 3]
+    assert ledger.completed == {0, 1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_waits_for_shard_finished_by_other_instance(ledger):
+    ledger.held = {1}
+    seen: list[int] = []
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        seen.append(shard.index)
+        if len(seen) == 3:
+            # The other instance finishes its shard
+            ledger.held.discard(1)
+            ledger.completed.add(1)
+        return JobRunResult(report={})
+
+    await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    assert sorted(seen) == [0, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_failed_shard_is_not_marked_completed(ledger):
+    async def work(shard: ShardSpec) -> JobRunResult:
+        if shard.index == 1:
+            raise RuntimeError("boom")
+        return JobRunResult(report={})
+
+    result = await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    assert ledger.completed == {0, 2, 3}
+    assert result is not None
+    assert set(result["shards"]) == {0, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_completion_write_is_retried(ledger):
+    attempts: list[int] = []
+    mark_completed = ledger.mark_completed
+
+    async def flaky_mark(job: str, run_key: str, shard: ShardSpec) -> None:
+        attempts.append(shard.index)
+        if attempts.count(shard.index) == 1:
+            raise RuntimeError("db blip")
+        await mark_completed(job, run_key, shard)
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        return JobRunResult(report={})
+
+    with patch(f"{MODULE}._mark_shard_completed", flaky_mark):
+        await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    assert ledger.completed == {0, 1, 2, 3}
+    assert sorted(attempts) == [0, 0, 1, 1, 2, 2, 3, 3]
+
+
+@pytest.mark.asyncio
+async def test_completion_write_failure_does_not_stop_other_shards(ledger):
+    """A shard whose completion cannot be recorded is neither raised nor re-run."""
+    seen: list[int] = []
+
+    async def broken_mark(_job: str, _run_key: str, _shard: ShardSpec) -> None:
+        raise RuntimeError("db down")
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        seen.append(shard.index)
+        return JobRunResult(report={})
+
+    with (
+        patch(f"{MODULE}._mark_shard_completed", broken_mark),
+        patch(
+            f"{MODULE}.settings",
+            MagicMock(scheduler_shard_count=4, scheduler_shard_wait_seconds=0),
+        ),
+    ):
+        result = await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    assert sorted(seen) == [0, 1, 2, 3]
+    assert result is not None
+    assert set(result["shards"]) == {0, 1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_wait(ledger):
+    ledger.held = {3}
+
+    async def work(shard: ShardSpec) -> JobRunResult:
+        return JobRunResult(report={})
+
+    with patch(
+        f"{MODULE}.settings", MagicMock(scheduler_shard_count=4, scheduler_shard_wait_seconds=0)
+    ):
+        await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    assert ledger.completed == {0, 1, 2}
+
+
+@pytest.mark.asyncio
+async def test_records_every_shard_run(ledger):
+    async def work(shard: ShardSpec) -> JobRunResult:
+        if shard.index == 1:
+            raise RuntimeError("boom")
+        return JobRunResult(
+            report={},
+            items_processed=10,
+            errors=[f"error {i}" for i in range(scheduler.MAX_JOB_RUN_ERRORS + 5)],
+            error_count=scheduler.MAX_JOB_RUN_ERRORS + 5,
+            org_timings={"org": 1.5},
+        )
+
+    await scheduler.run_sharded("job", 1, "2026-01-01", work)
+
+    runs = {run["shard_index"]: run for run in ledger.runs}
+    assert set(runs) == {0, 1, 2, 3}
+    for run in runs.values():
+        assert run["job_name"] == "job"
+        assert run["run_key"] == "2026-01-01"
+        assert run["shard_count"] == 4
+        assert run["instance_id"] == scheduler.INSTANCE_ID
+        assert run["duration_seconds"] >= 0
+        assert run["finished_at"] >= run["started_at"]
+
+    completed = runs[0]
+    assert completed["status"] == "completed"
+    assert completed["items_processed"] == 10
+    assert completed["error_count"] == scheduler.MAX_JOB_RUN_ERRORS + 5
+    assert len(completed["errors"]) == scheduler.MAX_JOB_RUN_ERRORS
+    assert completed["org_timings"] == {"org": 1.5}
+
+    failed = runs[1]
+    assert failed["status"] == "failed"
+    assert failed["error_count"] == 1
+    assert failed["errors"] == ["boom"]
+    assert "items_processed" not in failed
+
+
+@pytest.mark.asyncio
+async def test_ledger_failure_is_not_raised():
+    run = {"job_name": "job", "run_key": "2026-01-01", "started_at": datetime.now(UTC)}
+    session_maker = MagicMock(side_effect=RuntimeError("db down"))
+
+    with patch(f"{MODULE}.async_session_maker", session_maker):
+        await scheduler._record_job_run(run)
+
+    session_maker.assert_called_once()
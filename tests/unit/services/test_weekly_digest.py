@@ -12,23 +12,27 @@ Verifies:
 - Partial send failure counting
 - users_emailed only increments on success (Phase 1 fix)
 - Daily digest: subject lines, period, no day-of-week gate
+- Bulk prefetch: one summary/shipped/access query per run, sections shared
+- Postmark batch sending: per-message results
 - Progress review HTML: contributor blocks, overflow, commit ref badges
 - Plain-text contributor summaries
 """
 
 import uuid
+from contextlib import ExitStack
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.services.email.postmark import EmailMessage
 from app.services.email.weekly_digest import (
     WeeklyDigestReport,
     _build_email_html,
     _build_plain_text,
     _build_product_html,
     _build_progress_review_html,
-    _send_digest_for_org,
+    _select_products,
     send_digests,
     send_weekly_digests,
 )
@@ -152,6 +156,120 @@ def _make_mock_org_pref(
     return pref
 
 
+class DigestRun:
+    """Outcome of a send_digests() run with every data source mocked."""
+
+    def __init__(self, report: WeeklyDigestReport, mocks: dict[str, MagicMock]) -> None:
+        self.report = report
+        self.mocks = mocks
+
+    @property
+    def messages(self) -> list[EmailMessage]:
+        """Messages handed to Postmark, across all batch calls."""
+        send_batch = self.mocks["postmark_service"].send_batch
+        return [m for c in send_batch.call_args_list for m in c.args[0]]
+
+
+async def _run_digests(
+    products: list[MagicMock],
+    *,
+    summaries: dict[uuid.UUID, MagicMock] | None = None,
+    shipped: dict[uuid.UUID, MagicMock] | None = None,
+    access: dict[uuid.UUID, str] | None = None,
+    role: str | None = "member",
+    prefs: list[MagicMock] | None = None,
+    frequency: str = "weekly",
+    send_ok: bool | list[bool] = True,
+    org_name: str = "Acme Corp",
+    run_key: str | None = None,
+    delivered: set[uuid.UUID] | None = None,
+) -> DigestRun:
+    """Run send_digests() for one org whose products are `products`.
+
+    summaries/shipped map product IDs to cached rows, access maps product IDs
+    to every recipient's access level (default: viewer), and prefs default to
+    one pref covering all products. With a run_key, `delivered` holds the
+    preference IDs already recorded as sent for the run. send_ok may be a
+    list with one result per message.
+    """
+    org = MagicMock()
+    org.id = uuid.uuid4()
+    org.name = org_name
+    for product in products:
+        product.organization_id = org.id
+
+    prefs = prefs or [_make_mock_org_pref(frequency=frequency)]
+    users = []
+    for pref in prefs:
+        pref.organization_id = org.id
+        pref.email_digest = frequency
+        user = _make_mock_user(f"{pref.user_id}@test.com")
+        user.id = pref.user_id
+        users.append(user)
+
+    summary_rows = []
+    for product_id, summary in (summaries or {}).items():
+        summary.product_id = product_id
+        summary_rows.append(summary)
+    shipped_rows = []
+    for product_id, row in (shipped or {}).items():
+        row.product_id = product_id
+        shipped_rows.append(row)
+
+    module = "app.services.email.weekly_digest"
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(patch(f"{module}.{name}"))
+            for name in (
+                "settings",
+                "org_digest_preference_ops",
+                "organization_ops",
+                "product_access_ops",
+                "progress_summary_ops",
+                "dashboard_shipped_ops",
+                "postmark_service",
+                "digest_delivery_ops",
+                "_get_products_by_org",
+            )
+        }
+        _configure_digest_settings(mocks["settings"])
+        mocks["org_digest_preference_ops"].get_all_active_for_frequency = AsyncMock(
+            return_value=prefs
+        )
+        mocks["organization_ops"].get_member_roles_bulk = AsyncMock(
+            return_value={} if role is None else {(org.id, p.user_id): role for p in prefs}
+        )
+        mocks["_get_products_by_org"].side_effect = AsyncMock(
+            return_value={org.id: products}
+        )
+        mocks["product_access_ops"].get_effective_access_for_members = AsyncMock(
+            return_value={(org.id, p.user_id): dict(access or {}) for p in prefs}
+        )
+        mocks["progress_summary_ops"].get_by_products_period = AsyncMock(
+            return_value=summary_rows
+        )
+        mocks["dashboard_shipped_ops"].get_by_products_period = AsyncMock(
+            return_value=shipped_rows
+        )
+        mocks["postmark_service"].send_batch = AsyncMock(
+            side_effect=lambda messages: (
+                list(send_ok) if isinstance(send_ok, list) else [send_ok] * len(messages)
+            )
+        )
+        mocks["digest_delivery_ops"].get_delivered = AsyncMock(return_value=delivered or set())
+        mocks["digest_delivery_ops"].record = AsyncMock()
+        mocks["digest_delivery_ops"].remove = AsyncMock()
+
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[_mock_scalars_result(users), _mock_scalars_result([org])]
+        )
+        report = await send_digests(db, frequency=frequency, run_key=run_key)
+        mocks["db"] = db
+
+    return DigestRun(report, mocks)
+
+
 # ---------------------------------------------------------------------------
 # send_weekly_digests — top-level entry point
 # ---------------------------------------------------------------------------
@@ -238,407 +356,300 @@ class TestSendWeeklyDigests:
         assert report.skipped_reasons.get("no_email") == 1
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.organization_ops")
-    @patch("app.services.email.weekly_digest.org_digest_preference_ops")
-    @patch("app.services.email.weekly_digest._send_digest_for_org")
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_catches_exception_per_org_pref(
-        self,
-        mock_settings: MagicMock,
-        mock_postmark: MagicMock,
-        mock_send_org: MagicMock,
-        mock_pref_ops: MagicMock,
-        mock_org_ops: MagicMock,
-    ) -> None:
-        """If processing one org pref throws, the job continues to the next."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.batch.return_value.__aenter__ = AsyncMock(return_value=mock_postmark)
-        mock_postmark.batch.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        user1 = _make_mock_user("fail@test.com")
-        user1.id = uuid.uuid4()
-        user2 = _make_mock_user("ok@test.com")
-        user2.id = uuid.uuid4()
-
-        org = MagicMock()
-        org.id = uuid.uuid4()
-        org.name = "Test Org"
-
-        pref1 = _make_mock_org_pref(user_id=user1.id, organization_id=org.id)
-        pref2 = _make_mock_org_pref(user_id=user2.id, organization_id=org.id)
-
-        mock_pref_ops.get_all_active_for_frequency = AsyncMock(return_value=[pref1, pref2])
-        mock_org_ops.get_member_role = AsyncMock(return_value="member")
-
-        mock_send_org.side_effect = [RuntimeError("boom"), True]
-
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            side_effect=[
-                _mock_scalars_result([user1, user2]),  # batch users
-                _mock_scalars_result([org]),  # batch orgs
-            ]
+    @patch("app.services.email.weekly_digest._build_digest_message")
+    async def test_catches_exception_per_org_pref(self, mock_build: MagicMock) -> None:
+        """If building one digest throws, the job continues to the next."""
+        product = _make_mock_product("Shared")
+        prefs = [_make_mock_org_pref(), _make_mock_org_pref()]
+        ok = EmailMessage(to="ok@test.com", subject="s", html_body="h", text_body="t")
+        mock_build.side_effect = [RuntimeError("boom"), ok]
+
+        run = await _run_digests(
+            [product], summaries={product.id: _make_mock_summary()}, prefs=prefs
         )
 
-        report = await send_weekly_digests(db)
-
-        assert report.users_checked == 2
-        assert report.errors >= 1
-        assert mock_send_org.call_count == 2
+        assert run.report.users_checked == 2
+        assert run.report.errors == 1
+        assert run.report.emails_sent == 1
+        assert mock_build.call_count == 2
+        assert run.messages == [ok]
 
 
 # ---------------------------------------------------------------------------
-# _send_digest_for_org — core per-org logic
+# Per-org digest content (through the batched pipeline)
 # ---------------------------------------------------------------------------
 
 
-class TestSendDigestForOrg:
-    """Tests for the per-org digest logic via _send_digest_for_org.
-
-    Each test calls _send_digest_for_org directly, bypassing the dispatch
-    layer (batch loading, time filtering) tested in TestSendWeeklyDigests.
-    """
+class TestDigestContent:
+    """Tests for what each org's digest contains, driven through send_digests()."""
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_consolidated_sends_single_email(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
+    async def test_consolidated_sends_single_email(self) -> None:
         """All accessible org products → one consolidated email."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=True)
-
         product_a = _make_mock_product("Project Alpha")
         product_b = _make_mock_product("Project Beta")
-        mock_get_org_products.return_value = [product_a, product_b]
-        mock_filter_access.return_value = [product_a, product_b]
-
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            side_effect=[_make_mock_summary("Alpha progress"), _make_mock_summary("Beta progress")]
-        )
-        mock_shipped_ops.get_by_product_period = AsyncMock(
-            side_effect=[_make_mock_shipped(), _make_mock_shipped()]
-        )
-
-        pref = _make_mock_org_pref(digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
 
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
+        run = await _run_digests(
+            [product_a, product_b],
+            summaries={
+                product_a.id: _make_mock_summary("Alpha progress"),
+                product_b.id: _make_mock_summary("Beta progress"),
+            },
+            shipped={product_a.id: _make_mock_shipped(), product_b.id: _make_mock_shipped()},
         )
 
-        assert sent is True
-        assert report.emails_sent == 1
-        mock_postmark.send.assert_called_once()
-
-        call_kwargs = mock_postmark.send.call_args.kwargs
-        assert call_kwargs["subject"] == "Weekly Progress — Acme Corp"
-        assert "Project Alpha" in call_kwargs["html_body"]
-        assert "Project Beta" in call_kwargs["html_body"]
+        assert run.report.emails_sent == 1
+        assert run.report.users_emailed == 1
+        [message] = run.messages
+        assert message.subject == "Weekly Progress — Acme Corp"
+        assert "Project Alpha" in message.html_body
+        assert "Project Beta" in message.html_body
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_access_filtering_excludes_restricted_products(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
+    async def test_access_filtering_excludes_restricted_products(self) -> None:
         """Products the user can't access are excluded from the digest."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=True)
-
         product_ok = _make_mock_product("Accessible")
         product_restricted = _make_mock_product("Restricted")
-        mock_get_org_products.return_value = [product_ok, product_restricted]
-        # Access filter removes the restricted product
-        mock_filter_access.return_value = [product_ok]
 
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_summary("Accessible progress")
-        )
-        mock_shipped_ops.get_by_product_period = AsyncMock(return_value=_make_mock_shipped())
-
-        pref = _make_mock_org_pref(digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
-
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
+        run = await _run_digests(
+            [product_ok, product_restricted],
+            summaries={
+                product_ok.id: _make_mock_summary("Accessible progress"),
+                product_restricted.id: _make_mock_summary("Restricted progress"),
+            },
+            access={product_ok.id: "viewer", product_restricted.id: "none"},
         )
 
-        assert sent is True
-        assert report.emails_sent == 1
-        # Only 1 product queried (the accessible one)
-        assert mock_progress_ops.get_by_product_period.call_count == 1
-        call_kwargs = mock_postmark.send.call_args.kwargs
-        assert "Accessible" in call_kwargs["html_body"]
-        assert "Restricted" not in call_kwargs["html_body"]
+        [message] = run.messages
+        assert "Accessible" in message.html_body
+        assert "Restricted" not in message.html_body
+        # Only the accessible product's summary is loaded
+        load = run.mocks["progress_summary_ops"].get_by_products_period
+        assert load.call_args.args[1] == [product_ok.id]
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_skips_org_with_no_products(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
+    async def test_skips_org_with_no_products(self) -> None:
         """Org with no products after access filtering → skip."""
-        _configure_digest_settings(mock_settings)
-        mock_get_org_products.return_value = []
-        mock_filter_access.return_value = []
+        run = await _run_digests([])
 
-        pref = _make_mock_org_pref(digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
+        assert run.report.skipped_reasons.get("no_products") == 1
+        assert run.messages == []
+
+    @pytest.mark.asyncio
+    async def test_skips_non_member(self) -> None:
+        """Users who are no longer members of the org are skipped."""
+        product = _make_mock_product()
 
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
+        run = await _run_digests(
+            [product], summaries={product.id: _make_mock_summary()}, role=None
         )
 
-        assert sent is False
-        assert report.skipped_reasons.get("no_products") == 1
-        mock_postmark.send.assert_not_called()
+        assert run.report.skipped_reasons.get("not_member") == 1
+        assert run.messages == []
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_skips_org_with_no_activity(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
+    async def test_skips_org_with_no_activity(self) -> None:
         """Products exist but all have no cached data → skip."""
-        _configure_digest_settings(mock_settings)
-
-        product = _make_mock_product("Empty Project")
-        mock_get_org_products.return_value = [product]
-        mock_filter_access.return_value = [product]
+        run = await _run_digests([_make_mock_product("Empty Project")])
 
-        mock_progress_ops.get_by_product_period = AsyncMock(return_value=None)
-        mock_shipped_ops.get_by_product_period = AsyncMock(return_value=None)
+        assert run.report.skipped_reasons.get("no_activity") == 1
+        assert run.messages == []
 
-        pref = _make_mock_org_pref(digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
+    @pytest.mark.asyncio
+    async def test_digest_product_ids_filters_products(self) -> None:
+        """Only selected products should be included when digest_product_ids is set."""
+        product_a = _make_mock_product("Selected")
+        product_b = _make_mock_product("Not Selected")
+        pref = _make_mock_org_pref(digest_product_ids=[str(product_a.id)])
 
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
+        run = await _run_digests(
+            [product_a, product_b],
+            summaries={
+                product_a.id: _make_mock_summary("Selected progress"),
+                product_b.id: _make_mock_summary("Other progress"),
+            },
+            prefs=[pref],
         )
 
-        assert sent is False
-        assert report.skipped_reasons.get("no_activity") == 1
-        mock_postmark.send.assert_not_called()
+        [message] = run.messages
+        assert "Not Selected" not in message.html_body
+        load = run.mocks["progress_summary_ops"].get_by_products_period
+        assert load.call_args.args[1] == [product_a.id]
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_digest_product_ids_filters_products(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
-        """Only selected products should be included when digest_product_ids is set."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=True)
-
-        product_a = _make_mock_product("Selected")
-        product_b = _make_mock_product("Not Selected")
-        mock_get_org_products.return_value = [product_a, product_b]
-        mock_filter_access.return_value = [product_a, product_b]
+    async def test_send_failure_increments_errors(self) -> None:
+        """If Postmark rejects a message, it counts as an error, not a send."""
+        product = _make_mock_product("Fail Project")
 
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_summary("Selected progress")
+        run = await _run_digests(
+            [product], summaries={product.id: _make_mock_summary()}, send_ok=False
         )
-        mock_shipped_ops.get_by_product_period = AsyncMock(return_value=_make_mock_shipped())
 
-        # Only product_a selected
-        pref = _make_mock_org_pref(digest_product_ids=[str(product_a.id)])
-        report = WeeklyDigestReport()
-        db = AsyncMock()
+        assert run.report.emails_sent == 0
+        assert run.report.users_emailed == 0
+        assert run.report.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_shipped_not_significant_excluded(self) -> None:
+        """Products where shipped.has_significant_changes=False should exclude items."""
+        product = _make_mock_product("Minor Changes")
 
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
+        run = await _run_digests(
+            [product],
+            summaries={product.id: _make_mock_summary("Some narrative")},
+            shipped={
+                product.id: _make_mock_shipped(
+                    items=[{"description": "Minor tweak", "category": "fix"}],
+                    has_significant_changes=False,
+                )
+            },
         )
 
-        assert sent is True
-        assert report.emails_sent == 1
-        # Only 1 product queried (the selected one)
-        assert mock_progress_ops.get_by_product_period.call_count == 1
+        # Email still sent (narrative exists), but items should not appear
+        [message] = run.messages
+        assert "Minor tweak" not in message.text_body
+
+
+# ---------------------------------------------------------------------------
+# Bulk prefetch and batch sending
+# ---------------------------------------------------------------------------
+
+
+class TestBatchedPipeline:
+    """Tests that a run loads its data in bulk and sends in one batch."""
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_send_failure_returns_false_and_increments_errors(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
-        """If postmark.send fails, returns False and increments report.errors."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=False)
+    async def test_shared_products_loaded_and_rendered_once(self) -> None:
+        """Recipients sharing a product reuse one query and one rendered section."""
+        product = _make_mock_product("Shared Project")
+        prefs = [_make_mock_org_pref() for _ in range(3)]
+
+        with patch(
+            "app.services.email.weekly_digest._build_product_html",
+            wraps=_build_product_html,
+        ) as render:
+            run = await _run_digests(
+                [product],
+                summaries={product.id: _make_mock_summary("Shared progress")},
+                shipped={product.id: _make_mock_shipped()},
+                prefs=prefs,
+            )
 
-        product = _make_mock_product("Fail Project")
-        mock_get_org_products.return_value = [product]
-        mock_filter_access.return_value = [product]
+        assert run.mocks["progress_summary_ops"].get_by_products_period.await_count == 1
+        assert run.mocks["dashboard_shipped_ops"].get_by_products_period.await_count == 1
+        assert run.mocks["organization_ops"].get_member_roles_bulk.await_count == 1
+        assert render.call_count == 1
 
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_summary("Some progress")
-        )
-        mock_shipped_ops.get_by_product_period = AsyncMock(return_value=_make_mock_shipped())
+        assert run.mocks["postmark_service"].send_batch.await_count == 1
+        assert len(run.messages) == 3
+        assert {m.to for m in run.messages} == {f"{p.user_id}@test.com" for p in prefs}
+        assert run.report.emails_sent == 3
+        assert run.report.users_emailed == 3
 
-        pref = _make_mock_org_pref(digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
 
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
-        )
+# ---------------------------------------------------------------------------
+# Delivery records for scheduled runs
+# ---------------------------------------------------------------------------
 
-        assert sent is False
-        assert report.emails_sent == 0
-        assert report.errors == 1
+
+class TestDigestDeliveries:
+    """Tests that a scheduled run never emails the same recipient twice."""
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_shipped_not_significant_excluded(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
-        """Products where shipped.has_significant_changes=False should exclude items."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=True)
+    async def test_without_run_key_records_nothing(self) -> None:
+        product = _make_mock_product()
 
-        product = _make_mock_product("Minor Changes")
-        mock_get_org_products.return_value = [product]
-        mock_filter_access.return_value = [product]
+        run = await _run_digests([product], summaries={product.id: _make_mock_summary()})
 
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_summary("Some narrative")
-        )
-        mock_shipped_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_shipped(
-                items=[{"description": "Minor tweak", "category": "fix"}],
-                has_significant_changes=False,
-            )
+        assert run.report.emails_sent == 1
+        run.mocks["digest_delivery_ops"].get_delivered.assert_not_called()
+        run.mocks["digest_delivery_ops"].record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_records_and_commits_deliveries(self) -> None:
+        product = _make_mock_product()
+        pref = _make_mock_org_pref()
+
+        run = await _run_digests(
+            [product],
+            summaries={product.id: _make_mock_summary()},
+            prefs=[pref],
+            run_key="2026-03-06T17",
         )
 
-        pref = _make_mock_org_pref(digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
+        record = run.mocks["digest_delivery_ops"].record
+        record.assert_awaited_once()
+        assert record.call_args.args[1:] == ("weekly", "2026-03-06T17", [pref.id])
+        run.mocks["db"].commit.assert_awaited_once()
+        run.mocks["digest_delivery_ops"].remove.assert_not_called()
 
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
+    @pytest.mark.asyncio
+    async def test_skips_recipients_already_delivered(self) -> None:
+        """A re-run shard only emails recipients the first run did not reach."""
+        product = _make_mock_product()
+        prefs = [_make_mock_org_pref() for _ in range(2)]
+
+        run = await _run_digests(
+            [product],
+            summaries={product.id: _make_mock_summary()},
+            prefs=prefs,
+            run_key="2026-03-06T17",
+            delivered={prefs[0].id},
         )
 
-        # Email still sent (narrative exists), but items should not appear
-        assert sent is True
-        assert report.emails_sent == 1
-        call_kwargs = mock_postmark.send.call_args.kwargs
-        assert "Minor tweak" not in call_kwargs["text_body"]
+        assert [m.to for m in run.messages] == [f"{prefs[1].user_id}@test.com"]
+        assert run.report.skipped_reasons["already_sent"] == 1
+        assert run.mocks["digest_delivery_ops"].record.call_args.args[3] == [prefs[1].id]
 
+    @pytest.mark.asyncio
+    async def test_rejected_sends_are_unrecorded(self) -> None:
+        product = _make_mock_product()
+        prefs = [_make_mock_org_pref() for _ in range(2)]
+
+        run = await _run_digests(
+            [product],
+            summaries={product.id: _make_mock_summary()},
+            prefs=prefs,
+            run_key="2026-03-06T17",
+            send_ok=[True, False],
+        )
 
-# ---------------------------------------------------------------------------
-# Product access filtering
-# ---------------------------------------------------------------------------
+        assert run.report.emails_sent == 1
+        remove = run.mocks["digest_delivery_ops"].remove
+        remove.assert_awaited_once()
+        assert remove.call_args.args[3] == [prefs[1].id]
 
 
-class TestOrgProductFiltering:
-    """Tests for _filter_accessible_products."""
+class TestSelectProducts:
+    """Tests for _select_products."""
 
-    @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.product_access_ops")
-    async def test_filter_excludes_none_access(self, mock_access_ops: MagicMock) -> None:
+    def test_excludes_none_access(self) -> None:
         """Products with effective access 'none' are excluded."""
-        from app.services.email.weekly_digest import _filter_accessible_products
-
         product_ok = _make_mock_product("Accessible")
         product_restricted = _make_mock_product("Restricted")
 
-        mock_access_ops.get_effective_access_bulk = AsyncMock(
-            return_value={product_ok.id: "viewer", product_restricted.id: "none"}
+        result = _select_products(
+            [product_ok, product_restricted],
+            {product_ok.id: "viewer", product_restricted.id: "none"},
+            None,
         )
 
-        db = AsyncMock()
-        result = await _filter_accessible_products(
-            db, [product_ok, product_restricted], uuid.uuid4(), "member"
-        )
+        assert result == [product_ok]
 
-        assert len(result) == 1
-        assert result[0].name == "Accessible"
+    def test_selection_applies_on_top_of_access(self) -> None:
+        product_a = _make_mock_product("A")
+        product_b = _make_mock_product("B")
 
-    @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.product_access_ops")
-    async def test_filter_returns_empty_for_empty_input(
-        self, mock_access_ops: MagicMock
-    ) -> None:
-        """Empty product list returns empty without calling access ops."""
-        from app.services.email.weekly_digest import _filter_accessible_products
+        result = _select_products(
+            [product_a, product_b],
+            {product_a.id: "none", product_b.id: "viewer"},
+            [str(product_a.id), str(product_b.id)],
+        )
 
-        db = AsyncMock()
-        result = await _filter_accessible_products(db, [], uuid.uuid4(), "member")
+        assert result == [product_b]
 
-        assert result == []
-        mock_access_ops.get_effective_access_bulk.assert_not_called()
+    def test_empty_input(self) -> None:
+        assert _select_products([], {}, None) == []
 
 
 # ---------------------------------------------------------------------------
@@ -732,99 +743,42 @@ class TestSendDailyDigests:
     """Tests for the daily digest path via send_digests(frequency='daily')."""
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_daily_sends_with_daily_subject_and_period(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
+    async def test_daily_sends_with_daily_subject_and_period(self) -> None:
         """Daily digest uses 'Daily Progress — {org}' subject and '1d' period."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=True)
-
         product = _make_mock_product("My Project")
-        mock_get_org_products.return_value = [product]
-        mock_filter_access.return_value = [product]
 
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_summary("Daily progress")
+        run = await _run_digests(
+            [product],
+            summaries={product.id: _make_mock_summary("Daily progress")},
+            shipped={product.id: _make_mock_shipped()},
+            frequency="daily",
         )
-        mock_shipped_ops.get_by_product_period = AsyncMock(return_value=_make_mock_shipped())
 
-        pref = _make_mock_org_pref(frequency="daily", digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
-
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report, frequency="daily"
-        )
-
-        assert sent is True
-        assert report.emails_sent == 1
-
-        call_kwargs = mock_postmark.send.call_args.kwargs
-        assert call_kwargs["subject"] == "Daily Progress — Acme Corp"
-        assert "Daily Progress" in call_kwargs["html_body"]
+        assert run.report.emails_sent == 1
+        [message] = run.messages
+        assert message.subject == "Daily Progress — Acme Corp"
+        assert "Daily Progress" in message.html_body
 
         # Verify it queries the "1d" period, not "7d"
-        period_args = [
-            c.kwargs.get("period") or c.args[2]
-            for c in mock_progress_ops.get_by_product_period.call_args_list
-        ]
-        assert all(p == "1d" for p in period_args)
+        for ops in ("progress_summary_ops", "dashboard_shipped_ops"):
+            assert run.mocks[ops].get_by_products_period.call_args.args[2] == "1d"
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_daily_subject_includes_org_name(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
+    async def test_daily_subject_includes_org_name(self) -> None:
         """Daily digest subject line includes the org name."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=True)
-
         product = _make_mock_product("Acme App")
-        mock_get_org_products.return_value = [product]
-        mock_filter_access.return_value = [product]
-
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_summary("Daily update")
-        )
-        mock_shipped_ops.get_by_product_period = AsyncMock(return_value=_make_mock_shipped())
-
-        pref = _make_mock_org_pref(
-            frequency="daily", digest_product_ids=[str(product.id)]
-        )
-        report = WeeklyDigestReport()
-        db = AsyncMock()
-
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report, frequency="daily"
+        pref = _make_mock_org_pref(frequency="daily", digest_product_ids=[str(product.id)])
+
+        run = await _run_digests(
+            [product],
+            summaries={product.id: _make_mock_summary("Daily update")},
+            prefs=[pref],
+            frequency="daily",
+            org_name="Globex",
         )
 
-        assert sent is True
-        assert report.emails_sent == 1
-        call_kwargs = mock_postmark.send.call_args.kwargs
-        assert call_kwargs["subject"] == "Daily Progress — Acme Corp"
+        [message] = run.messages
+        assert message.subject == "Daily Progress — Globex"
 
     @pytest.mark.asyncio
     @patch("app.services.email.weekly_digest.postmark_service")
@@ -884,29 +838,9 @@ class TestDigestWithContributorSummaries:
     """Tests that contributor summaries flow through to the email."""
 
     @pytest.mark.asyncio
-    @patch("app.services.email.weekly_digest.postmark_service")
-    @patch("app.services.email.weekly_digest.dashboard_shipped_ops")
-    @patch("app.services.email.weekly_digest.progress_summary_ops")
-    @patch("app.services.email.weekly_digest._filter_accessible_products")
-    @patch("app.services.email.weekly_digest._get_org_products")
-    @patch("app.services.email.weekly_digest.settings")
-    async def test_contributor_summaries_appear_in_email(
-        self,
-        mock_settings: MagicMock,
-        mock_get_org_products: MagicMock,
-        mock_filter_access: MagicMock,
-        mock_progress_ops: MagicMock,
-        mock_shipped_ops: MagicMock,
-        mock_postmark: MagicMock,
-    ) -> None:
+    async def test_contributor_summaries_appear_in_email(self) -> None:
         """Contributor summaries from ProgressSummary should appear in both HTML and text."""
-        _configure_digest_settings(mock_settings)
-        mock_postmark.send = AsyncMock(return_value=True)
-
         product = _make_mock_product("Project X")
-        mock_get_org_products.return_value = [product]
-        mock_filter_access.return_value = [product]
-
         contribs = [
             {
                 "name": "Alice",
@@ -917,32 +851,27 @@ class TestDigestWithContributorSummaries:
                 "commit_refs": [{"sha": "abc1234", "branch": "main"}],
             },
         ]
-        mock_progress_ops.get_by_product_period = AsyncMock(
-            return_value=_make_mock_summary("Good week.", contributor_summaries=contribs)
-        )
-        mock_shipped_ops.get_by_product_period = AsyncMock(return_value=_make_mock_shipped())
 
-        pref = _make_mock_org_pref(digest_product_ids=None)
-        report = WeeklyDigestReport()
-        db = AsyncMock()
-
-        sent = await _send_digest_for_org(
-            db, pref, "user@test.com", "Acme Corp", "member", report
+        run = await _run_digests(
+            [product],
+            summaries={
+                product.id: _make_mock_summary("Good week.", contributor_summaries=contribs)
+            },
+            shipped={product.id: _make_mock_shipped()},
         )
 
-        assert sent is True
-        assert report.emails_sent == 1
-        call_kwargs = mock_postmark.send.call_args.kwargs
+        assert run.report.emails_sent == 1
+        [message] = run.messages
 
         # HTML should contain contributor name and summary
-        assert "Alice" in call_kwargs["html_body"]
-        assert "Implemented OAuth flow." in call_kwargs["html_body"]
-        assert "abc1234" in call_kwargs["html_body"]
-        assert "Progress Review" in call_kwargs["html_body"]
+        assert "Alice" in message.html_body
+        assert "Implemented OAuth flow." in message.html_body
+        assert "abc1234" in message.html_body
+        assert "Progress Review" in message.html_body
 
         # Plain text too
-        assert "Alice" in call_kwargs["text_body"]
-        assert "Implemented OAuth flow." in call_kwargs["text_body"]
+        assert "Alice" in message.text_body
+        assert "Implemented OAuth flow." in message.text_body
 
 
 # ---------------------------------------------------------------------------